@@ -7,13 +7,15 @@ Este módulo integra todos os módulos desenvolvidos em uma interface web.
 """
 
 import os
+import re
 import sys
 import json
+import uuid
 import logging
 import tempfile
 import datetime
 from typing import Dict, List, Any, Optional, Union
-from flask import Flask, render_template, request, redirect, url_for, jsonify, send_file, flash
+from flask import Flask, Response, render_template, request, redirect, url_for, jsonify, send_file, flash, stream_with_context
 
 # Importar módulos OSINT
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -21,6 +23,8 @@ from modules.social_media import SocialMediaOSINT
 from modules.contact_info import ContactInfoOSINT
 from modules.image_recognition import ImageRecognitionOSINT
 from modules.metadata_analysis import MetadataAnalysisOSINT
+from modules.jobs import JobManager, format_sse
+from modules.result_export import EXPORT_MIMETYPES
 
 # Configuração de logging
 logging.basicConfig(
@@ -45,6 +49,46 @@ contact_info_osint = ContactInfoOSINT(output_dir=os.path.join(app.config['RESULT
 image_recognition_osint = ImageRecognitionOSINT(output_dir=os.path.join(app.config['RESULTS_FOLDER'], 'image_recognition'))
 metadata_analysis_osint = MetadataAnalysisOSINT(output_dir=os.path.join(app.config['RESULTS_FOLDER'], 'metadata_analysis'))
 
+# Inicializar gerenciador de tarefas em segundo plano
+job_manager = JobManager(max_workers=int(os.environ.get('OSINT_JOB_WORKERS', 4)))
+
+def _is_background_request() -> bool:
+    """Verifica se a requisição pediu execução em segundo plano."""
+    return request.values.get('background', '').lower() in ('1', 'true', 'yes', 'sim')
+
+def _run_or_enqueue(name: str, func, *args, with_progress: bool = False, **kwargs):
+    """
+    Executa uma chamada dos módulos OSINT ou a envia para a fila de tarefas.
+    
+    Args:
+        name: Nome descritivo da tarefa
+        func: Função a ser executada
+        *args: Argumentos posicionais da função
+        with_progress: Se True, a função aceita progress_callback e a tarefa publica eventos de progresso
+        **kwargs: Argumentos nomeados da função
+        
+    Returns:
+        Resposta JSON com o resultado ou com o identificador da tarefa
+    """
+    if _is_background_request():
+        job = job_manager.submit(name, func, *args, with_progress=with_progress, **kwargs)
+        response = job.to_dict()
+        response['status_url'] = url_for('api_job_status', job_id=job.id)
+        response['result_url'] = url_for('api_job_result', job_id=job.id)
+        response['events_url'] = url_for('api_job_events', job_id=job.id)
+        return jsonify(response), 202
+    
+    return jsonify(func(*args, **kwargs))
+
+def _with_display_image(func):
+    """Adiciona o caminho da imagem de resultado para exibição na interface."""
+    def wrapper(*args, **kwargs):
+        results = func(*args, **kwargs)
+        if 'result_image' in results and results['result_image']:
+            results['display_image'] = results['result_image']
+        return results
+    return wrapper
+
 @app.route('/')
 def index():
     """Página inicial da ferramenta OSINT."""
@@ -80,13 +124,14 @@ def api_social_media_twitter():
     """API para busca no Twitter."""
     username = request.form.get('username')
     max_tweets = int(request.form.get('max_tweets', 100))
+    full_refresh = request.form.get('full_refresh', '').lower() in ('1', 'true', 'yes', 'sim')
     
     if not username:
         return jsonify({'error': 'Nome de usuário não fornecido'}), 400
     
     try:
-        results = social_media_osint.search_twitter(username, max_tweets)
-        return jsonify(results)
+        return _run_or_enqueue('social_media.twitter', social_media_osint.search_twitter, username, max_tweets,
+                               full_refresh=full_refresh, with_progress=True)
     except Exception as e:
         logger.error(f"Erro na busca do Twitter: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -101,8 +146,7 @@ def api_social_media_instagram():
         return jsonify({'error': 'Nome de usuário não fornecido'}), 400
     
     try:
-        results = social_media_osint.search_instagram(username, max_posts)
-        return jsonify(results)
+        return _run_or_enqueue('social_media.instagram', social_media_osint.search_instagram, username, max_posts)
     except Exception as e:
         logger.error(f"Erro na busca do Instagram: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -117,12 +161,107 @@ def api_social_media_facebook():
         return jsonify({'error': 'Nome de usuário não fornecido'}), 400
     
     try:
-        results = social_media_osint.search_facebook(username, max_posts)
-        return jsonify(results)
+        return _run_or_enqueue('social_media.facebook', social_media_osint.search_facebook, username, max_posts)
     except Exception as e:
         logger.error(f"Erro na busca do Facebook: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/social_media/all', methods=['POST'])
+def api_social_media_all():
+    """API para busca simultânea no Twitter, Instagram e Facebook."""
+    username = request.form.get('username', '')
+    max_posts = request.form.get('max_posts', type=int)
+    timeout = request.form.get('timeout', type=float)
+    
+    # Um nome para todas as redes, ou um nome específico por rede
+    handles = {network: request.form.get(network) or username for network in ('twitter', 'instagram', 'facebook')}
+    handles = {network: handle for network, handle in handles.items() if handle}
+    
+    if not handles:
+        return jsonify({'error': 'Nome de usuário não fornecido'}), 400
+    
+    timeouts = {network: timeout for network in handles} if timeout else None
+    
+    try:
+        return _run_or_enqueue('social_media.all', social_media_osint.search_all, handles, max_posts,
+                               timeouts=timeouts, with_progress=True)
+    except Exception as e:
+        logger.error(f"Erro na busca simultânea em redes sociais: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/social_media/stream', methods=['POST'])
+def api_social_media_stream():
+    """API para coleta de um perfil com os posts transmitidos em JSONL à medida que chegam."""
+    network = request.form.get('network', '')
+    username = request.form.get('username')
+    max_posts = request.form.get('max_posts', type=int)
+    full_refresh = request.form.get('full_refresh', '').lower() in ('1', 'true', 'yes', 'sim')
+    
+    if not username:
+        return jsonify({'error': 'Nome de usuário não fornecido'}), 400
+    
+    try:
+        if network == 'twitter':
+            records = social_media_osint.iter_tweets(username, max_posts or 100, full_refresh)
+        else:
+            records = social_media_osint.iter_posts(network, username, max_posts or 20)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    def generate():
+        # Um registro por linha, enviado assim que chega: o primeiro resultado não espera a coleta inteira
+        try:
+            for record in records:
+                yield json.dumps(record, ensure_ascii=False, default=str) + '\n'
+        except Exception as e:
+            logger.error(f"Erro na coleta transmitida de {network}: {str(e)}")
+            yield json.dumps({'network': network, 'username': username, 'type': 'error', 'error': str(e)},
+                             ensure_ascii=False) + '\n'
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='application/x-ndjson',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/social_media/schedule', methods=['POST'])
+def api_social_media_schedule():
+    """API para agendamento de coletas conforme os limites de taxa das redes sociais."""
+    network = request.form.get('network', '')
+    username = request.form.get('username')
+    max_posts = request.form.get('max_posts', type=int)
+    
+    if not username:
+        return jsonify({'error': 'Nome de usuário não fornecido'}), 400
+    
+    try:
+        job = social_media_osint.schedule_collection(network, username, max_posts)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        logger.error(f"Erro no agendamento da coleta: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+    
+    return jsonify(job.to_dict()), 202
+
+@app.route('/api/social_media/schedule', methods=['GET'])
+def api_social_media_schedule_status():
+    """API para consulta da fila de coletas e da cota de cada credencial."""
+    return jsonify(social_media_osint.scheduler.status())
+
+@app.route('/api/social_media/schedule/<job_id>', methods=['GET'])
+def api_social_media_schedule_job(job_id):
+    """API para consulta de uma coleta agendada e de seu resultado."""
+    job = social_media_osint.scheduler.get(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Coleta não encontrada'}), 404
+    
+    if not job.done:
+        return jsonify(job.to_dict()), 202
+    
+    return jsonify(job.to_dict(include_result=True))
+
 @app.route('/api/social_media/visualize', methods=['POST'])
 def api_social_media_visualize():
     """API para visualização de conexões sociais."""
@@ -150,13 +289,14 @@ def api_contact_info_domain():
     """API para busca de e-mails por domínio."""
     domain = request.form.get('domain')
     max_pages = int(request.form.get('max_pages', 5))
+    force_refresh = request.form.get('force_refresh', '').lower() in ('1', 'true', 'yes', 'sim')
     
     if not domain:
         return jsonify({'error': 'Domínio não fornecido'}), 400
     
     try:
-        results = contact_info_osint.search_emails_from_domain(domain, max_pages)
-        return jsonify(results)
+        return _run_or_enqueue('contact_info.domain', contact_info_osint.search_emails_from_domain, domain, max_pages,
+                               with_progress=True, force_refresh=force_refresh)
     except Exception as e:
         logger.error(f"Erro na busca de e-mails por domínio: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -166,6 +306,8 @@ def api_contact_info_person():
     """API para busca de e-mails por pessoa."""
     name = request.form.get('name')
     domains = request.form.get('domains', '').split(',')
+    top_k = request.form.get('top_k', type=int)
+    verify = request.form.get('verify', '').lower() in ('1', 'true', 'yes', 'sim')
     
     if not name:
         return jsonify({'error': 'Nome não fornecido'}), 400
@@ -174,12 +316,66 @@ def api_contact_info_person():
     domains = [d.strip() for d in domains if d.strip()]
     
     try:
-        results = contact_info_osint.search_emails_for_person(name, domains if domains else None)
-        return jsonify(results)
+        return _run_or_enqueue('contact_info.person', contact_info_osint.search_emails_for_person, name,
+                               domains if domains else None, top_k=top_k, verify=verify)
     except Exception as e:
         logger.error(f"Erro na busca de e-mails por pessoa: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/contact_info/person/batch', methods=['POST'])
+def api_contact_info_person_batch():
+    """API para geração de e-mails candidatos de uma lista de pessoas (CSV), com saída em CSV ou Parquet."""
+    batch_id = request.form.get('batch_id') or uuid.uuid4().hex
+    output_format = request.form.get('format', 'csv').lower()
+    domains = [d.strip() for d in request.form.get('domains', '').split(',') if d.strip()]
+    people_file = request.files.get('people_file')
+    
+    if not re.fullmatch(r'[A-Za-z0-9_-]{1,64}', batch_id):
+        return jsonify({'error': 'Identificador de lote inválido'}), 400
+    
+    if output_format not in ('csv', 'parquet'):
+        return jsonify({'error': f'Formato de saída não suportado: {output_format}'}), 400
+    
+    if not people_file or not people_file.filename:
+        return jsonify({'error': 'Arquivo de pessoas não fornecido'}), 400
+    
+    try:
+        input_file = os.path.join(app.config['UPLOAD_FOLDER'], f"people_{batch_id}.csv")
+        people_file.save(input_file)
+        output_file = os.path.join(contact_info_osint.output_dir, 'emails', f"candidates_{batch_id}.{output_format}")
+        
+        def run_batch(progress_callback=None):
+            results = contact_info_osint.generate_email_candidates(
+                input_file, output_file, output_format, domains or None, progress_callback=progress_callback)
+            if 'error' not in results:
+                results['batch_id'] = batch_id
+            return results
+        
+        if _is_background_request():
+            return _run_or_enqueue('contact_info.person_batch', run_batch, with_progress=True)
+        
+        results = run_batch()
+        if 'error' not in results:
+            results['download_url'] = url_for('download_file', filename=output_file)
+        return jsonify(results)
+    except Exception as e:
+        logger.error(f"Erro na geração de e-mails candidatos em lote: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/contact_info/verify_emails', methods=['POST'])
+def api_contact_info_verify_emails():
+    """API para verificação de e-mails nos servidores MX dos domínios."""
+    emails = [e.strip() for e in re.split(r'[,\s]+', request.form.get('emails', '')) if e.strip()]
+    
+    if not emails:
+        return jsonify({'error': 'E-mails não fornecidos'}), 400
+    
+    try:
+        return _run_or_enqueue('contact_info.verify_emails', contact_info_osint.verify_emails, emails, with_progress=True)
+    except Exception as e:
+        logger.error(f"Erro na verificação de e-mails: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/contact_info/phone', methods=['POST'])
 def api_contact_info_phone():
     """API para busca de informações de telefone."""
@@ -189,12 +385,77 @@ def api_contact_info_phone():
         return jsonify({'error': 'Telefone não fornecido'}), 400
     
     try:
-        results = contact_info_osint.search_phone_info(phone)
-        return jsonify(results)
+        return _run_or_enqueue('contact_info.phone', contact_info_osint.search_phone_info, phone)
     except Exception as e:
         logger.error(f"Erro na busca de informações de telefone: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/contact_info/phone/batch', methods=['POST'])
+def api_contact_info_phone_batch():
+    """API para normalização e classificação de uma lista de telefones, com resultados transmitidos em JSONL."""
+    batch_id = request.form.get('batch_id') or uuid.uuid4().hex
+    default_country_code = request.form.get('default_country_code', '55').lstrip('+')
+    
+    if not re.fullmatch(r'[A-Za-z0-9_-]{1,64}', batch_id):
+        return jsonify({'error': 'Identificador de lote inválido'}), 400
+    
+    if not re.fullmatch(r'[0-9]{1,3}', default_country_code):
+        return jsonify({'error': f'Código de país inválido: {default_country_code}'}), 400
+    
+    phones_file = request.files.get('phones_file')
+    phones_text = request.form.get('phones', '')
+    
+    if not (phones_file and phones_file.filename) and not phones_text.strip():
+        return jsonify({'error': 'Lista de telefones não fornecida'}), 400
+    
+    try:
+        # Salvar a lista para que seja lida sob demanda, inclusive por tarefas em segundo plano
+        list_path = os.path.join(app.config['UPLOAD_FOLDER'], f"phones_{batch_id}.txt")
+        if phones_file and phones_file.filename:
+            phones_file.save(list_path)
+        else:
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write(phones_text.replace(',', '\n'))
+        
+        def iter_results():
+            with open(list_path, 'r', encoding='utf-8', errors='ignore') as f:
+                yield from contact_info_osint.classify_phone_numbers(f, default_country_code)
+        
+        if _is_background_request():
+            output_file = os.path.join(contact_info_osint.output_dir, 'phones', f"batch_{batch_id}.jsonl")
+            
+            def run_batch():
+                os.makedirs(os.path.dirname(output_file), exist_ok=True)
+                processed = valid = 0
+                with open(output_file, 'w', encoding='utf-8') as out:
+                    for result in iter_results():
+                        out.write(json.dumps(result, ensure_ascii=False) + '\n')
+                        processed += 1
+                        valid += result['valid']
+                return {'batch_id': batch_id, 'processed': processed, 'valid': valid, 'output_file': output_file}
+            
+            return _run_or_enqueue('contact_info.phone_batch', run_batch)
+        
+        def generate():
+            # Linhas agrupadas em blocos: um yield por número tornaria a transmissão o gargalo
+            lines = []
+            for result in iter_results():
+                lines.append(json.dumps(result, ensure_ascii=False) + '\n')
+                if len(lines) >= 1000:
+                    yield ''.join(lines)
+                    lines = []
+            if lines:
+                yield ''.join(lines)
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson',
+            headers={'X-Batch-Id': batch_id, 'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        logger.error(f"Erro na classificação de telefones em lote: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/contact_info/domain_analysis', methods=['POST'])
 def api_contact_info_domain_analysis():
     """API para análise de domínio."""
@@ -204,12 +465,102 @@ def api_contact_info_domain_analysis():
         return jsonify({'error': 'Domínio não fornecido'}), 400
     
     try:
-        results = contact_info_osint.analyze_domain(domain)
-        return jsonify(results)
+        return _run_or_enqueue('contact_info.domain_analysis', contact_info_osint.analyze_domain, domain)
     except Exception as e:
         logger.error(f"Erro na análise de domínio: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/contact_info/domain_analysis/batch', methods=['POST'])
+def api_contact_info_domain_analysis_batch():
+    """API para análise de uma lista de domínios, com resultados transmitidos em JSONL."""
+    batch_id = request.form.get('batch_id') or uuid.uuid4().hex
+    max_workers = request.form.get('max_workers', type=int)
+    
+    if not re.fullmatch(r'[A-Za-z0-9_-]{1,64}', batch_id):
+        return jsonify({'error': 'Identificador de lote inválido'}), 400
+    
+    # Cada domínio simultâneo ocupa threads do processo web: valores fora do limite são recusados
+    if max_workers is not None and not 1 <= max_workers <= contact_info_osint.max_batch_concurrency:
+        return jsonify({'error': f"max_workers deve estar entre 1 e {contact_info_osint.max_batch_concurrency}"}), 400
+    
+    domains_file = request.files.get('domains_file')
+    domains_text = request.form.get('domains', '')
+    
+    if not (domains_file and domains_file.filename) and not domains_text.strip():
+        return jsonify({'error': 'Lista de domínios não fornecida'}), 400
+    
+    try:
+        # Salvar a lista para que seja lida sob demanda, inclusive por tarefas em segundo plano
+        list_path = os.path.join(app.config['UPLOAD_FOLDER'], f"domains_{batch_id}.txt")
+        if domains_file and domains_file.filename:
+            domains_file.save(list_path)
+        else:
+            with open(list_path, 'w', encoding='utf-8') as f:
+                f.write(domains_text.replace(',', '\n'))
+        
+        output_file = os.path.join(contact_info_osint.output_dir, 'domains', f"batch_{batch_id}.jsonl")
+        
+        def iter_domains():
+            with open(list_path, 'r', encoding='utf-8', errors='ignore') as f:
+                for line in f:
+                    yield line
+        
+        if _is_background_request():
+            def run_batch(progress_callback=None):
+                processed = sum(1 for _ in contact_info_osint.analyze_domains(
+                    iter_domains(), output_file, max_workers=max_workers, progress_callback=progress_callback))
+                return {'batch_id': batch_id, 'processed': processed, 'output_file': output_file}
+            
+            return _run_or_enqueue('contact_info.domain_analysis_batch', run_batch, with_progress=True)
+        
+        def generate():
+            for result in contact_info_osint.analyze_domains(iter_domains(), output_file, max_workers=max_workers):
+                yield json.dumps(result, ensure_ascii=False, default=str) + '\n'
+        
+        return Response(
+            stream_with_context(generate()),
+            mimetype='application/x-ndjson',
+            headers={'X-Batch-Id': batch_id, 'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+        )
+    except Exception as e:
+        logger.error(f"Erro na análise de domínios em lote: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
+@app.route('/api/contact_info/export', methods=['GET'])
+def api_contact_info_export():
+    """API para exportação dos resultados gravados em CSV, JSONL ou Parquet, transmitida em blocos."""
+    search_type = request.args.get('type', 'emails')
+    output_format = request.args.get('format', 'csv').lower()
+    
+    try:
+        chunks = contact_info_osint.iter_export(
+            search_type,
+            output_format,
+            since=request.args.get('since') or None,
+            until=request.args.get('until') or None,
+            domain=request.args.get('domain') or None
+        )
+    except ImportError:
+        return jsonify({'error': 'Biblioteca pyarrow não está instalada.'}), 500
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    filename = f"{search_type}_{datetime.datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format}"
+    return Response(
+        stream_with_context(chunks),
+        mimetype=EXPORT_MIMETYPES[output_format],
+        headers={'Content-Disposition': f'attachment; filename="{filename}"', 'X-Accel-Buffering': 'no'}
+    )
+
+@app.route('/api/contact_info/cache_stats', methods=['GET'])
+def api_contact_info_cache_stats():
+    """API para estatísticas dos caches do módulo de informações de contato."""
+    try:
+        return jsonify(contact_info_osint.get_cache_stats())
+    except Exception as e:
+        logger.error(f"Erro ao obter estatísticas de cache: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/image_recognition/detect_faces', methods=['POST'])
 def api_image_recognition_detect_faces():
     """API para detecção de faces em imagens."""
@@ -228,13 +579,7 @@ def api_image_recognition_detect_faces():
         image_file.save(image_path)
         
         # Detectar faces
-        results = image_recognition_osint.detect_faces(image_path)
-        
-        # Adicionar caminho da imagem para exibição
-        if 'result_image' in results and results['result_image']:
-            results['display_image'] = results['result_image']
-        
-        return jsonify(results)
+        return _run_or_enqueue('image_recognition.detect_faces', _with_display_image(image_recognition_osint.detect_faces), image_path)
     except Exception as e:
         logger.error(f"Erro na detecção de faces: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -257,13 +602,7 @@ def api_image_recognition_detect_objects():
         image_file.save(image_path)
         
         # Detectar objetos
-        results = image_recognition_osint.detect_objects(image_path)
-        
-        # Adicionar caminho da imagem para exibição
-        if 'result_image' in results and results['result_image']:
-            results['display_image'] = results['result_image']
-        
-        return jsonify(results)
+        return _run_or_enqueue('image_recognition.detect_objects', _with_display_image(image_recognition_osint.detect_objects), image_path)
     except Exception as e:
         logger.error(f"Erro na detecção de objetos: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -286,9 +625,7 @@ def api_image_recognition_analyze_colors():
         image_file.save(image_path)
         
         # Analisar cores
-        results = image_recognition_osint.analyze_image_colors(image_path)
-        
-        return jsonify(results)
+        return _run_or_enqueue('image_recognition.analyze_colors', image_recognition_osint.analyze_image_colors, image_path)
     except Exception as e:
         logger.error(f"Erro na análise de cores: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -314,9 +651,7 @@ def api_image_recognition_compare_faces():
         image2_file.save(image2_path)
         
         # Comparar faces
-        results = image_recognition_osint.compare_faces(image1_path, image2_path)
-        
-        return jsonify(results)
+        return _run_or_enqueue('image_recognition.compare_faces', image_recognition_osint.compare_faces, image1_path, image2_path)
     except Exception as e:
         logger.error(f"Erro na comparação de faces: {str(e)}")
         return jsonify({'error': str(e)}), 500
@@ -339,13 +674,31 @@ def api_metadata_analysis_analyze_file():
         file.save(file_path)
         
         # Analisar metadados
-        results = metadata_analysis_osint.analyze_file(file_path)
-        
-        return jsonify(results)
+        return _run_or_enqueue('metadata_analysis.analyze_file', metadata_analysis_osint.analyze_file, file_path)
     except Exception as e:
         logger.error(f"Erro na análise de metadados: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/metadata_analysis/analyze_directory', methods=['POST'])
+def api_metadata_analysis_analyze_directory():
+    """API para análise de metadados de um conjunto de arquivos."""
+    files = [f for f in request.files.getlist('files') if f.filename]
+    
+    if not files:
+        return jsonify({'error': 'Nenhum arquivo enviado'}), 400
+    
+    try:
+        # Salvar arquivos temporariamente em um mesmo diretório
+        temp_dir = tempfile.mkdtemp(dir=app.config['UPLOAD_FOLDER'])
+        for file in files:
+            file.save(os.path.join(temp_dir, os.path.basename(file.filename)))
+        
+        # Analisar metadados do diretório
+        return _run_or_enqueue('metadata_analysis.analyze_directory', metadata_analysis_osint.analyze_directory, temp_dir, with_progress=True)
+    except Exception as e:
+        logger.error(f"Erro na análise de metadados do diretório: {str(e)}")
+        return jsonify({'error': str(e)}), 500
+
 @app.route('/api/metadata_analysis/export_csv', methods=['POST'])
 def api_metadata_analysis_export_csv():
     """API para exportação de resultados para CSV."""
@@ -366,6 +719,56 @@ def api_metadata_analysis_export_csv():
         logger.error(f"Erro na exportação para CSV: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/jobs', methods=['GET'])
+def api_jobs():
+    """API para listagem das tarefas em segundo plano."""
+    return jsonify({'jobs': job_manager.list_jobs()})
+
+@app.route('/api/jobs/<job_id>', methods=['GET'])
+def api_job_status(job_id):
+    """API para consulta do estado de uma tarefa em segundo plano."""
+    job = job_manager.get(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Tarefa não encontrada'}), 404
+    
+    return jsonify(job.to_dict())
+
+@app.route('/api/jobs/<job_id>/result', methods=['GET'])
+def api_job_result(job_id):
+    """API para obtenção do resultado de uma tarefa em segundo plano."""
+    job = job_manager.get(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Tarefa não encontrada'}), 404
+    
+    if not job.done:
+        return jsonify(job.to_dict()), 202
+    
+    return jsonify(job.to_dict(include_result=True))
+
+@app.route('/api/jobs/<job_id>/events', methods=['GET'])
+def api_job_events(job_id):
+    """API para acompanhamento do progresso de uma tarefa via Server-Sent Events."""
+    job = job_manager.get(job_id)
+    
+    if not job:
+        return jsonify({'error': 'Tarefa não encontrada'}), 404
+    
+    # Permitir que o navegador retome o fluxo a partir do último evento recebido
+    last_event_id = request.headers.get('Last-Event-ID', request.args.get('after', '0'))
+    after = int(last_event_id) if str(last_event_id).isdigit() else 0
+    
+    def generate():
+        for event in job.iter_events(after=after):
+            yield format_sse(event)
+    
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
+
 @app.route('/download/<path:filename>')
 def download_file(filename):
     """Rota para download de arquivos."""
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Interface de Linha de Comando para Ferramenta OSINT
+Este módulo permite executar processamentos em lote dos módulos OSINT sem a interface web.
+"""
+
+import os
+import sys
+import json
+import time
+import logging
+import argparse
+from typing import List, Optional
+
+# Importar módulos OSINT
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from modules.contact_info import ContactInfoOSINT
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_cli')
+
+
+def _iter_lines(path: str):
+    """
+    Lê um arquivo de entrada linha a linha ('-' para a entrada padrão).
+
+    Args:
+        path: Caminho do arquivo
+
+    Yields:
+        Linhas do arquivo
+    """
+    if path == '-':
+        yield from sys.stdin
+        return
+
+    with open(path, 'r', encoding='utf-8', errors='ignore') as f:
+        yield from f
+
+
+def cmd_domains(args: argparse.Namespace) -> int:
+    """
+    Executa a análise de domínios em lote.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Código de saída
+    """
+    osint = ContactInfoOSINT(output_dir=args.results_dir)
+    start = time.monotonic()
+    processed = 0
+    errors = 0
+
+    for result in osint.analyze_domains(_iter_lines(args.input), args.output,
+                                        max_workers=args.workers, resume=not args.no_resume):
+        processed += 1
+        if 'error' in result:
+            errors += 1
+        if args.print:
+            print(json.dumps(result, ensure_ascii=False, default=str), flush=True)
+
+    elapsed = time.monotonic() - start
+    logger.info(f"{processed} domínios analisados em {elapsed:.1f}s ({errors} com erro). Resultados em {args.output}")
+    return 0
+
+
+def cmd_emails(args: argparse.Namespace) -> int:
+    """
+    Gera e-mails candidatos para uma lista de pessoas.
+
+    Args:
+        args: Argumentos da linha de comando
+        
+    Returns:
+        Código de saída
+    """
+    osint = ContactInfoOSINT(output_dir=args.results_dir)
+    output_file = args.output or f"candidates.{args.format}"
+    domains = [d.strip() for d in (args.domains or '').split(',') if d.strip()]
+
+    results = osint.generate_email_candidates(args.input, output_file, args.format, domains or None,
+                                              chunk_size=args.chunk_size)
+
+    if 'error' in results:
+        logger.error(results['error'])
+        return 1
+
+    logger.info(f"{results['candidates']} e-mails candidatos para {results['people']} pessoas em "
+                f"{results['elapsed_seconds']}s. Resultados em {results['output_file']}")
+    return 0
+
+
+def cmd_phones(args: argparse.Namespace) -> int:
+    """
+    Normaliza e classifica a coluna de telefones de um CSV.
+
+    Args:
+        args: Argumentos da linha de comando
+
+    Returns:
+        Código de saída
+    """
+    osint = ContactInfoOSINT(output_dir=args.results_dir)
+    results = osint.enrich_phone_numbers(args.input, args.output, column=args.column,
+                                         default_country_code=args.country_code.lstrip('+'),
+                                         chunk_size=args.chunk_size)
+
+    if 'error' in results:
+        logger.error(results['error'])
+        return 1
+
+    logger.info(f"{results['rows']} linhas, {results['unique']} números distintos ({results['invalid']} inválidos, "
+                f"{results['duplicates']} repetidos) em {results['elapsed_seconds']}s "
+                f"({results['rows_per_second']} linhas/s). Resultados em {results['output_file']}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Cria o analisador de argumentos da linha de comando.
+
+    Returns:
+        Analisador de argumentos
+    """
+    parser = argparse.ArgumentParser(description='Ferramenta OSINT - processamento em lote')
+    parser.add_argument('--results-dir', default='resultados', help='Diretório base dos resultados (padrão: resultados)')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    domains = subparsers.add_parser('domains', help='Analisa uma lista de domínios (um por linha)')
+    domains.add_argument('input', help="Arquivo com os domínios ('-' para a entrada padrão)")
+    domains.add_argument('-o', '--output', default='domains.jsonl', help='Arquivo JSONL de saída (padrão: domains.jsonl)')
+    domains.add_argument('-w', '--workers', type=int, default=8, help='Domínios analisados simultaneamente (padrão: 8)')
+    domains.add_argument('--no-resume', action='store_true', help='Reprocessa todos os domínios, sobrescrevendo a saída')
+    domains.add_argument('--print', action='store_true', help='Também imprime cada resultado na saída padrão')
+    domains.set_defaults(func=cmd_domains)
+
+    emails = subparsers.add_parser('emails', help='Gera e-mails candidatos para uma lista de pessoas (CSV)')
+    emails.add_argument('input', help="CSV com a coluna 'name' e, opcionalmente, 'domains' (separados por ';')")
+    emails.add_argument('-o', '--output', help='Arquivo de saída (padrão: candidates.<formato>)')
+    emails.add_argument('-f', '--format', choices=['csv', 'parquet'], default='csv', help='Formato da saída (padrão: csv)')
+    emails.add_argument('-d', '--domains', help='Domínios, separados por vírgula, para as linhas sem domínio')
+    emails.add_argument('--chunk-size', type=int, default=10000, help='Pessoas processadas por bloco (padrão: 10000)')
+    emails.set_defaults(func=cmd_emails)
+
+    phones = subparsers.add_parser('phones', help='Normaliza e classifica a coluna de telefones de um CSV')
+    phones.add_argument('input', help="CSV com uma coluna de telefones ('phone', 'telefone', 'celular'...)")
+    phones.add_argument('-o', '--output', default='phones.csv', help='CSV de saída (padrão: phones.csv)')
+    phones.add_argument('-c', '--column', help='Nome da coluna de telefones (padrão: detectada pelo cabeçalho)')
+    phones.add_argument('--country-code', default='55', help='Código do país dos números sem código (padrão: 55)')
+    phones.add_argument('--chunk-size', type=int, default=50000, help='Linhas processadas por bloco (padrão: 50000)')
+    phones.set_defaults(func=cmd_phones)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada da linha de comando.
+
+    Args:
+        argv: Argumentos (padrão: sys.argv)
+
+    Returns:
+        Código de saída
+    """
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Cache Persistente para Ferramenta OSINT
+Este módulo implementa um cache em dois níveis: um LRU em memória para acessos repetidos no mesmo
+processo e um armazenamento SQLite em disco, com tempo de expiração e limite de entradas.
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_cache')
+
+
+class PersistentCache:
+    """Cache chave-valor com TTL, nível LRU em memória e nível SQLite em disco."""
+
+    def __init__(self, db_path: str, ttl: float = 86400, max_entries: int = 10000, memory_items: int = 256):
+        """
+        Inicializa o cache.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+            ttl: Tempo de validade das entradas em segundos
+            max_entries: Número máximo de entradas mantidas em disco
+            memory_items: Número máximo de entradas mantidas no LRU em memória
+        """
+        self.db_path = db_path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.memory_items = memory_items
+        self._memory: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'memory_hits': 0, 'disk_hits': 0, 'misses': 0, 'expired': 0, 'evictions': 0}
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS cache ("
+            "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_cache_accessed ON cache (accessed_at)")
+        self._conn.commit()
+
+    def get(self, key: str) -> Optional[Any]:
+        """
+        Obtém um valor do cache.
+
+        Args:
+            key: Chave consultada
+
+        Returns:
+            Valor armazenado ou None se ausente ou expirado
+        """
+        now = time.time()
+
+        with self._lock:
+            # Nível 1: LRU em memória
+            entry = self._memory.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > now:
+                    self._memory.move_to_end(key)
+                    self._stats['memory_hits'] += 1
+                    return value
+                del self._memory[key]
+
+            # Nível 2: SQLite em disco
+            row = self._conn.execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,)).fetchone()
+
+            if row is None:
+                self._stats['misses'] += 1
+                return None
+
+            value_json, expires_at = row
+            if expires_at <= now:
+                self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+                self._conn.commit()
+                self._stats['expired'] += 1
+                self._stats['misses'] += 1
+                return None
+
+            self._conn.execute("UPDATE cache SET accessed_at = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+
+            value = json.loads(value_json)
+            self._remember(key, expires_at, value)
+            self._stats['disk_hits'] += 1
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> Any:
+        """
+        Armazena um valor no cache.
+
+        Args:
+            key: Chave do valor
+            value: Valor serializável em JSON
+            ttl: Tempo de validade específico em segundos (opcional)
+
+        Returns:
+            Valor na forma armazenada (após serialização em JSON)
+        """
+        now = time.time()
+        expires_at = now + (self.ttl if ttl is None else ttl)
+        value_json = json.dumps(value, ensure_ascii=False, default=str)
+
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value_json, expires_at, now)
+            )
+            self._evict()
+            self._conn.commit()
+            # Guardar a forma desserializada, igual à que uma leitura do disco devolveria
+            stored_value = json.loads(value_json)
+            self._remember(key, expires_at, stored_value)
+
+        return stored_value
+
+    def delete(self, key: str):
+        """
+        Remove uma entrada do cache.
+
+        Args:
+            key: Chave a ser removida
+        """
+        with self._lock:
+            self._memory.pop(key, None)
+            self._conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            self._conn.commit()
+
+    def clear(self):
+        """Remove todas as entradas do cache."""
+        with self._lock:
+            self._memory.clear()
+            self._conn.execute("DELETE FROM cache")
+            self._conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de uso do cache.
+
+        Returns:
+            Dicionário com acertos, falhas, taxa de acerto e tamanho do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['disk_entries'] = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+            stats['memory_entries'] = len(self._memory)
+
+        hits = stats['memory_hits'] + stats['disk_hits']
+        lookups = hits + stats['misses']
+        stats['hits'] = hits
+        stats['lookups'] = lookups
+        stats['hit_ratio'] = round(hits / lookups, 4) if lookups else 0.0
+        stats['ttl'] = self.ttl
+        stats['max_entries'] = self.max_entries
+        return stats
+
+    def close(self):
+        """Fecha a conexão com o banco SQLite."""
+        with self._lock:
+            self._conn.close()
+
+    def _remember(self, key: str, expires_at: float, value: Any):
+        """
+        Armazena uma entrada no LRU em memória, descartando a menos usada se necessário.
+
+        Args:
+            key: Chave do valor
+            expires_at: Instante de expiração (epoch)
+            value: Valor armazenado
+        """
+        if self.memory_items <= 0:
+            return
+
+        self._memory[key] = (expires_at, value)
+        self._memory.move_to_end(key)
+
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
+    def _evict(self):
+        """Remove entradas expiradas e, se necessário, as menos acessadas além do limite em disco."""
+        self._conn.execute("DELETE FROM cache WHERE expires_at <= ?", (time.time(),))
+
+        count = self._conn.execute("SELECT COUNT(*) FROM cache").fetchone()[0]
+        excess = count - self.max_entries
+
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM cache WHERE key IN (SELECT key FROM cache ORDER BY accessed_at ASC LIMIT ?)",
+                (excess,)
+            )
+            self._stats['evictions'] += excess
@@ -0,0 +1,359 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Pool de Clientes Autenticados para Ferramenta OSINT
+Este módulo cria uma única vez os clientes das APIs de redes sociais (tweepy e Instaloader), guarda as
+sessões do Instagram em disco para evitar novos logins, recria os clientes quando as credenciais mudam
+e os empresta com segurança a requisições simultâneas.
+"""
+
+import os
+import queue
+import hashlib
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Dict, List, Any, Optional, Tuple, Iterator
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_client_pool')
+
+# Variáveis de ambiente com as credenciais de cada rede; conjuntos adicionais usam um sufixo
+# (ex: TWITTER_API_KEY_2, TWITTER_API_SECRET_2...), identificado pelo nome do conjunto ('2')
+DEFAULT_CREDENTIAL = 'default'
+CREDENTIAL_VARIABLES = {
+    'twitter': ('TWITTER_API_KEY', 'TWITTER_API_SECRET', 'TWITTER_ACCESS_TOKEN', 'TWITTER_ACCESS_SECRET'),
+    'instagram': ('INSTAGRAM_USERNAME', 'INSTAGRAM_PASSWORD')
+}
+
+# Erros das bibliotecas que indicam credenciais recusadas ou sessão expirada (identificados pelo nome da classe)
+AUTH_ERRORS = ('Unauthorized', 'LoginRequiredException', 'BadCredentialsException', 'TwoFactorAuthRequiredException')
+
+
+def is_auth_error(error: Exception) -> bool:
+    """
+    Identifica um erro de autenticação das APIs de redes sociais.
+
+    Args:
+        error: Exceção lançada pela biblioteca da rede
+
+    Returns:
+        True se as credenciais foram recusadas ou a sessão expirou
+    """
+    status_code = getattr(getattr(error, 'response', None), 'status_code', None)
+    return type(error).__name__ in AUTH_ERRORS or status_code == 401
+
+
+class ClientPool:
+    """Pool de clientes autenticados por rede social, criados sob demanda e reaproveitados."""
+
+    def __init__(self, session_dir: str, max_clients: int = 2, acquire_timeout: float = 60.0,
+                 request_timeout: float = 30.0):
+        """
+        Inicializa o pool.
+
+        Args:
+            session_dir: Diretório dos arquivos de sessão do Instagram
+            max_clients: Número máximo de clientes de cada rede (requisições simultâneas por rede)
+            acquire_timeout: Tempo máximo de espera por um cliente livre, em segundos
+            request_timeout: Tempo limite de cada requisição HTTP dos clientes criados, em segundos
+        """
+        self.session_dir = session_dir
+        self.max_clients = max_clients
+        self.acquire_timeout = acquire_timeout
+        self.request_timeout = request_timeout
+        self._builders = {'twitter': self._build_twitter, 'instagram': self._build_instagram}
+        # Clientes livres e número de clientes criados, por (rede, conjunto de credenciais)
+        self._idle: Dict[Tuple[str, str], "queue.LifoQueue[Tuple[str, Any]]"] = {}
+        self._created: Dict[Tuple[str, str], int] = {}
+        self._lock = threading.Lock()
+        self._stats = {'created': 0, 'reused': 0, 'discarded': 0, 'logins': 0, 'sessions_loaded': 0}
+
+        if not os.path.exists(session_dir):
+            os.makedirs(session_dir)
+
+    def credentials(self, network: str, credential: str = DEFAULT_CREDENTIAL) -> Optional[Tuple[str, ...]]:
+        """
+        Lê as credenciais atuais de uma rede (variáveis de ambiente em CREDENTIAL_VARIABLES).
+
+        Args:
+            network: Nome da rede social
+            credential: Nome do conjunto de credenciais ('default' ou o sufixo das variáveis)
+
+        Returns:
+            Tupla de credenciais ou None se alguma estiver ausente
+        """
+        suffix = '' if credential == DEFAULT_CREDENTIAL else f"_{credential}"
+        values = tuple(os.environ.get(variable + suffix) for variable in CREDENTIAL_VARIABLES[network])
+        return values if all(values) else None
+
+    def has_credentials(self, network: str, credential: str = DEFAULT_CREDENTIAL) -> bool:
+        """
+        Verifica se as credenciais de uma rede estão configuradas.
+
+        Args:
+            network: Nome da rede social
+            credential: Nome do conjunto de credenciais
+
+        Returns:
+            True se todas as credenciais estão presentes
+        """
+        return self.credentials(network, credential) is not None
+
+    def credential_names(self, network: str) -> List[str]:
+        """
+        Lista os conjuntos de credenciais completos configurados para uma rede.
+
+        Args:
+            network: Nome da rede social
+
+        Returns:
+            Nomes dos conjuntos ('default' primeiro, depois os sufixos em ordem)
+        """
+        prefix = CREDENTIAL_VARIABLES[network][0] + '_'
+        suffixes = sorted(variable[len(prefix):] for variable in os.environ if variable.startswith(prefix))
+        names = [DEFAULT_CREDENTIAL] + [suffix for suffix in suffixes if suffix]
+        return [name for name in names if self.has_credentials(network, name)]
+
+    @contextmanager
+    def acquire(self, network: str, credential: str = DEFAULT_CREDENTIAL,
+                timeout: Optional[float] = None) -> Iterator[Any]:
+        """
+        Empresta um cliente de uma rede, devolvendo-o ao pool ao final do bloco.
+
+        Um cliente livre é reaproveitado se foi criado com as credenciais atuais; clientes de
+        credenciais antigas são descartados. Sem cliente livre, um novo é criado até max_clients;
+        acima disso, a chamada aguarda a devolução de um cliente. Se o bloco termina com um erro
+        de autenticação (sessão expirada, credenciais recusadas), o cliente não volta ao pool e
+        os demais clientes da rede são renovados (ver refresh).
+
+        Args:
+            network: Nome da rede social ('twitter' ou 'instagram')
+            credential: Nome do conjunto de credenciais
+            timeout: Tempo máximo de espera por um cliente livre (padrão: acquire_timeout)
+
+        Yields:
+            Cliente da rede (tweepy.API ou instaloader.Instaloader)
+
+        Raises:
+            ValueError: Se a rede não é suportada
+            TimeoutError: Se nenhum cliente ficou livre a tempo
+        """
+        if network not in self._builders:
+            raise ValueError(f"Rede não suportada pelo pool de clientes: {network}")
+
+        key = (network, credential)
+        with self._lock:
+            if key not in self._idle:
+                self._idle[key] = queue.LifoQueue()
+                self._created[key] = 0
+
+        fingerprint, client = self._checkout(key, self.acquire_timeout if timeout is None else timeout)
+        try:
+            yield client
+        except Exception as e:
+            if is_auth_error(e):
+                logger.warning(f"Autenticação de {network} ({credential}) recusada: {str(e)}. Renovando clientes.")
+                client = None
+                self._discard(key)
+                self.refresh(network, credential)
+            raise
+        finally:
+            if client is not None:
+                self._idle[key].put((fingerprint, client))
+
+    def refresh(self, network: str, credential: str = DEFAULT_CREDENTIAL):
+        """
+        Descarta os clientes livres de uma rede; os próximos empréstimos criam clientes novos.
+
+        A sessão do Instagram salva em disco também é apagada, para que o próximo cliente faça login.
+
+        Args:
+            network: Nome da rede social
+            credential: Nome do conjunto de credenciais
+        """
+        key = (network, credential)
+        while key in self._idle:
+            try:
+                self._idle[key].get_nowait()
+            except queue.Empty:
+                break
+            self._discard(key)
+
+        credentials = self.credentials(network, credential)
+        if network == 'instagram' and credentials:
+            session_file = self._session_file(credentials[0])
+            if os.path.exists(session_file):
+                os.remove(session_file)
+                logger.info(f"Sessão do Instagram removida: {session_file}")
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de uso do pool.
+
+        Returns:
+            Dicionário com clientes criados, reaproveitados e descartados, logins e sessões carregadas
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['clients'] = {f"{network}/{credential}": count for (network, credential), count in self._created.items()}
+            stats['idle'] = {f"{network}/{credential}": idle.qsize() for (network, credential), idle in self._idle.items()}
+        return stats
+
+    def _checkout(self, key: Tuple[str, str], timeout: float) -> Tuple[str, Any]:
+        """
+        Obtém um cliente livre com as credenciais atuais, criando-o se houver vaga no pool.
+
+        Args:
+            key: Tupla (rede, conjunto de credenciais)
+            timeout: Tempo máximo de espera por um cliente livre
+
+        Returns:
+            Tupla (impressão digital das credenciais, cliente)
+        """
+        network, credential = key
+        credentials = self.credentials(network, credential)
+        fingerprint = self._fingerprint(credentials)
+        idle = self._idle[key]
+
+        while True:
+            try:
+                client_fingerprint, client = idle.get_nowait()
+            except queue.Empty:
+                break
+
+            if client_fingerprint == fingerprint:
+                with self._lock:
+                    self._stats['reused'] += 1
+                return fingerprint, client
+
+            # Credenciais alteradas desde a criação do cliente
+            logger.info(f"Credenciais de {network} ({credential}) alteradas: descartando cliente antigo")
+            self._discard(key)
+
+        with self._lock:
+            can_create = self._created[key] < self.max_clients
+            if can_create:
+                # Reservar a vaga antes de criar o cliente, que pode demorar (login)
+                self._created[key] += 1
+
+        if can_create:
+            try:
+                client = self._builders[network](credentials)
+            except Exception:
+                with self._lock:
+                    self._created[key] -= 1
+                raise
+
+            with self._lock:
+                self._stats['created'] += 1
+            logger.info(f"Cliente de {network} ({credential}) criado ({self._created[key]}/{self.max_clients})")
+            return fingerprint, client
+
+        try:
+            client_fingerprint, client = idle.get(timeout=timeout)
+        except queue.Empty:
+            raise TimeoutError(f"Nenhum cliente de {network} ({credential}) disponível em {timeout}s")
+
+        if client_fingerprint != fingerprint:
+            self._discard(key)
+            return self._checkout(key, timeout)
+
+        with self._lock:
+            self._stats['reused'] += 1
+        return fingerprint, client
+
+    def _discard(self, key: Tuple[str, str]):
+        """Libera a vaga de um cliente descartado."""
+        with self._lock:
+            self._created[key] -= 1
+            self._stats['discarded'] += 1
+
+    def _session_file(self, username: str) -> str:
+        """Caminho do arquivo de sessão do Instagram de um usuário."""
+        return os.path.join(self.session_dir, f"instagram_{username.lower()}.session")
+
+    @staticmethod
+    def _fingerprint(credentials: Optional[Tuple[str, ...]]) -> str:
+        """Identifica um conjunto de credenciais sem mantê-las em texto nas filas do pool."""
+        if credentials is None:
+            return ''
+        return hashlib.sha256('\0'.join(credentials).encode('utf-8')).hexdigest()
+
+    def _build_twitter(self, credentials: Optional[Tuple[str, ...]]) -> Any:
+        """
+        Cria um cliente da API do Twitter.
+
+        Args:
+            credentials: Chave e segredo da API, token e segredo de acesso
+
+        Returns:
+            Cliente tweepy.API
+        """
+        import tweepy
+
+        if credentials is None:
+            raise ValueError("Credenciais da API do Twitter não encontradas")
+
+        api_key, api_secret, access_token, access_secret = credentials
+        auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_secret)
+        return tweepy.API(auth, timeout=self.request_timeout)
+
+    def _build_instagram(self, credentials: Optional[Tuple[str, ...]]) -> Any:
+        """
+        Cria um cliente do Instagram, reaproveitando a sessão salva em disco quando existir.
+
+        Sem credenciais, o cliente é anônimo. Com credenciais, a sessão salva é carregada e
+        o login só é feito se ela não existir ou estiver corrompida; a nova sessão é então salva.
+
+        Args:
+            credentials: Usuário e senha do Instagram
+
+        Returns:
+            Cliente instaloader.Instaloader
+
+        Raises:
+            Exception: Erro do Instaloader se o login falhar; um cliente anônimo não é guardado
+                no lugar do autenticado
+        """
+        import instaloader
+
+        # O padrão do Instaloader (300s por requisição) prenderia o cliente muito além do prazo das buscas
+        loader = instaloader.Instaloader(request_timeout=self.request_timeout)
+
+        if credentials is None:
+            logger.warning("Credenciais do Instagram não encontradas. Continuando sem login.")
+            return loader
+
+        username, password = credentials
+        session_file = self._session_file(username)
+
+        if os.path.exists(session_file):
+            try:
+                loader.load_session_from_file(username, session_file)
+                with self._lock:
+                    self._stats['sessions_loaded'] += 1
+                logger.info(f"Sessão do Instagram carregada de {session_file}")
+                return loader
+            except Exception as e:
+                logger.warning(f"Sessão do Instagram inválida ({str(e)}). Realizando novo login.")
+
+        try:
+            loader.login(username, password)
+        except Exception as e:
+            logger.error(f"Falha no login do Instagram: {str(e)}")
+            raise
+
+        with self._lock:
+            self._stats['logins'] += 1
+        loader.save_session_to_file(session_file)
+        # O arquivo de sessão equivale a uma credencial
+        os.chmod(session_file, 0o600)
+        logger.info("Login no Instagram realizado com sucesso")
+
+        return loader
@@ -9,15 +9,31 @@ Este módulo permite coletar e-mails, números de telefone e outras informaçõe
 import os
 import re
 import json
-import time
 import logging
-import requests
 import socket
+import time
 import whois
-import pandas as pd
-from bs4 import BeautifulSoup
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union, Set, Tuple
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Optional, Union, Set, Tuple, Callable, Iterable, Iterator
+from modules.crawler import AsyncCrawler
+from modules.http_client import HTTPClient
+from modules.rate_limiter import RateLimiter
+from modules.cache import PersistentCache
+from modules.http_cache import HTTPResponseCache
+from modules.dns_resolver import DNSResolver
+from modules.email_candidates import (
+    normalize_name, name_variations, read_people, parse_domains, candidates_frame, CandidateWriter
+)
+from modules.email_patterns import EmailPatternInference, TEMPLATE_LABELS
+from modules.email_verifier import EmailVerifier
+from modules.result_export import (
+    EXPORT_COLUMNS, EXPORT_FORMATS, iter_export_rows, iter_export_chunks, write_export, parse_date_bound
+)
+from modules.phone_codes import (
+    normalize_phone_number, lookup_country, classify_phone_numbers, classify_phone_frame, read_phone_column,
+    CLASSIFICATION_COLUMNS
+)
 
 # Configuração de logging
 logging.basicConfig(
@@ -26,15 +42,44 @@ logging.basicConfig(
 )
 logger = logging.getLogger('osint_contact_info')
 
+# O tldextract traz um instantâneo da Public Suffix List; sem ele, usa-se a lista parcial abaixo
+try:
+    import tldextract
+    # Sem URLs de atualização, apenas o instantâneo embutido no pacote é usado (nenhum acesso à rede)
+    TLD_EXTRACTOR = tldextract.TLDExtract(suffix_list_urls=(), cache_dir=None)
+    TLDEXTRACT_AVAILABLE = True
+except ImportError:
+    TLD_EXTRACTOR = None
+    TLDEXTRACT_AVAILABLE = False
+
+# Sufixos públicos de um único rótulo sem sufixos de dois rótulos abaixo deles (usados sem o tldextract)
+SINGLE_LABEL_SUFFIXES = {
+    'com', 'net', 'org', 'info', 'biz', 'edu', 'gov', 'mil', 'int', 'name', 'pro', 'mobi', 'app', 'dev',
+    'online', 'site', 'store', 'tech', 'xyz', 'shop', 'blog', 'cloud'
+}
+
+# Sufixos públicos com mais de um rótulo (ex: 'com.br'), usados para obter o domínio registrável sem o tldextract
+MULTI_LABEL_SUFFIXES = {
+    'com.br', 'net.br', 'org.br', 'gov.br', 'edu.br', 'art.br', 'blog.br', 'eng.br', 'ind.br', 'inf.br', 'jus.br', 'leg.br', 'mil.br',
+    'co.uk', 'org.uk', 'ac.uk', 'gov.uk', 'ltd.uk', 'plc.uk', 'me.uk',
+    'com.pt', 'gov.pt', 'org.pt', 'edu.pt',
+    'com.ar', 'com.mx', 'com.co', 'com.pe', 'com.uy', 'com.py', 'com.bo', 'com.ec', 'com.ve', 'cl.cl',
+    'com.au', 'net.au', 'org.au', 'edu.au', 'gov.au',
+    'co.jp', 'ne.jp', 'or.jp', 'ac.jp', 'go.jp',
+    'co.nz', 'org.nz', 'co.za', 'org.za', 'co.in', 'net.in', 'org.in',
+    'com.cn', 'net.cn', 'org.cn', 'com.hk', 'com.sg', 'com.tw', 'co.kr', 'com.tr', 'com.es', 'com.fr'
+}
+
 class ContactInfoOSINT:
     """Classe principal para busca de e-mails e informações de contato."""
     
-    def __init__(self, output_dir: str = "resultados"):
+    def __init__(self, output_dir: str = "resultados", http_client: Optional[HTTPClient] = None):
         """
         Inicializa o módulo de busca de e-mails e informações de contato.
         
         Args:
             output_dir: Diretório para salvar os resultados
+            http_client: Cliente HTTP compartilhado (opcional; um novo é criado se ausente)
         """
         self.output_dir = output_dir
         self._setup_directories()
@@ -42,6 +87,50 @@ class ContactInfoOSINT:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
         }
+        # Cache persistente de consultas WHOIS, indexado pelo domínio registrável
+        self.whois_cache = PersistentCache(
+            os.path.join(self.output_dir, 'cache', 'whois.sqlite3'),
+            ttl=24 * 3600,
+            max_entries=10000,
+            memory_items=512
+        )
+        # Modelo de padrões de e-mail por domínio, aprendido dos e-mails encontrados nos rastreamentos
+        self.pattern_inference = EmailPatternInference(PersistentCache(
+            os.path.join(self.output_dir, 'cache', 'email_patterns.sqlite3'),
+            ttl=30 * 24 * 3600,
+            max_entries=50000,
+            memory_items=512
+        ))
+        # Cache em disco das páginas rastreadas, revalidadas por requisições condicionais
+        self.http_cache = HTTPResponseCache(
+            os.path.join(self.output_dir, 'cache', 'http.sqlite3'),
+            max_bytes=200 * 1024 * 1024
+        )
+        # Resolvedor DNS com cache, compartilhado pela análise de domínios e pelo crawler
+        self.dns_resolver = DNSResolver()
+        # Verificação de e-mails por MX e SMTP, com o resultado da detecção de catch-all em cache por domínio
+        self.email_verifier = EmailVerifier(
+            dns_resolver=self.dns_resolver,
+            cache=PersistentCache(os.path.join(self.output_dir, 'cache', 'smtp.sqlite3'), ttl=7 * 24 * 3600)
+        )
+        # Configuração do crawler de websites
+        self.crawl_concurrency = 5
+        # Tempo limite (segundos) de cada sonda da análise de domínio e da análise completa
+        self.probe_timeouts = {'whois': 10.0, 'dns': 5.0, 'http': 10.0, 'ssl': 5.0}
+        self.domain_analysis_timeout = 12.0
+        # Número padrão de domínios analisados simultaneamente na análise em lote
+        self.batch_concurrency = 8
+        # Limite da concorrência pedida pelo chamador: cada domínio ocupa uma thread do lote e até 8 de sondas
+        self.max_batch_concurrency = 32
+        # Pool de threads compartilhado pelas sondas das análises avulsas (4 sondas por domínio); a folga cobre
+        # sondas que ainda terminam seu próprio tempo limite depois que a análise deixou de esperá-las
+        self.probe_executor = ThreadPoolExecutor(max_workers=8 * self.batch_concurrency, thread_name_prefix='osint-probe')
+        # Sessão HTTP com pool de conexões e limite de requisições por host, reutilizada por todas as buscas
+        self.http = http_client or HTTPClient(
+            headers=self.headers,
+            pool_maxsize=max(10, self.crawl_concurrency),
+            rate_limiter=RateLimiter(default_rate=4.0)
+        )
         logger.info("Módulo de busca de e-mails e informações de contato inicializado")
     
     def _setup_directories(self):
@@ -51,19 +140,23 @@ class ContactInfoOSINT:
             logger.info(f"Diretório de resultados criado: {self.output_dir}")
         
         # Diretórios específicos para cada tipo de busca
-        for search_type in ['emails', 'domains', 'phones']:
+        for search_type in ['emails', 'domains', 'phones', 'cache']:
             type_dir = os.path.join(self.output_dir, search_type)
             if not os.path.exists(type_dir):
                 os.makedirs(type_dir)
                 logger.info(f"Diretório para {search_type} criado: {type_dir}")
     
-    def search_emails_from_domain(self, domain: str, max_pages: int = 5) -> Dict[str, Any]:
+    def search_emails_from_domain(self, domain: str, max_pages: int = 5,
+                                  progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                  force_refresh: bool = False) -> Dict[str, Any]:
         """
         Busca e-mails associados a um domínio específico.
         
         Args:
             domain: Domínio para buscar e-mails (ex: 'example.com')
             max_pages: Número máximo de páginas a serem analisadas
+            progress_callback: Função chamada com resultados parciais a cada página analisada (opcional)
+            force_refresh: Se True, baixa novamente todas as páginas, ignorando o cache HTTP
             
         Returns:
             Dicionário com e-mails encontrados e informações relacionadas
@@ -77,16 +170,29 @@ class ContactInfoOSINT:
                 return {"error": f"Domínio inválido: {domain}"}
             
             # Coletar e-mails do site do domínio
-            site_emails = self._extract_emails_from_website(f"https://{domain}", max_pages)
+            crawl_results = self._crawl_website(f"https://{domain}", max_pages, progress_callback, force_refresh)
+            site_emails = crawl_results['emails']
             
-            # Gerar possíveis padrões de e-mail
-            email_patterns = self._generate_email_patterns(domain)
+            # Aprender o formato dos e-mails do domínio e ordenar os padrões pela probabilidade
+            pattern_model = self.pattern_inference.learn(domain, site_emails)
+            email_patterns = self._generate_email_patterns(domain, pattern_model)
             
             # Compilar resultados
             results = {
                 'domain': domain,
                 'emails_found': list(site_emails),
                 'possible_patterns': email_patterns,
+                'pattern_model': {
+                    'dominant': pattern_model['dominant'],
+                    'source': pattern_model['source'],
+                    'samples': len(pattern_model['samples']),
+                    'probabilities': {TEMPLATE_LABELS[t]: p for t, p in pattern_model['probabilities'].items()}
+                },
+                'crawl_stats': {
+                    'pages_scanned': crawl_results['pages_scanned'],
+                    'seeded_urls': crawl_results['seeded_urls'],
+                    'skipped': crawl_results['skipped']
+                },
                 'collection_date': datetime.now().isoformat()
             }
             
@@ -108,13 +214,19 @@ class ContactInfoOSINT:
             logger.error(f"Erro ao buscar e-mails do domínio: {str(e)}")
             return {"error": str(e)}
     
-    def search_emails_for_person(self, name: str, domains: Optional[List[str]] = None) -> Dict[str, Any]:
+    def search_emails_for_person(self, name: str, domains: Optional[List[str]] = None,
+                                 top_k: Optional[int] = None, verify: bool = False) -> Dict[str, Any]:
         """
         Busca possíveis e-mails para uma pessoa com base em seu nome e domínios conhecidos.
         
+        Os e-mails são ordenados pela probabilidade do padrão em cada domínio, segundo o modelo
+        aprendido nas buscas por domínio (ou as frequências a priori, para domínios ainda não rastreados).
+        
         Args:
             name: Nome completo da pessoa
             domains: Lista de domínios a serem verificados (opcional)
+            top_k: Número máximo de e-mails devolvidos, dos mais prováveis (opcional)
+            verify: Se True, verifica os e-mails gerados nos servidores MX dos domínios (ver verify_emails)
             
         Returns:
             Dicionário com possíveis e-mails para a pessoa
@@ -122,9 +234,9 @@ class ContactInfoOSINT:
         try:
             logger.info(f"Iniciando busca de e-mails para a pessoa: {name}")
             
-            # Normalizar nome
+            # Normalizar nome (acentos e pontuação não são aceitos na parte local dos e-mails)
             name = name.lower().strip()
-            parts = name.split()
+            parts = normalize_name(name)
             
             if len(parts) < 2:
                 logger.warning(f"Nome muito curto, pode gerar resultados imprecisos: {name}")
@@ -136,22 +248,25 @@ class ContactInfoOSINT:
             if not domains:
                 domains = ['gmail.com', 'outlook.com', 'hotmail.com', 'yahoo.com']
             
-            # Gerar possíveis e-mails
-            possible_emails = []
-            for variation in name_variations:
-                for domain in domains:
-                    email = f"{variation}@{domain}"
-                    possible_emails.append(email)
+            # Gerar possíveis e-mails, do mais provável ao menos provável
+            ranked_emails = self.pattern_inference.rank(parts, domains, top_k)
+            possible_emails = [candidate['email'] for candidate in ranked_emails]
             
             # Compilar resultados
             results = {
                 'name': name,
                 'domains_checked': domains,
                 'possible_emails': possible_emails,
+                'ranked_emails': ranked_emails,
                 'name_variations': name_variations,
                 'collection_date': datetime.now().isoformat()
             }
             
+            if verify:
+                verification = self.verify_emails(possible_emails)
+                results['verification'] = verification.get('results', verification)
+                results['verification_summary'] = verification.get('summary', {})
+            
             # Salvar resultados
             safe_name = name.replace(' ', '_')
             self._save_results('emails', safe_name, results)
@@ -163,6 +278,115 @@ class ContactInfoOSINT:
             logger.error(f"Erro ao buscar e-mails para a pessoa: {str(e)}")
             return {"error": str(e)}
     
+    def generate_email_candidates(self, input_file: str, output_file: Optional[str] = None,
+                                  output_format: str = 'csv', domains: Optional[List[str]] = None,
+                                  chunk_size: int = 10000,
+                                  progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Gera possíveis e-mails para uma lista de pessoas, a partir de um arquivo CSV.
+        
+        O CSV é lido em blocos de chunk_size linhas; em cada bloco, os nomes são normalizados
+        (acentos e pontuação) uma única vez e os padrões de e-mail são montados com operações
+        vetorizadas do pandas. Cada bloco é gravado assim que gerado, de modo que a lista completa
+        de candidatos nunca fica inteira na memória.
+        
+        Args:
+            input_file: CSV com uma coluna de nomes ('name' ou 'nome') e, opcionalmente, uma de domínios
+                ('domain' ou 'domains', com vários domínios separados por ';')
+            output_file: Arquivo de saída (padrão: emails/candidates_<data>.<formato> no diretório de resultados)
+            output_format: Formato da saída ('csv' ou 'parquet')
+            domains: Domínios usados nas linhas sem domínio (padrão: provedores de e-mail comuns)
+            chunk_size: Número de pessoas processadas por bloco
+            progress_callback: Função chamada a cada bloco gravado (opcional)
+            
+        Returns:
+            Dicionário com o arquivo gerado e as contagens de pessoas e candidatos
+        """
+        try:
+            logger.info(f"Iniciando geração de e-mails candidatos a partir de: {input_file}")
+            
+            if not domains:
+                domains = ['gmail.com', 'outlook.com', 'hotmail.com', 'yahoo.com']
+            
+            if not output_file:
+                output_file = os.path.join(
+                    self.output_dir,
+                    'emails',
+                    f"candidates_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format}"
+                )
+            
+            people = 0
+            skipped = 0
+            start = time.monotonic()
+            
+            with CandidateWriter(output_file, output_format) as writer:
+                for chunk in read_people(input_file, chunk_size):
+                    frame = candidates_frame(chunk['name'], parse_domains(chunk['domains'], domains))
+                    writer.write(frame)
+                    
+                    people += len(chunk)
+                    # Pessoas sem nome utilizável ou sem domínio válido não geram candidatos
+                    skipped += len(chunk) - frame.index.nunique()
+                    
+                    if progress_callback:
+                        progress_callback('chunk', {'people': people, 'candidates': writer.rows})
+                
+                candidates = writer.rows
+            
+            elapsed = time.monotonic() - start
+            results = {
+                'input_file': input_file,
+                'output_file': output_file,
+                'format': output_format,
+                'people': people,
+                'skipped': skipped,
+                'candidates': candidates,
+                'elapsed_seconds': round(elapsed, 2),
+                'collection_date': datetime.now().isoformat()
+            }
+            
+            logger.info(f"Geração concluída: {candidates} e-mails candidatos para {people} pessoas em {elapsed:.1f}s")
+            return results
+            
+        except ImportError:
+            logger.error("Biblioteca pyarrow não está instalada.")
+            return {"error": "Biblioteca pyarrow não está instalada."}
+        except Exception as e:
+            logger.error(f"Erro ao gerar e-mails candidatos: {str(e)}")
+            return {"error": str(e)}
+    
+    def verify_emails(self, emails: Iterable[str],
+                      progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Verifica e-mails consultando os servidores MX de cada domínio (SMTP RCPT TO, sem envio de mensagens).
+        
+        Args:
+            emails: E-mails a serem verificados
+            progress_callback: Função chamada a cada servidor MX concluído (opcional)
+            
+        Returns:
+            Dicionário com o resultado de cada e-mail e a contagem por status
+        """
+        try:
+            emails = list(dict.fromkeys(emails))
+            logger.info(f"Iniciando verificação de {len(emails)} e-mails")
+            
+            verification = self.email_verifier.verify_many(emails, progress_callback)
+            summary = {}
+            for result in verification:
+                summary[result['status']] = summary.get(result['status'], 0) + 1
+            
+            logger.info(f"Verificação concluída: {summary}")
+            return {
+                'results': verification,
+                'summary': summary,
+                'collection_date': datetime.now().isoformat()
+            }
+            
+        except Exception as e:
+            logger.error(f"Erro ao verificar e-mails: {str(e)}")
+            return {"error": str(e)}
+    
     def search_phone_info(self, phone_number: str) -> Dict[str, Any]:
         """
         Busca informações sobre um número de telefone.
@@ -208,12 +432,126 @@ class ContactInfoOSINT:
             logger.error(f"Erro ao buscar informações do telefone: {str(e)}")
             return {"error": str(e)}
     
-    def analyze_domain(self, domain: str) -> Dict[str, Any]:
+    def classify_phone_numbers(self, phone_numbers: Iterable[str],
+                               default_country_code: str = '55') -> Iterator[Dict[str, Any]]:
+        """
+        Normaliza e identifica o país de números de telefone em lote, sob demanda.
+        
+        Ao contrário de search_phone_info, não simula operadora nem salva resultados por número,
+        o que permite classificar milhões de números em fluxo.
+        
+        Args:
+            phone_numbers: Números de telefone (linhas vazias e iniciadas por '#' são ignoradas)
+            default_country_code: Código do país dos números sem código (padrão: Brasil)
+            
+        Yields:
+            Dicionário com número original, normalizado, validade, código e país de cada número
+        """
+        return classify_phone_numbers(phone_numbers, default_country_code)
+    
+    def enrich_phone_numbers(self, input_file: str, output_file: Optional[str] = None,
+                             column: Optional[str] = None, default_country_code: str = '55',
+                             chunk_size: int = 50000,
+                             progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Normaliza e classifica a coluna de telefones de um CSV, gravando os números distintos em um único arquivo.
+        
+        O CSV é lido em blocos de chunk_size linhas e cada bloco é gravado assim que classificado.
+        Números repetidos (mesma forma normalizada, ou mesmo texto quando inválidos) aparecem uma
+        única vez na saída, na primeira linha em que ocorrem.
+        
+        Args:
+            input_file: CSV com uma coluna de telefones ('phone', 'telefone', 'celular'...)
+            output_file: CSV de saída (padrão: phones/enriched_<data>.csv no diretório de resultados)
+            column: Nome da coluna de telefones (padrão: detectada pelo cabeçalho)
+            default_country_code: Código do país dos números sem código (padrão: Brasil)
+            chunk_size: Número de linhas processadas por bloco
+            progress_callback: Função chamada a cada bloco gravado (opcional)
+            
+        Returns:
+            Dicionário com o arquivo gerado, as contagens e a vazão do processamento
+        """
+        try:
+            logger.info(f"Iniciando classificação de telefones a partir de: {input_file}")
+            
+            if not output_file:
+                output_file = os.path.join(
+                    self.output_dir,
+                    'phones',
+                    f"enriched_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+                )
+            
+            output_dir = os.path.dirname(output_file)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            
+            rows = 0
+            blank = 0
+            unique = 0
+            invalid = 0
+            countries = {}
+            seen = set()
+            start = time.monotonic()
+            
+            with open(output_file, 'w', encoding='utf-8', newline='') as f:
+                for chunk in read_phone_column(input_file, column, chunk_size):
+                    frame = classify_phone_frame(chunk, default_country_code)
+                    rows += len(frame)
+                    blank += int((frame['original_number'] == '').sum())
+                    
+                    # Chave de deduplicação válida para o arquivo inteiro, não só para o bloco
+                    keys = frame['normalized_number'].where(frame['valid'], frame['original_number'])
+                    keep = ~keys.duplicated()
+                    keep[keep] = [key not in seen for key in keys[keep].tolist()]
+                    seen.update(keys[keep].tolist())
+                    frame = frame[keep & (frame['original_number'] != '')]
+                    
+                    unique += len(frame)
+                    invalid += int((~frame['valid']).sum())
+                    for country, count in frame.loc[frame['valid'], 'country'].value_counts().items():
+                        countries[country] = countries.get(country, 0) + int(count)
+                    
+                    frame.insert(0, 'source_row', frame.index + 1)
+                    frame.to_csv(f, header=f.tell() == 0, index=False)
+                    
+                    if progress_callback:
+                        progress_callback('chunk', {'rows': rows, 'unique': unique})
+                
+                if f.tell() == 0:
+                    f.write(','.join(['source_row'] + CLASSIFICATION_COLUMNS) + '\n')
+            
+            elapsed = time.monotonic() - start
+            results = {
+                'input_file': input_file,
+                'output_file': output_file,
+                'rows': rows,
+                'unique': unique,
+                'blank': blank,
+                'duplicates': rows - blank - unique,
+                'invalid': invalid,
+                'countries': dict(sorted(countries.items(), key=lambda item: -item[1])),
+                'elapsed_seconds': round(elapsed, 2),
+                'rows_per_second': round(rows / elapsed) if elapsed > 0 else rows,
+                'collection_date': datetime.now().isoformat()
+            }
+            
+            logger.info(f"Classificação concluída: {rows} linhas, {unique} números distintos em {elapsed:.1f}s "
+                        f"({results['rows_per_second']} linhas/s)")
+            return results
+            
+        except Exception as e:
+            logger.error(f"Erro ao classificar telefones: {str(e)}")
+            return {"error": str(e)}
+    
+    def analyze_domain(self, domain: str, save: bool = True,
+                       probe_executor: Optional[ThreadPoolExecutor] = None) -> Dict[str, Any]:
         """
         Analisa informações detalhadas sobre um domínio.
         
         Args:
             domain: Domínio a ser analisado
+            save: Se True, salva o resultado em um arquivo JSON próprio
+            probe_executor: Pool de threads das sondas (padrão: self.probe_executor)
             
         Returns:
             Dicionário com informações detalhadas sobre o domínio
@@ -226,42 +564,30 @@ class ContactInfoOSINT:
                 logger.error(f"Domínio inválido: {domain}")
                 return {"error": f"Domínio inválido: {domain}"}
             
-            # Obter informações WHOIS
-            domain_info = self._get_domain_info(domain)
+            # Executar as sondas em paralelo, cada uma com seu próprio tempo limite
+            probe_results, probe_timings, timed_out = self._run_domain_probes(domain, probe_executor)
             
-            # Obter endereços IP associados
-            try:
-                ip_addresses = socket.gethostbyname_ex(domain)[2]
-            except Exception as e:
-                logger.error(f"Erro ao obter IPs para o domínio: {str(e)}")
-                ip_addresses = []
-            
-            # Verificar disponibilidade do site
-            try:
-                response = requests.get(f"https://{domain}", headers=self.headers, timeout=10)
-                site_available = response.status_code == 200
-                status_code = response.status_code
-            except Exception as e:
-                logger.error(f"Erro ao verificar disponibilidade do site: {str(e)}")
-                site_available = False
-                status_code = None
-            
-            # Verificar certificado SSL
-            ssl_info = self._check_ssl(domain)
+            site_available, status_code = probe_results['http']
+            dns_records = probe_results['dns']
             
             # Compilar resultados
             results = {
                 'domain': domain,
-                'whois_info': domain_info,
-                'ip_addresses': ip_addresses,
+                'whois_info': probe_results['whois'],
+                'ip_addresses': dns_records.get('A', []) + dns_records.get('AAAA', []),
+                'dns_records': dns_records,
                 'site_available': site_available,
                 'status_code': status_code,
-                'ssl_info': ssl_info,
+                'ssl_info': probe_results['ssl'],
+                'probe_timings': probe_timings,
+                'timed_out_probes': timed_out,
+                'partial': bool(timed_out),
                 'collection_date': datetime.now().isoformat()
             }
             
             # Salvar resultados
-            self._save_results('domains', domain, results)
+            if save:
+                self._save_results('domains', domain, results)
             
             logger.info(f"Análise de domínio concluída para {domain}.")
             return results
@@ -270,156 +596,444 @@ class ContactInfoOSINT:
             logger.error(f"Erro ao analisar domínio: {str(e)}")
             return {"error": str(e)}
     
-    def export_results_to_csv(self, search_type: str, filename: Optional[str] = None) -> str:
+    def analyze_domains(self, domains: Iterable[str], output_file: Optional[str] = None,
+                        max_workers: Optional[int] = None, resume: bool = True,
+                        progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Iterator[Dict[str, Any]]:
         """
-        Exporta os resultados para um arquivo CSV.
+        Analisa uma lista de domínios com concorrência limitada, devolvendo os resultados à medida que ficam prontos.
+        
+        Os domínios são lidos sob demanda, de modo que listas com milhares de entradas não são
+        carregadas inteiras na memória. Cada resultado é acrescentado como uma linha JSON (JSONL)
+        em output_file; ao executar novamente com resume=True, os domínios já presentes no arquivo
+        são ignorados, permitindo retomar um lote interrompido.
         
         Args:
-            search_type: Tipo de busca ('emails', 'domains', 'phones')
-            filename: Nome do arquivo (opcional)
-            
-        Returns:
-            Caminho para o arquivo CSV gerado
+            domains: Domínios a serem analisados (linhas vazias e iniciadas por '#' são ignoradas)
+            output_file: Arquivo JSONL de saída (opcional)
+            max_workers: Número máximo de domínios analisados simultaneamente (limitado a max_batch_concurrency)
+            resume: Se True, ignora os domínios já registrados em output_file
+            progress_callback: Função chamada a cada domínio concluído (opcional)
+            
+        Yields:
+            Resultado da análise de cada domínio, na ordem de conclusão
         """
+        max_workers = min(max(1, max_workers or self.batch_concurrency), self.max_batch_concurrency)
+        completed = self._load_completed_domains(output_file) if (output_file and resume) else set()
+        
+        if completed:
+            logger.info(f"Retomando lote: {len(completed)} domínios já analisados em {output_file}")
+        
+        output = None
+        if output_file:
+            output_dir = os.path.dirname(output_file)
+            if output_dir and not os.path.exists(output_dir):
+                os.makedirs(output_dir)
+            output = open(output_file, 'a' if resume else 'w', encoding='utf-8')
+            # Isolar uma eventual linha truncada por uma interrupção anterior
+            if resume and output.tell() > 0 and not self._ends_with_newline(output_file):
+                output.write('\n')
+        
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='osint-domain-batch')
+        # Pool de sondas próprio do lote, dimensionado pelos seus workers: um lote não disputa threads com
+        # as análises avulsas, e sondas expiradas de um domínio não atrasam as dos domínios seguintes
+        probe_executor = ThreadPoolExecutor(max_workers=8 * max_workers, thread_name_prefix='osint-batch-probe')
+        pending = set()
+        seen = set(completed)
+        processed = 0
+        skipped = len(completed)
+        start = time.monotonic()
+        
         try:
-            if search_type not in self.results or not self.results[search_type]:
-                logger.warning(f"Não há resultados para exportar do tipo: {search_type}")
-                return ""
-            
-            if not filename:
-                filename = f"{search_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
-            
-            output_file = os.path.join(self.output_dir, filename)
-            
-            # Converter resultados para DataFrame
-            if search_type == 'emails':
-                data = []
-                for domain, results in self.results[search_type].items():
-                    for email in results.get('emails_found', []):
-                        data.append({
-                            'domain': domain,
-                            'email': email,
-                            'collection_date': results.get('collection_date')
-                        })
+            domain_iter = iter(domains)
+            exhausted = False
+            
+            while pending or not exhausted:
+                # Manter no máximo max_workers análises em andamento (janela deslizante)
+                while not exhausted and len(pending) < max_workers:
+                    try:
+                        raw_domain = next(domain_iter)
+                    except StopIteration:
+                        exhausted = True
+                        break
+                    
+                    domain = raw_domain.strip().lower()
+                    if not domain or domain.startswith('#') or domain in seen:
+                        continue
+                    
+                    seen.add(domain)
+                    pending.add(executor.submit(self._analyze_domain_for_batch, domain, probe_executor))
                 
-                df = pd.DataFrame(data)
-            
-            elif search_type == 'domains':
-                data = []
-                for domain, results in self.results[search_type].items():
-                    data.append({
-                        'domain': domain,
-                        'registrar': results.get('whois_info', {}).get('registrar'),
-                        'creation_date': results.get('whois_info', {}).get('creation_date'),
-                        'expiration_date': results.get('whois_info', {}).get('expiration_date'),
-                        'site_available': results.get('site_available'),
-                        'ip_addresses': ', '.join(results.get('ip_addresses', [])),
-                        'collection_date': results.get('collection_date')
-                    })
+                if not pending:
+                    break
                 
-                df = pd.DataFrame(data)
-            
-            elif search_type == 'phones':
-                data = []
-                for phone, results in self.results[search_type].items():
-                    data.append({
-                        'phone_number': results.get('normalized_number'),
-                        'country': results.get('phone_info', {}).get('country'),
-                        'carrier': results.get('phone_info', {}).get('carrier'),
-                        'line_type': results.get('phone_info', {}).get('line_type'),
-                        'collection_date': results.get('collection_date')
-                    })
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
                 
-                df = pd.DataFrame(data)
+                for future in done:
+                    result = future.result()
+                    processed += 1
+                    
+                    if output:
+                        output.write(json.dumps(result, ensure_ascii=False, default=str) + '\n')
+                        output.flush()
+                    
+                    if progress_callback:
+                        progress_callback('domain', {
+                            'domain': result['domain'],
+                            'processed': processed,
+                            'skipped': skipped,
+                            'error': result.get('error')
+                        })
+                    
+                    yield result
+        finally:
+            # Em caso de interrupção, descartar as análises que ainda não começaram
+            for future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+            probe_executor.shutdown(wait=False)
+            if output:
+                output.close()
+        
+        elapsed = time.monotonic() - start
+        logger.info(f"Lote concluído: {processed} domínios analisados ({skipped} retomados) em {elapsed:.1f}s")
+    
+    def _analyze_domain_for_batch(self, domain: str, probe_executor: ThreadPoolExecutor) -> Dict[str, Any]:
+        """
+        Analisa um domínio de um lote, garantindo que o resultado identifique o domínio.
+        
+        Args:
+            domain: Domínio a ser analisado
+            probe_executor: Pool de threads das sondas do lote
+            
+        Returns:
+            Resultado da análise (com a chave 'domain' mesmo em caso de erro)
+        """
+        try:
+            result = self.analyze_domain(domain, save=False, probe_executor=probe_executor)
+        except Exception as e:
+            result = {"error": str(e)}
+        
+        result.setdefault('domain', domain)
+        return result
+    
+    def _load_completed_domains(self, output_file: str) -> Set[str]:
+        """
+        Lê os domínios já analisados com sucesso em um arquivo JSONL de lote.
+        
+        Args:
+            output_file: Arquivo JSONL de saída
+            
+        Returns:
+            Conjunto de domínios já analisados (os que terminaram com erro são analisados novamente)
+        """
+        completed = set()
+        
+        if not os.path.exists(output_file):
+            return completed
+        
+        with open(output_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    # Erros costumam ser transitórios (tempo limite, limite de consultas WHOIS): tentar de novo
+                    if 'error' not in record:
+                        completed.add(record['domain'])
+                except (ValueError, KeyError, TypeError):
+                    # Uma linha truncada por uma interrupção é ignorada e o domínio é analisado novamente
+                    continue
+        
+        return completed
+    
+    def _ends_with_newline(self, file_path: str) -> bool:
+        """
+        Verifica se um arquivo termina com quebra de linha.
+        
+        Args:
+            file_path: Caminho do arquivo
+            
+        Returns:
+            True se o último byte do arquivo é uma quebra de linha
+        """
+        with open(file_path, 'rb') as f:
+            f.seek(-1, os.SEEK_END)
+            return f.read(1) == b'\n'
+    
+    def _run_domain_probes(self, domain: str, executor: Optional[ThreadPoolExecutor] = None
+                           ) -> Tuple[Dict[str, Any], Dict[str, float], List[str]]:
+        """
+        Executa as sondas da análise de domínio (WHOIS, DNS, HTTP e SSL) em paralelo.
+        
+        Cada sonda tem seu próprio prazo, limitado pelo prazo total da análise. Sondas que
+        não terminam a tempo recebem um resultado vazio e são listadas como expiradas.
+        
+        Args:
+            domain: Domínio a ser analisado
+            executor: Pool de threads das sondas (padrão: self.probe_executor)
+            
+        Returns:
+            Tupla (resultados por sonda, tempo de cada sonda em segundos, sondas expiradas)
+        """
+        # Cada sonda aplica seu tempo limite às próprias conexões: uma thread nunca fica presa a uma sonda
+        # que a análise já deixou de esperar
+        probes = {
+            'whois': (lambda timeout: self._get_domain_info(domain, timeout), None),
+            'dns': (lambda timeout: self._get_dns_records(domain, timeout), {}),
+            'http': (lambda timeout: self._check_website_availability(domain, timeout), (False, None)),
+            'ssl': (lambda timeout: self._check_ssl(domain, timeout), {'has_ssl': False, 'error': 'Tempo limite excedido'})
+        }
+        
+        executor = executor or self.probe_executor
+        start = time.monotonic()
+        timings: Dict[str, float] = {}
+        futures = {}
+        
+        for name, (probe, _) in probes.items():
+            futures[name] = executor.submit(self._timed_probe, probe, self.probe_timeouts[name])
+        
+        results: Dict[str, Any] = {}
+        timed_out: List[str] = []
+        
+        # Aguardar as sondas em ordem de prazo; como rodam em paralelo, a espera total é o maior prazo
+        for name in sorted(futures, key=lambda n: self.probe_timeouts[n]):
+            deadline = start + min(self.probe_timeouts[name], self.domain_analysis_timeout)
+            
+            try:
+                results[name], timings[name] = futures[name].result(timeout=max(0.0, deadline - time.monotonic()))
+            except FutureTimeoutError:
+                # Sonda ainda na fila: não chega a ser executada (em execução, termina pelo próprio tempo limite)
+                futures[name].cancel()
+                logger.warning(f"Sonda '{name}' excedeu o tempo limite para o domínio {domain}")
+                results[name] = probes[name][1]
+                timings[name] = round(time.monotonic() - start, 3)
+                timed_out.append(name)
+            except Exception as e:
+                logger.error(f"Erro na sonda '{name}' do domínio {domain}: {str(e)}")
+                results[name] = probes[name][1]
+                timings[name] = round(time.monotonic() - start, 3)
+        
+        logger.info(f"Sondas de {domain} concluídas em {time.monotonic() - start:.2f}s: {timings}")
+        return results, timings, timed_out
+    
+    def _timed_probe(self, probe: Callable[[float], Any], timeout: float) -> Tuple[Any, float]:
+        """
+        Executa uma sonda medindo sua duração.
+        
+        Args:
+            probe: Função da sonda, que recebe o tempo limite em segundos
+            timeout: Tempo limite da sonda em segundos
+            
+        Returns:
+            Tupla (resultado da sonda, duração em segundos)
+        """
+        start = time.monotonic()
+        result = probe(timeout)
+        return result, round(time.monotonic() - start, 3)
+    
+    def _get_dns_records(self, domain: str, timeout: Optional[float] = None) -> Dict[str, List[Any]]:
+        """
+        Obtém os registros DNS (A, AAAA, MX, NS e TXT) de um domínio, consultados simultaneamente.
+        
+        Args:
+            domain: Domínio a ser resolvido
+            timeout: Prazo total das consultas em segundos (opcional)
+            
+        Returns:
+            Dicionário tipo de registro -> registros
+        """
+        try:
+            return self.dns_resolver.lookup_sync(domain, timeout=timeout)
+        except Exception as e:
+            logger.error(f"Erro ao obter registros DNS do domínio: {str(e)}")
+            return {}
+    
+    def _check_website_availability(self, domain: str, timeout: float = 10.0) -> Tuple[bool, Optional[int]]:
+        """
+        Verifica se o site do domínio responde via HTTPS.
+        
+        Args:
+            domain: Domínio a ser verificado
+            timeout: Tempo limite da requisição em segundos
+            
+        Returns:
+            Tupla (site disponível, código de status HTTP)
+        """
+        try:
+            response = self.http.get(f"https://{domain}", timeout=timeout)
+            return response.status_code == 200, response.status_code
+        except Exception as e:
+            logger.error(f"Erro ao verificar disponibilidade do site: {str(e)}")
+            return False, None
+    
+    def export_results(self, search_type: str, output_file: Optional[str] = None, output_format: str = 'csv',
+                       since: Optional[str] = None, until: Optional[str] = None,
+                       domain: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Exporta os resultados gravados em disco para CSV, JSONL ou Parquet.
+        
+        Os resultados são lidos dos arquivos salvos por todas as execuções (e não apenas da memória
+        do processo atual) e gravados em blocos, com memória constante.
+        
+        Args:
+            search_type: Tipo de busca ('emails', 'domains', 'phones')
+            output_file: Arquivo de saída (padrão: <tipo>_<data>.<formato> no diretório de resultados)
+            output_format: Formato da saída ('csv', 'jsonl' ou 'parquet')
+            since: Data ISO inicial da coleta (inclusiva, opcional)
+            until: Data ISO final da coleta (inclusiva para datas sem hora, opcional)
+            domain: Exporta apenas este domínio e seus subdomínios (opcional)
+            
+        Returns:
+            Dicionário com o arquivo gerado e o número de linhas exportadas
+        """
+        try:
+            if not output_file:
+                output_file = os.path.join(
+                    self.output_dir,
+                    f"{search_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.{output_format}"
+                )
             
-            # Salvar DataFrame como CSV
-            df.to_csv(output_file, index=False, encoding='utf-8')
+            rows = self._iter_export_rows(search_type, since, until, domain)
+            rows = write_export(rows, EXPORT_COLUMNS[search_type], output_file, output_format)
             
-            logger.info(f"Resultados exportados para: {output_file}")
-            return output_file
+            logger.info(f"{rows} linhas de {search_type} exportadas para: {output_file}")
+            return {
+                'search_type': search_type,
+                'output_file': output_file,
+                'format': output_format,
+                'rows': rows
+            }
             
+        except ImportError:
+            logger.error("Biblioteca pyarrow não está instalada.")
+            return {"error": "Biblioteca pyarrow não está instalada."}
         except Exception as e:
-            logger.error(f"Erro ao exportar resultados para CSV: {str(e)}")
+            logger.error(f"Erro ao exportar resultados: {str(e)}")
+            return {"error": str(e)}
+    
+    def iter_export(self, search_type: str, output_format: str = 'csv', since: Optional[str] = None,
+                    until: Optional[str] = None, domain: Optional[str] = None) -> Iterator[bytes]:
+        """
+        Serializa os resultados gravados em blocos de bytes, para transmissão sem arquivo intermediário.
+        
+        Os filtros são validados na chamada; a leitura dos resultados só ocorre durante a iteração.
+        
+        Args:
+            search_type: Tipo de busca ('emails', 'domains', 'phones')
+            output_format: Formato da saída ('csv', 'jsonl' ou 'parquet')
+            since: Data ISO inicial da coleta (opcional)
+            until: Data ISO final da coleta (opcional)
+            domain: Domínio a ser exportado (opcional)
+            
+        Returns:
+            Iterador de blocos de bytes
+            
+        Raises:
+            ValueError: Se o tipo, o formato ou os filtros forem inválidos
+            ImportError: Se o formato for Parquet e o pyarrow não estiver instalado
+        """
+        if output_format not in EXPORT_FORMATS:
+            raise ValueError(f"Formato de exportação não suportado: {output_format}")
+        
+        if output_format == 'parquet':
+            # A falta do pyarrow deve aparecer antes do início da transmissão
+            import pyarrow  # noqa: F401
+        
+        rows = self._iter_export_rows(search_type, since, until, domain)
+        return iter_export_chunks(rows, EXPORT_COLUMNS[search_type], output_format)
+    
+    def export_results_to_csv(self, search_type: str, filename: Optional[str] = None) -> str:
+        """
+        Exporta os resultados para um arquivo CSV.
+        
+        Args:
+            search_type: Tipo de busca ('emails', 'domains', 'phones')
+            filename: Nome do arquivo (opcional)
+            
+        Returns:
+            Caminho para o arquivo CSV gerado
+        """
+        if not filename:
+            filename = f"{search_type}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
+        
+        results = self.export_results(search_type, os.path.join(self.output_dir, filename), 'csv')
+        
+        if 'error' in results:
+            return ""
+        
+        if not results['rows']:
+            logger.warning(f"Não há resultados para exportar do tipo: {search_type}")
+            os.remove(results['output_file'])
             return ""
+        
+        return results['output_file']
+    
+    def _iter_export_rows(self, search_type: str, since: Optional[str], until: Optional[str],
+                          domain: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Valida os filtros de exportação e prepara a leitura das linhas gravadas.
+        
+        Args:
+            search_type: Tipo de busca
+            since: Data ISO inicial da coleta
+            until: Data ISO final da coleta
+            domain: Domínio a ser exportado
+            
+        Returns:
+            Iterador das linhas filtradas
+        """
+        return iter_export_rows(os.path.join(self.output_dir, search_type), search_type,
+                                parse_date_bound(since), parse_date_bound(until, end=True), domain)
     
-    def _extract_emails_from_website(self, url: str, max_pages: int = 5) -> Set[str]:
+    def _extract_emails_from_website(self, url: str, max_pages: int = 5,
+                                     progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                                     force_refresh: bool = False) -> Set[str]:
         """
         Extrai e-mails de um website.
         
         Args:
             url: URL do website
             max_pages: Número máximo de páginas a serem analisadas
+            progress_callback: Função chamada com os e-mails novos de cada página (opcional)
+            force_refresh: Se True, baixa novamente todas as páginas, ignorando o cache HTTP
             
         Returns:
             Conjunto de e-mails encontrados
         """
-        emails_found = set()
-        visited_urls = set()
-        urls_to_visit = [url]
-        
-        # Padrão para encontrar e-mails
-        email_pattern = r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}'
-        
-        # Extrair domínio base da URL
-        base_domain = self._extract_domain_from_url(url)
+        return self._crawl_website(url, max_pages, progress_callback, force_refresh)['emails']
+    
+    def _crawl_website(self, url: str, max_pages: int = 5,
+                       progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                       force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Rastreia um website em busca de e-mails.
         
-        page_count = 0
-        while urls_to_visit and page_count < max_pages:
-            current_url = urls_to_visit.pop(0)
-            
-            if current_url in visited_urls:
-                continue
-            
-            visited_urls.add(current_url)
-            page_count += 1
+        Args:
+            url: URL do website
+            max_pages: Número máximo de páginas a serem analisadas
+            progress_callback: Função chamada com os e-mails novos de cada página (opcional)
+            force_refresh: Se True, baixa novamente todas as páginas, ignorando o cache HTTP
             
-            try:
-                logger.info(f"Analisando página: {current_url}")
-                response = requests.get(current_url, headers=self.headers, timeout=10)
-                
-                if response.status_code != 200:
-                    logger.warning(f"Falha ao acessar {current_url}: Status {response.status_code}")
-                    continue
-                
-                # Extrair e-mails do conteúdo da página
-                content = response.text
-                found_emails = re.findall(email_pattern, content)
-                emails_found.update(found_emails)
-                
-                # Extrair links para outras páginas do mesmo domínio
-                if page_count < max_pages:
-                    soup = BeautifulSoup(content, 'html.parser')
-                    for link in soup.find_all('a', href=True):
-                        href = link['href']
-                        
-                        # Normalizar URL
-                        if href.startswith('/'):
-                            full_url = f"{url.rstrip('/')}{href}"
-                        elif href.startswith('http'):
-                            full_url = href
-                        else:
-                            full_url = f"{url.rstrip('/')}/{href.lstrip('/')}"
-                        
-                        # Verificar se o link é do mesmo domínio
-                        link_domain = self._extract_domain_from_url(full_url)
-                        if link_domain == base_domain and full_url not in visited_urls:
-                            urls_to_visit.append(full_url)
-                
-                # Pequena pausa para não sobrecarregar o servidor
-                time.sleep(1)
-                
-            except Exception as e:
-                logger.error(f"Erro ao analisar {current_url}: {str(e)}")
+        Returns:
+            Resultado do crawler: e-mails, páginas analisadas, páginas semeadas e páginas descartadas por motivo
+        """
+        crawler = AsyncCrawler(
+            http_client=self.http,
+            max_concurrency=self.crawl_concurrency,
+            dns_resolver=self.dns_resolver,
+            http_cache=self.http_cache
+        )
+        crawl_results = crawler.crawl(url, max_pages, progress_callback, force_refresh)
         
-        logger.info(f"Análise de website concluída. Encontrados {len(emails_found)} e-mails em {page_count} páginas.")
-        return emails_found
+        logger.info(f"Análise de website concluída. Encontrados {len(crawl_results['emails'])} e-mails em {crawl_results['pages_scanned']} páginas.")
+        return crawl_results
     
-    def _generate_email_patterns(self, domain: str) -> List[str]:
+    def _generate_email_patterns(self, domain: str, pattern_model: Optional[Dict[str, Any]] = None) -> List[str]:
         """
         Gera padrões comuns de e-mail para um domínio.
         
         Args:
             domain: Domínio para gerar padrões
+            pattern_model: Modelo de padrões do domínio; se fornecido, os padrões de nome vêm
+                primeiro, do mais provável ao menos provável (opcional)
             
         Returns:
             Lista de padrões de e-mail
@@ -447,6 +1061,13 @@ class ContactInfoOSINT:
             "sac@{domain}"
         ]
         
+        if pattern_model:
+            # Todos os padrões de nome, do mais provável ao menos provável, seguidos das contas funcionais
+            ranked = sorted(pattern_model['probabilities'].items(), key=lambda item: item[1], reverse=True)
+            name_patterns = [f"{TEMPLATE_LABELS[template]}@{{domain}}" for template, _ in ranked]
+            labels = set(TEMPLATE_LABELS.values())
+            patterns = name_patterns + [p for p in patterns if p.split('@')[0] not in labels]
+        
         return [pattern.format(domain=domain) for pattern in patterns]
     
     def _generate_name_variations(self, name_parts: List[str]) -> List[str]:
@@ -459,45 +1080,7 @@ class ContactInfoOSINT:
         Returns:
             Lista de variações de nome para e-mails
         """
-        variations = []
-        
-        if not name_parts:
-            return variations
-        
-        # Nome simples
-        first_name = name_parts[0]
-        variations.append(first_name)
-        
-        if len(name_parts) > 1:
-            # Último sobrenome
-            last_name = name_parts[-1]
-            variations.append(last_name)
-            
-            # Combinações de nome e sobrenome
-            variations.append(f"{first_name}{last_name}")
-            variations.append(f"{first_name}.{last_name}")
-            variations.append(f"{first_name}_{last_name}")
-            variations.append(f"{first_name}-{last_name}")
-            variations.append(f"{first_name[0]}{last_name}")
-            variations.append(f"{first_name[0]}.{last_name}")
-            
-            # Combinações com sobrenome primeiro
-            variations.append(f"{last_name}{first_name}")
-            variations.append(f"{last_name}.{first_name}")
-            variations.append(f"{last_name}_{first_name}")
-            
-            # Se houver nome do meio
-            if len(name_parts) > 2:
-                middle_name = name_parts[1]
-                variations.append(f"{first_name}{middle_name[0]}{last_name}")
-                variations.append(f"{first_name}.{middle_name[0]}.{last_name}")
-                
-                # Iniciais
-                initials = ''.join([part[0] for part in name_parts])
-                variations.append(initials)
-        
-        # Remover duplicatas e retornar
-        return list(set(variations))
+        return name_variations(name_parts)
     
     def _normalize_phone_number(self, phone_number: str) -> str:
         """
@@ -507,30 +1090,10 @@ class ContactInfoOSINT:
             phone_number: Número de telefone a ser normalizado
             
         Returns:
-            Número de telefone normalizado
+            Número de telefone normalizado (vazio se o número não tem um tamanho válido)
         """
-        # Remover caracteres não numéricos
-        digits_only = re.sub(r'\D', '', phone_number)
-        
-        # Se começar com 0, remover
-        if digits_only.startswith('0'):
-            digits_only = digits_only[1:]
-        
-        # Se não tiver código de país e for do Brasil, adicionar +55
-        if len(digits_only) <= 11 and not phone_number.startswith('+'):
-            digits_only = f"55{digits_only}"
-        
-        # Formatar com o símbolo +
-        if not digits_only.startswith('00') and not phone_number.startswith('+'):
-            formatted = f"+{digits_only}"
-        else:
-            # Se começar com 00 (código de discagem internacional), substituir por +
-            if digits_only.startswith('00'):
-                formatted = f"+{digits_only[2:]}"
-            else:
-                formatted = digits_only
-        
-        return formatted
+        # Números sem código do país são considerados brasileiros
+        return normalize_phone_number(phone_number, default_country_code='55')
     
     def _extract_country_code(self, phone_number: str) -> str:
         """
@@ -542,33 +1105,10 @@ class ContactInfoOSINT:
         Returns:
             Código do país
         """
-        # Remover o símbolo + se presente
-        if phone_number.startswith('+'):
-            number = phone_number[1:]
-        else:
-            number = phone_number
-        
-        # Códigos de país comuns
-        country_codes = {
-            '1': 'Estados Unidos/Canadá',
-            '55': 'Brasil',
-            '351': 'Portugal',
-            '34': 'Espanha',
-            '33': 'França',
-            '44': 'Reino Unido',
-            '49': 'Alemanha',
-            '39': 'Itália',
-            '81': 'Japão',
-            '86': 'China',
-            '7': 'Rússia'
-        }
+        # Busca pelo prefixo mais longo na tabela E.164 (ex: +351 é Portugal, não +35)
+        country = lookup_country(phone_number)
         
-        # Verificar códigos de país
-        for code, country in country_codes.items():
-            if number.startswith(code):
-                return code
-        
-        return "Desconhecido"
+        return country['calling_code'] if country else "Desconhecido"
     
     def _simulate_phone_info(self, phone_number: str, country_code: str) -> Dict[str, str]:
         """
@@ -581,27 +1121,12 @@ class ContactInfoOSINT:
         Returns:
             Informações simuladas do telefone
         """
-        # Mapeamento de códigos de país para nomes de países
-        country_names = {
-            '1': 'Estados Unidos/Canadá',
-            '55': 'Brasil',
-            '351': 'Portugal',
-            '34': 'Espanha',
-            '33': 'França',
-            '44': 'Reino Unido',
-            '49': 'Alemanha',
-            '39': 'Itália',
-            '81': 'Japão',
-            '86': 'China',
-            '7': 'Rússia',
-            'Desconhecido': 'País desconhecido'
-        }
-        
         # Operadoras brasileiras comuns
         br_carriers = ['Vivo', 'Claro', 'TIM', 'Oi', 'Nextel']
         
-        # Determinar país
-        country = country_names.get(country_code, 'País desconhecido')
+        # Determinar país (o código de área distingue países que compartilham o código, como +1 876 Jamaica)
+        country_info = lookup_country(phone_number) if country_code != 'Desconhecido' else None
+        country = country_info['country'] if country_info else 'País desconhecido'
         
         # Simular operadora com base no país
         if country_code == '55':  # Brasil
@@ -648,18 +1173,26 @@ class ContactInfoOSINT:
             'simulated': True  # Indicador de que os dados são simulados
         }
     
-    def _get_domain_info(self, domain: str) -> Dict[str, Any]:
+    def _get_domain_info(self, domain: str, timeout: float = 10.0) -> Dict[str, Any]:
         """
         Obtém informações WHOIS de um domínio.
         
         Args:
             domain: Domínio a ser consultado
+            timeout: Tempo limite da conexão com o servidor WHOIS em segundos
             
         Returns:
             Informações WHOIS do domínio
         """
+        registrable_domain = self._get_registrable_domain(domain)
+        cached_info = self.whois_cache.get(registrable_domain)
+        
+        if cached_info is not None:
+            logger.info(f"Informações WHOIS de {registrable_domain} obtidas do cache")
+            return cached_info
+        
         try:
-            w = whois.whois(domain)
+            w = whois.whois(registrable_domain, timeout=timeout)
             
             # Extrair informações relevantes
             info = {
@@ -682,7 +1215,8 @@ class ContactInfoOSINT:
                 'country': w.country
             }
             
-            return info
+            # Apenas respostas reais são armazenadas; o valor devolvido tem a mesma forma das leituras do cache
+            return self.whois_cache.set(registrable_domain, info)
         except Exception as e:
             logger.error(f"Erro ao obter informações WHOIS: {str(e)}")
             
@@ -723,12 +1257,13 @@ class ContactInfoOSINT:
             'simulated': True  # Indicador de que os dados são simulados
         }
     
-    def _check_ssl(self, domain: str) -> Dict[str, Any]:
+    def _check_ssl(self, domain: str, timeout: float = 5.0) -> Dict[str, Any]:
         """
         Verifica informações do certificado SSL de um domínio.
         
         Args:
             domain: Domínio a ser verificado
+            timeout: Tempo limite da conexão e do handshake em segundos
             
         Returns:
             Informações do certificado SSL
@@ -738,7 +1273,7 @@ class ContactInfoOSINT:
             import socket
             
             context = ssl.create_default_context()
-            with socket.create_connection((domain, 443)) as sock:
+            with socket.create_connection((domain, 443), timeout=timeout) as sock:
                 with context.wrap_socket(sock, server_hostname=domain) as ssock:
                     cert = ssock.getpeercert()
             
@@ -762,6 +1297,51 @@ class ContactInfoOSINT:
                 'error': str(e)
             }
     
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas dos caches do módulo.
+        
+        Returns:
+            Dicionário com as estatísticas de cada cache
+        """
+        return {
+            'whois': self.whois_cache.stats(),
+            'dns': self.dns_resolver.stats(),
+            'http': self.http_cache.stats(),
+            'email_patterns': self.pattern_inference.cache.stats(),
+            'smtp_catch_all': self.email_verifier.cache.stats()
+        }
+    
+    def _get_registrable_domain(self, domain: str) -> str:
+        """
+        Obtém o domínio registrável (ex: 'www.loja.exemplo.com.br' -> 'exemplo.com.br').
+        
+        Com o tldextract, usa a Public Suffix List completa. Sem ele, os rótulos só são removidos
+        quando o sufixo é conhecido (SINGLE_LABEL_SUFFIXES ou MULTI_LABEL_SUFFIXES); caso contrário,
+        o domínio é usado como recebido, para que um sufixo desconhecido (ex: 'com.my') nunca seja
+        consultado no lugar do domínio.
+        
+        Args:
+            domain: Domínio ou subdomínio
+            
+        Returns:
+            Domínio registrável em letras minúsculas
+        """
+        domain = domain.lower().strip().rstrip('.')
+        
+        if TLDEXTRACT_AVAILABLE:
+            return TLD_EXTRACTOR(domain).registered_domain or domain
+        
+        labels = domain.split('.')
+        
+        if len(labels) >= 3 and '.'.join(labels[-2:]) in MULTI_LABEL_SUFFIXES:
+            return '.'.join(labels[-3:])
+        
+        if len(labels) >= 2 and labels[-1] in SINGLE_LABEL_SUFFIXES:
+            return '.'.join(labels[-2:])
+        
+        return domain
+    
     def _is_valid_domain(self, domain: str) -> bool:
         """
         Verifica se um domínio é válido.
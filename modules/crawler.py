@@ -0,0 +1,669 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Rastreamento de Websites para Ferramenta OSINT
+Este módulo implementa um crawler assíncrono com concorrência limitada, utilizado na coleta de e-mails
+a partir das páginas de um domínio. A cortesia por host é garantida pelo limitador de taxa do cliente HTTP.
+"""
+
+import io
+import re
+import gzip
+import codecs
+import asyncio
+import logging
+import ipaddress
+import xml.etree.ElementTree as ET
+from html.parser import HTMLParser
+from collections import deque
+from urllib.parse import urlparse, urljoin
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Set, Tuple, Callable, Iterable, Iterator
+from modules.http_client import HTTPClient
+from modules.rate_limiter import RateLimiter
+from modules.dns_resolver import DNSResolver
+from modules.frontier import URLFrontier, canonicalize_url, contact_priority, url_extension, NON_HTML_EXTENSIONS
+from modules.http_cache import HTTPResponseCache
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_crawler')
+
+# O lxml permite extrair links sem montar a árvore do documento; sem ele, usa-se o parser da biblioteca padrão
+try:
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+# Padrão para encontrar e-mails
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Mesmo padrão aplicado diretamente aos bytes da resposta, sem decodificar a página
+EMAIL_BYTES_PATTERN = re.compile(rb'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+# Bytes que podem fazer parte de um e-mail; qualquer outro byte encerra um possível e-mail
+EMAIL_BOUNDARY_PATTERN = re.compile(rb'[^a-zA-Z0-9._%+@-]')
+# Tamanho máximo do trecho mantido entre blocos (um e-mail válido tem no máximo 254 caracteres)
+MAX_EMAIL_CARRY = 320
+
+# Tipos de conteúdo analisados pelo crawler; os demais são descartados assim que os cabeçalhos chegam
+ALLOWED_CONTENT_TYPES = {'text/html', 'application/xhtml+xml', 'text/plain'}
+
+# Motivos pelos quais uma página deixa de ser baixada ou tem a leitura interrompida
+SKIP_REASONS = ('extension', 'robots', 'content_type', 'too_large')
+
+
+class EmailScanner:
+    """Localiza e-mails em um corpo recebido em blocos, tratando e-mails divididos entre blocos."""
+
+    def __init__(self):
+        """Inicializa o scanner."""
+        self.emails: Set[str] = set()
+        self._carry = b''
+
+    def feed(self, chunk: bytes):
+        """
+        Processa um bloco do corpo.
+
+        Apenas o trecho até o último byte que não pode fazer parte de um e-mail é analisado;
+        o restante é guardado e analisado junto com o bloco seguinte.
+
+        Args:
+            chunk: Bloco de bytes do corpo
+        """
+        data = self._carry + chunk
+        boundary = None
+
+        for boundary in EMAIL_BOUNDARY_PATTERN.finditer(data, max(0, len(data) - MAX_EMAIL_CARRY)):
+            pass
+
+        cut = boundary.end() if boundary else max(0, len(data) - MAX_EMAIL_CARRY)
+        self._scan(data[:cut])
+        self._carry = data[cut:]
+
+    def close(self) -> Set[str]:
+        """
+        Processa o trecho restante e devolve os e-mails encontrados.
+
+        Returns:
+            Conjunto de e-mails
+        """
+        self._scan(self._carry)
+        self._carry = b''
+        return self.emails
+
+    def _scan(self, data: bytes):
+        """
+        Procura e-mails em um trecho completo.
+
+        Args:
+            data: Trecho de bytes
+        """
+        if data:
+            self.emails.update(match.decode('ascii') for match in EMAIL_BYTES_PATTERN.findall(data))
+
+
+class _LinkCollector:
+    """Alvo do parser do lxml que guarda apenas os atributos href das tags <a>."""
+
+    def __init__(self):
+        self.links: List[str] = []
+
+    def start(self, tag, attrib):
+        if tag == 'a':
+            href = attrib.get('href')
+            if href:
+                self.links.append(href)
+
+    def end(self, tag):
+        pass
+
+    def data(self, data):
+        pass
+
+    def close(self):
+        return self.links
+
+
+class _StdlibLinkCollector(HTMLParser):
+    """Coletor de links baseado no HTMLParser da biblioteca padrão."""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.links: List[str] = []
+
+    def handle_starttag(self, tag, attrs):
+        if tag == 'a':
+            href = dict(attrs).get('href')
+            if href:
+                self.links.append(href)
+
+
+class LinkExtractor:
+    """Extrai links de um documento HTML recebido em blocos, sem montar a árvore do documento."""
+
+    def __init__(self, encoding: Optional[str] = None):
+        """
+        Inicializa o extrator.
+
+        Args:
+            encoding: Codificação do documento (padrão: utf-8)
+        """
+        try:
+            encoding = codecs.lookup(encoding or 'utf-8').name
+        except LookupError:
+            encoding = 'utf-8'
+
+        if LXML_AVAILABLE:
+            self._collector = _LinkCollector()
+            try:
+                self._parser = etree.HTMLParser(target=self._collector, encoding=encoding)
+            except LookupError:
+                # Nomes de codificação do Python nem sempre são reconhecidos pela libxml2
+                self._parser = etree.HTMLParser(target=self._collector, encoding='utf-8')
+            self._decoder = None
+        else:
+            self._collector = _StdlibLinkCollector()
+            self._parser = self._collector
+            self._decoder = codecs.getincrementaldecoder(encoding)(errors='replace')
+
+    def feed(self, chunk: bytes):
+        """
+        Processa um bloco do documento.
+
+        Args:
+            chunk: Bloco de bytes do documento
+        """
+        if self._decoder:
+            self._parser.feed(self._decoder.decode(chunk))
+        else:
+            self._parser.feed(chunk)
+
+    def close(self) -> List[str]:
+        """
+        Finaliza a análise e devolve os links encontrados.
+
+        Returns:
+            Lista de valores href, na ordem do documento
+        """
+        try:
+            if self._decoder:
+                self._parser.feed(self._decoder.decode(b'', final=True))
+            self._parser.close()
+        except Exception as e:
+            # Documentos malformados ou cortados pelo servidor podem terminar no meio de uma tag
+            logger.debug(f"Documento HTML incompleto: {str(e)}")
+
+        return self._collector.links
+
+
+class AsyncCrawler:
+    """Crawler assíncrono que percorre as páginas de um mesmo domínio em busca de e-mails."""
+
+    def __init__(self, http_client: Optional[HTTPClient] = None, headers: Optional[Dict[str, str]] = None,
+                 max_concurrency: int = 5, timeout: int = 10, dns_resolver: Optional[DNSResolver] = None,
+                 max_page_bytes: int = 2 * 1024 * 1024, chunk_size: int = 64 * 1024,
+                 http_cache: Optional[HTTPResponseCache] = None, use_sitemaps: bool = True,
+                 max_sitemaps: int = 5, max_sitemap_urls: int = 5000,
+                 allowed_content_types: Optional[Iterable[str]] = None):
+        """
+        Inicializa o crawler.
+
+        Args:
+            http_client: Cliente HTTP compartilhado (opcional; um novo, com limitador de taxa, é criado se ausente)
+            headers: Cabeçalhos HTTP usados quando um novo cliente é criado
+            max_concurrency: Número máximo de páginas baixadas simultaneamente
+            timeout: Tempo limite de cada requisição em segundos
+            dns_resolver: Resolvedor DNS compartilhado, com cache (opcional; um novo é criado se ausente)
+            max_page_bytes: Tamanho máximo de uma página; páginas maiores, pelo Content-Length ou pelos
+                bytes efetivamente recebidos, são descartadas como 'too_large'
+            chunk_size: Tamanho dos blocos lidos do corpo das respostas
+            http_cache: Cache de respostas para requisições condicionais (opcional)
+            use_sitemaps: Se True, lê o robots.txt e os sitemaps do site para semear a fronteira
+            max_sitemaps: Número máximo de arquivos de sitemap lidos (incluindo índices)
+            max_sitemap_urls: Número máximo de páginas obtidas dos sitemaps
+            allowed_content_types: Tipos MIME analisados (padrão: ALLOWED_CONTENT_TYPES)
+        """
+        self.http = http_client or HTTPClient(headers=headers, timeout=timeout, rate_limiter=RateLimiter())
+        self.dns_resolver = dns_resolver or DNSResolver()
+        self.max_concurrency = max(1, max_concurrency)
+        self.timeout = timeout
+        self.max_page_bytes = max_page_bytes
+        self.chunk_size = chunk_size
+        self.http_cache = http_cache
+        self.use_sitemaps = use_sitemaps
+        self.max_sitemaps = max_sitemaps
+        self.max_sitemap_urls = max_sitemap_urls
+        self.allowed_content_types = set(allowed_content_types or ALLOWED_CONTENT_TYPES)
+
+    def crawl(self, start_url: str, max_pages: int = 5,
+              progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+              force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Percorre um website a partir de uma URL inicial.
+
+        Args:
+            start_url: URL inicial do rastreamento
+            max_pages: Número máximo de páginas a serem analisadas
+            progress_callback: Função chamada com os e-mails novos de cada página (opcional)
+            force_refresh: Se True, baixa todas as páginas novamente, sem requisições condicionais
+
+        Returns:
+            Dicionário com os e-mails encontrados ('emails'), o número de páginas analisadas ('pages_scanned'),
+            o número de páginas obtidas dos sitemaps ('seeded_urls') e as páginas descartadas por motivo ('skipped')
+        """
+        return asyncio.run(self._crawl(start_url, max_pages, progress_callback, force_refresh))
+
+    async def _crawl(self, start_url: str, max_pages: int,
+                     progress_callback: Optional[Callable[[str, Dict[str, Any]], None]],
+                     force_refresh: bool = False) -> Dict[str, Any]:
+        """
+        Executa o rastreamento no loop de eventos.
+
+        Args:
+            start_url: URL inicial do rastreamento
+            max_pages: Número máximo de páginas a serem analisadas
+            progress_callback: Função chamada com os e-mails novos de cada página (opcional)
+            force_refresh: Se True, ignora os validadores armazenados no cache HTTP
+
+        Returns:
+            Dicionário com os e-mails encontrados e o número de páginas analisadas
+        """
+        emails_found: Set[str] = set()
+        start_url = canonicalize_url(start_url) or start_url
+        base_domain = urlparse(start_url).netloc
+
+        # Hosts que não resolvem são descartados antes de ocupar conexões e tempo limite do cliente HTTP
+        if not await self._host_resolves(urlparse(start_url).hostname or ''):
+            logger.warning(f"Host {base_domain} não possui endereços DNS; rastreamento ignorado")
+            return {'emails': emails_found, 'pages_scanned': 0, 'seeded_urls': 0,
+                    'skipped': dict.fromkeys(SKIP_REASONS, 0)}
+
+        skipped = dict.fromkeys(SKIP_REASONS, 0)
+        robots = None
+        user_agent = self.http.session.headers.get('User-Agent', '*')
+
+        def url_filter(candidate: str) -> bool:
+            # Arquivos que não são páginas e caminhos proibidos pelo robots.txt nem chegam à fila
+            if url_extension(candidate) in NON_HTML_EXTENSIONS:
+                skipped['extension'] += 1
+                return False
+            if robots is not None and not robots.can_fetch(user_agent, candidate):
+                skipped['robots'] += 1
+                return False
+            return True
+
+        # Páginas com cara de contato (contato, sobre, equipe) saem da fronteira primeiro
+        frontier = URLFrontier(allowed_hosts={base_domain}, priority=contact_priority, url_filter=url_filter)
+        in_flight = set()
+        pages_scheduled = 0
+        pages_scanned = 0
+        seeded_urls = 0
+
+        loop = asyncio.get_running_loop()
+        seed_slots = 1 if self.use_sitemaps else 0
+        executor = ThreadPoolExecutor(max_workers=self.max_concurrency + seed_slots, thread_name_prefix='osint-crawler')
+        seed_task = None
+
+        try:
+            if self.use_sitemaps:
+                # Um único download do robots.txt, concluído antes da primeira página: o limitador de
+                # taxa e o filtro da fronteira passam a usar as mesmas regras desde o início
+                robots = await loop.run_in_executor(executor, self._get_robots, start_url)
+
+                # Os sitemaps são lidos junto com a página inicial; as demais páginas aguardam a
+                # semeadura para que a fronteira já esteja ordenada quando o orçamento de páginas for gasto
+                seed_task = loop.run_in_executor(executor, self._discover_seeds, start_url, robots)
+                in_flight.add(seed_task)
+
+            frontier.add(start_url)
+
+            while frontier or in_flight:
+                # Preencher as vagas livres com as próximas URLs da fronteira
+                seeding = seed_task is not None and not seed_task.done()
+                while (frontier and pages_scheduled < max_pages
+                       and len(in_flight) - int(seeding) < self.max_concurrency
+                       and (not seeding or pages_scheduled == 0)):
+                    url = frontier.pop()
+                    pages_scheduled += 1
+                    in_flight.add(loop.run_in_executor(executor, self._fetch_and_parse, url, force_refresh))
+
+                if not in_flight:
+                    break
+
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+
+                for task in done:
+                    if task is seed_task:
+                        seed_urls = task.result()
+                        seeded_urls = frontier.add_many(seed_urls)
+                        if progress_callback and seeded_urls:
+                            progress_callback('sitemap', {'seeded_urls': seeded_urls})
+                        continue
+
+                    url, final_url, ok, page_emails, links, skip_reason = task.result()
+
+                    if skip_reason:
+                        skipped[skip_reason] += 1
+
+                    if not ok:
+                        continue
+
+                    # Após um redirecionamento, a página de destino não deve ser baixada de novo
+                    if final_url != url:
+                        frontier.mark_seen(final_url)
+                        if url == start_url:
+                            frontier.allow_host(final_url)
+
+                    pages_scanned += 1
+                    new_emails = page_emails - emails_found
+                    emails_found.update(page_emails)
+
+                    if progress_callback:
+                        progress_callback('page', {
+                            'url': url,
+                            'pages_scanned': pages_scanned,
+                            'new_emails': sorted(new_emails)
+                        })
+
+                    # Links relativos são resolvidos a partir da página onde foram encontrados
+                    if pages_scheduled < max_pages:
+                        frontier.add_many(links, base_url=final_url)
+        finally:
+            executor.shutdown(wait=False)
+
+        logger.info(f"Rastreamento concluído. Encontrados {len(emails_found)} e-mails em {pages_scanned} páginas.")
+        return {'emails': emails_found, 'pages_scanned': pages_scanned, 'seeded_urls': seeded_urls, 'skipped': skipped}
+
+    def _get_robots(self, start_url: str) -> Any:
+        """
+        Obtém as regras do robots.txt do site (executado em uma thread do pool).
+
+        Args:
+            start_url: URL inicial do rastreamento
+
+        Returns:
+            Regras do robots.txt ou None se não puderam ser obtidas
+        """
+        try:
+            return self.http.get_robots(start_url)
+        except Exception as e:
+            logger.warning(f"Erro ao ler robots.txt de {start_url}: {str(e)}")
+            return None
+
+    def _discover_seeds(self, start_url: str, robots: Any = None) -> List[str]:
+        """
+        Lê os sitemaps do site (executado em uma thread do pool).
+
+        Os sitemaps indicados no robots.txt (ou /sitemap.xml, se nenhum for indicado) são lidos
+        em fluxo; índices de sitemaps são seguidos até max_sitemaps arquivos.
+
+        Args:
+            start_url: URL inicial do rastreamento
+            robots: Regras do robots.txt já obtidas (opcional)
+
+        Returns:
+            Páginas listadas nos sitemaps
+        """
+        urls: List[str] = []
+
+        try:
+            sitemaps = list((robots.site_maps() if robots else None) or [])
+            pending = deque(sitemaps or [urljoin(start_url, '/sitemap.xml')])
+            visited = set()
+
+            while pending and len(visited) < self.max_sitemaps and len(urls) < self.max_sitemap_urls:
+                sitemap_url = pending.popleft()
+                if sitemap_url in visited:
+                    continue
+                visited.add(sitemap_url)
+
+                for kind, loc in self._iter_sitemap(sitemap_url):
+                    if kind == 'sitemap':
+                        pending.append(loc)
+                        continue
+
+                    urls.append(loc)
+                    if len(urls) >= self.max_sitemap_urls:
+                        break
+
+            logger.info(f"{len(urls)} páginas obtidas de {len(visited)} sitemaps de {start_url}")
+        except Exception as e:
+            logger.warning(f"Erro ao ler os sitemaps de {start_url}: {str(e)}")
+
+        return urls
+
+    def _iter_sitemap(self, sitemap_url: str) -> Iterator[Tuple[str, str]]:
+        """
+        Lê um sitemap em fluxo, sem carregá-lo inteiro na memória.
+
+        Args:
+            sitemap_url: URL do sitemap (XML, comprimido ou não)
+
+        Yields:
+            Tuplas ('sitemap', url) para entradas de índices e ('page', url) para páginas
+        """
+        response = self.http.get(sitemap_url, timeout=self.timeout, stream=True)
+
+        try:
+            if response.status_code != 200:
+                logger.info(f"Sitemap {sitemap_url} indisponível: Status {response.status_code}")
+                return
+
+            # Sem auto_close, o urllib3 não fecha o fluxo antes de o BufferedReader ler o fim do arquivo
+            response.raw.decode_content = True
+            response.raw.auto_close = False
+            stream = io.BufferedReader(response.raw)
+
+            # Arquivos .xml.gz costumam ser servidos sem Content-Encoding
+            if stream.peek(2)[:2] == b'\x1f\x8b':
+                stream = gzip.GzipFile(fileobj=stream)
+
+            root = None
+            kind = None
+
+            for event, element in ET.iterparse(stream, events=('start', 'end')):
+                tag = element.tag.rsplit('}', 1)[-1]
+
+                if event == 'start':
+                    if root is None:
+                        root = element
+                    if tag in ('sitemap', 'url'):
+                        kind = 'sitemap' if tag == 'sitemap' else 'page'
+                    continue
+
+                if tag == 'loc' and kind and element.text:
+                    yield kind, element.text.strip()
+                elif tag in ('sitemap', 'url'):
+                    # Descartar as entradas já lidas mantém a memória constante em sitemaps grandes
+                    root.clear()
+        except ET.ParseError as e:
+            logger.warning(f"Sitemap {sitemap_url} inválido: {str(e)}")
+        finally:
+            response.close()
+
+    async def _host_resolves(self, host: str) -> bool:
+        """
+        Verifica, pelo resolvedor com cache, se um host possui endereços IP.
+
+        Args:
+            host: Nome do host (endereços IP literais e 'localhost' são aceitos diretamente)
+
+        Returns:
+            True se o host possui ao menos um endereço
+        """
+        if not host or host == 'localhost':
+            return bool(host)
+
+        try:
+            ipaddress.ip_address(host)
+            return True
+        except ValueError:
+            pass
+
+        return bool(await self.dns_resolver.resolve_host(host))
+
+    def _fetch_and_parse(self, url: str, force_refresh: bool = False) -> Tuple[str, str, bool, Set[str], List[str], Optional[str]]:
+        """
+        Baixa uma página e extrai e-mails e links (executado em uma thread do pool).
+
+        O corpo é lido em blocos e cada bloco passa uma única vez pelo scanner de e-mails e
+        pelo extrator de links, sem manter a página inteira na memória.
+        Com cache HTTP, páginas já conhecidas são pedidas de forma condicional e, em uma
+        resposta 304, o corpo armazenado é reutilizado.
+        Respostas com tipo de conteúdo fora da lista permitida ou tamanho declarado acima de
+        max_page_bytes são descartadas logo após a chegada dos cabeçalhos, sem ler o corpo; sem
+        tamanho declarado (ou com um tamanho incorreto), a leitura é interrompida ao ultrapassar o limite.
+        A espera imposta pelo limitador de taxa ocorre aqui, ocupando apenas a vaga desta página.
+
+        Args:
+            url: URL da página
+            force_refresh: Se True, ignora os validadores armazenados no cache HTTP
+
+        Returns:
+            Tupla (url, url final após redirecionamentos, sucesso, e-mails encontrados, links encontrados sem resolver,
+            motivo do descarte, se houver)
+        """
+        try:
+            logger.info(f"Analisando página: {url}")
+            cached = self.http_cache.get(url) if self.http_cache else None
+            headers = self.http_cache.conditional_headers(cached) if (cached and not force_refresh) else {}
+            response = self.http.get(url, timeout=self.timeout, stream=True, headers=headers)
+            body_parts = None
+
+            try:
+                if response.status_code == 304 and headers:
+                    body = self.http_cache.get_body(url)
+                    if body is not None:
+                        logger.info(f"Página {url} não modificada; usando o corpo em cache")
+                        chunks = (body[i:i + self.chunk_size] for i in range(0, len(body), self.chunk_size))
+                        page_emails, links, _ = self._scan_body(url, chunks, cached['encoding'])
+                        return url, cached['final_url'], True, page_emails, links, None
+
+                    # O corpo foi removido do cache (ex: por outro rastreamento) depois da consulta aos
+                    # validadores: a página é baixada de novo, sem cabeçalhos condicionais, e volta ao cache
+                    logger.info(f"Corpo em cache de {url} indisponível após resposta 304; baixando a página novamente")
+                    response.close()
+                    response = self.http.get(url, timeout=self.timeout, stream=True)
+
+                if response.status_code != 200:
+                    logger.warning(f"Falha ao acessar {url}: Status {response.status_code}")
+                    return url, url, False, set(), [], None
+
+                skip_reason = self._check_headers(url, response)
+                if skip_reason:
+                    return url, response.url or url, False, set(), [], skip_reason
+
+                # Guardar o corpo apenas de respostas que poderão ser revalidadas
+                if self._is_cacheable(response):
+                    body_parts = []
+
+                page_emails, links, too_large = self._scan_body(
+                    url, response.iter_content(chunk_size=self.chunk_size), response.encoding, body_parts)
+            finally:
+                # Devolver a conexão ao pool, descartando o que não foi lido
+                response.close()
+
+            final_url = response.url or url
+
+            # O que foi lido de uma página grande demais é descartado, como no limite pelo Content-Length
+            if too_large:
+                return url, final_url, False, set(), [], 'too_large'
+
+            if body_parts is not None:
+                self.http_cache.store(
+                    url, final_url, b''.join(body_parts),
+                    etag=response.headers.get('ETag'),
+                    last_modified=response.headers.get('Last-Modified'),
+                    encoding=response.encoding,
+                    content_type=response.headers.get('Content-Type')
+                )
+
+            return url, final_url, True, page_emails, links, None
+
+        except Exception as e:
+            logger.error(f"Erro ao analisar {url}: {str(e)}")
+            return url, url, False, set(), [], None
+
+    def _check_headers(self, url: str, response) -> Optional[str]:
+        """
+        Aplica a política de download aos cabeçalhos de uma resposta, antes da leitura do corpo.
+
+        Args:
+            url: URL da página (usada nos logs)
+            response: Resposta HTTP obtida em modo stream
+
+        Returns:
+            Motivo do descarte ('content_type' ou 'too_large') ou None se a página pode ser lida
+        """
+        # Respostas sem Content-Type são lidas; o limite de max_page_bytes continua valendo durante a leitura
+        content_type = response.headers.get('Content-Type', '').split(';', 1)[0].strip().lower()
+        if content_type and content_type not in self.allowed_content_types:
+            logger.info(f"Página {url} ignorada: tipo de conteúdo {content_type}")
+            return 'content_type'
+
+        try:
+            content_length = int(response.headers.get('Content-Length', ''))
+        except ValueError:
+            content_length = None
+
+        if content_length is not None and content_length > self.max_page_bytes:
+            logger.info(f"Página {url} ignorada: {content_length} bytes excedem o limite de {self.max_page_bytes}")
+            return 'too_large'
+
+        return None
+
+    def _scan_body(self, url: str, chunks: Iterable[bytes], encoding: Optional[str],
+                   body_parts: Optional[List[bytes]] = None) -> Tuple[Set[str], List[str], bool]:
+        """
+        Passa os blocos de um corpo pelo scanner de e-mails e pelo extrator de links.
+
+        A leitura é interrompida assim que o corpo ultrapassa max_page_bytes.
+
+        Args:
+            url: URL da página (usada nos logs)
+            chunks: Blocos do corpo
+            encoding: Codificação do corpo
+            body_parts: Lista que recebe os blocos lidos, para armazenamento em cache (opcional)
+
+        Returns:
+            Tupla (e-mails encontrados, links encontrados, corpo acima do limite de tamanho)
+        """
+        email_scanner = EmailScanner()
+        link_extractor = LinkExtractor(encoding)
+        bytes_read = 0
+
+        for chunk in chunks:
+            bytes_read += len(chunk)
+            if bytes_read > self.max_page_bytes:
+                logger.info(f"Página {url} ignorada: mais de {self.max_page_bytes} bytes recebidos")
+                return set(), [], True
+
+            email_scanner.feed(chunk)
+            link_extractor.feed(chunk)
+
+            if body_parts is not None:
+                body_parts.append(chunk)
+
+        return email_scanner.close(), link_extractor.close(), False
+
+    def _is_cacheable(self, response) -> bool:
+        """
+        Verifica se uma resposta pode ser armazenada no cache HTTP.
+
+        Args:
+            response: Resposta HTTP
+
+        Returns:
+            True se há cache configurado e a resposta tem validadores e permite armazenamento
+        """
+        if not self.http_cache:
+            return False
+
+        if 'no-store' in response.headers.get('Cache-Control', '').lower():
+            return False
+
+        return bool(response.headers.get('ETag') or response.headers.get('Last-Modified'))
@@ -0,0 +1,591 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Resolução DNS para Ferramenta OSINT
+Este módulo implementa um resolvedor DNS assíncrono (UDP, com TCP para respostas truncadas),
+com cache em memória que respeita o TTL dos registros e consultas em lote com concorrência limitada.
+"""
+
+import time
+import random
+import socket
+import struct
+import asyncio
+import logging
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Iterable, Tuple, Union
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_dns_resolver')
+
+# Códigos dos tipos de registro suportados
+RECORD_TYPES = {'A': 1, 'NS': 2, 'CNAME': 5, 'MX': 15, 'TXT': 16, 'AAAA': 28}
+RECORD_NAMES = {code: name for name, code in RECORD_TYPES.items()}
+
+# Tipos consultados por padrão na análise de um domínio
+DEFAULT_RECORD_TYPES = ('A', 'AAAA', 'MX', 'NS', 'TXT')
+
+# Códigos de resposta relevantes
+RCODE_NOERROR = 0
+RCODE_NXDOMAIN = 3
+
+
+class DNSError(Exception):
+    """Erro na consulta a um servidor DNS."""
+
+
+def build_query(name: str, record_type: str, query_id: int) -> bytes:
+    """
+    Monta uma mensagem de consulta DNS.
+
+    Args:
+        name: Nome consultado
+        record_type: Tipo de registro ('A', 'MX', ...)
+        query_id: Identificador da consulta
+
+    Returns:
+        Mensagem DNS codificada
+    """
+    # Cabeçalho: id, flags (recursão desejada), 1 pergunta, 0 respostas
+    header = struct.pack('!HHHHHH', query_id, 0x0100, 1, 0, 0, 0)
+    return header + encode_name(name) + struct.pack('!HH', RECORD_TYPES[record_type], 1)
+
+
+def encode_name(name: str) -> bytes:
+    """
+    Codifica um nome de domínio no formato de rótulos do DNS.
+
+    Args:
+        name: Nome de domínio
+
+    Returns:
+        Nome codificado
+    """
+    encoded = b''
+    for label in name.strip('.').split('.'):
+        if label:
+            data = label.encode('idna')
+            encoded += bytes([len(data)]) + data
+    return encoded + b'\x00'
+
+
+def parse_response(data: bytes) -> Dict[str, Any]:
+    """
+    Decodifica uma mensagem de resposta DNS.
+
+    Args:
+        data: Mensagem recebida
+
+    Returns:
+        Dicionário com id, código de resposta, indicador de truncamento e registros da seção de respostas
+
+    Raises:
+        DNSError: Se a mensagem está incompleta ou malformada
+    """
+    if len(data) < 12:
+        raise DNSError("Resposta DNS incompleta")
+
+    try:
+        return _parse_message(data)
+    except (struct.error, IndexError, UnicodeDecodeError) as e:
+        # Uma resposta malformada conta como falha do servidor: o próximo servidor (ou o resolvedor do sistema) é tentado
+        raise DNSError(f"Resposta DNS malformada: {str(e)}") from e
+
+
+def _parse_message(data: bytes) -> Dict[str, Any]:
+    """Decodifica uma mensagem DNS com ao menos o cabeçalho completo (ver parse_response)."""
+    query_id, flags, qdcount, ancount, _, _ = struct.unpack('!HHHHHH', data[:12])
+    offset = 12
+
+    for _ in range(qdcount):
+        _, offset = _read_name(data, offset)
+        offset += 4
+
+    answers = []
+    for _ in range(ancount):
+        name, offset = _read_name(data, offset)
+        rtype, _, ttl, rdlength = struct.unpack('!HHIH', data[offset:offset + 10])
+        offset += 10
+        rdata_offset = offset
+        offset += rdlength
+
+        if offset > len(data):
+            raise DNSError("Registro DNS incompleto")
+
+        if rtype in RECORD_NAMES:
+            answers.append({
+                'name': name,
+                'type': RECORD_NAMES[rtype],
+                'ttl': ttl,
+                'value': _parse_rdata(data, rtype, rdata_offset, rdlength)
+            })
+
+    return {
+        'id': query_id,
+        'rcode': flags & 0x000F,
+        'truncated': bool(flags & 0x0200),
+        'answers': answers
+    }
+
+
+def _read_name(data: bytes, offset: int) -> Tuple[str, int]:
+    """
+    Lê um nome de domínio, seguindo ponteiros de compressão.
+
+    Args:
+        data: Mensagem DNS
+        offset: Posição inicial do nome
+
+    Returns:
+        Tupla (nome, posição logo após o nome na mensagem)
+    """
+    labels = []
+    end_offset = None
+    jumps = 0
+
+    while True:
+        if offset >= len(data):
+            raise DNSError("Nome DNS malformado")
+
+        length = data[offset]
+
+        if length & 0xC0 == 0xC0:
+            # Ponteiro de compressão: o restante do nome está em outra posição da mensagem
+            if end_offset is None:
+                end_offset = offset + 2
+            offset = ((length & 0x3F) << 8) | data[offset + 1]
+            jumps += 1
+            if jumps > 64:
+                raise DNSError("Ponteiros de compressão em ciclo")
+            continue
+
+        offset += 1
+        if length == 0:
+            break
+
+        labels.append(data[offset:offset + length].decode('ascii', errors='replace'))
+        offset += length
+
+    return '.'.join(labels), end_offset if end_offset is not None else offset
+
+
+def _parse_rdata(data: bytes, rtype: int, offset: int, length: int) -> Union[str, Dict[str, Any]]:
+    """
+    Decodifica os dados de um registro.
+
+    Args:
+        data: Mensagem DNS
+        rtype: Código do tipo do registro
+        offset: Posição dos dados do registro
+        length: Tamanho dos dados do registro
+
+    Returns:
+        Valor do registro (texto, ou dicionário para MX)
+    """
+    rdata = data[offset:offset + length]
+
+    if rtype == RECORD_TYPES['A']:
+        return socket.inet_ntop(socket.AF_INET, rdata)
+    if rtype == RECORD_TYPES['AAAA']:
+        return socket.inet_ntop(socket.AF_INET6, rdata)
+    if rtype == RECORD_TYPES['MX']:
+        preference = struct.unpack('!H', rdata[:2])[0]
+        exchange, _ = _read_name(data, offset + 2)
+        return {'preference': preference, 'exchange': exchange}
+    if rtype == RECORD_TYPES['TXT']:
+        # Um registro TXT pode ter vários segmentos de até 255 bytes
+        parts = []
+        position = 0
+        while position < len(rdata):
+            size = rdata[position]
+            parts.append(rdata[position + 1:position + 1 + size].decode('utf-8', errors='replace'))
+            position += 1 + size
+        return ''.join(parts)
+
+    # NS e CNAME contêm um nome
+    name, _ = _read_name(data, offset)
+    return name
+
+
+def load_system_nameservers(path: str = '/etc/resolv.conf') -> List[str]:
+    """
+    Obtém os servidores DNS configurados no sistema.
+
+    Args:
+        path: Arquivo de configuração do resolvedor
+
+    Returns:
+        Lista de endereços dos servidores DNS
+    """
+    nameservers = []
+
+    try:
+        with open(path, 'r') as f:
+            for line in f:
+                parts = line.split()
+                if len(parts) >= 2 and parts[0] == 'nameserver':
+                    nameservers.append(parts[1])
+    except OSError:
+        pass
+
+    return nameservers or ['8.8.8.8', '1.1.1.1']
+
+
+class _UDPQueryProtocol(asyncio.DatagramProtocol):
+    """Protocolo que aguarda a resposta de uma única consulta UDP."""
+
+    def __init__(self, query_id: int, future: asyncio.Future):
+        self.query_id = query_id
+        self.future = future
+
+    def datagram_received(self, data: bytes, addr):
+        # Respostas com outro id (atrasadas ou forjadas) são descartadas
+        if len(data) >= 2 and struct.unpack('!H', data[:2])[0] == self.query_id and not self.future.done():
+            self.future.set_result(data)
+
+    def error_received(self, exc: Exception):
+        if not self.future.done():
+            self.future.set_exception(exc)
+
+
+class DNSResolver:
+    """Resolvedor DNS assíncrono com cache em memória que respeita o TTL dos registros."""
+
+    def __init__(self, nameservers: Optional[List[Union[str, Tuple[str, int]]]] = None, timeout: float = 2.0,
+                 retries: int = 2, cache_size: int = 4096, max_ttl: int = 86400, negative_ttl: int = 60,
+                 use_system_fallback: bool = True):
+        """
+        Inicializa o resolvedor.
+
+        Args:
+            nameservers: Servidores DNS, como endereço ou tupla (endereço, porta) (padrão: os do sistema)
+            timeout: Tempo limite de cada tentativa em segundos
+            retries: Número de tentativas por servidor
+            cache_size: Número máximo de respostas mantidas em cache
+            max_ttl: TTL máximo, em segundos, aplicado às respostas em cache
+            negative_ttl: Tempo, em segundos, que respostas vazias ou NXDOMAIN ficam em cache
+            use_system_fallback: Se True, usa o resolvedor do sistema para A/AAAA quando nenhum servidor responde
+                ou a resposta é vazia (NXDOMAIN)
+        """
+        servers = nameservers or load_system_nameservers()
+        self.nameservers = [server if isinstance(server, tuple) else (server, 53) for server in servers]
+        self.timeout = timeout
+        self.retries = max(1, retries)
+        self.cache_size = cache_size
+        self.max_ttl = max_ttl
+        self.negative_ttl = negative_ttl
+        self.use_system_fallback = use_system_fallback
+        self._cache: "OrderedDict[Tuple[str, str], Tuple[float, List[Any]]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._stats = {'hits': 0, 'misses': 0, 'queries': 0, 'failures': 0}
+
+    async def query(self, name: str, record_type: str = 'A') -> List[Any]:
+        """
+        Consulta os registros de um tipo para um nome, usando o cache quando possível.
+
+        Args:
+            name: Nome consultado
+            record_type: Tipo de registro ('A', 'AAAA', 'MX', 'NS', 'TXT' ou 'CNAME')
+
+        Returns:
+            Lista de valores dos registros (vazia se não existirem)
+        """
+        name = name.strip().rstrip('.').lower()
+        record_type = record_type.upper()
+
+        if record_type not in RECORD_TYPES:
+            raise ValueError(f"Tipo de registro não suportado: {record_type}")
+
+        cached = self._cache_get((name, record_type))
+        if cached is not None:
+            return cached
+
+        system_fallback = self.use_system_fallback and record_type in ('A', 'AAAA')
+
+        try:
+            records, ttl = await self._query_servers(name, record_type)
+        except DNSError as e:
+            self._stats['failures'] += 1
+            if not system_fallback:
+                logger.error(f"Falha na consulta DNS {record_type} de {name}: {str(e)}")
+                raise
+            logger.warning(f"Servidores DNS indisponíveis para {name}; usando o resolvedor do sistema")
+            records, ttl = await self._query_system(name, record_type), self.negative_ttl
+        else:
+            if not records and system_fallback:
+                # Nomes do /etc/hosts e dos domínios de busca do resolv.conf só existem para o resolvedor do sistema
+                records = await self._query_system(name, record_type)
+
+        self._cache_set((name, record_type), records, ttl)
+        return records
+
+    async def lookup(self, name: str, record_types: Iterable[str] = DEFAULT_RECORD_TYPES) -> Dict[str, List[Any]]:
+        """
+        Consulta vários tipos de registro de um nome simultaneamente.
+
+        Args:
+            name: Nome consultado
+            record_types: Tipos de registro
+
+        Returns:
+            Dicionário tipo -> registros (tipos que falharam ficam com lista vazia)
+        """
+        record_types = list(record_types)
+        results = await asyncio.gather(*(self.query(name, rtype) for rtype in record_types), return_exceptions=True)
+
+        return {
+            rtype: (result if not isinstance(result, BaseException) else [])
+            for rtype, result in zip(record_types, results)
+        }
+
+    async def resolve_many(self, names: Iterable[str], record_types: Iterable[str] = ('A',),
+                           concurrency: int = 50) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Consulta uma lista de nomes com concorrência limitada.
+
+        Args:
+            names: Nomes consultados
+            record_types: Tipos de registro consultados para cada nome
+            concurrency: Número máximo de nomes consultados simultaneamente
+
+        Returns:
+            Dicionário nome -> (tipo -> registros)
+        """
+        record_types = list(record_types)
+        semaphore = asyncio.Semaphore(max(1, concurrency))
+
+        async def resolve(name: str):
+            async with semaphore:
+                return name, await self.lookup(name, record_types)
+
+        results = await asyncio.gather(*(resolve(name) for name in dict.fromkeys(names)))
+        return dict(results)
+
+    async def resolve_host(self, host: str) -> List[str]:
+        """
+        Obtém os endereços IPv4 e IPv6 de um host.
+
+        Args:
+            host: Nome do host
+
+        Returns:
+            Lista de endereços IP
+        """
+        records = await self.lookup(host, ('A', 'AAAA'))
+        return records['A'] + records['AAAA']
+
+    def lookup_sync(self, name: str, record_types: Iterable[str] = DEFAULT_RECORD_TYPES,
+                    timeout: Optional[float] = None) -> Dict[str, List[Any]]:
+        """
+        Versão síncrona de lookup, para uso fora de um loop de eventos.
+
+        Args:
+            name: Nome consultado
+            record_types: Tipos de registro
+            timeout: Prazo total da consulta em segundos, somadas as tentativas (opcional)
+
+        Returns:
+            Dicionário tipo -> registros
+
+        Raises:
+            asyncio.TimeoutError: Se o prazo total terminar antes das respostas
+        """
+        lookup = self.lookup(name, record_types)
+        if timeout is not None:
+            lookup = asyncio.wait_for(lookup, timeout)
+
+        return asyncio.run(lookup)
+
+    def resolve_many_sync(self, names: Iterable[str], record_types: Iterable[str] = ('A',),
+                          concurrency: int = 50) -> Dict[str, Dict[str, List[Any]]]:
+        """
+        Versão síncrona de resolve_many, para uso fora de um loop de eventos.
+
+        Args:
+            names: Nomes consultados
+            record_types: Tipos de registro consultados para cada nome
+            concurrency: Número máximo de nomes consultados simultaneamente
+
+        Returns:
+            Dicionário nome -> (tipo -> registros)
+        """
+        return asyncio.run(self.resolve_many(names, record_types, concurrency))
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de uso do cache e das consultas.
+
+        Returns:
+            Dicionário com acertos, falhas e tamanho do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['cache_entries'] = len(self._cache)
+
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_ratio'] = round(stats['hits'] / lookups, 4) if lookups else 0.0
+        return stats
+
+    def clear_cache(self):
+        """Remove todas as respostas do cache."""
+        with self._lock:
+            self._cache.clear()
+
+    async def _query_servers(self, name: str, record_type: str) -> Tuple[List[Any], float]:
+        """
+        Envia a consulta aos servidores configurados até obter uma resposta.
+
+        Args:
+            name: Nome consultado
+            record_type: Tipo de registro
+
+        Returns:
+            Tupla (registros, TTL em segundos)
+        """
+        last_error: Optional[Exception] = None
+
+        for _ in range(self.retries):
+            for server in self.nameservers:
+                query_id = random.randint(0, 0xFFFF)
+                message = build_query(name, record_type, query_id)
+
+                try:
+                    self._stats['queries'] += 1
+                    response = parse_response(await self._send_udp(server, message, query_id))
+
+                    # Respostas que não cabem em UDP são repetidas via TCP
+                    if response['truncated']:
+                        response = parse_response(await self._send_tcp(server, message))
+                except (asyncio.TimeoutError, OSError, DNSError) as e:
+                    last_error = e
+                    continue
+
+                if response['rcode'] not in (RCODE_NOERROR, RCODE_NXDOMAIN):
+                    last_error = DNSError(f"Servidor {server[0]} respondeu com código {response['rcode']}")
+                    continue
+
+                records = [answer['value'] for answer in response['answers'] if answer['type'] == record_type]
+
+                if not records:
+                    return [], self.negative_ttl
+
+                # A resposta expira junto com o registro de menor TTL
+                ttl = min(answer['ttl'] for answer in response['answers'] if answer['type'] == record_type)
+                return records, min(ttl, self.max_ttl)
+
+        raise DNSError(f"Nenhum servidor DNS respondeu para {name} ({record_type}): {last_error}")
+
+    async def _send_udp(self, server: Tuple[str, int], message: bytes, query_id: int) -> bytes:
+        """
+        Envia uma consulta via UDP e aguarda a resposta.
+
+        Args:
+            server: Tupla (endereço, porta) do servidor
+            message: Consulta codificada
+            query_id: Identificador da consulta
+
+        Returns:
+            Resposta recebida
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _UDPQueryProtocol(query_id, future),
+            remote_addr=server
+        )
+
+        try:
+            transport.sendto(message)
+            return await asyncio.wait_for(future, self.timeout)
+        finally:
+            transport.close()
+
+    async def _send_tcp(self, server: Tuple[str, int], message: bytes) -> bytes:
+        """
+        Envia uma consulta via TCP (usado quando a resposta UDP vem truncada).
+
+        Args:
+            server: Tupla (endereço, porta) do servidor
+            message: Consulta codificada
+
+        Returns:
+            Resposta recebida
+        """
+        reader, writer = await asyncio.wait_for(asyncio.open_connection(*server), self.timeout)
+
+        try:
+            writer.write(struct.pack('!H', len(message)) + message)
+            await writer.drain()
+            length = struct.unpack('!H', await asyncio.wait_for(reader.readexactly(2), self.timeout))[0]
+            return await asyncio.wait_for(reader.readexactly(length), self.timeout)
+        finally:
+            writer.close()
+
+    async def _query_system(self, name: str, record_type: str) -> List[str]:
+        """
+        Resolve endereços usando o resolvedor do sistema (getaddrinfo).
+
+        Args:
+            name: Nome consultado
+            record_type: 'A' ou 'AAAA'
+
+        Returns:
+            Lista de endereços IP
+        """
+        family = socket.AF_INET if record_type == 'A' else socket.AF_INET6
+
+        try:
+            infos = await asyncio.get_running_loop().getaddrinfo(name, None, family=family, type=socket.SOCK_STREAM)
+        except socket.gaierror:
+            return []
+
+        return list(dict.fromkeys(info[4][0] for info in infos))
+
+    def _cache_get(self, key: Tuple[str, str]) -> Optional[List[Any]]:
+        """
+        Obtém uma resposta do cache, se ainda válida.
+
+        Args:
+            key: Tupla (nome, tipo)
+
+        Returns:
+            Registros em cache ou None
+        """
+        with self._lock:
+            entry = self._cache.get(key)
+
+            if entry is not None and entry[0] > time.monotonic():
+                self._cache.move_to_end(key)
+                self._stats['hits'] += 1
+                return list(entry[1])
+
+            if entry is not None:
+                del self._cache[key]
+
+            self._stats['misses'] += 1
+            return None
+
+    def _cache_set(self, key: Tuple[str, str], records: List[Any], ttl: float):
+        """
+        Armazena uma resposta no cache pelo tempo do seu TTL.
+
+        Args:
+            key: Tupla (nome, tipo)
+            records: Registros da resposta
+            ttl: Tempo de validade em segundos
+        """
+        if ttl <= 0:
+            return
+
+        with self._lock:
+            self._cache[key] = (time.monotonic() + ttl, list(records))
+            self._cache.move_to_end(key)
+
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
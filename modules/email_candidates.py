@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Geração de Candidatos de E-mail para Ferramenta OSINT
+Este módulo gera, de forma vetorizada, os e-mails candidatos de listas de pessoas em domínios conhecidos,
+processando a entrada em blocos e gravando os candidatos em CSV ou Parquet sem mantê-los todos na memória.
+"""
+
+import os
+import logging
+import unicodedata
+from string import Formatter
+from typing import List, Optional, Iterator
+
+import pandas as pd
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_email_candidates')
+
+# Padrões de parte local e número mínimo de partes do nome para aplicá-los
+# (first: primeiro nome, last: último sobrenome, f/m: iniciais do primeiro nome e do nome do meio)
+NAME_TEMPLATES = [
+    ('{first}', 1),
+    ('{last}', 2),
+    ('{first}{last}', 2),
+    ('{first}.{last}', 2),
+    ('{first}_{last}', 2),
+    ('{first}-{last}', 2),
+    ('{f}{last}', 2),
+    ('{f}.{last}', 2),
+    ('{last}{first}', 2),
+    ('{last}.{first}', 2),
+    ('{last}_{first}', 2),
+    ('{first}{m}{last}', 3),
+    ('{first}.{m}.{last}', 3),
+    ('{initials}', 3)
+]
+
+# Nomes aceitos para as colunas do CSV de entrada
+NAME_COLUMNS = ('name', 'nome', 'full_name', 'nome_completo')
+DOMAIN_COLUMNS = ('domain', 'domains', 'dominio', 'dominios', 'domínio', 'domínios')
+
+# Separadores aceitos entre vários domínios na mesma célula
+DOMAIN_SEPARATORS = r'[;,|\s]+'
+
+DOMAIN_PATTERN = r'([a-z0-9]([a-z0-9\-]{0,61}[a-z0-9])?\.)+[a-z]{2,}'
+
+OUTPUT_COLUMNS = ['name', 'domain', 'pattern', 'email']
+
+_FORMATTER = Formatter()
+
+
+def normalize_name(name: str) -> List[str]:
+    """
+    Normaliza um nome para a geração de e-mails: remove acentos, pontuação e caixa alta.
+
+    Args:
+        name: Nome completo
+
+    Returns:
+        Partes do nome normalizado
+    """
+    ascii_name = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode('ascii')
+    ascii_name = ascii_name.lower().replace('-', ' ')
+    return ''.join(c for c in ascii_name if c.isalnum() or c.isspace()).split()
+
+
+def name_variations(name_parts: List[str]) -> List[str]:
+    """
+    Gera as partes locais de e-mail de um nome já normalizado, segundo NAME_TEMPLATES.
+
+    Args:
+        name_parts: Partes do nome (primeiro nome, sobrenomes)
+
+    Returns:
+        Partes locais distintas, na ordem dos padrões
+    """
+    if not name_parts:
+        return []
+
+    fields = {
+        'first': name_parts[0],
+        'last': name_parts[-1],
+        'f': name_parts[0][0],
+        'm': name_parts[1][0] if len(name_parts) > 2 else '',
+        'initials': ''.join(part[0] for part in name_parts)
+    }
+
+    variations = (template.format(**fields) for template, min_parts in NAME_TEMPLATES if len(name_parts) >= min_parts)
+    return list(dict.fromkeys(variations))
+
+
+def normalize_names(names: pd.Series) -> pd.Series:
+    """
+    Versão vetorizada de normalize_name, aplicada a uma coluna inteira de uma vez.
+
+    Args:
+        names: Nomes completos
+
+    Returns:
+        Nomes normalizados, com as partes separadas por um único espaço
+    """
+    return (
+        names.fillna('').astype(str)
+        .str.normalize('NFKD').str.encode('ascii', 'ignore').str.decode('ascii')
+        .str.lower()
+        .str.replace('-', ' ', regex=False)
+        .str.replace(r'[^a-z0-9\s]', '', regex=True)
+        .str.split().str.join(' ')
+    )
+
+
+def candidates_frame(names: pd.Series, domains: pd.Series) -> pd.DataFrame:
+    """
+    Gera os e-mails candidatos de um bloco de pessoas, sem laços por pessoa.
+
+    Cada padrão de NAME_TEMPLATES é montado com operações de coluna sobre o bloco inteiro;
+    as partes locais são então combinadas com os domínios de cada linha por uma junção.
+
+    Args:
+        names: Nomes completos
+        domains: Domínios de cada linha, uma entrada por domínio, indexados pela linha (ver parse_domains)
+
+    Returns:
+        DataFrame com as colunas OUTPUT_COLUMNS, indexado pela linha de origem
+    """
+    normalized = normalize_names(names)
+    parts = normalized.str.split(' ')
+    part_count = normalized.str.count(' ') + (normalized != '').astype(int)
+
+    fields = {
+        'first': parts.str[0].fillna(''),
+        'last': parts.str[-1].fillna(''),
+        'f': parts.str[0].str[0].fillna(''),
+        'm': parts.str[1].str[0].where(part_count > 2, '').fillna(''),
+        # Primeira letra de cada parte
+        'initials': normalized.str.replace(r'(\w)\w*\s*', r'\1', regex=True)
+    }
+
+    local_parts = []
+    for template, min_parts in NAME_TEMPLATES:
+        mask = part_count >= min_parts
+        if not mask.any():
+            continue
+
+        value = pd.Series('', index=normalized.index[mask])
+        for literal, field, _, _ in _FORMATTER.parse(template):
+            value = value + literal
+            if field:
+                value = value + fields[field][mask]
+
+        local_parts.append(pd.DataFrame({'row': value.index, 'pattern': template, 'local_part': value.values}))
+
+    if not local_parts:
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
+
+    # Nomes curtos geram a mesma parte local em padrões diferentes; vale o primeiro padrão
+    locals_frame = pd.concat(local_parts, ignore_index=True).drop_duplicates(['row', 'local_part'])
+
+    domain_frame = domains.rename('domain').rename_axis('row').reset_index()
+    domain_frame = domain_frame.drop_duplicates(['row', 'domain'])
+
+    frame = locals_frame.merge(domain_frame, on='row', how='inner', sort=False)
+    frame = frame.sort_values(['row', 'domain'], kind='stable')
+    frame['name'] = names.fillna('').astype(str).str.strip().loc[frame['row']].values
+    frame['email'] = frame['local_part'] + '@' + frame['domain']
+
+    # O índice identifica a linha de origem de cada candidato (não é gravado na saída)
+    return frame.set_index('row')[OUTPUT_COLUMNS]
+
+
+def parse_domains(cells: pd.Series, default_domains: Optional[List[str]] = None) -> pd.Series:
+    """
+    Separa e valida os domínios de cada linha; linhas sem domínios válidos recebem os domínios padrão.
+
+    Args:
+        cells: Células da coluna de domínios (vários domínios separados por ';', ',', '|' ou espaço)
+        default_domains: Domínios aplicados às linhas sem domínio (opcional)
+
+    Returns:
+        Série com um domínio por entrada, indexada pela linha de origem (uma linha pode se repetir)
+    """
+    defaults = [d.strip().lower() for d in (default_domains or []) if d and d.strip()]
+    exploded = cells.fillna('').astype(str).str.lower().str.split(DOMAIN_SEPARATORS, regex=True).explode()
+    domains = exploded[exploded.str.fullmatch(DOMAIN_PATTERN, na=False)]
+
+    # Formato longo: evita montar uma lista Python por linha
+    missing = cells.index.difference(domains.index)
+    if defaults and len(missing):
+        filler = pd.Series(defaults * len(missing), index=missing.repeat(len(defaults)))
+        domains = pd.concat([domains, filler]).sort_index(kind='stable')
+
+    return domains
+
+
+def read_people(input_file: str, chunk_size: int = 10000) -> Iterator[pd.DataFrame]:
+    """
+    Lê o CSV de pessoas em blocos, identificando as colunas de nome e de domínios.
+
+    A coluna de nomes é a primeira cujo cabeçalho está em NAME_COLUMNS (ou a primeira coluna);
+    a de domínios, a primeira cujo cabeçalho está em DOMAIN_COLUMNS (opcional).
+
+    Args:
+        input_file: Caminho do arquivo CSV
+        chunk_size: Número de linhas por bloco
+
+    Yields:
+        Blocos com as colunas 'name' e 'domains'
+    """
+    reader = pd.read_csv(input_file, dtype=str, keep_default_na=False, chunksize=chunk_size,
+                         skipinitialspace=True, encoding='utf-8', encoding_errors='ignore')
+
+    for chunk in reader:
+        columns = {str(column).strip().lower(): column for column in chunk.columns}
+        name_column = next((columns[c] for c in NAME_COLUMNS if c in columns), chunk.columns[0])
+        domain_column = next((columns[c] for c in DOMAIN_COLUMNS if c in columns), None)
+
+        yield pd.DataFrame({
+            'name': chunk[name_column],
+            'domains': chunk[domain_column] if domain_column is not None else ''
+        }, index=chunk.index)
+
+
+class CandidateWriter:
+    """Grava blocos de candidatos em CSV ou Parquet, à medida que são gerados."""
+
+    FORMATS = ('csv', 'parquet')
+
+    def __init__(self, output_file: str, output_format: str = 'csv'):
+        """
+        Inicializa o gravador.
+
+        Args:
+            output_file: Arquivo de saída
+            output_format: Formato da saída ('csv' ou 'parquet')
+        """
+        if output_format not in self.FORMATS:
+            raise ValueError(f"Formato de saída não suportado: {output_format}")
+
+        self.output_file = output_file
+        self.output_format = output_format
+        self.rows = 0
+        self._file = None
+        self._parquet_writer = None
+
+        output_dir = os.path.dirname(output_file)
+        if output_dir and not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        if output_format == 'parquet':
+            # Importado apenas quando necessário: o pyarrow é uma dependência opcional
+            import pyarrow  # noqa: F401
+        else:
+            self._file = open(output_file, 'w', encoding='utf-8', newline='')
+
+    def write(self, frame: pd.DataFrame):
+        """
+        Acrescenta um bloco de candidatos à saída.
+
+        Args:
+            frame: DataFrame com as colunas OUTPUT_COLUMNS
+        """
+        if self.output_format == 'parquet':
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.Table.from_pandas(frame, preserve_index=False)
+            if self._parquet_writer is None:
+                self._parquet_writer = pq.ParquetWriter(self.output_file, table.schema)
+            self._parquet_writer.write_table(table)
+        else:
+            frame.to_csv(self._file, header=self._file.tell() == 0, index=False)
+
+        self.rows += len(frame)
+
+    def close(self):
+        """Finaliza o arquivo de saída."""
+        if self.output_format == 'parquet':
+            if self._parquet_writer is None:
+                # Mesmo sem candidatos, o arquivo deve existir com o esquema esperado
+                self.write(pd.DataFrame(columns=OUTPUT_COLUMNS, dtype=str))
+            self._parquet_writer.close()
+        elif self._file:
+            if self._file.tell() == 0:
+                pd.DataFrame(columns=OUTPUT_COLUMNS).to_csv(self._file, index=False)
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
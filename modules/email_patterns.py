@@ -0,0 +1,291 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Inferência de Padrões de E-mail para Ferramenta OSINT
+Este módulo aprende, a partir dos e-mails encontrados em um domínio, o formato predominante da parte local
+(ex: nome.sobrenome ou nsobrenome) e ordena os e-mails candidatos de uma pessoa pela sua probabilidade.
+"""
+
+import re
+import logging
+from datetime import datetime
+from typing import Dict, List, Any, Optional, Iterable
+from modules.cache import PersistentCache
+from modules.email_candidates import NAME_TEMPLATES
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_email_patterns')
+
+# Frequência aproximada de cada padrão em domínios corporativos, usada quando há poucos exemplos
+PRIOR_WEIGHTS = {
+    '{first}.{last}': 0.30,
+    '{f}{last}': 0.15,
+    '{first}': 0.12,
+    '{first}{last}': 0.08,
+    '{first}_{last}': 0.06,
+    '{f}.{last}': 0.06,
+    '{last}': 0.04,
+    '{first}.{m}.{last}': 0.04,
+    '{first}-{last}': 0.03,
+    '{last}.{first}': 0.03,
+    '{first}{m}{last}': 0.03,
+    '{last}{first}': 0.02,
+    '{last}_{first}': 0.02,
+    '{initials}': 0.02
+}
+
+# Nomes dos padrões na notação usada em _generate_email_patterns
+TEMPLATE_LABELS = {
+    '{first}': 'nome',
+    '{last}': 'sobrenome',
+    '{first}{last}': 'nomesob',
+    '{first}.{last}': 'nome.sobrenome',
+    '{first}_{last}': 'nome_sobrenome',
+    '{first}-{last}': 'nome-sobrenome',
+    '{f}{last}': 'nsobrenome',
+    '{f}.{last}': 'n.sobrenome',
+    '{last}{first}': 'sobrenomenome',
+    '{last}.{first}': 'sobrenome.nome',
+    '{last}_{first}': 'sobrenome_nome',
+    '{first}{m}{last}': 'nomemsobrenome',
+    '{first}.{m}.{last}': 'nome.m.sobrenome',
+    '{initials}': 'iniciais'
+}
+
+# Contas funcionais, que não seguem o formato dos e-mails de pessoas
+ROLE_ACCOUNTS = {
+    'contato', 'contatos', 'contact', 'info', 'informacoes', 'atendimento', 'suporte', 'support', 'vendas',
+    'sales', 'comercial', 'admin', 'administracao', 'administrativo', 'rh', 'hr', 'financeiro', 'finance',
+    'marketing', 'sac', 'ouvidoria', 'imprensa', 'press', 'faleconosco', 'noreply', 'no-reply', 'webmaster',
+    'postmaster', 'hostmaster', 'abuse', 'hello', 'ola', 'oi', 'help', 'ajuda', 'office', 'secretaria',
+    'diretoria', 'juridico', 'legal', 'compras', 'ti', 'it', 'jobs', 'carreiras', 'careers', 'vagas',
+    'newsletter', 'news', 'privacidade', 'privacy', 'dpo', 'lgpd', 'cobranca', 'billing', 'faturamento',
+    'recepcao', 'reservas', 'eventos', 'parcerias', 'ir', 'ri', 'investidores', 'mail', 'email', 'site'
+}
+
+# Primeiros nomes frequentes, usados para distinguir 'nome', 'nomesobrenome' e 'nsobrenome' sem separadores
+COMMON_FIRST_NAMES = {
+    'ana', 'maria', 'joao', 'jose', 'antonio', 'francisco', 'carlos', 'paulo', 'pedro', 'lucas', 'luiz',
+    'luis', 'marcos', 'gabriel', 'rafael', 'daniel', 'marcelo', 'bruno', 'eduardo', 'felipe', 'rodrigo',
+    'manoel', 'mateus', 'andre', 'fernando', 'fabio', 'leonardo', 'gustavo', 'guilherme', 'leandro',
+    'tiago', 'thiago', 'diego', 'ricardo', 'sergio', 'roberto', 'renato', 'vitor', 'victor', 'igor',
+    'julio', 'cesar', 'alexandre', 'sandro', 'marcio', 'mario', 'jorge', 'raul', 'hugo', 'caio', 'otavio',
+    'juliana', 'mariana', 'fernanda', 'patricia', 'aline', 'camila', 'amanda', 'bruna', 'jessica',
+    'leticia', 'julia', 'luana', 'vanessa', 'beatriz', 'larissa', 'adriana', 'gabriela', 'marcia',
+    'debora', 'sandra', 'carla', 'cristina', 'paula', 'renata', 'simone', 'tatiana', 'claudia', 'luciana',
+    'lucia', 'sara', 'sarah', 'isabela', 'isabel', 'helena', 'laura', 'alice', 'sofia', 'rita', 'vera',
+    'john', 'james', 'robert', 'michael', 'william', 'david', 'richard', 'joseph', 'thomas', 'charles',
+    'mark', 'paul', 'peter', 'george', 'kevin', 'brian', 'steven', 'mary', 'linda', 'susan', 'karen',
+    'lisa', 'nancy', 'emily', 'emma', 'anna', 'jennifer', 'elizabeth', 'barbara'
+}
+
+_SEPARATOR_PATTERN = re.compile(r'[._-]')
+_TRAILING_DIGITS_PATTERN = re.compile(r'\d+$')
+
+
+def classify_local_part(local_part: str) -> Dict[str, float]:
+    """
+    Estima o padrão de nome que gerou a parte local de um e-mail.
+
+    Partes locais sem separador são ambíguas (ex: 'jsilva' pode ser 'nsobrenome' ou 'sobrenome');
+    nesses casos o peso é distribuído entre os padrões possíveis.
+
+    Args:
+        local_part: Parte local do e-mail (antes do '@')
+
+    Returns:
+        Pesos dos padrões de NAME_TEMPLATES (somam 1) ou dicionário vazio para contas funcionais e formatos desconhecidos
+    """
+    local_part = _TRAILING_DIGITS_PATTERN.sub('', (local_part or '').lower().split('+', 1)[0])
+
+    if not local_part or local_part in ROLE_ACCOUNTS or not re.fullmatch(r'[a-z]+([._-][a-z]+)*', local_part):
+        return {}
+
+    tokens = _SEPARATOR_PATTERN.split(local_part)
+    separators = _SEPARATOR_PATTERN.findall(local_part)
+
+    if len(tokens) == 1:
+        token = tokens[0]
+        if len(token) <= 3:
+            return {'{initials}': 1.0}
+        if token in COMMON_FIRST_NAMES:
+            return {'{first}': 1.0}
+        prefix = next((token[:size] for size in range(len(token) - 2, 1, -1) if token[:size] in COMMON_FIRST_NAMES), None)
+        if prefix:
+            return {'{first}{last}': 1.0}
+        if token[1:] in COMMON_FIRST_NAMES:
+            return {'{last}': 1.0}
+        return {'{f}{last}': 0.6, '{last}': 0.25, '{first}{last}': 0.15}
+
+    if len(tokens) == 2:
+        separator = separators[0]
+        if len(tokens[0]) == 1 and separator == '.':
+            return {'{f}.{last}': 1.0}
+        if len(tokens[0]) == 1 or len(tokens[1]) == 1:
+            return {}
+        direct = '{first}' + separator + '{last}'
+        reverse = '{last}' + separator + '{first}'
+        # A ordem sobrenome-nome só é reconhecível quando o nome aparece em segundo lugar
+        if tokens[1] in COMMON_FIRST_NAMES and tokens[0] not in COMMON_FIRST_NAMES and reverse in PRIOR_WEIGHTS:
+            return {reverse: 1.0}
+        if direct not in PRIOR_WEIGHTS:
+            return {}
+        return {direct: 0.9, reverse: 0.1} if reverse in PRIOR_WEIGHTS else {direct: 1.0}
+
+    if len(tokens) == 3 and separators == ['.', '.'] and len(tokens[1]) == 1:
+        return {'{first}.{m}.{last}': 1.0}
+
+    return {}
+
+
+class EmailPatternInference:
+    """Modelo de padrões de e-mail por domínio, aprendido dos e-mails encontrados e mantido em cache."""
+
+    def __init__(self, cache: PersistentCache, smoothing: float = 2.0, max_samples: int = 500):
+        """
+        Inicializa o modelo.
+
+        Args:
+            cache: Cache persistente onde o modelo de cada domínio é armazenado
+            smoothing: Peso das frequências a priori (PRIOR_WEIGHTS) frente aos exemplos observados
+            max_samples: Número máximo de e-mails de exemplo mantidos por domínio
+        """
+        self.cache = cache
+        self.smoothing = smoothing
+        self.max_samples = max_samples
+
+    def learn(self, domain: str, emails: Iterable[str]) -> Dict[str, Any]:
+        """
+        Atualiza o modelo de um domínio com novos e-mails encontrados.
+
+        Os exemplos já conhecidos são mantidos, de modo que rastreamentos repetidos não contam
+        o mesmo e-mail duas vezes. E-mails de outros domínios e contas funcionais são ignorados.
+
+        Args:
+            domain: Domínio do modelo
+            emails: E-mails encontrados (de qualquer domínio)
+
+        Returns:
+            Modelo atualizado do domínio
+        """
+        domain = domain.lower().strip()
+        model = self.cache.get(domain)
+        samples = list(model['samples']) if model else []
+        known = set(samples)
+
+        for email in emails:
+            email = email.lower()
+            local_part, _, email_domain = email.rpartition('@')
+            if not (email_domain == domain or email_domain.endswith('.' + domain)):
+                continue
+            if email in known or not classify_local_part(local_part):
+                continue
+
+            known.add(email)
+            samples.append(email)
+
+        model = self._build_model(domain, samples[-self.max_samples:])
+        if model['samples']:
+            model = self.cache.set(domain, model)
+            logger.info(f"Padrão predominante de {domain}: {model['dominant']} ({len(model['samples'])} exemplos)")
+
+        return model
+
+    def get_model(self, domain: str) -> Dict[str, Any]:
+        """
+        Obtém o modelo de um domínio (as frequências a priori, se nenhum e-mail do domínio foi aprendido).
+
+        Args:
+            domain: Domínio consultado
+
+        Returns:
+            Modelo do domínio
+        """
+        domain = domain.lower().strip()
+        return self.cache.get(domain) or self._build_model(domain, [])
+
+    def rank(self, name_parts: List[str], domains: List[str], top_k: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Ordena os e-mails candidatos de uma pessoa pela probabilidade do padrão em cada domínio.
+
+        Args:
+            name_parts: Partes do nome já normalizado
+            domains: Domínios candidatos
+            top_k: Número máximo de candidatos devolvidos (opcional)
+
+        Returns:
+            Candidatos com e-mail, domínio, padrão e pontuação, do mais provável ao menos provável
+        """
+        if not name_parts:
+            return []
+
+        fields = {
+            'first': name_parts[0],
+            'last': name_parts[-1],
+            'f': name_parts[0][0],
+            'm': name_parts[1][0] if len(name_parts) > 2 else '',
+            'initials': ''.join(part[0] for part in name_parts)
+        }
+
+        ranked = []
+        for domain in domains:
+            probabilities = self.get_model(domain)['probabilities']
+            scores = {}
+
+            for template, min_parts in NAME_TEMPLATES:
+                if len(name_parts) < min_parts:
+                    continue
+                # Padrões diferentes podem gerar a mesma parte local; vale a maior pontuação
+                local_part = template.format(**fields)
+                score = probabilities.get(template, 0.0)
+                if local_part not in scores or score > scores[local_part][1]:
+                    scores[local_part] = (template, score)
+
+            for local_part, (template, score) in scores.items():
+                ranked.append({
+                    'email': f"{local_part}@{domain}",
+                    'domain': domain,
+                    'pattern': TEMPLATE_LABELS[template],
+                    'score': round(score, 4)
+                })
+
+        ranked.sort(key=lambda candidate: candidate['score'], reverse=True)
+        return ranked[:top_k] if top_k else ranked
+
+    def _build_model(self, domain: str, samples: List[str]) -> Dict[str, Any]:
+        """
+        Calcula as probabilidades dos padrões a partir dos exemplos, suavizadas pelas frequências a priori.
+
+        Args:
+            domain: Domínio do modelo
+            samples: E-mails de exemplo do domínio
+
+        Returns:
+            Modelo com exemplos, contagens, probabilidades e padrão predominante
+        """
+        counts = dict.fromkeys(PRIOR_WEIGHTS, 0.0)
+        for email in samples:
+            for template, weight in classify_local_part(email.rpartition('@')[0]).items():
+                counts[template] += weight
+
+        total = len(samples) + self.smoothing
+        probabilities = {
+            template: round((counts[template] + self.smoothing * prior) / total, 4)
+            for template, prior in PRIOR_WEIGHTS.items()
+        }
+        dominant = max(probabilities, key=probabilities.get)
+
+        return {
+            'domain': domain,
+            'samples': samples,
+            'counts': {template: round(count, 4) for template, count in counts.items() if count},
+            'probabilities': probabilities,
+            'dominant': TEMPLATE_LABELS[dominant],
+            'source': 'learned' if samples else 'prior',
+            'updated_at': datetime.now().isoformat()
+        }
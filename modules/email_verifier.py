@@ -0,0 +1,433 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Verificação de E-mails para Ferramenta OSINT
+Este módulo verifica e-mails candidatos consultando os registros MX do domínio e perguntando ao servidor
+de e-mail, pelo comando SMTP RCPT TO, se a caixa existe, sem enviar nenhuma mensagem. Cada servidor MX
+recebe uma única conexão, reutilizada por todos os e-mails dos domínios que atende.
+"""
+
+import re
+import uuid
+import socket
+import smtplib
+import logging
+import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Iterable, Callable, Tuple
+from modules.cache import PersistentCache
+from modules.dns_resolver import DNSResolver
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_email_verifier')
+
+EMAIL_SYNTAX_PATTERN = re.compile(r'^[a-zA-Z0-9._%+-]+@([a-zA-Z0-9-]+\.)+[a-zA-Z]{2,}$')
+
+# Resultados possíveis da verificação
+STATUS_VALID = 'valid'
+STATUS_INVALID = 'invalid'
+STATUS_CATCH_ALL = 'catch_all'
+STATUS_UNKNOWN = 'unknown'
+STATUS_NO_MX = 'no_mx'
+STATUS_SYNTAX = 'invalid_syntax'
+
+# Número máximo de destinatários por transação SMTP (o mínimo garantido pela RFC 5321 é 100)
+MAX_RECIPIENTS_PER_TRANSACTION = 50
+
+
+class SMTPSession:
+    """Conexão SMTP com um servidor MX, reaberta automaticamente se o servidor a encerrar."""
+
+    def __init__(self, host: str, address: str, port: int, helo_host: str, mail_from: str, timeout: float):
+        """
+        Inicializa a sessão (a conexão só é aberta na primeira consulta).
+
+        Args:
+            host: Nome do servidor MX
+            address: Endereço IP do servidor MX
+            port: Porta SMTP
+            helo_host: Nome anunciado no EHLO/HELO
+            mail_from: Remetente usado no MAIL FROM
+            timeout: Tempo limite das operações em segundos
+        """
+        self.host = host
+        self.address = address
+        self.port = port
+        self.helo_host = helo_host
+        self.mail_from = mail_from
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.connections = 0
+        self._smtp: Optional[smtplib.SMTP] = None
+        self._recipients = 0
+
+    def check(self, recipients: List[str]) -> List[Tuple[int, str]]:
+        """
+        Consulta uma lista de destinatários em uma única transação (ou em poucas, se a lista for longa).
+
+        Args:
+            recipients: Endereços consultados
+
+        Returns:
+            Lista de (código, mensagem) da resposta ao RCPT TO de cada endereço
+        """
+        with self.lock:
+            try:
+                return self._check(recipients)
+            except (smtplib.SMTPServerDisconnected, ConnectionError, socket.timeout):
+                # Conexões ociosas costumam ser encerradas pelo servidor; uma nova tentativa basta
+                self._discard()
+                return self._check(recipients)
+
+    def close(self):
+        """Encerra a conexão com o servidor."""
+        with self.lock:
+            if self._smtp is not None:
+                try:
+                    self._smtp.quit()
+                except Exception:
+                    pass
+                self._discard()
+
+    def _check(self, recipients: List[str]) -> List[Tuple[int, str]]:
+        """
+        Executa as consultas RCPT TO na conexão aberta, abrindo-a se necessário.
+
+        Args:
+            recipients: Endereços consultados
+
+        Returns:
+            Lista de (código, mensagem) de cada endereço
+        """
+        if self._smtp is None:
+            self._connect()
+        else:
+            # Encerrar a transação anterior antes de começar outra
+            self._smtp.rset()
+            self._begin_transaction()
+
+        replies = []
+        for recipient in recipients:
+            if self._recipients >= MAX_RECIPIENTS_PER_TRANSACTION:
+                self._smtp.rset()
+                self._begin_transaction()
+
+            code, message = self._smtp.rcpt(recipient)
+            self._recipients += 1
+            replies.append((code, message.decode('utf-8', errors='replace') if isinstance(message, bytes) else str(message)))
+
+        return replies
+
+    def _connect(self):
+        """Abre a conexão, cumprimenta o servidor e inicia uma transação."""
+        smtp = smtplib.SMTP(timeout=self.timeout, local_hostname=self.helo_host)
+        self._smtp = smtp
+        code, message = smtp.connect(self.address, self.port)
+        if code != 220:
+            raise smtplib.SMTPConnectError(code, message)
+        self.connections += 1
+        smtp.ehlo_or_helo_if_needed()
+        self._begin_transaction()
+        logger.info(f"Conexão SMTP aberta com {self.host} ({self.address}:{self.port})")
+
+    def _begin_transaction(self):
+        """Inicia uma transação com MAIL FROM."""
+        code, message = self._smtp.mail(self.mail_from)
+        if code != 250:
+            raise smtplib.SMTPSenderRefused(code, message, self.mail_from)
+        self._recipients = 0
+
+    def _discard(self):
+        """Descarta a conexão atual sem cumprimentar o servidor."""
+        if self._smtp is not None:
+            try:
+                self._smtp.close()
+            except Exception:
+                pass
+        self._smtp = None
+
+
+class EmailVerifier:
+    """Verificador de e-mails por MX e SMTP RCPT TO, com uma conexão por servidor MX e detecção de catch-all."""
+
+    def __init__(self, dns_resolver: Optional[DNSResolver] = None, cache: Optional[PersistentCache] = None,
+                 helo_host: Optional[str] = None, mail_from: Optional[str] = None, smtp_port: int = 25,
+                 timeout: float = 10.0, max_concurrency: int = 5):
+        """
+        Inicializa o verificador.
+
+        Args:
+            dns_resolver: Resolvedor DNS compartilhado (opcional; um novo é criado se ausente)
+            cache: Cache persistente do resultado da detecção de catch-all por domínio (opcional)
+            helo_host: Nome anunciado no EHLO/HELO (padrão: nome da máquina, sem consulta DNS)
+            mail_from: Remetente usado no MAIL FROM (padrão: verificacao@<helo_host>)
+            smtp_port: Porta SMTP dos servidores MX
+            timeout: Tempo limite das operações SMTP em segundos
+            max_concurrency: Número máximo de servidores MX consultados simultaneamente
+        """
+        self.dns_resolver = dns_resolver or DNSResolver()
+        self.cache = cache
+        self.helo_host = helo_host or socket.gethostname()
+        self.mail_from = mail_from or f"verificacao@{self.helo_host}"
+        self.smtp_port = smtp_port
+        self.timeout = timeout
+        self.max_concurrency = max(1, max_concurrency)
+        self._sessions: Dict[str, SMTPSession] = {}
+        self._sessions_lock = threading.Lock()
+
+    def verify(self, email: str) -> Dict[str, Any]:
+        """
+        Verifica um único e-mail.
+
+        Args:
+            email: E-mail a ser verificado
+
+        Returns:
+            Resultado da verificação
+        """
+        return self.verify_many([email])[0]
+
+    def verify_many(self, emails: Iterable[str],
+                    progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
+        """
+        Verifica uma lista de e-mails.
+
+        Os e-mails são agrupados pelo servidor MX de maior prioridade do domínio; cada servidor é
+        consultado por uma única conexão, e até max_concurrency servidores são consultados ao mesmo tempo.
+
+        Args:
+            emails: E-mails a serem verificados
+            progress_callback: Função chamada a cada servidor MX concluído (opcional)
+
+        Returns:
+            Resultados da verificação, na ordem dos e-mails recebidos
+        """
+        emails = [email.strip() for email in emails if email and email.strip()]
+        results: Dict[str, Dict[str, Any]] = {}
+        by_domain: Dict[str, List[str]] = defaultdict(list)
+
+        for email in emails:
+            if not EMAIL_SYNTAX_PATTERN.match(email):
+                results[email] = self._result(email, STATUS_SYNTAX)
+            else:
+                by_domain[email.rsplit('@', 1)[1].lower()].append(email)
+
+        # Consultas MX de todos os domínios em paralelo, com o cache do resolvedor
+        mx_records = self.dns_resolver.resolve_many_sync(by_domain, ('MX', 'A'))
+        by_host: Dict[Tuple[str, str], Dict[str, List[str]]] = defaultdict(dict)
+
+        for domain, domain_emails in by_domain.items():
+            mx_host = self._select_mx(domain, mx_records.get(domain, {}))
+            address = self._resolve_mx_address(mx_host) if mx_host else None
+
+            if not address:
+                for email in domain_emails:
+                    results[email] = self._result(email, STATUS_NO_MX, mx_host=mx_host)
+                continue
+
+            by_host[(mx_host, address)][domain] = domain_emails
+
+        completed = 0
+        with ThreadPoolExecutor(max_workers=self.max_concurrency, thread_name_prefix='osint-smtp') as executor:
+            futures = [executor.submit(self._verify_host, host, address, domains)
+                       for (host, address), domains in by_host.items()]
+
+            for future in futures:
+                host_results = future.result()
+                results.update(host_results)
+                completed += 1
+
+                if progress_callback:
+                    progress_callback('mx_host', {'completed': completed, 'total': len(futures),
+                                                  'verified': len(results)})
+
+        return [results[email] for email in emails]
+
+    def close(self):
+        """Encerra todas as conexões SMTP mantidas no pool."""
+        with self._sessions_lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _verify_host(self, host: str, address: str, domains: Dict[str, List[str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Verifica os e-mails de todos os domínios atendidos por um servidor MX, pela mesma conexão.
+
+        Args:
+            host: Nome do servidor MX
+            address: Endereço IP do servidor MX
+            domains: Dicionário domínio -> e-mails
+
+        Returns:
+            Dicionário e-mail -> resultado
+        """
+        session = self._get_session(host, address)
+        results = {}
+
+        for domain, emails in domains.items():
+            try:
+                catch_all = self._cached_catch_all(domain)
+                # A sonda de catch-all vai na mesma transação dos e-mails do domínio
+                probe = [] if catch_all is not None else [f"{uuid.uuid4().hex[:16]}@{domain}"]
+                replies = session.check(probe + emails)
+
+                if probe:
+                    catch_all = self._probe_catch_all(replies[0][0])
+                    replies = replies[1:]
+                    # Respostas 4xx à sonda (ex: greylisting) não são guardadas; o domínio é testado de novo
+                    if self.cache is not None and catch_all is not None:
+                        self.cache.set(f"catch_all:{domain}", catch_all)
+
+                for email, (code, message) in zip(emails, replies):
+                    results[email] = self._result(email, self._classify(code, catch_all), host, code, message, catch_all)
+
+            except Exception as e:
+                logger.warning(f"Erro na verificação SMTP de {domain} em {host}: {str(e)}")
+                for email in emails:
+                    results[email] = self._result(email, STATUS_UNKNOWN, host, error=str(e))
+
+        return results
+
+    def _get_session(self, host: str, address: str) -> SMTPSession:
+        """
+        Obtém a conexão mantida com um servidor MX, criando-a se necessário.
+
+        Args:
+            host: Nome do servidor MX
+            address: Endereço IP do servidor MX
+
+        Returns:
+            Sessão SMTP do servidor
+        """
+        with self._sessions_lock:
+            session = self._sessions.get(address)
+            if session is None:
+                session = SMTPSession(host, address, self.smtp_port, self.helo_host, self.mail_from, self.timeout)
+                self._sessions[address] = session
+            return session
+
+    def _cached_catch_all(self, domain: str) -> Optional[bool]:
+        """
+        Consulta o resultado da detecção de catch-all de um domínio no cache.
+
+        Args:
+            domain: Domínio consultado
+
+        Returns:
+            True/False se o domínio já foi testado, ou None
+        """
+        if self.cache is None:
+            return None
+        return self.cache.get(f"catch_all:{domain}")
+
+    def _select_mx(self, domain: str, records: Dict[str, List[Any]]) -> Optional[str]:
+        """
+        Escolhe o servidor MX de maior prioridade (menor preferência) de um domínio.
+
+        Args:
+            domain: Domínio consultado
+            records: Registros MX e A do domínio
+
+        Returns:
+            Nome do servidor MX, o próprio domínio (MX implícito, se houver registro A) ou None
+        """
+        mx = sorted(records.get('MX', []), key=lambda record: record['preference'])
+        if mx:
+            exchange = mx[0]['exchange'].rstrip('.')
+            # Um MX nulo ('.') indica que o domínio não recebe e-mails (RFC 7505)
+            return exchange or None
+
+        return domain if records.get('A') else None
+
+    def _resolve_mx_address(self, host: str) -> Optional[str]:
+        """
+        Resolve o endereço IPv4 de um servidor MX.
+
+        Args:
+            host: Nome do servidor MX
+
+        Returns:
+            Endereço IP ou None
+        """
+        try:
+            addresses = self.dns_resolver.lookup_sync(host, ('A',))['A']
+        except Exception as e:
+            logger.warning(f"Erro ao resolver o servidor MX {host}: {str(e)}")
+            return None
+        return addresses[0] if addresses else None
+
+    def _probe_catch_all(self, code: int) -> Optional[bool]:
+        """
+        Interpreta a resposta do servidor à sonda de catch-all.
+
+        Args:
+            code: Código da resposta SMTP ao destinatário inexistente
+
+        Returns:
+            True se o destinatário foi aceito, False se foi recusado, ou None se a resposta não permite concluir
+        """
+        if 200 <= code < 300:
+            return True
+        if 500 <= code < 600:
+            return False
+        return None
+
+    def _classify(self, code: int, catch_all: Optional[bool]) -> str:
+        """
+        Classifica a resposta ao RCPT TO.
+
+        Args:
+            code: Código da resposta SMTP
+            catch_all: Se o domínio aceita qualquer destinatário (None se não foi possível determinar)
+
+        Returns:
+            Status da verificação
+        """
+        if 200 <= code < 300:
+            # Sem saber se o domínio é catch-all, um destinatário aceito não confirma a caixa
+            if catch_all is None:
+                return STATUS_UNKNOWN
+            return STATUS_CATCH_ALL if catch_all else STATUS_VALID
+        if 500 <= code < 600:
+            return STATUS_INVALID
+        # Respostas 4xx (ex: greylisting) não permitem concluir
+        return STATUS_UNKNOWN
+
+    def _result(self, email: str, status: str, mx_host: Optional[str] = None, code: Optional[int] = None,
+                message: Optional[str] = None, catch_all: Optional[bool] = None,
+                error: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Monta o resultado da verificação de um e-mail.
+
+        Args:
+            email: E-mail verificado
+            status: Status da verificação
+            mx_host: Servidor MX consultado
+            code: Código da resposta SMTP
+            message: Mensagem da resposta SMTP
+            catch_all: Se o domínio aceita qualquer destinatário
+            error: Erro ocorrido na verificação
+
+        Returns:
+            Dicionário com o resultado
+        """
+        result = {
+            'email': email,
+            'status': status,
+            'mx_host': mx_host,
+            'smtp_code': code,
+            'smtp_message': message,
+            'catch_all': catch_all
+        }
+        if error:
+            result['error'] = error
+        return result
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Fronteira de Rastreamento para Ferramenta OSINT
+Este módulo normaliza URLs para uma forma canônica e mantém a fila de páginas a visitar,
+descartando duplicatas no momento da inclusão e priorizando as páginas com maior chance de conter contatos.
+"""
+
+import re
+import heapq
+import logging
+import posixpath
+import itertools
+from urllib.parse import urljoin, urlsplit, urlunsplit, parse_qsl, urlencode
+from typing import Callable, Iterable, Optional, Set
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_frontier')
+
+# Esquemas que podem ser baixados pelo crawler
+FETCHABLE_SCHEMES = {'http', 'https'}
+
+# Portas padrão, omitidas da forma canônica
+DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Parâmetros de rastreamento de campanhas, que não alteram o conteúdo da página
+TRACKING_PARAMS = {'fbclid', 'gclid', 'mc_cid', 'mc_eid'}
+TRACKING_PREFIXES = ('utm_',)
+
+# Termos de caminho que indicam páginas de contato (peso maior) ou institucionais (peso menor)
+CONTACT_TERMS = {
+    'contato', 'contatos', 'contact', 'contacts', 'contacto', 'contactos', 'conosco', 'faleconosco',
+    'atendimento', 'kontakt', 'impressum'
+}
+ABOUT_TERMS = {
+    'sobre', 'about', 'somos', 'quemsomos', 'equipe', 'team', 'staff', 'people', 'pessoas', 'imprensa',
+    'press', 'empresa', 'institucional', 'diretoria', 'lideranca', 'leadership', 'ouvidoria', 'suporte',
+    'support', 'carreiras', 'careers', 'expediente'
+}
+
+# Extensões de arquivos que não são páginas HTML
+NON_HTML_EXTENSIONS = {
+    'pdf', 'jpg', 'jpeg', 'png', 'gif', 'svg', 'webp', 'ico', 'css', 'js', 'zip', 'gz', 'rar', 'mp3',
+    'mp4', 'avi', 'mov', 'doc', 'docx', 'xls', 'xlsx', 'ppt', 'pptx', 'xml', 'json', 'woff', 'woff2'
+}
+
+_PATH_TOKEN_PATTERN = re.compile(r'[a-z0-9]+')
+
+
+def canonicalize_url(href: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    Converte um link em uma URL absoluta e canônica.
+
+    A forma canônica resolve o link relativo à página onde foi encontrado, usa esquema e host
+    em minúsculas, omite a porta padrão e o fragmento, resolve segmentos '.' e '..', ordena
+    os parâmetros da query e remove parâmetros de rastreamento de campanhas.
+
+    Args:
+        href: Valor do link (absoluto ou relativo)
+        base_url: URL da página onde o link foi encontrado
+
+    Returns:
+        URL canônica ou None se o link não aponta para uma página que possa ser baixada
+    """
+    href = (href or '').strip()
+    if not href:
+        return None
+
+    try:
+        absolute = urljoin(base_url, href) if base_url else href
+        parts = urlsplit(absolute)
+        scheme = parts.scheme.lower()
+
+        # mailto:, javascript:, tel:, data: e outros não são páginas
+        if scheme not in FETCHABLE_SCHEMES or not parts.hostname:
+            return None
+
+        host = parts.hostname.lower().rstrip('.')
+        port = parts.port
+    except ValueError:
+        # Portas inválidas ou IPv6 malformado
+        return None
+
+    if ':' in host:
+        host = f"[{host}]"
+    netloc = host if port in (None, DEFAULT_PORTS[scheme]) else f"{host}:{port}"
+
+    path = _normalize_path(parts.path)
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key not in TRACKING_PARAMS and not key.startswith(TRACKING_PREFIXES)
+    ))
+
+    return urlunsplit((scheme, netloc, path, query, ''))
+
+
+def contact_priority(url: str) -> float:
+    """
+    Estima a chance de uma página conter contatos, a partir do seu caminho.
+
+    Caminhos com termos de contato recebem a maior pontuação, seguidos dos institucionais
+    (sobre, equipe, imprensa). Páginas profundas, com parâmetros ou que não são HTML perdem pontos.
+
+    Args:
+        url: URL canônica
+
+    Returns:
+        Pontuação da página (maior é mais prioritária)
+    """
+    parts = urlsplit(url)
+    path = parts.path.lower()
+    tokens = _PATH_TOKEN_PATTERN.findall(path)
+    score = 0.0
+
+    if CONTACT_TERMS.intersection(tokens):
+        score += 10
+    elif ABOUT_TERMS.intersection(tokens):
+        score += 5
+
+    if url_extension(url) in NON_HTML_EXTENSIONS:
+        score -= 20
+
+    score -= path.strip('/').count('/') * 0.5
+    if parts.query:
+        score -= 1
+
+    return score
+
+
+def url_extension(url: str) -> str:
+    """
+    Obtém a extensão do último segmento do caminho de uma URL.
+
+    Args:
+        url: URL canônica
+
+    Returns:
+        Extensão em minúsculas, sem o ponto (vazia se o segmento não tem extensão)
+    """
+    segment = urlsplit(url).path.rsplit('/', 1)[-1].lower()
+    return segment.rsplit('.', 1)[-1] if '.' in segment else ''
+
+
+def _normalize_path(path: str) -> str:
+    """
+    Resolve segmentos '.' e '..' de um caminho, preservando a barra final.
+
+    Args:
+        path: Caminho da URL
+
+    Returns:
+        Caminho normalizado (sempre iniciado por '/')
+    """
+    if not path:
+        return '/'
+
+    normalized = posixpath.normpath(path)
+    # normpath preserva '//' inicial e remove a barra final, que distingue diretórios de arquivos
+    normalized = '/' + normalized.lstrip('/') if normalized != '.' else '/'
+    if path.endswith('/') and not normalized.endswith('/'):
+        normalized += '/'
+
+    return normalized
+
+
+class URLFrontier:
+    """Fila de prioridade de URLs a visitar, com deduplicação no momento da inclusão e filtro de hosts."""
+
+    def __init__(self, allowed_hosts: Optional[Iterable[str]] = None,
+                 priority: Optional[Callable[[str], float]] = None,
+                 url_filter: Optional[Callable[[str], bool]] = None):
+        """
+        Inicializa a fronteira.
+
+        Args:
+            allowed_hosts: Hosts (netloc canônico) cujas páginas podem ser incluídas (padrão: qualquer host)
+            priority: Função que pontua cada URL; as maiores pontuações saem primeiro (padrão: ordem de inclusão)
+            url_filter: Função que decide se uma URL pode ser visitada (ex: regras do robots.txt)
+        """
+        self.allowed_hosts: Optional[Set[str]] = set(allowed_hosts) if allowed_hosts is not None else None
+        self.priority = priority
+        self.url_filter = url_filter
+        self._heap = []
+        self._counter = itertools.count()
+        self._seen: Set[str] = set()
+        self.duplicates = 0
+        self.rejected = 0
+
+    def add(self, href: str, base_url: Optional[str] = None) -> bool:
+        """
+        Inclui um link na fronteira, se for uma página nova de um host permitido.
+
+        Args:
+            href: Valor do link (absoluto ou relativo)
+            base_url: URL da página onde o link foi encontrado
+
+        Returns:
+            True se o link foi incluído
+        """
+        url = canonicalize_url(href, base_url)
+
+        if url is None or (self.allowed_hosts is not None and urlsplit(url).netloc not in self.allowed_hosts):
+            self.rejected += 1
+            return False
+
+        # Marcar como visto já na inclusão impede que a mesma página entre na fila mais de uma vez
+        if url in self._seen:
+            self.duplicates += 1
+            return False
+
+        self._seen.add(url)
+
+        if self.url_filter and not self.url_filter(url):
+            self.rejected += 1
+            return False
+
+        # Empates saem na ordem de inclusão
+        score = self.priority(url) if self.priority else 0.0
+        heapq.heappush(self._heap, (-score, next(self._counter), url))
+        return True
+
+    def add_many(self, hrefs: Iterable[str], base_url: Optional[str] = None) -> int:
+        """
+        Inclui vários links na fronteira.
+
+        Args:
+            hrefs: Valores dos links
+            base_url: URL da página onde os links foram encontrados
+
+        Returns:
+            Número de links incluídos
+        """
+        return sum(1 for href in hrefs if self.add(href, base_url))
+
+    def allow_host(self, url: str):
+        """
+        Permite as páginas do host de uma URL (ex: destino de um redirecionamento da página inicial).
+
+        Args:
+            url: URL cujo host deve ser permitido
+        """
+        canonical = canonicalize_url(url)
+        if canonical and self.allowed_hosts is not None:
+            self.allowed_hosts.add(urlsplit(canonical).netloc)
+
+    def mark_seen(self, url: str):
+        """
+        Registra uma URL como já visitada sem incluí-la na fila.
+
+        Args:
+            url: URL visitada
+        """
+        canonical = canonicalize_url(url)
+        if canonical:
+            self._seen.add(canonical)
+
+    def pop(self) -> str:
+        """
+        Remove e devolve a URL mais prioritária da fila.
+
+        Returns:
+            URL canônica
+        """
+        return heapq.heappop(self._heap)[2]
+
+    @property
+    def seen_count(self) -> int:
+        """Número de URLs distintas já incluídas ou visitadas."""
+        return len(self._seen)
+
+    def __len__(self) -> int:
+        return len(self._heap)
+
+    def __bool__(self) -> bool:
+        return bool(self._heap)
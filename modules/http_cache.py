@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Cache de Respostas HTTP para Ferramenta OSINT
+Este módulo armazena em disco (SQLite) o corpo e os validadores (ETag e Last-Modified) das páginas
+baixadas pelo crawler, permitindo requisições condicionais nos rastreamentos seguintes.
+"""
+
+import os
+import zlib
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, Any, Optional
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_http_cache')
+
+
+class HTTPResponseCache:
+    """Cache de respostas HTTP indexado pela URL canônica, com limite de tamanho e descarte LRU."""
+
+    def __init__(self, db_path: str, max_bytes: int = 200 * 1024 * 1024):
+        """
+        Inicializa o cache.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+            max_bytes: Tamanho máximo, em bytes, dos corpos armazenados (comprimidos)
+        """
+        self.db_path = db_path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._stats = {'lookups': 0, 'revalidated': 0, 'stored': 0, 'evictions': 0}
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "url TEXT PRIMARY KEY, final_url TEXT NOT NULL, etag TEXT, last_modified TEXT, "
+            "encoding TEXT, content_type TEXT, body BLOB NOT NULL, size INTEGER NOT NULL, "
+            "stored_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_responses_accessed ON responses (accessed_at)")
+        self._conn.commit()
+        self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+
+    def get(self, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Obtém os validadores de uma resposta armazenada (sem o corpo).
+
+        Args:
+            url: URL canônica
+
+        Returns:
+            Dicionário com final_url, etag, last_modified, encoding e content_type, ou None se ausente
+        """
+        with self._lock:
+            self._stats['lookups'] += 1
+            row = self._conn.execute(
+                "SELECT final_url, etag, last_modified, encoding, content_type FROM responses WHERE url = ?",
+                (url,)
+            ).fetchone()
+
+        if row is None:
+            return None
+
+        return {
+            'final_url': row[0],
+            'etag': row[1],
+            'last_modified': row[2],
+            'encoding': row[3],
+            'content_type': row[4]
+        }
+
+    def conditional_headers(self, entry: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Monta os cabeçalhos de uma requisição condicional.
+
+        Args:
+            entry: Entrada obtida com get()
+
+        Returns:
+            Cabeçalhos If-None-Match e/ou If-Modified-Since
+        """
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def get_body(self, url: str) -> Optional[bytes]:
+        """
+        Obtém o corpo armazenado de uma resposta, após uma resposta 304 do servidor.
+
+        Args:
+            url: URL canônica
+
+        Returns:
+            Corpo da resposta ou None se ausente
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT body FROM responses WHERE url = ?", (url,)).fetchone()
+
+            if row is None:
+                return None
+
+            self._conn.execute("UPDATE responses SET accessed_at = ? WHERE url = ?", (time.time(), url))
+            self._conn.commit()
+            self._stats['revalidated'] += 1
+
+        return zlib.decompress(row[0])
+
+    def store(self, url: str, final_url: str, body: bytes, etag: Optional[str] = None,
+              last_modified: Optional[str] = None, encoding: Optional[str] = None,
+              content_type: Optional[str] = None) -> bool:
+        """
+        Armazena uma resposta com seus validadores.
+
+        Args:
+            url: URL canônica requisitada
+            final_url: URL final após redirecionamentos
+            body: Corpo completo da resposta
+            etag: Valor do cabeçalho ETag
+            last_modified: Valor do cabeçalho Last-Modified
+            encoding: Codificação do corpo
+            content_type: Valor do cabeçalho Content-Type
+
+        Returns:
+            True se a resposta foi armazenada
+        """
+        # Sem validadores, não há como revalidar a resposta depois
+        if not etag and not last_modified:
+            return False
+
+        compressed = zlib.compress(body, 6)
+        size = len(compressed)
+
+        if size > self.max_bytes:
+            return False
+
+        now = time.time()
+
+        with self._lock:
+            previous = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (url, final_url, etag, last_modified, encoding, content_type, "
+                "body, size, stored_at, accessed_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (url, final_url, etag, last_modified, encoding, content_type, compressed, size, now, now)
+            )
+            self._total_bytes += size - (previous[0] if previous else 0)
+            self._evict()
+            self._conn.commit()
+            self._stats['stored'] += 1
+
+        return True
+
+    def delete(self, url: str):
+        """
+        Remove uma resposta do cache.
+
+        Args:
+            url: URL canônica
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT size FROM responses WHERE url = ?", (url,)).fetchone()
+            if row:
+                self._conn.execute("DELETE FROM responses WHERE url = ?", (url,))
+                self._conn.commit()
+                self._total_bytes -= row[0]
+
+    def clear(self):
+        """Remove todas as respostas do cache."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+            self._conn.commit()
+            self._total_bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Obtém estatísticas de uso do cache.
+
+        Returns:
+            Dicionário com consultas, revalidações, armazenamentos, descartes e tamanho do cache
+        """
+        with self._lock:
+            stats = dict(self._stats)
+            stats['entries'] = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            stats['total_bytes'] = self._total_bytes
+
+        stats['max_bytes'] = self.max_bytes
+        stats['hit_ratio'] = round(stats['revalidated'] / stats['lookups'], 4) if stats['lookups'] else 0.0
+        return stats
+
+    def close(self):
+        """Fecha a conexão com o banco SQLite."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self):
+        """Remove as respostas menos acessadas até que o cache respeite o limite de tamanho."""
+        while self._total_bytes > self.max_bytes:
+            row = self._conn.execute("SELECT url, size FROM responses ORDER BY accessed_at ASC LIMIT 1").fetchone()
+            if row is None:
+                self._total_bytes = 0
+                break
+
+            self._conn.execute("DELETE FROM responses WHERE url = ?", (row[0],))
+            self._total_bytes -= row[1]
+            self._stats['evictions'] += 1
+            logger.debug(f"Resposta de {row[0]} removida do cache HTTP")
@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Cliente HTTP Compartilhado para Ferramenta OSINT
+Este módulo fornece uma sessão HTTP reutilizável, com pool de conexões persistentes por host,
+novas tentativas com espera exponencial, suporte a respostas comprimidas e limitação de taxa por host.
+"""
+
+import logging
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.util.retry import Retry
+from urllib.robotparser import RobotFileParser
+from typing import Dict, Any, Optional
+from modules.rate_limiter import RateLimiter, parse_robots
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_http_client')
+
+# O urllib3 só decodifica brotli quando uma das bibliotecas está instalada
+try:
+    import brotli  # noqa: F401
+    BROTLI_AVAILABLE = True
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        BROTLI_AVAILABLE = True
+    except ImportError:
+        BROTLI_AVAILABLE = False
+
+
+class HTTPClient:
+    """Cliente HTTP com pool de conexões keep-alive compartilhado entre chamadas e threads."""
+
+    def __init__(self, headers: Optional[Dict[str, str]] = None, timeout: int = 10,
+                 pool_connections: int = 20, pool_maxsize: int = 10, pool_block: bool = False,
+                 max_retries: int = 3, backoff_factor: float = 0.5,
+                 rate_limiter: Optional[RateLimiter] = None):
+        """
+        Inicializa o cliente HTTP.
+
+        Args:
+            headers: Cabeçalhos enviados em todas as requisições
+            timeout: Tempo limite padrão das requisições em segundos
+            pool_connections: Número de hosts distintos com pool de conexões mantido
+            pool_maxsize: Número máximo de conexões mantidas por host
+            pool_block: Se True, bloqueia em vez de abrir conexões além de pool_maxsize por host
+            max_retries: Número máximo de novas tentativas em falhas de conexão e status transitórios
+            backoff_factor: Fator da espera exponencial entre tentativas
+            rate_limiter: Limitador de taxa por host aplicado a todas as requisições (opcional)
+        """
+        self.timeout = timeout
+        self.rate_limiter = rate_limiter
+        self.session = requests.Session()
+        # Regras de robots.txt por host, usadas quando não há limitador de taxa que as guarde
+        self._robots: Dict[str, RobotFileParser] = {}
+        self._robots_lock = threading.Lock()
+
+        if headers:
+            self.session.headers.update(headers)
+
+        encodings = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+        self.session.headers['Accept-Encoding'] = encodings
+
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+            max_retries=retry
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+
+        logger.info(f"Cliente HTTP inicializado (até {pool_maxsize} conexões por host, {max_retries} tentativas)")
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Executa uma requisição HTTP reutilizando as conexões do pool.
+
+        Args:
+            method: Método HTTP
+            url: URL de destino
+            **kwargs: Argumentos adicionais repassados para requests
+
+        Returns:
+            Resposta HTTP
+        """
+        kwargs.setdefault('timeout', self.timeout)
+
+        if self.rate_limiter:
+            self._throttle(url)
+
+        return self.session.request(method, url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        """
+        Executa uma requisição GET.
+
+        Args:
+            url: URL de destino
+            **kwargs: Argumentos adicionais repassados para requests
+
+        Returns:
+            Resposta HTTP
+        """
+        return self.request('GET', url, **kwargs)
+
+    def head(self, url: str, **kwargs) -> requests.Response:
+        """
+        Executa uma requisição HEAD.
+
+        Args:
+            url: URL de destino
+            **kwargs: Argumentos adicionais repassados para requests
+
+        Returns:
+            Resposta HTTP
+        """
+        kwargs.setdefault('allow_redirects', True)
+        return self.request('HEAD', url, **kwargs)
+
+    def get_robots(self, url: str) -> Optional[RobotFileParser]:
+        """
+        Obtém as regras do robots.txt do host de uma URL, baixando-o na primeira consulta.
+
+        Se outra thread já está baixando o mesmo robots.txt (por exemplo, o limitador de taxa
+        antes da primeira requisição ao host), aguarda por ele em vez de baixá-lo de novo.
+
+        Args:
+            url: URL de uma página do host
+
+        Returns:
+            Regras do robots.txt ou None se não puderam ser carregadas dentro do tempo limite
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc
+
+        if self.rate_limiter and self.rate_limiter.respect_robots:
+            if self.rate_limiter.needs_robots(host):
+                self._load_robots(parsed.scheme, host)
+            return self.rate_limiter.wait_robots(host, timeout=self.timeout)
+
+        with self._robots_lock:
+            parser = self._robots.get(host)
+
+        if parser is None:
+            parser = parse_robots(self._fetch_robots_text(parsed.scheme, host))
+            with self._robots_lock:
+                parser = self._robots.setdefault(host, parser)
+
+        return parser
+
+    def _throttle(self, url: str):
+        """
+        Aguarda a liberação do limitador de taxa para o host da URL.
+
+        Args:
+            url: URL da próxima requisição
+        """
+        parsed = urlparse(url)
+        host = parsed.netloc
+
+        if self.rate_limiter.needs_robots(host):
+            self._load_robots(parsed.scheme, host)
+
+        waited = self.rate_limiter.wait(host)
+        if waited > 0:
+            logger.debug(f"Aguardados {waited:.2f}s pelo limite de taxa do host {host}")
+
+    def _load_robots(self, scheme: str, host: str):
+        """
+        Baixa o robots.txt de um host e aplica suas regras ao limitador de taxa.
+
+        Args:
+            scheme: Esquema da URL (http ou https)
+            host: Host (netloc) a ser consultado
+        """
+        robots_text = self._fetch_robots_text(scheme, host)
+        user_agent = self.session.headers.get('User-Agent', '*')
+        self.rate_limiter.apply_robots(host, robots_text, user_agent)
+
+    def _fetch_robots_text(self, scheme: str, host: str) -> str:
+        """
+        Baixa o robots.txt de um host, sem passar pelo limitador de taxa.
+
+        Args:
+            scheme: Esquema da URL (http ou https)
+            host: Host (netloc) a ser consultado
+
+        Returns:
+            Conteúdo do robots.txt (vazio se indisponível)
+        """
+        try:
+            response = self.session.get(f"{scheme}://{host}/robots.txt", timeout=min(self.timeout, 5))
+            if response.status_code == 200:
+                return response.text
+        except Exception as e:
+            logger.warning(f"Não foi possível obter robots.txt de {host}: {str(e)}")
+
+        return ''
+
+    def close(self):
+        """Fecha todas as conexões mantidas no pool."""
+        self.session.close()
@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Execução de Tarefas em Segundo Plano para Ferramenta OSINT
+Este módulo permite executar chamadas lentas dos módulos OSINT em um pool limitado de workers,
+devolvendo imediatamente um identificador de tarefa que pode ser consultado posteriormente.
+As tarefas também registram eventos de progresso, que podem ser transmitidos via Server-Sent Events.
+"""
+
+import json
+import uuid
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Callable, Iterator
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_jobs')
+
+# Estados possíveis de uma tarefa
+STATUS_QUEUED = 'queued'
+STATUS_RUNNING = 'running'
+STATUS_FINISHED = 'finished'
+STATUS_FAILED = 'failed'
+
+
+class Job:
+    """Representa uma tarefa submetida ao gerenciador."""
+
+    def __init__(self, name: str, max_events: int = 1000):
+        """
+        Inicializa uma tarefa.
+
+        Args:
+            name: Nome descritivo da tarefa (ex: 'contact_info.domain')
+            max_events: Número máximo de eventos de progresso mantidos em memória
+        """
+        self.id = uuid.uuid4().hex
+        self.name = name
+        self.status = STATUS_QUEUED
+        self.result = None
+        self.error = None
+        self.created_at = datetime.now()
+        self.started_at = None
+        self.finished_at = None
+        self._events = deque(maxlen=max_events)
+        self._event_seq = 0
+        self._events_closed = False
+        self._condition = threading.Condition()
+
+    @property
+    def done(self) -> bool:
+        """Indica se a tarefa já terminou (com sucesso ou falha)."""
+        return self.status in (STATUS_FINISHED, STATUS_FAILED)
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        """
+        Converte a tarefa em um dicionário serializável.
+
+        Args:
+            include_result: Se True, inclui o resultado da tarefa
+
+        Returns:
+            Dicionário com o estado da tarefa
+        """
+        data = {
+            'job_id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'created_at': self.created_at.isoformat(),
+            'started_at': self.started_at.isoformat() if self.started_at else None,
+            'finished_at': self.finished_at.isoformat() if self.finished_at else None
+        }
+
+        if self.error:
+            data['error'] = self.error
+
+        if include_result:
+            data['result'] = self.result
+
+        return data
+
+    def emit(self, event: str, data: Dict[str, Any]):
+        """
+        Registra um evento de progresso da tarefa.
+
+        Pode ser passado diretamente como progress_callback para os módulos OSINT.
+
+        Args:
+            event: Tipo do evento (ex: 'page', 'tweets', 'file')
+            data: Dados parciais associados ao evento
+        """
+        with self._condition:
+            self._event_seq += 1
+            self._events.append((self._event_seq, event, data))
+            self._condition.notify_all()
+
+    def close_events(self):
+        """Sinaliza que a tarefa não produzirá mais eventos de progresso."""
+        with self._condition:
+            self._events_closed = True
+            self._condition.notify_all()
+
+    def iter_events(self, after: int = 0, keepalive: float = 15.0) -> Iterator[Optional[Dict[str, Any]]]:
+        """
+        Itera sobre os eventos de progresso, aguardando novos eventos até o fim da tarefa.
+
+        Eventos descartados por excederem o limite em memória não são reenviados.
+
+        Args:
+            after: Número de sequência do último evento já recebido
+            keepalive: Intervalo máximo de espera, em segundos, antes de produzir None
+
+        Returns:
+            Iterador de eventos ({'id', 'event', 'data'}); None indica que nada ocorreu no intervalo
+        """
+        last_seq = after
+
+        while True:
+            with self._condition:
+                pending = [item for item in self._events if item[0] > last_seq]
+
+                if not pending:
+                    if self._events_closed:
+                        return
+                    self._condition.wait(timeout=keepalive)
+                    pending = [item for item in self._events if item[0] > last_seq]
+
+            if not pending:
+                yield None
+                continue
+
+            for seq, event, data in pending:
+                last_seq = seq
+                yield {'id': seq, 'event': event, 'data': data}
+
+
+def format_sse(event: Optional[Dict[str, Any]]) -> str:
+    """
+    Formata um evento de tarefa no padrão Server-Sent Events.
+
+    Args:
+        event: Evento produzido por Job.iter_events (None gera um comentário de keep-alive)
+
+    Returns:
+        Texto do evento pronto para envio ao cliente
+    """
+    if event is None:
+        return ": keep-alive\n\n"
+
+    payload = json.dumps(event['data'], ensure_ascii=False, default=str)
+    return f"id: {event['id']}\nevent: {event['event']}\ndata: {payload}\n\n"
+
+
+class JobManager:
+    """Gerenciador de tarefas executadas em um pool limitado de threads."""
+
+    def __init__(self, max_workers: int = 4, max_finished_jobs: int = 500):
+        """
+        Inicializa o gerenciador de tarefas.
+
+        Args:
+            max_workers: Número máximo de tarefas executadas simultaneamente
+            max_finished_jobs: Número máximo de tarefas concluídas mantidas em memória
+        """
+        self.max_workers = max_workers
+        self.max_finished_jobs = max_finished_jobs
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='osint-job')
+        self._jobs: Dict[str, Job] = {}
+        self._finished_order = deque()
+        self._lock = threading.Lock()
+        logger.info(f"Gerenciador de tarefas inicializado com {max_workers} workers")
+
+    def submit(self, name: str, func: Callable[..., Any], *args, with_progress: bool = False, **kwargs) -> Job:
+        """
+        Submete uma chamada para execução em segundo plano.
+
+        Args:
+            name: Nome descritivo da tarefa
+            func: Função a ser executada
+            *args: Argumentos posicionais da função
+            with_progress: Se True, passa Job.emit como argumento progress_callback da função
+            **kwargs: Argumentos nomeados da função
+
+        Returns:
+            Tarefa criada (ainda na fila)
+        """
+        job = Job(name)
+
+        if with_progress:
+            kwargs['progress_callback'] = job.emit
+
+        with self._lock:
+            self._jobs[job.id] = job
+
+        self._executor.submit(self._run, job, func, args, kwargs)
+        logger.info(f"Tarefa {job.id} ({name}) adicionada à fila")
+        return job
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """
+        Obtém uma tarefa pelo seu identificador.
+
+        Args:
+            job_id: Identificador da tarefa
+
+        Returns:
+            Tarefa encontrada ou None
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """
+        Lista o estado de todas as tarefas conhecidas.
+
+        Returns:
+            Lista de dicionários com o estado das tarefas
+        """
+        with self._lock:
+            jobs = list(self._jobs.values())
+
+        return [job.to_dict() for job in jobs]
+
+    def shutdown(self, wait: bool = True):
+        """
+        Encerra o pool de workers.
+
+        Args:
+            wait: Se True, aguarda a conclusão das tarefas em andamento
+        """
+        self._executor.shutdown(wait=wait)
+
+    def _run(self, job: Job, func: Callable[..., Any], args: tuple, kwargs: Dict[str, Any]):
+        """
+        Executa uma tarefa e registra seu resultado.
+
+        Args:
+            job: Tarefa a ser executada
+            func: Função a ser executada
+            args: Argumentos posicionais da função
+            kwargs: Argumentos nomeados da função
+        """
+        job.status = STATUS_RUNNING
+        job.started_at = datetime.now()
+
+        try:
+            job.result = func(*args, **kwargs)
+
+            # Os módulos OSINT sinalizam falhas com a chave 'error' no resultado
+            if isinstance(job.result, dict) and 'error' in job.result:
+                job.error = job.result['error']
+                job.status = STATUS_FAILED
+            else:
+                job.status = STATUS_FINISHED
+        except Exception as e:
+            logger.error(f"Erro na execução da tarefa {job.id} ({job.name}): {str(e)}")
+            job.error = str(e)
+            job.status = STATUS_FAILED
+        finally:
+            job.finished_at = datetime.now()
+            self._register_finished(job)
+            job.emit('done', {'status': job.status, 'error': job.error})
+            job.close_events()
+
+        logger.info(f"Tarefa {job.id} ({job.name}) concluída com status: {job.status}")
+
+    def _register_finished(self, job: Job):
+        """
+        Registra uma tarefa concluída, descartando as mais antigas além do limite.
+
+        Args:
+            job: Tarefa concluída
+        """
+        with self._lock:
+            self._finished_order.append(job.id)
+
+            while len(self._finished_order) > self.max_finished_jobs:
+                old_id = self._finished_order.popleft()
+                self._jobs.pop(old_id, None)
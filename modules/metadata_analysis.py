@@ -14,7 +14,7 @@ import datetime
 import pandas as pd
 from PIL import Image
 from PIL.ExifTags import TAGS, GPSTAGS
-from typing import Dict, List, Any, Optional, Union, Tuple
+from typing import Dict, List, Any, Optional, Union, Tuple, Callable
 from docx import Document
 from openpyxl import load_workbook
 from PyPDF2 import PdfReader
@@ -428,12 +428,14 @@ class MetadataAnalysisOSINT:
             logger.error(f"Erro ao analisar arquivo genérico: {str(e)}")
             return {"error": str(e)}
     
-    def analyze_directory(self, directory_path: str) -> Dict[str, Any]:
+    def analyze_directory(self, directory_path: str,
+                          progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
         """
         Analisa todos os arquivos em um diretório.
         
         Args:
             directory_path: Caminho para o diretório
+            progress_callback: Função chamada com o resultado de cada arquivo analisado (opcional)
             
         Returns:
             Dicionário com resumo da análise
@@ -474,6 +476,13 @@ class MetadataAnalysisOSINT:
                                 file_types[file_type] += 1
                             else:
                                 file_types[file_type] = 1
+                        
+                        if progress_callback:
+                            progress_callback('file', {
+                                'file': file_path,
+                                'file_count': file_count,
+                                'result': result
+                            })
                     
                     except Exception as e:
                         logger.error(f"Erro ao analisar {file_path}: {str(e)}")
@@ -0,0 +1,515 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Códigos Telefônicos para Ferramenta OSINT
+Este módulo mantém a tabela de códigos de país da UIT (E.164), incluindo os códigos de área que identificam
+países dentro de um mesmo código (ex: +1 876 Jamaica, +7 7 Cazaquistão), em uma árvore de prefixos com
+busca pelo prefixo mais longo, e normaliza e classifica números de telefone em grande volume, inclusive
+colunas de telefones de arquivos CSV lidos em blocos.
+"""
+
+import re
+import logging
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Tuple
+
+import pandas as pd
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_phone_codes')
+
+# Tabela E.164: (prefixo, código do país, código ISO, nome do país)
+# Prefixos mais longos que o código do país identificam territórios que compartilham o código
+COUNTRY_CALLING_CODES: List[Tuple[str, str, str, str]] = [
+    # Plano de Numeração Norte-Americano (+1)
+    ('1', '1', 'US', 'Estados Unidos'),
+    ('1242', '1', 'BS', 'Bahamas'),
+    ('1246', '1', 'BB', 'Barbados'),
+    ('1264', '1', 'AI', 'Anguila'),
+    ('1268', '1', 'AG', 'Antígua e Barbuda'),
+    ('1284', '1', 'VG', 'Ilhas Virgens Britânicas'),
+    ('1340', '1', 'VI', 'Ilhas Virgens Americanas'),
+    ('1345', '1', 'KY', 'Ilhas Cayman'),
+    ('1441', '1', 'BM', 'Bermudas'),
+    ('1473', '1', 'GD', 'Granada'),
+    ('1649', '1', 'TC', 'Ilhas Turcas e Caicos'),
+    ('1658', '1', 'JM', 'Jamaica'),
+    ('1664', '1', 'MS', 'Montserrat'),
+    ('1670', '1', 'MP', 'Ilhas Marianas do Norte'),
+    ('1671', '1', 'GU', 'Guam'),
+    ('1684', '1', 'AS', 'Samoa Americana'),
+    ('1721', '1', 'SX', 'São Martinho'),
+    ('1758', '1', 'LC', 'Santa Lúcia'),
+    ('1767', '1', 'DM', 'Dominica'),
+    ('1784', '1', 'VC', 'São Vicente e Granadinas'),
+    ('1787', '1', 'PR', 'Porto Rico'),
+    ('1809', '1', 'DO', 'República Dominicana'),
+    ('1829', '1', 'DO', 'República Dominicana'),
+    ('1849', '1', 'DO', 'República Dominicana'),
+    ('1868', '1', 'TT', 'Trinidad e Tobago'),
+    ('1869', '1', 'KN', 'São Cristóvão e Neves'),
+    ('1876', '1', 'JM', 'Jamaica'),
+    ('1939', '1', 'PR', 'Porto Rico'),
+] + [
+    # Códigos de área do Canadá
+    ('1' + area, '1', 'CA', 'Canadá') for area in (
+        '204', '226', '236', '249', '250', '263', '289', '306', '343', '354', '365', '367', '368', '382',
+        '403', '416', '418', '428', '431', '437', '438', '450', '468', '474', '506', '514', '519', '548',
+        '579', '581', '584', '587', '604', '613', '639', '647', '672', '683', '705', '709', '742', '753',
+        '778', '780', '782', '807', '819', '825', '867', '873', '879', '902', '905'
+    )
+] + [
+    # Zona 2: África e Atlântico
+    ('20', '20', 'EG', 'Egito'),
+    ('211', '211', 'SS', 'Sudão do Sul'),
+    ('212', '212', 'MA', 'Marrocos'),
+    ('213', '213', 'DZ', 'Argélia'),
+    ('216', '216', 'TN', 'Tunísia'),
+    ('218', '218', 'LY', 'Líbia'),
+    ('220', '220', 'GM', 'Gâmbia'),
+    ('221', '221', 'SN', 'Senegal'),
+    ('222', '222', 'MR', 'Mauritânia'),
+    ('223', '223', 'ML', 'Mali'),
+    ('224', '224', 'GN', 'Guiné'),
+    ('225', '225', 'CI', 'Costa do Marfim'),
+    ('226', '226', 'BF', 'Burkina Faso'),
+    ('227', '227', 'NE', 'Níger'),
+    ('228', '228', 'TG', 'Togo'),
+    ('229', '229', 'BJ', 'Benin'),
+    ('230', '230', 'MU', 'Maurício'),
+    ('231', '231', 'LR', 'Libéria'),
+    ('232', '232', 'SL', 'Serra Leoa'),
+    ('233', '233', 'GH', 'Gana'),
+    ('234', '234', 'NG', 'Nigéria'),
+    ('235', '235', 'TD', 'Chade'),
+    ('236', '236', 'CF', 'República Centro-Africana'),
+    ('237', '237', 'CM', 'Camarões'),
+    ('238', '238', 'CV', 'Cabo Verde'),
+    ('239', '239', 'ST', 'São Tomé e Príncipe'),
+    ('240', '240', 'GQ', 'Guiné Equatorial'),
+    ('241', '241', 'GA', 'Gabão'),
+    ('242', '242', 'CG', 'República do Congo'),
+    ('243', '243', 'CD', 'República Democrática do Congo'),
+    ('244', '244', 'AO', 'Angola'),
+    ('245', '245', 'GW', 'Guiné-Bissau'),
+    ('246', '246', 'IO', 'Território Britânico do Oceano Índico'),
+    ('247', '247', 'AC', 'Ilha de Ascensão'),
+    ('248', '248', 'SC', 'Seicheles'),
+    ('249', '249', 'SD', 'Sudão'),
+    ('250', '250', 'RW', 'Ruanda'),
+    ('251', '251', 'ET', 'Etiópia'),
+    ('252', '252', 'SO', 'Somália'),
+    ('253', '253', 'DJ', 'Djibuti'),
+    ('254', '254', 'KE', 'Quênia'),
+    ('255', '255', 'TZ', 'Tanzânia'),
+    ('256', '256', 'UG', 'Uganda'),
+    ('257', '257', 'BI', 'Burundi'),
+    ('258', '258', 'MZ', 'Moçambique'),
+    ('260', '260', 'ZM', 'Zâmbia'),
+    ('261', '261', 'MG', 'Madagascar'),
+    ('262', '262', 'RE', 'Reunião'),
+    ('262269', '262', 'YT', 'Mayotte'),
+    ('262639', '262', 'YT', 'Mayotte'),
+    ('263', '263', 'ZW', 'Zimbábue'),
+    ('264', '264', 'NA', 'Namíbia'),
+    ('265', '265', 'MW', 'Malawi'),
+    ('266', '266', 'LS', 'Lesoto'),
+    ('267', '267', 'BW', 'Botsuana'),
+    ('268', '268', 'SZ', 'Essuatíni'),
+    ('269', '269', 'KM', 'Comores'),
+    ('27', '27', 'ZA', 'África do Sul'),
+    ('290', '290', 'SH', 'Santa Helena'),
+    ('291', '291', 'ER', 'Eritreia'),
+    ('297', '297', 'AW', 'Aruba'),
+    ('298', '298', 'FO', 'Ilhas Feroé'),
+    ('299', '299', 'GL', 'Groenlândia'),
+    # Zonas 3 e 4: Europa
+    ('30', '30', 'GR', 'Grécia'),
+    ('31', '31', 'NL', 'Países Baixos'),
+    ('32', '32', 'BE', 'Bélgica'),
+    ('33', '33', 'FR', 'França'),
+    ('34', '34', 'ES', 'Espanha'),
+    ('350', '350', 'GI', 'Gibraltar'),
+    ('351', '351', 'PT', 'Portugal'),
+    ('352', '352', 'LU', 'Luxemburgo'),
+    ('353', '353', 'IE', 'Irlanda'),
+    ('354', '354', 'IS', 'Islândia'),
+    ('355', '355', 'AL', 'Albânia'),
+    ('356', '356', 'MT', 'Malta'),
+    ('357', '357', 'CY', 'Chipre'),
+    ('358', '358', 'FI', 'Finlândia'),
+    ('35818', '358', 'AX', 'Ilhas Åland'),
+    ('359', '359', 'BG', 'Bulgária'),
+    ('36', '36', 'HU', 'Hungria'),
+    ('370', '370', 'LT', 'Lituânia'),
+    ('371', '371', 'LV', 'Letônia'),
+    ('372', '372', 'EE', 'Estônia'),
+    ('373', '373', 'MD', 'Moldávia'),
+    ('374', '374', 'AM', 'Armênia'),
+    ('375', '375', 'BY', 'Belarus'),
+    ('376', '376', 'AD', 'Andorra'),
+    ('377', '377', 'MC', 'Mônaco'),
+    ('378', '378', 'SM', 'San Marino'),
+    ('379', '379', 'VA', 'Vaticano'),
+    ('380', '380', 'UA', 'Ucrânia'),
+    ('381', '381', 'RS', 'Sérvia'),
+    ('382', '382', 'ME', 'Montenegro'),
+    ('383', '383', 'XK', 'Kosovo'),
+    ('385', '385', 'HR', 'Croácia'),
+    ('386', '386', 'SI', 'Eslovênia'),
+    ('387', '387', 'BA', 'Bósnia e Herzegovina'),
+    ('389', '389', 'MK', 'Macedônia do Norte'),
+    ('39', '39', 'IT', 'Itália'),
+    ('3906698', '39', 'VA', 'Vaticano'),
+    ('40', '40', 'RO', 'Romênia'),
+    ('41', '41', 'CH', 'Suíça'),
+    ('420', '420', 'CZ', 'Tchéquia'),
+    ('421', '421', 'SK', 'Eslováquia'),
+    ('423', '423', 'LI', 'Liechtenstein'),
+    ('43', '43', 'AT', 'Áustria'),
+    ('44', '44', 'GB', 'Reino Unido'),
+    ('441481', '44', 'GG', 'Guernsey'),
+    ('441534', '44', 'JE', 'Jersey'),
+    ('441624', '44', 'IM', 'Ilha de Man'),
+    ('45', '45', 'DK', 'Dinamarca'),
+    ('46', '46', 'SE', 'Suécia'),
+    ('47', '47', 'NO', 'Noruega'),
+    ('4779', '47', 'SJ', 'Svalbard e Jan Mayen'),
+    ('48', '48', 'PL', 'Polônia'),
+    ('49', '49', 'DE', 'Alemanha'),
+    # Zona 5: Américas Central e do Sul
+    ('500', '500', 'FK', 'Ilhas Malvinas'),
+    ('501', '501', 'BZ', 'Belize'),
+    ('502', '502', 'GT', 'Guatemala'),
+    ('503', '503', 'SV', 'El Salvador'),
+    ('504', '504', 'HN', 'Honduras'),
+    ('505', '505', 'NI', 'Nicarágua'),
+    ('506', '506', 'CR', 'Costa Rica'),
+    ('507', '507', 'PA', 'Panamá'),
+    ('508', '508', 'PM', 'Saint-Pierre e Miquelon'),
+    ('509', '509', 'HT', 'Haiti'),
+    ('51', '51', 'PE', 'Peru'),
+    ('52', '52', 'MX', 'México'),
+    ('53', '53', 'CU', 'Cuba'),
+    ('54', '54', 'AR', 'Argentina'),
+    ('55', '55', 'BR', 'Brasil'),
+    ('56', '56', 'CL', 'Chile'),
+    ('57', '57', 'CO', 'Colômbia'),
+    ('58', '58', 'VE', 'Venezuela'),
+    ('590', '590', 'GP', 'Guadalupe'),
+    ('591', '591', 'BO', 'Bolívia'),
+    ('592', '592', 'GY', 'Guiana'),
+    ('593', '593', 'EC', 'Equador'),
+    ('594', '594', 'GF', 'Guiana Francesa'),
+    ('595', '595', 'PY', 'Paraguai'),
+    ('596', '596', 'MQ', 'Martinica'),
+    ('597', '597', 'SR', 'Suriname'),
+    ('598', '598', 'UY', 'Uruguai'),
+    ('599', '599', 'CW', 'Curaçao'),
+    ('5993', '599', 'BQ', 'Caribe Neerlandês'),
+    ('5994', '599', 'BQ', 'Caribe Neerlandês'),
+    ('5997', '599', 'BQ', 'Caribe Neerlandês'),
+    # Zona 6: Sudeste Asiático e Oceania
+    ('60', '60', 'MY', 'Malásia'),
+    ('61', '61', 'AU', 'Austrália'),
+    ('62', '62', 'ID', 'Indonésia'),
+    ('63', '63', 'PH', 'Filipinas'),
+    ('64', '64', 'NZ', 'Nova Zelândia'),
+    ('65', '65', 'SG', 'Singapura'),
+    ('66', '66', 'TH', 'Tailândia'),
+    ('670', '670', 'TL', 'Timor-Leste'),
+    ('672', '672', 'NF', 'Ilha Norfolk'),
+    ('673', '673', 'BN', 'Brunei'),
+    ('674', '674', 'NR', 'Nauru'),
+    ('675', '675', 'PG', 'Papua-Nova Guiné'),
+    ('676', '676', 'TO', 'Tonga'),
+    ('677', '677', 'SB', 'Ilhas Salomão'),
+    ('678', '678', 'VU', 'Vanuatu'),
+    ('679', '679', 'FJ', 'Fiji'),
+    ('680', '680', 'PW', 'Palau'),
+    ('681', '681', 'WF', 'Wallis e Futuna'),
+    ('682', '682', 'CK', 'Ilhas Cook'),
+    ('683', '683', 'NU', 'Niue'),
+    ('685', '685', 'WS', 'Samoa'),
+    ('686', '686', 'KI', 'Kiribati'),
+    ('687', '687', 'NC', 'Nova Caledônia'),
+    ('688', '688', 'TV', 'Tuvalu'),
+    ('689', '689', 'PF', 'Polinésia Francesa'),
+    ('690', '690', 'TK', 'Tokelau'),
+    ('691', '691', 'FM', 'Micronésia'),
+    ('692', '692', 'MH', 'Ilhas Marshall'),
+    # Zona 7: Rússia e Cazaquistão
+    ('7', '7', 'RU', 'Rússia'),
+    ('76', '7', 'KZ', 'Cazaquistão'),
+    ('77', '7', 'KZ', 'Cazaquistão'),
+    # Zona 8: Leste Asiático e serviços especiais
+    ('800', '800', '', 'Número gratuito internacional'),
+    ('808', '808', '', 'Serviço de custo compartilhado internacional'),
+    ('81', '81', 'JP', 'Japão'),
+    ('82', '82', 'KR', 'Coreia do Sul'),
+    ('84', '84', 'VN', 'Vietnã'),
+    ('850', '850', 'KP', 'Coreia do Norte'),
+    ('852', '852', 'HK', 'Hong Kong'),
+    ('853', '853', 'MO', 'Macau'),
+    ('855', '855', 'KH', 'Camboja'),
+    ('856', '856', 'LA', 'Laos'),
+    ('86', '86', 'CN', 'China'),
+    ('870', '870', '', 'Inmarsat'),
+    ('878', '878', '', 'Serviço de telecomunicações pessoais universais'),
+    ('880', '880', 'BD', 'Bangladesh'),
+    ('881', '881', '', 'Sistema global de satélites móveis'),
+    ('882', '882', '', 'Redes internacionais'),
+    ('883', '883', '', 'Redes internacionais'),
+    ('886', '886', 'TW', 'Taiwan'),
+    ('888', '888', '', 'Ajuda humanitária (ONU)'),
+    # Zona 9: Ásia Ocidental, Meridional e Central
+    ('90', '90', 'TR', 'Turquia'),
+    ('91', '91', 'IN', 'Índia'),
+    ('92', '92', 'PK', 'Paquistão'),
+    ('93', '93', 'AF', 'Afeganistão'),
+    ('94', '94', 'LK', 'Sri Lanka'),
+    ('95', '95', 'MM', 'Mianmar'),
+    ('960', '960', 'MV', 'Maldivas'),
+    ('961', '961', 'LB', 'Líbano'),
+    ('962', '962', 'JO', 'Jordânia'),
+    ('963', '963', 'SY', 'Síria'),
+    ('964', '964', 'IQ', 'Iraque'),
+    ('965', '965', 'KW', 'Kuwait'),
+    ('966', '966', 'SA', 'Arábia Saudita'),
+    ('967', '967', 'YE', 'Iêmen'),
+    ('968', '968', 'OM', 'Omã'),
+    ('970', '970', 'PS', 'Palestina'),
+    ('971', '971', 'AE', 'Emirados Árabes Unidos'),
+    ('972', '972', 'IL', 'Israel'),
+    ('973', '973', 'BH', 'Bahrein'),
+    ('974', '974', 'QA', 'Catar'),
+    ('975', '975', 'BT', 'Butão'),
+    ('976', '976', 'MN', 'Mongólia'),
+    ('977', '977', 'NP', 'Nepal'),
+    ('979', '979', '', 'Tarifação adicional internacional'),
+    ('98', '98', 'IR', 'Irã'),
+    ('992', '992', 'TJ', 'Tajiquistão'),
+    ('993', '993', 'TM', 'Turcomenistão'),
+    ('994', '994', 'AZ', 'Azerbaijão'),
+    ('995', '995', 'GE', 'Geórgia'),
+    ('996', '996', 'KG', 'Quirguistão'),
+    ('998', '998', 'UZ', 'Uzbequistão')
+]
+
+# Limites de tamanho de um número E.164 (código do país incluído)
+MIN_PHONE_DIGITS = 8
+MAX_PHONE_DIGITS = 15
+
+# Nomes aceitos para a coluna de telefones do CSV de entrada
+PHONE_COLUMNS = ('phone', 'phones', 'telefone', 'telefones', 'celular', 'mobile', 'tel', 'fone', 'phone_number', 'numero')
+
+CLASSIFICATION_COLUMNS = ['original_number', 'normalized_number', 'valid', 'calling_code', 'country_iso', 'country']
+
+_NON_DIGIT_PATTERN = re.compile(r'\D')
+
+
+class PrefixTrie:
+    """Árvore de prefixos de dígitos com busca pelo prefixo mais longo."""
+
+    # Chave reservada para o valor associado a um nó (dígitos são sempre '0'-'9')
+    _VALUE = ''
+
+    def __init__(self, items: Optional[Iterable[Tuple[str, Any]]] = None):
+        """
+        Inicializa a árvore.
+
+        Args:
+            items: Pares (prefixo, valor) inseridos inicialmente (opcional)
+        """
+        self._root: Dict[str, Any] = {}
+        self._size = 0
+        for prefix, value in items or ():
+            self.insert(prefix, value)
+
+    def insert(self, prefix: str, value: Any):
+        """
+        Associa um valor a um prefixo.
+
+        Args:
+            prefix: Sequência de dígitos
+            value: Valor associado
+        """
+        node = self._root
+        for digit in prefix:
+            node = node.setdefault(digit, {})
+        if self._VALUE not in node:
+            self._size += 1
+        node[self._VALUE] = value
+
+    def longest_match(self, digits: str) -> Optional[Tuple[str, Any]]:
+        """
+        Encontra o prefixo mais longo de uma sequência de dígitos presente na árvore.
+
+        Args:
+            digits: Sequência de dígitos
+
+        Returns:
+            Tupla (prefixo, valor) ou None se nenhum prefixo corresponder
+        """
+        node = self._root
+        match = None
+        for position, digit in enumerate(digits):
+            node = node.get(digit)
+            if node is None:
+                break
+            if self._VALUE in node:
+                match = (position + 1, node[self._VALUE])
+
+        return (digits[:match[0]], match[1]) if match else None
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# Carregada uma única vez, na importação do módulo
+COUNTRY_TRIE = PrefixTrie(
+    (prefix, {'calling_code': code, 'country_iso': iso, 'country': name})
+    for prefix, code, iso, name in COUNTRY_CALLING_CODES
+)
+
+
+def lookup_country(phone_number: str) -> Optional[Dict[str, str]]:
+    """
+    Identifica o país de um número no formato internacional, pelo prefixo mais longo da tabela E.164.
+
+    Args:
+        phone_number: Número com código do país (com ou sem '+')
+
+    Returns:
+        Dicionário com calling_code, country_iso e country, ou None se o código é desconhecido
+    """
+    match = COUNTRY_TRIE.longest_match(phone_number.lstrip('+'))
+    return match[1] if match else None
+
+
+def normalize_phone_number(phone_number: str, default_country_code: str = '55') -> str:
+    """
+    Normaliza um número de telefone para o formato E.164 (+<código do país><número>).
+
+    Números com '+' ou com o prefixo internacional '00' já trazem o código do país. Nos demais,
+    o prefixo de longa distância '0' é removido e, se o número tiver até 11 dígitos (DDD e número),
+    o código do país padrão é acrescentado.
+
+    Args:
+        phone_number: Número de telefone em qualquer formato
+        default_country_code: Código do país dos números nacionais (padrão: Brasil)
+
+    Returns:
+        Número normalizado ou string vazia se o número não tem um tamanho válido
+    """
+    raw = (phone_number or '').strip()
+    digits = _NON_DIGIT_PATTERN.sub('', raw)
+
+    if not raw.startswith('+'):
+        if digits.startswith('00'):
+            digits = digits[2:]
+        else:
+            digits = digits[1:] if digits.startswith('0') else digits
+            if len(digits) <= 11:
+                digits = default_country_code + digits
+
+    if not MIN_PHONE_DIGITS <= len(digits) <= MAX_PHONE_DIGITS:
+        return ''
+
+    return '+' + digits
+
+
+def classify_phone_number(phone_number: str, default_country_code: str = '55') -> Dict[str, Any]:
+    """
+    Normaliza um número e identifica o seu país.
+
+    Args:
+        phone_number: Número de telefone em qualquer formato
+        default_country_code: Código do país dos números nacionais
+
+    Returns:
+        Dicionário com o número original e normalizado, validade, código e país
+    """
+    normalized = normalize_phone_number(phone_number, default_country_code)
+    country = lookup_country(normalized) if normalized else None
+
+    return {
+        'original_number': phone_number,
+        'normalized_number': normalized,
+        'valid': country is not None,
+        'calling_code': country['calling_code'] if country else None,
+        'country_iso': country['country_iso'] if country else None,
+        'country': country['country'] if country else None
+    }
+
+
+def classify_phone_numbers(phone_numbers: Iterable[str], default_country_code: str = '55') -> Iterator[Dict[str, Any]]:
+    """
+    Classifica uma sequência de números sob demanda, sem carregá-la inteira na memória.
+
+    Args:
+        phone_numbers: Números de telefone (linhas vazias e iniciadas por '#' são ignoradas)
+        default_country_code: Código do país dos números nacionais
+
+    Yields:
+        Resultado de classify_phone_number para cada número
+    """
+    for phone_number in phone_numbers:
+        phone_number = phone_number.strip()
+        if phone_number and not phone_number.startswith('#'):
+            yield classify_phone_number(phone_number, default_country_code)
+
+
+def classify_phone_frame(phone_numbers: pd.Series, default_country_code: str = '55') -> pd.DataFrame:
+    """
+    Classifica uma coluna de números, processando cada valor distinto uma única vez.
+
+    Em vazamentos, o mesmo número costuma se repetir muitas vezes; a classificação é feita sobre os
+    valores distintos do bloco e distribuída às linhas por um mapeamento.
+
+    Args:
+        phone_numbers: Números de telefone em qualquer formato
+        default_country_code: Código do país dos números nacionais
+
+    Returns:
+        DataFrame com as colunas CLASSIFICATION_COLUMNS, com o mesmo índice da entrada
+    """
+    # Listas Python: iterar arrays de strings do pandas elemento a elemento é várias vezes mais lento
+    values = phone_numbers.fillna('').astype(str).str.strip().tolist()
+    classified = {value: classify_phone_number(value, default_country_code) for value in dict.fromkeys(values)}
+
+    return pd.DataFrame.from_records([classified[value] for value in values], index=phone_numbers.index,
+                                     columns=CLASSIFICATION_COLUMNS)
+
+
+def read_phone_column(input_file: str, column: Optional[str] = None, chunk_size: int = 50000) -> Iterator[pd.Series]:
+    """
+    Lê a coluna de telefones de um CSV em blocos.
+
+    Sem coluna informada, usa a primeira cujo cabeçalho está em PHONE_COLUMNS (ou a primeira coluna).
+
+    Args:
+        input_file: Caminho do arquivo CSV
+        column: Nome da coluna de telefones (opcional)
+        chunk_size: Número de linhas por bloco
+
+    Yields:
+        Blocos da coluna de telefones, indexados pela linha de dados do arquivo (a partir de 0)
+    """
+    reader = pd.read_csv(input_file, dtype=str, keep_default_na=False, chunksize=chunk_size,
+                         skipinitialspace=True, encoding='utf-8', encoding_errors='ignore')
+
+    for chunk in reader:
+        columns = {str(c).strip().lower(): c for c in chunk.columns}
+        if column is not None:
+            if column.strip().lower() not in columns:
+                raise ValueError(f"Coluna de telefones não encontrada: {column}")
+            phone_column = columns[column.strip().lower()]
+        else:
+            phone_column = next((columns[c] for c in PHONE_COLUMNS if c in columns), chunk.columns[0])
+
+        yield chunk[phone_column]
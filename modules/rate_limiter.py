@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Limitação de Taxa para Ferramenta OSINT
+Este módulo controla a frequência de requisições por host usando token buckets,
+com taxas configuráveis e suporte à diretiva Crawl-delay do robots.txt.
+"""
+
+import time
+import logging
+import threading
+from urllib.robotparser import RobotFileParser
+from typing import Dict, Optional
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_rate_limiter')
+
+
+def parse_robots(robots_text: str) -> RobotFileParser:
+    """
+    Interpreta o conteúdo de um robots.txt.
+
+    Args:
+        robots_text: Conteúdo do robots.txt (vazio se indisponível, o que libera todas as páginas)
+
+    Returns:
+        Regras do robots.txt
+    """
+    parser = RobotFileParser()
+    # Sem a data de leitura registrada, o RobotFileParser ignora Crawl-delay e Request-rate e nega todas as páginas
+    parser.modified()
+    parser.parse(robots_text.splitlines())
+    return parser
+
+
+class TokenBucket:
+    """Token bucket thread-safe que libera requisições a uma taxa constante."""
+
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Inicializa o bucket.
+
+        Args:
+            rate: Número de requisições liberadas por segundo
+            capacity: Número máximo de requisições acumuladas para rajadas
+        """
+        self.rate = rate
+        self.capacity = max(1.0, capacity)
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserva tokens e informa quanto tempo o chamador deve esperar para usá-los.
+
+        Args:
+            tokens: Número de tokens a reservar
+
+        Returns:
+            Tempo de espera em segundos (0 se os tokens já estão disponíveis)
+        """
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated_at) * self.rate)
+            self.updated_at = now
+            self.tokens -= tokens
+
+            if self.tokens >= 0:
+                return 0.0
+
+            return -self.tokens / self.rate
+
+    def set_rate(self, rate: float):
+        """
+        Altera a taxa do bucket mantendo os tokens acumulados.
+
+        Args:
+            rate: Nova taxa em requisições por segundo
+        """
+        with self._lock:
+            self.rate = rate
+
+
+class RateLimiter:
+    """Limitador de taxa com um token bucket independente para cada host."""
+
+    def __init__(self, default_rate: Optional[float] = 4.0, burst: float = 1.0,
+                 host_rates: Optional[Dict[str, float]] = None, respect_robots: bool = True):
+        """
+        Inicializa o limitador.
+
+        Args:
+            default_rate: Requisições por segundo permitidas para cada host (None para sem limite)
+            burst: Número de requisições que podem ser feitas em rajada
+            host_rates: Taxas específicas por host, sobrepondo a taxa padrão
+            respect_robots: Se True, aplica a diretiva Crawl-delay do robots.txt de cada host
+        """
+        self.default_rate = default_rate
+        self.burst = burst
+        self.host_rates = dict(host_rates or {})
+        self.respect_robots = respect_robots
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._robots: Dict[str, Optional[RobotFileParser]] = {}
+        self._robots_loaded: Dict[str, threading.Event] = {}
+        self._crawl_delays: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def set_host_rate(self, host: str, rate: Optional[float]):
+        """
+        Define a taxa de um host específico.
+
+        Args:
+            host: Host (netloc) a ser configurado
+            rate: Requisições por segundo (None para sem limite)
+        """
+        with self._lock:
+            self.host_rates[host] = rate
+            self._buckets.pop(host, None)
+
+    def get_rate(self, host: str) -> Optional[float]:
+        """
+        Calcula a taxa efetiva de um host, considerando configuração e robots.txt.
+
+        Args:
+            host: Host (netloc) consultado
+
+        Returns:
+            Requisições por segundo permitidas (None para sem limite)
+        """
+        rate = self.host_rates.get(host, self.default_rate)
+        crawl_delay = self._crawl_delays.get(host)
+
+        if crawl_delay:
+            robots_rate = 1.0 / crawl_delay
+            rate = robots_rate if rate is None else min(rate, robots_rate)
+
+        return rate
+
+    def wait(self, host: str) -> float:
+        """
+        Bloqueia até que uma requisição ao host seja permitida.
+
+        Args:
+            host: Host (netloc) da requisição
+
+        Returns:
+            Tempo efetivamente aguardado em segundos
+        """
+        bucket = self._get_bucket(host)
+
+        if bucket is None:
+            return 0.0
+
+        delay = bucket.reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+        return delay
+
+    def needs_robots(self, host: str) -> bool:
+        """
+        Indica se o robots.txt do host ainda precisa ser carregado.
+
+        Apenas o primeiro chamador recebe True; os demais seguem com a taxa padrão
+        até que as regras sejam aplicadas (ou aguardam por elas com wait_robots).
+
+        Args:
+            host: Host (netloc) consultado
+
+        Returns:
+            True se o chamador deve carregar o robots.txt
+        """
+        if not self.respect_robots:
+            return False
+
+        with self._lock:
+            if host in self._robots:
+                return False
+            self._robots[host] = None
+            self._robots_loaded[host] = threading.Event()
+            return True
+
+    def apply_robots(self, host: str, robots_text: str, user_agent: str = '*') -> Optional[float]:
+        """
+        Aplica as regras de um robots.txt ao host.
+
+        Args:
+            host: Host (netloc) ao qual o robots.txt pertence
+            robots_text: Conteúdo do robots.txt (vazio se indisponível)
+            user_agent: User-Agent usado para selecionar as regras
+
+        Returns:
+            Intervalo mínimo entre requisições, em segundos, se definido pelo robots.txt
+        """
+        parser = parse_robots(robots_text)
+
+        crawl_delay = self._parse_crawl_delay(robots_text, user_agent)
+        request_rate = parser.request_rate(user_agent)
+
+        # Request-rate: N requisições a cada M segundos equivale a um intervalo de M/N
+        if request_rate and request_rate.requests:
+            rate_delay = request_rate.seconds / request_rate.requests
+            crawl_delay = max(float(crawl_delay or 0), rate_delay)
+
+        with self._lock:
+            self._robots[host] = parser
+            loaded = self._robots_loaded.get(host)
+
+            if crawl_delay:
+                self._crawl_delays[host] = float(crawl_delay)
+                self._buckets.pop(host, None)
+                logger.info(f"Crawl-delay de {crawl_delay}s aplicado ao host {host}")
+
+        if loaded:
+            loaded.set()
+
+        return float(crawl_delay) if crawl_delay else None
+
+    def get_robots(self, host: str) -> Optional[RobotFileParser]:
+        """
+        Obtém as regras de robots.txt já carregadas para um host.
+
+        Args:
+            host: Host (netloc) consultado
+
+        Returns:
+            Regras do robots.txt ou None se ainda não carregadas
+        """
+        return self._robots.get(host)
+
+    def wait_robots(self, host: str, timeout: Optional[float] = None) -> Optional[RobotFileParser]:
+        """
+        Aguarda as regras de robots.txt de um host que está sendo carregado por outra thread.
+
+        Args:
+            host: Host (netloc) consultado
+            timeout: Tempo máximo de espera em segundos (None para aguardar indefinidamente)
+
+        Returns:
+            Regras do robots.txt ou None se não foram carregadas dentro do tempo limite
+        """
+        loaded = self._robots_loaded.get(host)
+
+        if loaded is not None:
+            loaded.wait(timeout)
+
+        return self._robots.get(host)
+
+    def _parse_crawl_delay(self, robots_text: str, user_agent: str) -> Optional[float]:
+        """
+        Extrai a diretiva Crawl-delay aplicável ao User-Agent.
+
+        O RobotFileParser da biblioteca padrão aceita apenas valores inteiros, mas
+        intervalos fracionários (ex: 'Crawl-delay: 0.5') são comuns.
+
+        Args:
+            robots_text: Conteúdo do robots.txt
+            user_agent: User-Agent usado para selecionar as regras
+
+        Returns:
+            Intervalo em segundos ou None se não definido
+        """
+        agent_token = user_agent.split('/')[0].lower()
+        delays = {}
+        group_agents = []
+        in_agent_lines = False
+
+        for line in robots_text.splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+
+            key, value = [part.strip() for part in line.split(':', 1)]
+            key = key.lower()
+
+            if key == 'user-agent':
+                if not in_agent_lines:
+                    group_agents = []
+                group_agents.append(value.lower())
+                in_agent_lines = True
+                continue
+
+            in_agent_lines = False
+
+            if key == 'crawl-delay':
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in group_agents:
+                    delays.setdefault(agent, delay)
+
+        for agent, delay in delays.items():
+            if agent != '*' and agent in agent_token:
+                return delay
+
+        return delays.get('*')
+
+    def _get_bucket(self, host: str) -> Optional[TokenBucket]:
+        """
+        Obtém (ou cria) o token bucket de um host.
+
+        Args:
+            host: Host (netloc) consultado
+
+        Returns:
+            Token bucket do host ou None se o host não tem limite
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+
+            if bucket is None:
+                rate = self.get_rate(host)
+                if not rate:
+                    return None
+                bucket = TokenBucket(rate, self.burst)
+                self._buckets[host] = bucket
+
+            return bucket
@@ -0,0 +1,324 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Exportação de Resultados para Ferramenta OSINT
+Este módulo lê os resultados gravados em disco (arquivos JSON de cada busca e arquivos JSONL dos lotes)
+e os converte em linhas tabulares, transmitidas em blocos para CSV, JSONL ou Parquet sem carregar
+o conjunto inteiro na memória.
+"""
+
+import io
+import os
+import csv
+import json
+import logging
+from datetime import datetime, timedelta
+from typing import Dict, List, Any, Optional, Iterable, Iterator, Callable
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_result_export')
+
+EXPORT_FORMATS = ('csv', 'jsonl', 'parquet')
+
+EXPORT_MIMETYPES = {
+    'csv': 'text/csv',
+    'jsonl': 'application/x-ndjson',
+    'parquet': 'application/vnd.apache.parquet'
+}
+
+# Colunas exportadas para cada tipo de busca
+EXPORT_COLUMNS = {
+    'emails': ['domain', 'email', 'collection_date'],
+    'domains': ['domain', 'registrar', 'creation_date', 'expiration_date', 'site_available', 'ip_addresses',
+                'collection_date'],
+    'phones': ['phone_number', 'country', 'carrier', 'line_type', 'collection_date']
+}
+
+# Extensões dos arquivos de resultados: JSON (um resultado por arquivo) e JSONL (um resultado por linha)
+RESULT_EXTENSIONS = ('.json', '.jsonl')
+
+
+def _email_rows(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Uma linha por e-mail encontrado em uma busca por domínio."""
+    for email in record.get('emails_found', []):
+        yield {
+            'domain': record.get('domain'),
+            'email': email,
+            'collection_date': record.get('collection_date')
+        }
+
+
+def _domain_rows(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Uma linha por análise de domínio."""
+    if 'domain' not in record or 'error' in record:
+        return
+
+    whois_info = record.get('whois_info') or {}
+    yield {
+        'domain': record.get('domain'),
+        'registrar': whois_info.get('registrar'),
+        'creation_date': whois_info.get('creation_date'),
+        'expiration_date': whois_info.get('expiration_date'),
+        'site_available': record.get('site_available'),
+        'ip_addresses': ', '.join(record.get('ip_addresses', [])),
+        'collection_date': record.get('collection_date')
+    }
+
+
+def _phone_rows(record: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    """Uma linha por telefone (busca individual ou classificação em lote)."""
+    if not record.get('normalized_number'):
+        return
+
+    phone_info = record.get('phone_info') or {}
+    yield {
+        'phone_number': record.get('normalized_number'),
+        'country': phone_info.get('country', record.get('country')),
+        'carrier': phone_info.get('carrier'),
+        'line_type': phone_info.get('line_type'),
+        'collection_date': record.get('collection_date')
+    }
+
+
+ROW_BUILDERS: Dict[str, Callable[[Dict[str, Any]], Iterator[Dict[str, Any]]]] = {
+    'emails': _email_rows,
+    'domains': _domain_rows,
+    'phones': _phone_rows
+}
+
+
+def parse_date_bound(value: Optional[str], end: bool = False) -> Optional[datetime]:
+    """
+    Converte o limite de um filtro de datas (ISO 8601) em datetime.
+
+    Args:
+        value: Data ('2024-05-01') ou data e hora ('2024-05-01T12:00:00')
+        end: Se True, uma data sem hora inclui o dia inteiro
+
+    Returns:
+        Limite como datetime (None se não informado)
+    """
+    if not value:
+        return None
+
+    bound = datetime.fromisoformat(value)
+    if end and len(value) == 10:
+        bound += timedelta(days=1)
+
+    return bound
+
+
+def iter_result_records(results_dir: str) -> Iterator[Dict[str, Any]]:
+    """
+    Lê os resultados gravados em um diretório, um de cada vez.
+
+    Args:
+        results_dir: Diretório de um tipo de busca (ex: resultados/contact_info/emails)
+
+    Yields:
+        Resultados, na ordem dos nomes de arquivo
+    """
+    if not os.path.isdir(results_dir):
+        return
+
+    names = sorted(name for name in os.listdir(results_dir) if name.endswith(RESULT_EXTENSIONS))
+    for name in names:
+        path = os.path.join(results_dir, name)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                if name.endswith('.jsonl'):
+                    for line in f:
+                        if line.strip():
+                            yield json.loads(line)
+                else:
+                    yield json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning(f"Arquivo de resultados ignorado ({path}): {str(e)}")
+
+
+def iter_export_rows(results_dir: str, search_type: str, since: Optional[datetime] = None,
+                     until: Optional[datetime] = None, domain: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Converte os resultados gravados em linhas tabulares, aplicando os filtros.
+
+    Args:
+        results_dir: Diretório do tipo de busca
+        search_type: Tipo de busca ('emails', 'domains', 'phones')
+        since: Inclui apenas resultados coletados a partir desta data (opcional)
+        until: Inclui apenas resultados coletados antes desta data (opcional)
+        domain: Inclui apenas linhas deste domínio ou de seus subdomínios (opcional)
+
+    Returns:
+        Iterador de linhas com as colunas EXPORT_COLUMNS[search_type]
+    """
+    # Validado na chamada, e não apenas quando a primeira linha for pedida
+    if search_type not in ROW_BUILDERS:
+        raise ValueError(f"Tipo de busca não suportado: {search_type}")
+
+    if domain and 'domain' not in EXPORT_COLUMNS[search_type]:
+        raise ValueError(f"O filtro de domínio não se aplica a {search_type}")
+
+    domain = domain.lower().strip('.') if domain else None
+    return _filter_rows(iter_result_records(results_dir), ROW_BUILDERS[search_type], since, until, domain)
+
+
+def _filter_rows(records: Iterable[Dict[str, Any]], build_rows: Callable[[Dict[str, Any]], Iterator[Dict[str, Any]]],
+                 since: Optional[datetime], until: Optional[datetime], domain: Optional[str]) -> Iterator[Dict[str, Any]]:
+    """Converte os resultados em linhas, descartando os que estão fora dos filtros."""
+    for record in records:
+        if since or until:
+            try:
+                collected = datetime.fromisoformat(record.get('collection_date') or '')
+            except ValueError:
+                continue
+            if (since and collected < since) or (until and collected >= until):
+                continue
+
+        for row in build_rows(record):
+            if domain:
+                row_domain = (row.get('domain') or '').lower()
+                if row_domain != domain and not row_domain.endswith('.' + domain):
+                    continue
+            yield row
+
+
+def _batched(rows: Iterable[Dict[str, Any]], batch_size: int) -> Iterator[List[Dict[str, Any]]]:
+    """Agrupa as linhas em listas de até batch_size elementos."""
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+class _ByteSink:
+    """Destino de escrita que acumula bytes até serem recolhidos, mantendo a posição absoluta."""
+
+    def __init__(self):
+        self._chunks = []
+        self._position = 0
+        self.closed = False
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        # O Parquet grava as posições absolutas dos blocos no rodapé do arquivo
+        return self._position
+
+    def flush(self):
+        pass
+
+    def close(self):
+        self.closed = True
+
+    def drain(self) -> bytes:
+        data = b''.join(self._chunks)
+        self._chunks = []
+        return data
+
+
+def iter_export_chunks(rows: Iterable[Dict[str, Any]], columns: List[str], output_format: str = 'csv',
+                       batch_size: int = 5000) -> Iterator[bytes]:
+    """
+    Serializa as linhas no formato pedido, em blocos de bytes prontos para gravar ou transmitir.
+
+    Apenas um bloco de batch_size linhas fica na memória de cada vez; no Parquet, cada bloco
+    se torna um row group.
+
+    Args:
+        rows: Linhas tabulares
+        columns: Colunas, na ordem da saída
+        output_format: Formato ('csv', 'jsonl' ou 'parquet')
+        batch_size: Linhas por bloco
+
+    Yields:
+        Blocos de bytes da saída
+    """
+    if output_format not in EXPORT_FORMATS:
+        raise ValueError(f"Formato de exportação não suportado: {output_format}")
+
+    if output_format == 'csv':
+        buffer = io.StringIO()
+        writer = csv.DictWriter(buffer, fieldnames=columns, extrasaction='ignore')
+        writer.writeheader()
+        for batch in _batched(rows, batch_size):
+            writer.writerows(batch)
+            yield buffer.getvalue().encode('utf-8')
+            buffer.seek(0)
+            buffer.truncate(0)
+        if buffer.tell():
+            # Apenas o cabeçalho: não havia linhas
+            yield buffer.getvalue().encode('utf-8')
+
+    elif output_format == 'jsonl':
+        for batch in _batched(rows, batch_size):
+            yield ''.join(
+                json.dumps({column: row.get(column) for column in columns}, ensure_ascii=False, default=str) + '\n'
+                for row in batch
+            ).encode('utf-8')
+
+    else:
+        # Importado apenas quando necessário: o pyarrow é uma dependência opcional
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        # Esquema fixo em texto: todos os row groups precisam do mesmo esquema
+        schema = pa.schema([(column, pa.string()) for column in columns])
+        sink = _ByteSink()
+        writer = pq.ParquetWriter(sink, schema)
+        try:
+            for batch in _batched(rows, batch_size):
+                table = pa.table({
+                    column: [None if row.get(column) is None else str(row.get(column)) for row in batch]
+                    for column in columns
+                }, schema=schema)
+                writer.write_table(table)
+                yield sink.drain()
+        finally:
+            writer.close()
+        yield sink.drain()
+
+
+def write_export(rows: Iterable[Dict[str, Any]], columns: List[str], output_file: str,
+                 output_format: str = 'csv', batch_size: int = 5000) -> int:
+    """
+    Grava as linhas em um arquivo, bloco a bloco.
+
+    Args:
+        rows: Linhas tabulares
+        columns: Colunas, na ordem da saída
+        output_file: Arquivo de saída
+        output_format: Formato ('csv', 'jsonl' ou 'parquet')
+        batch_size: Linhas por bloco
+
+    Returns:
+        Número de linhas gravadas
+    """
+    counter = {'rows': 0}
+
+    def counted():
+        for row in rows:
+            counter['rows'] += 1
+            yield row
+
+    output_dir = os.path.dirname(output_file)
+    if output_dir and not os.path.exists(output_dir):
+        os.makedirs(output_dir)
+
+    with open(output_file, 'wb') as f:
+        for chunk in iter_export_chunks(counted(), columns, output_format, batch_size):
+            f.write(chunk)
+
+    return counter['rows']
@@ -13,7 +13,12 @@ import logging
 import networkx as nx
 import matplotlib.pyplot as plt
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Union
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from typing import Dict, List, Any, Optional, Union, Callable, Iterator
+from modules.tweet_store import TweetStore
+from modules.client_pool import ClientPool, DEFAULT_CREDENTIAL
+from modules.social_scheduler import (CollectionScheduler, ScheduledJob, RateLimitExceeded, DEFAULT_QUOTAS,
+                                      TWEETS_PER_PAGE, collection_costs, rate_limit_reset)
 
 # Configuração de logging
 logging.basicConfig(
@@ -35,6 +40,17 @@ class SocialMediaOSINT:
         self.output_dir = output_dir
         self._setup_directories()
         self.results = {}
+        self.progress_batch_size = 20
+        self.tweet_store = TweetStore(os.path.join(self.output_dir, 'twitter', 'tweets.sqlite3'))
+        # Clientes autenticados criados uma única vez e compartilhados entre as buscas
+        self.client_pool = ClientPool(os.path.join(self.output_dir, 'sessions'))
+        
+        # Tempo limite de cada rede na busca simultânea (search_all), em segundos
+        self.network_timeouts = {'twitter': 60.0, 'instagram': 60.0, 'facebook': 60.0}
+        # Coletores de várias buscas simultâneas compartilham o mesmo pool de threads
+        self.collector_executor = ThreadPoolExecutor(max_workers=9, thread_name_prefix='osint-social')
+        # Fila de coletas iniciadas conforme a cota de cada conjunto de credenciais nas APIs
+        self.scheduler = CollectionScheduler(credentials=self.client_pool.credential_names)
         logger.info("Módulo de busca em redes sociais inicializado")
     
     def _setup_directories(self):
@@ -50,128 +66,186 @@ class SocialMediaOSINT:
                 os.makedirs(network_dir)
                 logger.info(f"Diretório para {network} criado: {network_dir}")
     
-    def search_twitter(self, username: str, max_tweets: int = 100) -> Dict[str, Any]:
+    def iter_tweets(self, username: str, max_tweets: int = 100, full_refresh: bool = False,
+                    credential: str = DEFAULT_CREDENTIAL, deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
         """
-        Busca informações de um perfil do Twitter e seus tweets recentes.
+        Coleta um perfil do Twitter e seus tweets recentes, produzindo cada registro assim que chega.
+        
+        A coleta é incremental: apenas os tweets mais novos que o último armazenado em self.tweet_store
+        são pedidos à API (since_id). Os tweets novos são armazenados em lotes durante a coleta, mas o
+        checkpoint só avança ao final: uma coleta interrompida é refeita a partir do checkpoint anterior.
+        Se há mais de max_tweets tweets novos, os que ficaram entre o checkpoint anterior e o mais antigo
+        obtido são registrados como lacuna e pedidos nas coletas seguintes (max_id), depois dos mais novos;
+        cada lacuna é pedida separadamente, da mais recente à mais antiga.
         
         Args:
             username: Nome de usuário do Twitter (sem @)
             max_tweets: Número máximo de tweets a serem coletados
-            
-        Returns:
-            Dicionário com informações do perfil e tweets
+            full_refresh: Se True, descarta os tweets armazenados do usuário e refaz a coleta completa
+            credential: Conjunto de credenciais da API usado na coleta
+            deadline: Prazo da coleta (time.monotonic()), que limita a espera por um cliente do pool (opcional)
+        
+        Yields:
+            Registros normalizados: o perfil ('profile'), cada tweet novo ('post') e o resumo final ('summary')
         """
-        try:
-            import tweepy
-            
-            logger.info(f"Iniciando busca no Twitter para usuário: {username}")
-            
-            # Verificar se as credenciais da API estão disponíveis
-            # Nota: Em uma implementação real, estas credenciais seriam armazenadas de forma segura
-            # e não diretamente no código
-            api_key = os.environ.get("TWITTER_API_KEY")
-            api_secret = os.environ.get("TWITTER_API_SECRET")
-            access_token = os.environ.get("TWITTER_ACCESS_TOKEN")
-            access_secret = os.environ.get("TWITTER_ACCESS_SECRET")
-            
-            if not all([api_key, api_secret, access_token, access_secret]):
-                logger.warning("Credenciais da API do Twitter não encontradas. Usando modo simulado.")
-                # Modo simulado para demonstração
-                profile_data = self._simulate_twitter_profile(username)
-                self._save_results('twitter', username, profile_data)
-                return profile_data
-            
-            # Configuração da API do Twitter
-            auth = tweepy.OAuth1UserHandler(api_key, api_secret, access_token, access_secret)
-            api = tweepy.API(auth)
-            
+        import tweepy
+        
+        logger.info(f"Iniciando busca no Twitter para usuário: {username}")
+        
+        # Verificar se as credenciais da API estão disponíveis
+        if not self.client_pool.has_credentials('twitter', credential):
+            logger.warning("Credenciais da API do Twitter não encontradas. Usando modo simulado.")
+            # Modo simulado para demonstração
+            profile_data = self._simulate_twitter_profile(username)
+            yield self._profile_record('twitter', username, profile_data['profile'], simulated=True)
+            for tweet_data in profile_data['tweets']:
+                yield self._post_record('twitter', username, tweet_data)
+            yield self._summary_record('twitter', username, len(profile_data['tweets']), simulated=True)
+            return
+        
+        # Cliente da API emprestado do pool durante toda a coleta (criado uma única vez e reaproveitado)
+        with self.client_pool.acquire('twitter', credential, timeout=self._remaining(deadline)) as api:
             # Obter informações do perfil
             user = api.get_user(screen_name=username)
             
-            # Obter tweets recentes
-            tweets = []
-            for tweet in tweepy.Cursor(api.user_timeline, screen_name=username, tweet_mode="extended").items(max_tweets):
-                tweets.append({
-                    'id': tweet.id,
-                    'created_at': tweet.created_at.isoformat(),
-                    'text': tweet.full_text,
-                    'retweet_count': tweet.retweet_count,
-                    'favorite_count': tweet.favorite_count,
-                    'hashtags': [h['text'] for h in tweet.entities.get('hashtags', [])],
-                    'mentions': [m['screen_name'] for m in tweet.entities.get('user_mentions', [])]
-                })
-            
-            # Compilar resultados
-            results = {
-                'profile': {
-                    'id': user.id,
-                    'name': user.name,
-                    'screen_name': user.screen_name,
-                    'description': user.description,
-                    'location': user.location,
-                    'url': user.url,
-                    'followers_count': user.followers_count,
-                    'friends_count': user.friends_count,
-                    'listed_count': user.listed_count,
-                    'created_at': user.created_at.isoformat(),
-                    'verified': user.verified,
-                    'statuses_count': user.statuses_count,
-                    'profile_image_url': user.profile_image_url_https
-                },
-                'tweets': tweets,
-                'collection_date': datetime.now().isoformat()
+            profile = {
+                'id': user.id,
+                'name': user.name,
+                'screen_name': user.screen_name,
+                'description': user.description,
+                'location': user.location,
+                'url': user.url,
+                'followers_count': user.followers_count,
+                'friends_count': user.friends_count,
+                'listed_count': user.listed_count,
+                'created_at': user.created_at.isoformat(),
+                'verified': user.verified,
+                'statuses_count': user.statuses_count,
+                'profile_image_url': user.profile_image_url_https
             }
             
-            # Salvar resultados
-            self._save_results('twitter', username, results)
-            
-            logger.info(f"Busca no Twitter concluída para {username}. Coletados {len(tweets)} tweets.")
-            return results
-            
-        except ImportError:
-            logger.error("Biblioteca Tweepy não está instalada.")
-            return {"error": "Biblioteca Tweepy não está instalada."}
-        except Exception as e:
-            logger.error(f"Erro ao buscar informações do Twitter: {str(e)}")
-            return {"error": str(e)}
+            yield self._profile_record('twitter', username, profile)
+            
+            if full_refresh:
+                self.tweet_store.reset(username)
+            
+            # Pedir apenas os tweets posteriores ao último armazenado e, com a cota restante, os da lacuna
+            since_id = self.tweet_store.get_since_id(username)
+            windows = [(since_id, None)] + self.tweet_store.get_gaps(username)
+            
+            # Obter tweets recentes, armazenando-os em lotes
+            collected = 0
+            new_tweets = 0
+            newest_id = None
+            next_gaps = []
+            batch = []
+            for window_since_id, window_max_id in windows:
+                limit = max_tweets - collected
+                window_count = 0
+                oldest_id = None
+                
+                if limit > 0:
+                    # Páginas com o máximo de tweets permitido: menos requisições da cota por coleta
+                    timeline_params = {'screen_name': username, 'tweet_mode': "extended",
+                                       'count': max(1, min(limit, TWEETS_PER_PAGE))}
+                    if window_since_id:
+                        timeline_params['since_id'] = window_since_id
+                    if window_max_id:
+                        timeline_params['max_id'] = window_max_id
+                    
+                    for tweet in tweepy.Cursor(api.user_timeline, **timeline_params).items(limit):
+                        tweet_data = {
+                            'id': tweet.id,
+                            'created_at': tweet.created_at.isoformat(),
+                            'text': tweet.full_text,
+                            'retweet_count': tweet.retweet_count,
+                            'favorite_count': tweet.favorite_count,
+                            'hashtags': [h['text'] for h in tweet.entities.get('hashtags', [])],
+                            'mentions': [m['screen_name'] for m in tweet.entities.get('user_mentions', [])]
+                        }
+                        collected += 1
+                        window_count += 1
+                        newest_id = max(newest_id or 0, tweet.id)
+                        oldest_id = min(oldest_id or tweet.id, tweet.id)
+                        batch.append(tweet_data)
+                        
+                        if len(batch) >= self.progress_batch_size:
+                            new_tweets += self.tweet_store.append(username, batch, checkpoint=False)
+                            batch = []
+                        
+                        yield self._post_record('twitter', username, tweet_data)
+                
+                # Janela não esgotada dentro do limite: os tweets entre window_since_id e o mais antigo obtido
+                # ficam como lacuna própria, sem unir lacunas separadas por tweets já armazenados
+                # (na primeira coleta, sem checkpoint, não há o que completar)
+                if window_since_id and window_count >= limit:
+                    gap_max_id = oldest_id - 1 if oldest_id else window_max_id
+                    if gap_max_id and gap_max_id > window_since_id:
+                        next_gaps.append((window_since_id, gap_max_id))
+        
+        new_tweets += self.tweet_store.append(username, batch, checkpoint=False)
+        self.tweet_store.set_checkpoint(username, newest_id, profile, gaps=next_gaps)
+        
+        logger.info(f"Busca no Twitter concluída para {username}. Coletados {collected} tweets novos "
+                    f"(desde o id {since_id}).")
+        yield self._summary_record('twitter', username, collected, new_tweets=new_tweets,
+                                   stored_tweets=self.tweet_store.count(username), since_id=since_id,
+                                   full_refresh=full_refresh)
     
-    def search_instagram(self, username: str, max_posts: int = 20) -> Dict[str, Any]:
+    def iter_posts(self, network: str, username: str, max_posts: int = 20,
+                   credential: str = DEFAULT_CREDENTIAL, deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
         """
-        Busca informações de um perfil do Instagram e seus posts recentes.
+        Coleta um perfil e seus posts recentes em uma rede, produzindo cada registro assim que chega.
+        
+        Os registros têm o mesmo formato em todas as redes: 'network', 'username', 'type' e 'data'
+        (o registro original da rede); os posts trazem também 'id', 'date', 'text' e 'url'.
+        
+        Args:
+            network: Nome da rede social ('twitter', 'instagram' ou 'facebook')
+            username: Nome de usuário na rede
+            max_posts: Número máximo de tweets ou posts a serem coletados
+            credential: Conjunto de credenciais usado na coleta (Twitter e Instagram)
+            deadline: Prazo da coleta (time.monotonic()), que limita a espera por um cliente do pool (opcional)
+        
+        Returns:
+            Iterador de registros: o perfil ('profile'), cada post ('post') e o resumo final ('summary')
+        """
+        # Validado na chamada, e não apenas quando o primeiro registro for pedido
+        if network == 'twitter':
+            return self.iter_tweets(username, max_posts, credential=credential, deadline=deadline)
+        if network == 'instagram':
+            return self._iter_instagram_posts(username, max_posts, credential, deadline)
+        if network == 'facebook':
+            return self._iter_facebook_posts(username, max_posts)
+        
+        raise ValueError(f"Rede social não suportada: {network}")
+    
+    def _iter_instagram_posts(self, username: str, max_posts: int, credential: str,
+                              deadline: Optional[float] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Coleta um perfil do Instagram e seus posts recentes (ver iter_posts).
         
         Args:
             username: Nome de usuário do Instagram
             max_posts: Número máximo de posts a serem coletados
-            
-        Returns:
-            Dicionário com informações do perfil e posts
+            credential: Conjunto de credenciais usado na coleta
+            deadline: Prazo da coleta (time.monotonic()), que limita a espera por um cliente do pool (opcional)
+        
+        Yields:
+            Registros normalizados do perfil, dos posts e do resumo final
         """
-        try:
-            import instaloader
-            
-            logger.info(f"Iniciando busca no Instagram para usuário: {username}")
-            
-            # Inicializar o Instaloader
-            L = instaloader.Instaloader()
-            
-            # Tentar login se as credenciais estiverem disponíveis
-            insta_username = os.environ.get("INSTAGRAM_USERNAME")
-            insta_password = os.environ.get("INSTAGRAM_PASSWORD")
-            
-            if insta_username and insta_password:
-                try:
-                    L.login(insta_username, insta_password)
-                    logger.info("Login no Instagram realizado com sucesso")
-                except Exception as e:
-                    logger.warning(f"Falha no login do Instagram: {str(e)}. Continuando sem login.")
-            else:
-                logger.warning("Credenciais do Instagram não encontradas. Continuando sem login.")
-            
+        import instaloader
+        
+        logger.info(f"Iniciando busca no Instagram para usuário: {username}")
+        
+        count = 0
+        # Instaloader emprestado do pool: o login (ou a sessão salva) é reaproveitado entre as buscas
+        with self.client_pool.acquire('instagram', credential, timeout=self._remaining(deadline)) as L:
             # Obter perfil
             profile = instaloader.Profile.from_username(L.context, username)
             
             # Coletar informações do perfil
-            profile_data = {
+            yield self._profile_record('instagram', username, {
                 'username': profile.username,
                 'user_id': profile.userid,
                 'full_name': profile.full_name,
@@ -183,17 +257,15 @@ class SocialMediaOSINT:
                 'media_count': profile.mediacount,
                 'profile_pic_url': profile.profile_pic_url,
                 'external_url': profile.external_url
-            }
+            })
             
             # Coletar posts recentes
-            posts = []
-            count = 0
-            
             for post in profile.get_posts():
                 if count >= max_posts:
                     break
                 
-                post_data = {
+                count += 1
+                yield self._post_record('instagram', username, {
                     'id': post.shortcode,
                     'date': post.date_local.isoformat(),
                     'caption': post.caption if post.caption else "",
@@ -204,22 +276,152 @@ class SocialMediaOSINT:
                     'location': post.location.name if post.location else None,
                     'hashtags': list(post.caption_hashtags),
                     'mentioned_users': list(post.caption_mentions)
+                })
+        
+        logger.info(f"Busca no Instagram concluída para {username}. Coletados {count} posts.")
+        yield self._summary_record('instagram', username, count)
+    
+    def _iter_facebook_posts(self, username: str, max_posts: int) -> Iterator[Dict[str, Any]]:
+        """
+        Coleta um perfil do Facebook e seus posts recentes (ver iter_posts).
+        
+        Args:
+            username: Nome de usuário ou ID do Facebook
+            max_posts: Número máximo de posts a serem coletados
+        
+        Yields:
+            Registros normalizados do perfil, dos posts e do resumo final
+        """
+        from facebook_scraper import get_profile, get_posts
+        
+        logger.info(f"Iniciando busca no Facebook para usuário: {username}")
+        
+        # Obter informações do perfil
+        try:
+            profile_data = get_profile(username)
+        except Exception as e:
+            logger.error(f"Erro ao obter perfil do Facebook: {str(e)}")
+            # Modo simulado para demonstração
+            profile_data = self._simulate_facebook_profile(username)
+        
+        yield self._profile_record('facebook', username, profile_data)
+        
+        # Obter posts recentes
+        count = 0
+        try:
+            for post in get_posts(username, pages=max_posts//10 + 1):
+                if count >= max_posts:
+                    break
+                
+                post_data = {
+                    'post_id': post.get('post_id'),
+                    'text': post.get('text'),
+                    'time': post.get('time').isoformat() if post.get('time') else None,
+                    'likes': post.get('likes'),
+                    'comments': post.get('comments'),
+                    'shares': post.get('shares'),
+                    'post_url': post.get('post_url'),
+                    'is_video': post.get('is_video', False),
+                    'image_url': post.get('image'),
+                    'video_url': post.get('video'),
+                    'video_thumbnail_url': post.get('video_thumbnail')
                 }
                 
-                posts.append(post_data)
                 count += 1
+                yield self._post_record('facebook', username, post_data)
+        except Exception as e:
+            logger.error(f"Erro ao obter posts do Facebook: {str(e)}")
+            # Modo simulado para demonstração, apenas se nenhum post real foi produzido
+            if not count:
+                for post_data in self._simulate_facebook_posts(username, max_posts):
+                    count += 1
+                    yield self._post_record('facebook', username, post_data)
+        
+        logger.info(f"Busca no Facebook concluída para {username}. Coletados {count} posts.")
+        yield self._summary_record('facebook', username, count)
+    
+    def search_twitter(self, username: str, max_tweets: int = 100,
+                       progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                       full_refresh: bool = False, credential: str = DEFAULT_CREDENTIAL,
+                       deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Busca informações de um perfil do Twitter e seus tweets recentes.
+        
+        Reúne os registros de iter_tweets em um único resultado, com a visão combinada dos tweets
+        novos e dos já armazenados.
+        
+        Args:
+            username: Nome de usuário do Twitter (sem @)
+            max_tweets: Número máximo de tweets a serem coletados e devolvidos
+            progress_callback: Função chamada com o perfil e com cada lote de tweets novos (opcional)
+            full_refresh: Se True, descarta os tweets armazenados do usuário e refaz a coleta completa
+            credential: Conjunto de credenciais da API usado na coleta
+            deadline: Prazo da coleta (time.monotonic()); ao vencer, a coleta é interrompida (opcional)
+        
+        Returns:
+            Dicionário com informações do perfil e tweets ('rate_limited_until' se a API recusou por limite de taxa)
+        """
+        try:
+            profile, tweets, summary = self._collect_records(
+                self.iter_tweets(username, max_tweets, full_refresh, credential, deadline), 'tweets',
+                progress_callback, deadline)
+            
+            if summary.get('simulated'):
+                results = {'profile': profile, 'tweets': tweets, 'collection_date': summary['collection_date'],
+                           'simulated': True}
+            else:
+                # Compilar resultados: tweets novos combinados com os já armazenados
+                results = {
+                    'profile': profile,
+                    'tweets': self.tweet_store.latest(username, max_tweets),
+                    'new_tweets': summary['new_tweets'],
+                    'stored_tweets': summary['stored_tweets'],
+                    'since_id': summary['since_id'],
+                    'full_refresh': full_refresh,
+                    'collection_date': summary['collection_date']
+                }
+            
+            # Salvar resultados
+            self._save_results('twitter', username, results)
+            return results
+            
+        except ImportError:
+            logger.error("Biblioteca Tweepy não está instalada.")
+            return {"error": "Biblioteca Tweepy não está instalada."}
+        except Exception as e:
+            logger.error(f"Erro ao buscar informações do Twitter: {str(e)}")
+            reset_at = rate_limit_reset(e, DEFAULT_QUOTAS['twitter']['statuses/user_timeline'][1])
+            if reset_at:
+                return {"error": str(e), "rate_limited_until": reset_at}
+            return {"error": str(e)}
+    
+    def search_instagram(self, username: str, max_posts: int = 20, credential: str = DEFAULT_CREDENTIAL,
+                         deadline: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Busca informações de um perfil do Instagram e seus posts recentes.
+        
+        Args:
+            username: Nome de usuário do Instagram
+            max_posts: Número máximo de posts a serem coletados
+            credential: Conjunto de credenciais usado na coleta
+            deadline: Prazo da coleta (time.monotonic()); ao vencer, a coleta é interrompida (opcional)
+        
+        Returns:
+            Dicionário com informações do perfil e posts ('rate_limited_until' se recusada por limite de taxa)
+        """
+        try:
+            profile, posts, summary = self._collect_records(
+                self._iter_instagram_posts(username, max_posts, credential, deadline), 'posts', deadline=deadline)
             
             # Compilar resultados
             results = {
-                'profile': profile_data,
+                'profile': profile,
                 'posts': posts,
-                'collection_date': datetime.now().isoformat()
+                'collection_date': summary['collection_date']
             }
             
             # Salvar resultados
             self._save_results('instagram', username, results)
-            
-            logger.info(f"Busca no Instagram concluída para {username}. Coletados {len(posts)} posts.")
             return results
             
         except ImportError:
@@ -227,70 +429,36 @@ class SocialMediaOSINT:
             return {"error": "Biblioteca Instaloader não está instalada."}
         except Exception as e:
             logger.error(f"Erro ao buscar informações do Instagram: {str(e)}")
+            reset_at = rate_limit_reset(e, DEFAULT_QUOTAS['instagram']['posts'][1])
+            if reset_at:
+                return {"error": str(e), "rate_limited_until": reset_at}
             return {"error": str(e)}
     
-    def search_facebook(self, username: str, max_posts: int = 20) -> Dict[str, Any]:
+    def search_facebook(self, username: str, max_posts: int = 20, deadline: Optional[float] = None) -> Dict[str, Any]:
         """
         Busca informações de um perfil do Facebook e seus posts recentes.
         
         Args:
             username: Nome de usuário ou ID do Facebook
             max_posts: Número máximo de posts a serem coletados
-            
+            deadline: Prazo da coleta (time.monotonic()); ao vencer, a coleta é interrompida (opcional)
+        
         Returns:
             Dicionário com informações do perfil e posts
         """
         try:
-            from facebook_scraper import get_profile, get_posts
-            
-            logger.info(f"Iniciando busca no Facebook para usuário: {username}")
-            
-            # Obter informações do perfil
-            try:
-                profile_data = get_profile(username)
-            except Exception as e:
-                logger.error(f"Erro ao obter perfil do Facebook: {str(e)}")
-                # Modo simulado para demonstração
-                profile_data = self._simulate_facebook_profile(username)
-            
-            # Obter posts recentes
-            posts = []
-            try:
-                for i, post in enumerate(get_posts(username, pages=max_posts//10 + 1)):
-                    if i >= max_posts:
-                        break
-                    
-                    post_data = {
-                        'post_id': post.get('post_id'),
-                        'text': post.get('text'),
-                        'time': post.get('time').isoformat() if post.get('time') else None,
-                        'likes': post.get('likes'),
-                        'comments': post.get('comments'),
-                        'shares': post.get('shares'),
-                        'post_url': post.get('post_url'),
-                        'is_video': post.get('is_video', False),
-                        'image_url': post.get('image'),
-                        'video_url': post.get('video'),
-                        'video_thumbnail_url': post.get('video_thumbnail')
-                    }
-                    
-                    posts.append(post_data)
-            except Exception as e:
-                logger.error(f"Erro ao obter posts do Facebook: {str(e)}")
-                # Modo simulado para demonstração
-                posts = self._simulate_facebook_posts(username, max_posts)
+            profile, posts, summary = self._collect_records(self._iter_facebook_posts(username, max_posts), 'posts',
+                                                            deadline=deadline)
             
             # Compilar resultados
             results = {
-                'profile': profile_data,
+                'profile': profile,
                 'posts': posts,
-                'collection_date': datetime.now().isoformat()
+                'collection_date': summary['collection_date']
             }
             
             # Salvar resultados
             self._save_results('facebook', username, results)
-            
-            logger.info(f"Busca no Facebook concluída para {username}. Coletados {len(posts)} posts.")
             return results
             
         except ImportError:
@@ -300,6 +468,220 @@ class SocialMediaOSINT:
             logger.error(f"Erro ao buscar informações do Facebook: {str(e)}")
             return {"error": str(e)}
     
+    def _collect_records(self, records: Iterator[Dict[str, Any]], event: str,
+                         progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+                         deadline: Optional[float] = None):
+        """
+        Reúne os registros de uma coleta, notificando o progresso em lotes.
+        
+        Args:
+            records: Registros produzidos por iter_tweets ou iter_posts
+            event: Nome do evento de progresso dos posts ('tweets' ou 'posts')
+            progress_callback: Função chamada com o perfil e com cada lote de posts (opcional)
+            deadline: Prazo da coleta (time.monotonic()), verificado a cada registro (opcional)
+        
+        Returns:
+            Tupla (perfil, lista de posts, resumo)
+        
+        Raises:
+            TimeoutError: Se o prazo vence antes do fim da coleta
+        """
+        profile = None
+        posts = []
+        summary = {}
+        batch = []
+        
+        for record in records:
+            if deadline is not None and time.monotonic() >= deadline:
+                # Encerrar o gerador devolve ao pool o cliente emprestado durante a coleta
+                records.close()
+                raise TimeoutError("Tempo limite excedido")
+            
+            if record['type'] == 'profile':
+                profile = record['data']
+                if progress_callback:
+                    progress_callback('profile', profile)
+            elif record['type'] == 'post':
+                posts.append(record['data'])
+                batch.append(record['data'])
+                if progress_callback and len(batch) >= self.progress_batch_size:
+                    progress_callback(event, {event: batch, 'collected': len(posts)})
+                    batch = []
+            else:
+                summary = record
+        
+        if progress_callback and batch:
+            progress_callback(event, {event: batch, 'collected': len(posts)})
+        
+        return profile, posts, summary
+    
+    @staticmethod
+    def _remaining(deadline: Optional[float]) -> Optional[float]:
+        """Tempo restante até um prazo (time.monotonic()), ou None se não há prazo."""
+        if deadline is None:
+            return None
+        return max(0.0, deadline - time.monotonic())
+    
+    @staticmethod
+    def _profile_record(network: str, username: str, data: Dict[str, Any], simulated: bool = False) -> Dict[str, Any]:
+        """Registro normalizado do perfil coletado."""
+        record = {'network': network, 'username': username, 'type': 'profile', 'data': data}
+        if simulated:
+            record['simulated'] = True
+        return record
+    
+    @staticmethod
+    def _post_record(network: str, username: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Registro normalizado de um tweet ou post, com os campos comuns às redes."""
+        post_id = data.get('id', data.get('post_id'))
+        if network == 'twitter':
+            url = f"https://twitter.com/{username}/status/{post_id}"
+        else:
+            url = data.get('url', data.get('post_url'))
+        
+        return {
+            'network': network,
+            'username': username,
+            'type': 'post',
+            'id': post_id,
+            'date': data.get('created_at', data.get('date', data.get('time'))),
+            'text': data.get('text', data.get('caption')),
+            'url': url,
+            'data': data
+        }
+    
+    @staticmethod
+    def _summary_record(network: str, username: str, count: int, **details) -> Dict[str, Any]:
+        """Registro normalizado do resumo, produzido ao final da coleta."""
+        return {'network': network, 'username': username, 'type': 'summary', 'count': count,
+                'collection_date': datetime.now().isoformat(), **details}
+    
+    def search_all(self, handles: Union[str, Dict[str, str]], max_posts: Optional[int] = None,
+                   timeouts: Optional[Dict[str, float]] = None,
+                   progress_callback: Optional[Callable[[str, Dict[str, Any]], None]] = None) -> Dict[str, Any]:
+        """
+        Busca um mesmo alvo no Twitter, Instagram e Facebook simultaneamente.
+        
+        Cada rede é coletada em uma thread própria e tem seu próprio tempo limite; o resultado
+        combinado é devolvido assim que a rede mais lenta termina ou expira. Redes expiradas
+        recebem um erro no resultado; a coleta recebe o mesmo prazo e se interrompe sozinha,
+        liberando a thread e o cliente emprestado do pool.
+        
+        Args:
+            handles: Nome de usuário usado em todas as redes, ou dicionário rede -> nome de usuário
+            max_posts: Número máximo de tweets/posts por rede (padrão: o padrão de cada rede)
+            timeouts: Tempo limite por rede em segundos (padrão: self.network_timeouts)
+            progress_callback: Função chamada quando cada rede termina ou expira (opcional)
+            
+        Returns:
+            Dicionário com o resultado de cada rede, a latência de cada uma e as redes expiradas
+        """
+        collectors = {
+            'twitter': self.search_twitter,
+            'instagram': self.search_instagram,
+            'facebook': self.search_facebook
+        }
+        
+        if isinstance(handles, str):
+            handles = {network: handles for network in collectors}
+        
+        handles = {network: username.strip().lstrip('@') for network, username in handles.items()
+                   if network in collectors and username and username.strip()}
+        
+        if not handles:
+            return {"error": "Nenhum nome de usuário fornecido para as redes suportadas"}
+        
+        timeouts = {**self.network_timeouts, **(timeouts or {})}
+        logger.info(f"Iniciando busca simultânea em {', '.join(handles)}")
+        
+        start = time.monotonic()
+        pending = {}
+        deadlines = {network: start + timeouts[network] for network in handles}
+        for network, username in handles.items():
+            args = (username, max_posts) if max_posts else (username,)
+            future = self.collector_executor.submit(collectors[network], *args, deadline=deadlines[network])
+            pending[future] = network
+        
+        results: Dict[str, Any] = {}
+        latency: Dict[str, float] = {}
+        timed_out: List[str] = []
+        
+        while pending:
+            next_deadline = min(deadlines[network] for network in pending.values())
+            done, _ = wait(pending, timeout=max(0.0, next_deadline - time.monotonic()), return_when=FIRST_COMPLETED)
+            
+            for future in done:
+                network = pending.pop(future)
+                latency[network] = round(time.monotonic() - start, 3)
+                try:
+                    results[network] = future.result()
+                except Exception as e:
+                    logger.error(f"Erro na coleta do {network}: {str(e)}")
+                    results[network] = {"error": str(e)}
+                
+                if progress_callback:
+                    progress_callback('network', {'network': network, 'latency': latency[network],
+                                                  'error': results[network].get('error')})
+            
+            # Redes cujo prazo venceu sem resultado
+            now = time.monotonic()
+            for future, network in list(pending.items()):
+                if deadlines[network] <= now:
+                    future.cancel()
+                    del pending[future]
+                    logger.warning(f"Coleta do {network} excedeu o tempo limite de {timeouts[network]}s")
+                    latency[network] = round(now - start, 3)
+                    results[network] = {"error": "Tempo limite excedido"}
+                    timed_out.append(network)
+                    
+                    if progress_callback:
+                        progress_callback('network', {'network': network, 'latency': latency[network],
+                                                      'error': results[network]['error']})
+        
+        elapsed = time.monotonic() - start
+        logger.info(f"Busca simultânea concluída em {elapsed:.2f}s: {latency}")
+        
+        return {
+            'handles': handles,
+            'results': results,
+            'latency': latency,
+            'timed_out': timed_out,
+            'elapsed_seconds': round(elapsed, 3),
+            'collection_date': datetime.now().isoformat()
+        }
+    
+    def schedule_collection(self, network: str, username: str, max_posts: Optional[int] = None) -> ScheduledJob:
+        """
+        Agenda a coleta de um perfil para quando houver cota na API da rede.
+        
+        A coleta usa o conjunto de credenciais com cota disponível mais cedo (ver
+        ClientPool.credential_names); se a API ainda assim recusá-la por limite de taxa, ela volta
+        à fila até a renovação da cota.
+        
+        Args:
+            network: Nome da rede social ('twitter' ou 'instagram')
+            username: Nome de usuário na rede
+            max_posts: Número máximo de tweets ou posts (padrão: o padrão da busca da rede)
+            
+        Returns:
+            Coleta agendada, com a previsão de início (eta)
+        """
+        collectors = {'twitter': (self.search_twitter, 100), 'instagram': (self.search_instagram, 20)}
+        if network not in collectors:
+            raise ValueError(f"Rede não suportada pelo agendador: {network}")
+        
+        search, default_max_posts = collectors[network]
+        max_posts = max_posts or default_max_posts
+        
+        def collect(credential: str) -> Dict[str, Any]:
+            result = search(username, max_posts, credential=credential)
+            if result.get('rate_limited_until'):
+                raise RateLimitExceeded(result['rate_limited_until'], message=result['error'])
+            return result
+        
+        return self.scheduler.submit(network, collect, costs=collection_costs(network, max_posts),
+                                     name=f"social_media.{network}:{username}")
+    
     def visualize_social_connections(self, data: Dict[str, Any], network_type: str, username: str) -> str:
         """
         Cria uma visualização das conexões sociais do usuário.
@@ -0,0 +1,545 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Agendamento de Coletas em Redes Sociais para Ferramenta OSINT
+Este módulo acompanha a cota restante de cada credencial em cada endpoint das APIs (janelas de limite
+de taxa), mantém uma fila de coletas e só as inicia quando há cota, distribuindo-as no tempo ou entre
+vários conjuntos de credenciais e informando a cada chamador a previsão de início (ETA).
+"""
+
+import math
+import time
+import heapq
+import logging
+import threading
+from collections import deque
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple, Callable
+from modules.jobs import Job, STATUS_QUEUED, STATUS_RUNNING, STATUS_FINISHED, STATUS_FAILED
+from modules.client_pool import DEFAULT_CREDENTIAL
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_social_scheduler')
+
+# Cota de cada endpoint por credencial: (requisições por janela, duração da janela em segundos)
+DEFAULT_QUOTAS = {
+    # API v1.1 do Twitter em contexto de usuário: janelas de 15 minutos
+    'twitter': {'users/show': (900, 900.0), 'statuses/user_timeline': (900, 900.0)},
+    # O Instagram não publica seus limites: valores conservadores por hora
+    'instagram': {'profile': (200, 3600.0), 'posts': (200, 3600.0)}
+}
+
+# Itens devolvidos por página de cada endpoint paginado
+TWEETS_PER_PAGE = 200
+INSTAGRAM_POSTS_PER_PAGE = 12
+
+# Exceções das bibliotecas que indicam limite de taxa atingido
+RATE_LIMIT_ERRORS = ('TooManyRequests', 'RateLimitError', 'TooManyRequestsException')
+
+
+class RateLimitExceeded(Exception):
+    """Sinaliza que a API recusou uma coleta por limite de taxa."""
+
+    def __init__(self, reset_at: float, endpoint: Optional[str] = None, message: str = ''):
+        """
+        Inicializa a exceção.
+
+        Args:
+            reset_at: Momento (epoch) em que a cota é renovada
+            endpoint: Endpoint cuja cota se esgotou (None para todos os endpoints da credencial)
+            message: Mensagem de erro da API
+        """
+        super().__init__(message or f"Limite de taxa atingido até {datetime.fromtimestamp(reset_at).isoformat()}")
+        self.reset_at = reset_at
+        self.endpoint = endpoint
+
+
+def collection_costs(network: str, max_posts: int) -> Dict[str, int]:
+    """
+    Estima as requisições de uma coleta em cada endpoint.
+
+    Args:
+        network: Nome da rede social ('twitter' ou 'instagram')
+        max_posts: Número máximo de tweets ou posts coletados
+
+    Returns:
+        Dicionário endpoint -> número de requisições
+    """
+    if network == 'twitter':
+        return {'users/show': 1, 'statuses/user_timeline': max(1, math.ceil(max_posts / TWEETS_PER_PAGE))}
+
+    if network == 'instagram':
+        return {'profile': 1, 'posts': max(1, math.ceil(max_posts / INSTAGRAM_POSTS_PER_PAGE))}
+
+    raise ValueError(f"Rede não suportada pelo agendador: {network}")
+
+
+def rate_limit_reset(error: Exception, default_wait: float) -> Optional[float]:
+    """
+    Identifica um erro de limite de taxa e o momento em que a cota é renovada.
+
+    Args:
+        error: Exceção lançada pela biblioteca da rede
+        default_wait: Espera, em segundos, se a resposta não informar a renovação
+
+    Returns:
+        Momento (epoch) da renovação da cota ou None se o erro não é de limite de taxa
+    """
+    response = getattr(error, 'response', None)
+    status_code = getattr(response, 'status_code', None)
+    if type(error).__name__ not in RATE_LIMIT_ERRORS and status_code != 429:
+        return None
+
+    headers = getattr(response, 'headers', None) or {}
+    if headers.get('x-rate-limit-reset'):
+        return float(headers['x-rate-limit-reset'])
+    if headers.get('Retry-After', '').isdigit():
+        return time.time() + int(headers['Retry-After'])
+
+    return time.time() + default_wait
+
+
+class QuotaTracker:
+    """Cota restante de cada credencial em cada endpoint de uma rede, por janela de tempo."""
+
+    def __init__(self, quotas: Dict[str, Tuple[int, float]]):
+        """
+        Inicializa o acompanhamento das cotas.
+
+        Args:
+            quotas: Dicionário endpoint -> (requisições por janela, duração da janela em segundos)
+        """
+        self.quotas = quotas
+        # (credencial, endpoint) -> [requisições restantes, fim da janela (epoch)]
+        self._windows: Dict[Tuple[str, str], List[float]] = {}
+
+    def copy(self) -> 'QuotaTracker':
+        """Cópia independente, usada para simular a fila sem alterar as cotas reais."""
+        tracker = QuotaTracker(self.quotas)
+        tracker._windows = {key: list(window) for key, window in self._windows.items()}
+        return tracker
+
+    def _window(self, credential: str, endpoint: str, now: float) -> List[float]:
+        """Obtém a janela atual, renovando a cota das janelas que já terminaram."""
+        limit, period = self.quotas[endpoint]
+        window = self._windows.get((credential, endpoint))
+
+        if window is None:
+            window = self._windows[(credential, endpoint)] = [limit, now + period]
+        elif now >= window[1]:
+            # Cota consumida além do limite (negativa) é descontada das janelas seguintes
+            periods = int((now - window[1]) // period) + 1
+            window[0] = min(limit, window[0] + limit * periods)
+            window[1] += period * periods
+
+        return window
+
+    def available_at(self, credential: str, costs: Dict[str, int], now: float) -> float:
+        """
+        Calcula quando uma credencial terá cota para uma coleta.
+
+        Args:
+            credential: Nome do conjunto de credenciais
+            costs: Requisições da coleta em cada endpoint
+            now: Momento atual (epoch)
+
+        Returns:
+            Momento (epoch) a partir do qual a coleta pode começar
+        """
+        start = now
+        for endpoint, cost in costs.items():
+            limit, period = self.quotas[endpoint]
+            remaining, reset_at = self._window(credential, endpoint, now)
+            # Na simulação da fila, a janela pode já ter avançado além do momento atual
+            start = max(start, reset_at - period)
+            # Uma coleta maior que a janela começa com a janela cheia e consome também as seguintes
+            needed = min(cost, limit)
+            if needed > remaining:
+                start = max(start, reset_at + period * (math.ceil((needed - remaining) / limit) - 1))
+
+        return start
+
+    def consume(self, credential: str, costs: Dict[str, int], now: float):
+        """
+        Desconta da cota as requisições de uma coleta.
+
+        Args:
+            credential: Nome do conjunto de credenciais
+            costs: Requisições da coleta em cada endpoint
+            now: Momento do início da coleta (epoch)
+        """
+        for endpoint, cost in costs.items():
+            self._window(credential, endpoint, now)[0] -= cost
+
+    def update(self, credential: str, endpoint: str, remaining: int, reset_at: float):
+        """
+        Corrige a cota com os valores informados pela API (ex: cabeçalhos x-rate-limit-*).
+
+        Args:
+            credential: Nome do conjunto de credenciais
+            endpoint: Endpoint da API
+            remaining: Requisições restantes na janela
+            reset_at: Fim da janela (epoch)
+        """
+        self._windows[(credential, endpoint)] = [remaining, reset_at]
+
+    def exhaust(self, credential: str, reset_at: float, endpoint: Optional[str] = None):
+        """
+        Zera a cota de uma credencial até a renovação, após a API recusar uma requisição.
+
+        Args:
+            credential: Nome do conjunto de credenciais
+            reset_at: Momento da renovação (epoch)
+            endpoint: Endpoint recusado (None para todos)
+        """
+        for name in ([endpoint] if endpoint in self.quotas else self.quotas):
+            self.update(credential, name, 0, reset_at)
+
+    def snapshot(self, now: float) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Obtém a cota de cada credencial já usada.
+
+        Args:
+            now: Momento atual (epoch)
+
+        Returns:
+            Dicionário credencial -> endpoint -> {limit, remaining, reset_at}
+        """
+        snapshot = {}
+        for credential, endpoint in list(self._windows):
+            remaining, reset_at = self._window(credential, endpoint, now)
+            snapshot.setdefault(credential, {})[endpoint] = {
+                'limit': self.quotas[endpoint][0],
+                'remaining': max(0, int(remaining)),
+                'reset_at': datetime.fromtimestamp(reset_at).isoformat()
+            }
+
+        return snapshot
+
+
+class ScheduledJob(Job):
+    """Coleta aguardando cota no agendador."""
+
+    def __init__(self, name: str, network: str, costs: Dict[str, int], func: Callable[..., Any],
+                 args: tuple, kwargs: Dict[str, Any]):
+        """
+        Inicializa uma coleta agendada.
+
+        Args:
+            name: Nome descritivo da coleta
+            network: Nome da rede social
+            costs: Requisições da coleta em cada endpoint
+            func: Função da coleta (recebe o argumento nomeado credential)
+            args: Argumentos posicionais da função
+            kwargs: Argumentos nomeados da função
+        """
+        super().__init__(name)
+        self.network = network
+        self.costs = costs
+        self.credential = None
+        self.eta = None
+        self.attempts = 0
+        self._call = (func, args, kwargs)
+        self._finished = threading.Event()
+
+    def to_dict(self, include_result: bool = False) -> Dict[str, Any]:
+        """
+        Converte a coleta em um dicionário serializável.
+
+        Args:
+            include_result: Se True, inclui o resultado da coleta
+
+        Returns:
+            Dicionário com o estado da coleta, a credencial e a previsão de início
+        """
+        data = super().to_dict(include_result)
+        data.update({
+            'network': self.network,
+            'requests': self.costs,
+            'credential': self.credential,
+            'attempts': self.attempts,
+            'eta': datetime.fromtimestamp(self.eta).isoformat() if self.eta else None,
+            'eta_seconds': round(max(0.0, self.eta - time.time()), 1) if self.eta and not self.started_at else 0.0
+        })
+        return data
+
+    def wait(self, timeout: Optional[float] = None) -> bool:
+        """
+        Aguarda o fim da coleta.
+
+        Args:
+            timeout: Tempo máximo de espera, em segundos
+
+        Returns:
+            True se a coleta terminou
+        """
+        return self._finished.wait(timeout)
+
+
+class CollectionScheduler:
+    """Fila de coletas iniciadas conforme a cota de cada credencial nas APIs das redes sociais."""
+
+    def __init__(self, quotas: Optional[Dict[str, Dict[str, Tuple[int, float]]]] = None,
+                 credentials: Optional[Callable[[str], List[str]]] = None, max_workers: int = 4,
+                 max_attempts: int = 3, default_duration: float = 5.0, max_finished_jobs: int = 500):
+        """
+        Inicializa o agendador.
+
+        Args:
+            quotas: Cotas por rede e endpoint (padrão: DEFAULT_QUOTAS)
+            credentials: Função que lista os conjuntos de credenciais de uma rede (padrão: apenas 'default')
+            max_workers: Número máximo de coletas simultâneas
+            max_attempts: Tentativas de uma coleta recusada por limite de taxa
+            default_duration: Duração estimada de uma coleta, em segundos, até haver medições
+            max_finished_jobs: Número máximo de coletas concluídas mantidas em memória
+        """
+        self.quotas = quotas or DEFAULT_QUOTAS
+        self.max_workers = max_workers
+        self.max_attempts = max_attempts
+        self.max_finished_jobs = max_finished_jobs
+        self._credentials = credentials or (lambda network: [DEFAULT_CREDENTIAL])
+        self._trackers = {network: QuotaTracker(endpoints) for network, endpoints in self.quotas.items()}
+        self._durations = {network: default_duration for network in self.quotas}
+        self._queue: List[ScheduledJob] = []
+        self._jobs: Dict[str, ScheduledJob] = {}
+        self._finished_order = deque()
+        self._running: Dict[str, ScheduledJob] = {}
+        self._condition = threading.Condition()
+        self._stopped = False
+        self._dispatcher = None
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='osint-schedule')
+
+    def submit(self, network: str, func: Callable[..., Any], *args, costs: Optional[Dict[str, int]] = None,
+               name: Optional[str] = None, **kwargs) -> ScheduledJob:
+        """
+        Coloca uma coleta na fila.
+
+        Args:
+            network: Nome da rede social
+            func: Função da coleta, chamada com o argumento nomeado credential escolhido pelo agendador
+            *args: Argumentos posicionais da função
+            costs: Requisições da coleta em cada endpoint (padrão: uma em cada endpoint da rede)
+            name: Nome descritivo da coleta
+            **kwargs: Argumentos nomeados da função
+
+        Returns:
+            Coleta agendada, com a previsão de início (eta)
+        """
+        if network not in self._trackers:
+            raise ValueError(f"Rede não suportada pelo agendador: {network}")
+
+        costs = costs or {endpoint: 1 for endpoint in self.quotas[network]}
+        job = ScheduledJob(name or f"social_media.{network}", network, costs, func, args, kwargs)
+
+        with self._condition:
+            if self._stopped:
+                raise RuntimeError("Agendador encerrado")
+
+            self._jobs[job.id] = job
+            self._queue.append(job)
+            self._plan(time.time())
+            self._condition.notify_all()
+
+            if self._dispatcher is None:
+                self._dispatcher = threading.Thread(target=self._dispatch_loop, name='osint-scheduler', daemon=True)
+                self._dispatcher.start()
+
+        logger.info(f"Coleta {job.id} ({job.name}) agendada; início previsto em {job.to_dict()['eta_seconds']}s")
+        return job
+
+    def get(self, job_id: str) -> Optional[ScheduledJob]:
+        """
+        Obtém uma coleta pelo seu identificador.
+
+        Args:
+            job_id: Identificador da coleta
+
+        Returns:
+            Coleta encontrada ou None
+        """
+        with self._condition:
+            return self._jobs.get(job_id)
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Obtém a fila, as coletas em andamento e a cota de cada credencial.
+
+        Returns:
+            Dicionário com as coletas na fila (em ordem de início previsto), em andamento e as cotas
+        """
+        with self._condition:
+            now = time.time()
+            self._plan(now)
+            queued = sorted(self._queue, key=lambda job: job.eta)
+            return {
+                'queued': [job.to_dict() for job in queued],
+                'running': [job.to_dict() for job in self._running.values()],
+                'quotas': {network: tracker.snapshot(now) for network, tracker in self._trackers.items()}
+            }
+
+    def update_quota(self, network: str, credential: str, endpoint: str, remaining: int, reset_at: float):
+        """
+        Corrige a cota de uma credencial com os valores informados pela API.
+
+        Args:
+            network: Nome da rede social
+            credential: Nome do conjunto de credenciais
+            endpoint: Endpoint da API
+            remaining: Requisições restantes na janela
+            reset_at: Fim da janela (epoch)
+        """
+        with self._condition:
+            self._trackers[network].update(credential, endpoint, remaining, reset_at)
+            self._plan(time.time())
+            self._condition.notify_all()
+
+    def shutdown(self, wait: bool = True):
+        """
+        Encerra o agendador; coletas ainda na fila não são iniciadas.
+
+        Args:
+            wait: Se True, aguarda a conclusão das coletas em andamento
+        """
+        with self._condition:
+            self._stopped = True
+            self._condition.notify_all()
+
+        self._executor.shutdown(wait=wait)
+
+    def _plan(self, now: float) -> List[Tuple[float, ScheduledJob, str]]:
+        """
+        Simula a fila sobre uma cópia das cotas e atualiza a previsão de início de cada coleta.
+
+        A cada passo, entre as coletas restantes, é escolhida a que pode começar mais cedo (com a
+        credencial de cota mais próxima e o primeiro worker livre); empates seguem a ordem de chegada.
+        Deve ser chamado com self._condition adquirido.
+
+        Args:
+            now: Momento atual (epoch)
+
+        Returns:
+            Lista de (início previsto, coleta, credencial), em ordem de início
+        """
+        trackers = {network: tracker.copy() for network, tracker in self._trackers.items()}
+        credentials = {network: self._credentials(network) or [DEFAULT_CREDENTIAL] for network in trackers}
+
+        # Momento em que cada worker fica livre (coletas em andamento pela duração média da rede)
+        workers = [max(now, job.started_at.timestamp() + self._durations[job.network])
+                   for job in self._running.values()]
+        workers += [now] * (self.max_workers - len(workers))
+        heapq.heapify(workers)
+
+        plan = []
+        pending = list(self._queue)
+        while pending:
+            best = None
+            seen = set()
+            for job in pending:
+                # Coletas iguais (mesma rede e mesmas requisições) começam na ordem de chegada
+                signature = (job.network, tuple(sorted(job.costs.items())))
+                if signature in seen:
+                    continue
+                seen.add(signature)
+                tracker = trackers[job.network]
+                for credential in credentials[job.network]:
+                    start = max(workers[0], tracker.available_at(credential, job.costs, now))
+                    if best is None or start < best[0]:
+                        best = (start, job, credential)
+
+            start, job, credential = best
+            trackers[job.network].consume(credential, job.costs, start)
+            heapq.heapreplace(workers, start + self._durations[job.network])
+            pending.remove(job)
+            job.eta = start
+            plan.append(best)
+
+        return plan
+
+    def _dispatch_loop(self):
+        """Inicia as coletas da fila assim que há cota e worker livre."""
+        with self._condition:
+            while not self._stopped:
+                if not self._queue or len(self._running) >= self.max_workers:
+                    self._condition.wait()
+                    continue
+
+                now = time.time()
+                start, job, credential = self._plan(now)[0]
+                if start > now:
+                    # Aguardar a renovação da cota (ou uma mudança na fila)
+                    self._condition.wait(timeout=start - now)
+                    continue
+
+                self._queue.remove(job)
+                self._trackers[job.network].consume(credential, job.costs, now)
+                job.credential = credential
+                job.status = STATUS_RUNNING
+                job.started_at = datetime.now()
+                self._running[job.id] = job
+                self._executor.submit(self._run, job)
+
+    def _run(self, job: ScheduledJob):
+        """
+        Executa uma coleta, devolvendo-a à fila se a API recusá-la por limite de taxa.
+
+        Args:
+            job: Coleta a ser executada
+        """
+        func, args, kwargs = job._call
+        requeued = False
+
+        try:
+            job.result = func(*args, credential=job.credential, **kwargs)
+
+            # Os módulos OSINT sinalizam falhas com a chave 'error' no resultado
+            if isinstance(job.result, dict) and 'error' in job.result:
+                job.error = job.result['error']
+                job.status = STATUS_FAILED
+            else:
+                job.status = STATUS_FINISHED
+        except RateLimitExceeded as e:
+            job.attempts += 1
+            logger.warning(f"Coleta {job.id} ({job.name}) recusada por limite de taxa "
+                           f"(credencial {job.credential}, tentativa {job.attempts}/{self.max_attempts})")
+            with self._condition:
+                self._trackers[job.network].exhaust(job.credential, e.reset_at, e.endpoint)
+                if job.attempts < self.max_attempts:
+                    job.status = STATUS_QUEUED
+                    job.started_at = None
+                    self._queue.insert(0, job)
+                    requeued = True
+            if requeued:
+                job.emit('rate_limited', {'credential': job.credential, 'reset_at': e.reset_at,
+                                          'attempts': job.attempts})
+            else:
+                job.error = str(e)
+                job.status = STATUS_FAILED
+        except Exception as e:
+            logger.error(f"Erro na execução da coleta {job.id} ({job.name}): {str(e)}")
+            job.error = str(e)
+            job.status = STATUS_FAILED
+        finally:
+            with self._condition:
+                self._running.pop(job.id, None)
+                if not requeued:
+                    elapsed = time.time() - job.started_at.timestamp()
+                    # Média móvel da duração das coletas de cada rede, usada nas previsões
+                    self._durations[job.network] = 0.8 * self._durations[job.network] + 0.2 * elapsed
+                    job.finished_at = datetime.now()
+                    self._finished_order.append(job.id)
+                    while len(self._finished_order) > self.max_finished_jobs:
+                        self._jobs.pop(self._finished_order.popleft(), None)
+                self._plan(time.time())
+                self._condition.notify_all()
+
+        if not requeued:
+            job.emit('done', {'status': job.status, 'error': job.error})
+            job.close_events()
+            job._finished.set()
+            logger.info(f"Coleta {job.id} ({job.name}) concluída com status: {job.status}")
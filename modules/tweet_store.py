@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+"""
+Módulo de Armazenamento de Tweets para Ferramenta OSINT
+Este módulo mantém, em SQLite, os tweets já coletados de cada usuário e o maior id visto (checkpoint),
+permitindo que coletas periódicas peçam ao Twitter apenas os tweets mais novos (since_id), além do
+intervalos de ids ainda não coletados quando uma coleta atinge o limite de tweets (lacunas).
+"""
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from typing import Dict, List, Any, Optional, Iterable, Tuple
+
+# Configuração de logging
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+logger = logging.getLogger('osint_tweet_store')
+
+
+class TweetStore:
+    """Armazenamento de tweets por usuário, com deduplicação por id e checkpoint da última coleta."""
+
+    def __init__(self, db_path: str):
+        """
+        Inicializa o armazenamento.
+
+        Args:
+            db_path: Caminho do arquivo SQLite
+        """
+        self.db_path = db_path
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(db_path)
+        if db_dir and not os.path.exists(db_dir):
+            os.makedirs(db_dir)
+
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS tweets ("
+            "username TEXT NOT NULL, id INTEGER NOT NULL, data TEXT NOT NULL, PRIMARY KEY (username, id))"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS checkpoints ("
+            "username TEXT PRIMARY KEY, since_id INTEGER, profile TEXT, updated_at REAL NOT NULL)"
+        )
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS gaps ("
+            "username TEXT NOT NULL, since_id INTEGER NOT NULL, max_id INTEGER NOT NULL, "
+            "PRIMARY KEY (username, since_id))"
+        )
+        self._conn.commit()
+
+    @staticmethod
+    def _key(username: str) -> str:
+        """Nomes de usuário do Twitter não diferenciam maiúsculas de minúsculas."""
+        return username.strip().lstrip('@').lower()
+
+    def get_since_id(self, username: str) -> Optional[int]:
+        """
+        Obtém o maior id de tweet já coletado de um usuário.
+
+        Args:
+            username: Nome de usuário do Twitter
+
+        Returns:
+            Id do tweet mais recente armazenado ou None se o usuário nunca foi coletado
+        """
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT since_id FROM checkpoints WHERE username = ?", (self._key(username),)
+            ).fetchone()
+
+        return row[0] if row else None
+
+    def get_gaps(self, username: str) -> List[Tuple[int, int]]:
+        """
+        Obtém os intervalos de tweets de um usuário que ficaram sem coletar.
+
+        Uma coleta que atinge o limite de tweets antes de chegar ao checkpoint anterior deixa
+        uma lacuna entre ele e o tweet mais antigo obtido; as coletas seguintes a preenchem.
+        Cada lacuna é guardada separadamente, sem cobrir os tweets já armazenados entre elas.
+
+        Args:
+            username: Nome de usuário do Twitter
+
+        Returns:
+            Lista de tuplas (since_id, max_id) com os ids ainda não coletados (since_id < id <= max_id),
+            da lacuna mais recente à mais antiga
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT since_id, max_id FROM gaps WHERE username = ? ORDER BY since_id DESC", (self._key(username),)
+            ).fetchall()
+
+        return [(row[0], row[1]) for row in rows]
+
+    def append(self, username: str, tweets: Iterable[Dict[str, Any]], profile: Optional[Dict[str, Any]] = None,
+               checkpoint: bool = True) -> int:
+        """
+        Acrescenta tweets de um usuário, ignorando os já armazenados, e avança o checkpoint.
+
+        Args:
+            username: Nome de usuário do Twitter
+            tweets: Tweets coletados (com o campo 'id' numérico)
+            profile: Perfil mais recente do usuário (opcional)
+            checkpoint: Se False, apenas armazena os tweets (coletas em andamento, ver set_checkpoint)
+
+        Returns:
+            Número de tweets novos armazenados
+        """
+        key = self._key(username)
+        rows = [(key, int(tweet['id']), json.dumps(tweet, ensure_ascii=False, default=str)) for tweet in tweets]
+
+        with self._lock:
+            before = self._conn.total_changes
+            self._conn.executemany("INSERT OR IGNORE INTO tweets (username, id, data) VALUES (?, ?, ?)", rows)
+            added = self._conn.total_changes - before
+
+            if checkpoint:
+                self._upsert_checkpoint(key, max((row[1] for row in rows), default=None), profile)
+            self._conn.commit()
+
+        logger.info(f"{added} tweets novos armazenados para {key}")
+        return added
+
+    def set_checkpoint(self, username: str, since_id: Optional[int], profile: Optional[Dict[str, Any]] = None,
+                       gaps: Optional[Iterable[Tuple[int, int]]] = None):
+        """
+        Avança o checkpoint de um usuário ao final de uma coleta armazenada em partes.
+
+        O checkpoint e as lacunas são gravados na mesma transação: o checkpoint nunca avança
+        sem que os tweets deixados para trás estejam registrados.
+
+        Args:
+            username: Nome de usuário do Twitter
+            since_id: Maior id de tweet coletado (None se nenhum tweet novo)
+            profile: Perfil mais recente do usuário (opcional)
+            gaps: Intervalos (since_id, max_id) ainda não coletados, substituindo os anteriores (ver get_gaps)
+        """
+        key = self._key(username)
+
+        with self._lock:
+            self._upsert_checkpoint(key, since_id, profile)
+            self._conn.execute("DELETE FROM gaps WHERE username = ?", (key,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO gaps (username, since_id, max_id) VALUES (?, ?, ?)",
+                [(key, gap_since_id, gap_max_id) for gap_since_id, gap_max_id in gaps or ()]
+            )
+            self._conn.commit()
+
+    def _upsert_checkpoint(self, key: str, since_id: Optional[int], profile: Optional[Dict[str, Any]]):
+        """Grava o checkpoint de um usuário; deve ser chamado com self._lock adquirido."""
+        profile_json = json.dumps(profile, ensure_ascii=False, default=str) if profile is not None else None
+        # O checkpoint só avança: uma coleta antiga nunca faz o próximo since_id recuar
+        self._conn.execute(
+            "INSERT INTO checkpoints (username, since_id, profile, updated_at) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT(username) DO UPDATE SET "
+            "since_id = NULLIF(MAX(COALESCE(checkpoints.since_id, 0), COALESCE(excluded.since_id, 0)), 0), "
+            "profile = COALESCE(excluded.profile, checkpoints.profile), updated_at = excluded.updated_at",
+            (key, since_id, profile_json, time.time())
+        )
+
+    def latest(self, username: str, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Obtém os tweets armazenados de um usuário, do mais recente ao mais antigo.
+
+        Args:
+            username: Nome de usuário do Twitter
+            limit: Número máximo de tweets (padrão: todos)
+
+        Returns:
+            Lista de tweets
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM tweets WHERE username = ? ORDER BY id DESC LIMIT ?",
+                (self._key(username), -1 if limit is None else limit)
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self, username: str) -> int:
+        """
+        Conta os tweets armazenados de um usuário.
+
+        Args:
+            username: Nome de usuário do Twitter
+
+        Returns:
+            Número de tweets armazenados
+        """
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*) FROM tweets WHERE username = ?", (self._key(username),)
+            ).fetchone()[0]
+
+    def reset(self, username: str):
+        """
+        Remove os tweets, o checkpoint e as lacunas de um usuário (coleta completa na próxima vez).
+
+        Args:
+            username: Nome de usuário do Twitter
+        """
+        key = self._key(username)
+        with self._lock:
+            self._conn.execute("DELETE FROM tweets WHERE username = ?", (key,))
+            self._conn.execute("DELETE FROM checkpoints WHERE username = ?", (key,))
+            self._conn.execute("DELETE FROM gaps WHERE username = ?", (key,))
+            self._conn.commit()
+
+    def close(self):
+        """Fecha a conexão com o banco SQLite."""
+        with self._lock:
+            self._conn.close()
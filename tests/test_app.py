@@ -6,8 +6,11 @@ Testes de integração para a aplicação Flask da Ferramenta OSINT
 Este script realiza testes na aplicação web para garantir que todas as rotas e APIs estejam funcionando corretamente.
 """
 
+import io
 import os
 import sys
+import json
+import uuid
 import unittest
 import tempfile
 import shutil
@@ -75,7 +78,7 @@ class TestFlaskApp(unittest.TestCase):
         """Testa a rota de análise de metadados."""
         response = self.client.get('/metadata_analysis')
         self.assertEqual(response.status_code, 200)
-        self.assertIn(b'Análise de Metadados', response.data)
+        self.assertIn('Análise de Metadados'.encode('utf-8'), response.data)
     
     def test_about_route(self):
         """Testa a rota sobre."""
@@ -214,6 +217,241 @@ class TestFlaskApp(unittest.TestCase):
         self.assertIn("exif_data", data)
         self.assertEqual(data["exif_data"]["Make"], "Canon")
 
+    def test_background_job_api(self):
+        """Testa a execução de uma API em segundo plano com consulta do resultado."""
+        import time
+        import app as app_module
+        
+        with patch.object(app_module.contact_info_osint, 'search_phone_info') as mock_phone:
+            mock_phone.return_value = {"normalized_number": "+5511999999999"}
+            
+            # Executar requisição em segundo plano
+            response = self.client.post('/api/contact_info/phone', data={
+                "phone": "11999999999",
+                "background": "1"
+            })
+            
+            self.assertEqual(response.status_code, 202)
+            job_id = response.get_json()["job_id"]
+            
+            # Aguardar a conclusão da tarefa
+            for _ in range(50):
+                status = self.client.get(f'/api/jobs/{job_id}').get_json()["status"]
+                if status in ("finished", "failed"):
+                    break
+                time.sleep(0.05)
+        
+        # Verificar resultado
+        response = self.client.get(f'/api/jobs/{job_id}/result')
+        self.assertEqual(response.status_code, 200)
+        data = response.get_json()
+        self.assertEqual(data["status"], "finished")
+        self.assertEqual(data["result"]["normalized_number"], "+5511999999999")
+    
+    def test_job_events_stream(self):
+        """Testa o fluxo Server-Sent Events com resultados parciais de uma tarefa."""
+        import app as app_module
+        
+        def fake_search(domain, max_pages, progress_callback=None, force_refresh=False):
+            progress_callback('page', {'url': f'https://{domain}', 'new_emails': ['contato@' + domain]})
+            return {'domain': domain, 'emails_found': ['contato@' + domain]}
+        
+        with patch.object(app_module.contact_info_osint, 'search_emails_from_domain', side_effect=fake_search):
+            response = self.client.post('/api/contact_info/domain', data={
+                "domain": "exemplo.com.br",
+                "background": "1"
+            })
+            self.assertEqual(response.status_code, 202)
+            events_url = response.get_json()["events_url"]
+            
+            # Ler o fluxo até o evento final
+            response = self.client.get(events_url)
+            body = response.get_data(as_text=True)
+        
+        self.assertEqual(response.mimetype, 'text/event-stream')
+        self.assertIn('event: page', body)
+        self.assertIn('contato@exemplo.com.br', body)
+        self.assertIn('event: done', body)
+    
+    def test_unknown_job_api(self):
+        """Testa a consulta de uma tarefa inexistente."""
+        response = self.client.get('/api/jobs/inexistente')
+        self.assertEqual(response.status_code, 404)
+    
+    def test_domain_analysis_batch_api(self):
+        """Testa a API de análise de domínios em lote com resposta JSONL."""
+        batch_id = f"teste_{uuid.uuid4().hex}"
+        with patch('app.contact_info_osint.analyze_domain') as mock_analyze:
+            mock_analyze.side_effect = lambda domain, save=True: {'domain': domain, 'site_available': True}
+            response = self.client.post('/api/contact_info/domain_analysis/batch', data={
+                'domains': 'a.com.br\nb.com.br',
+                'batch_id': batch_id
+            })
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Batch-Id'], batch_id)
+        self.assertEqual(sorted(line['domain'] for line in lines), ['a.com.br', 'b.com.br'])
+        
+        response = self.client.post('/api/contact_info/domain_analysis/batch', data={
+            'domains': 'a.com.br', 'batch_id': batch_id, 'max_workers': '5000'
+        })
+        self.assertEqual(response.status_code, 400)
+    
+    def test_person_batch_api(self):
+        """Testa a API de geração de e-mails candidatos a partir de um CSV de pessoas."""
+        batch_id = f"teste_{uuid.uuid4().hex}"
+        csv_data = 'name,domain\nMaria Souza,exemplo.com.br\nPedro,\n'.encode('utf-8')
+        response = self.client.post('/api/contact_info/person/batch', data={
+            'people_file': (io.BytesIO(csv_data), 'pessoas.csv'),
+            'domains': 'gmail.com',
+            'batch_id': batch_id
+        }, content_type='multipart/form-data')
+        data = response.get_json()
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(data['people'], 2)
+        self.assertEqual(data['candidates'], 12)
+        self.assertTrue(os.path.exists(data['output_file']))
+        os.remove(data['output_file'])
+        
+        response = self.client.post('/api/contact_info/person/batch', data={'format': 'xlsx'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_phone_batch_api(self):
+        """Testa a API de classificação de telefones em lote com resposta JSONL."""
+        batch_id = f"teste_{uuid.uuid4().hex}"
+        response = self.client.post('/api/contact_info/phone/batch', data={
+            'phones_file': (io.BytesIO('11 99999-9999\n+351 912 345 678\n123\n'.encode('utf-8')), 'telefones.txt'),
+            'batch_id': batch_id
+        }, content_type='multipart/form-data')
+        lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.headers['X-Batch-Id'], batch_id)
+        self.assertEqual([line['country'] for line in lines], ['Brasil', 'Portugal', None])
+        
+        response = self.client.post('/api/contact_info/phone/batch', data={})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_social_media_all_api(self):
+        """Testa a API de busca simultânea nas redes sociais."""
+        with patch('app.social_media_osint.search_all') as mock_search:
+            mock_search.return_value = {'results': {}, 'latency': {}, 'timed_out': []}
+            response = self.client.post('/api/social_media/all', data={
+                'username': 'usuario_teste',
+                'instagram': 'outro_usuario',
+                'timeout': '5'
+            })
+        
+        self.assertEqual(response.status_code, 200)
+        handles = mock_search.call_args[0][0]
+        self.assertEqual(handles, {'twitter': 'usuario_teste', 'instagram': 'outro_usuario', 'facebook': 'usuario_teste'})
+        self.assertEqual(mock_search.call_args[1]['timeouts']['facebook'], 5.0)
+        
+        response = self.client.post('/api/social_media/all', data={})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_social_media_stream_api(self):
+        """Testa a coleta transmitida em JSONL, registro a registro."""
+        def records():
+            yield {'network': 'instagram', 'type': 'profile', 'data': {'username': 'usuario_teste'}}
+            yield {'network': 'instagram', 'type': 'post', 'id': 'abc', 'data': {}}
+            raise RuntimeError('Conexão perdida')
+        
+        with patch('app.social_media_osint.iter_posts', return_value=records()) as mock_iter:
+            response = self.client.post('/api/social_media/stream', data={
+                'network': 'instagram',
+                'username': 'usuario_teste',
+                'max_posts': '500'
+            })
+            lines = [json.loads(line) for line in response.get_data(as_text=True).splitlines()]
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.mimetype, 'application/x-ndjson')
+        self.assertEqual(mock_iter.call_args[0], ('instagram', 'usuario_teste', 500))
+        self.assertEqual([line['type'] for line in lines], ['profile', 'post', 'error'])
+        self.assertEqual(lines[2]['error'], 'Conexão perdida')
+        
+        response = self.client.post('/api/social_media/stream', data={'network': 'orkut', 'username': 'x'})
+        self.assertEqual(response.status_code, 400)
+        response = self.client.post('/api/social_media/stream', data={'network': 'twitter'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_social_media_schedule_api(self):
+        """Testa o agendamento de coletas com previsão de início."""
+        import app as app_module
+        with patch('app.social_media_osint.search_instagram') as mock_search:
+            mock_search.return_value = {'profile': {'username': 'usuario_teste'}, 'posts': []}
+            response = self.client.post('/api/social_media/schedule', data={
+                'network': 'instagram',
+                'username': 'usuario_teste',
+                'max_posts': '30'
+            })
+            
+            self.assertEqual(response.status_code, 202)
+            data = json.loads(response.data)
+            self.assertEqual(data['requests'], {'profile': 1, 'posts': 3})
+            self.assertIn('eta', data)
+            
+            job = app_module.social_media_osint.scheduler.get(data['job_id'])
+            self.assertTrue(job.wait(timeout=5))
+        
+        response = self.client.get(f"/api/social_media/schedule/{data['job_id']}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.data)['result']['profile']['username'], 'usuario_teste')
+        self.assertEqual(mock_search.call_args[1]['credential'], 'default')
+        
+        response = self.client.get('/api/social_media/schedule')
+        self.assertIn('instagram', json.loads(response.data)['quotas'])
+        
+        response = self.client.post('/api/social_media/schedule', data={'network': 'facebook', 'username': 'x'})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get('/api/social_media/schedule/inexistente').status_code, 404)
+    
+    def test_export_api(self):
+        """Testa a exportação transmitida dos resultados gravados."""
+        with patch('app.contact_info_osint.output_dir', self.temp_dir):
+            os.makedirs(os.path.join(self.temp_dir, 'domains'))
+            with open(os.path.join(self.temp_dir, 'domains', 'batch_teste.jsonl'), 'w', encoding='utf-8') as f:
+                f.write(json.dumps({'domain': 'a.com.br', 'site_available': True, 'ip_addresses': ['10.0.0.1'],
+                                    'collection_date': '2024-05-01T10:00:00'}) + '\n')
+                f.write(json.dumps({'domain': 'b.com.br', 'error': 'Falha'}) + '\n')
+            
+            response = self.client.get('/api/contact_info/export?type=domains&format=csv')
+            lines = response.get_data(as_text=True).splitlines()
+            
+            self.assertEqual(response.status_code, 200)
+            self.assertIn('attachment', response.headers['Content-Disposition'])
+            self.assertEqual(len(lines), 2)
+            self.assertTrue(lines[1].startswith('a.com.br,'))
+            
+            response = self.client.get('/api/contact_info/export?type=domains&format=xlsx')
+            self.assertEqual(response.status_code, 400)
+            response = self.client.get('/api/contact_info/export?type=phones&domain=a.com.br')
+            self.assertEqual(response.status_code, 400)
+    
+    def test_verify_emails_api(self):
+        """Testa a API de verificação de e-mails."""
+        with patch('app.contact_info_osint.email_verifier.verify_many') as mock_verify:
+            mock_verify.side_effect = lambda emails, progress_callback=None: [
+                {'email': email, 'status': 'valid'} for email in emails]
+            response = self.client.post('/api/contact_info/verify_emails', data={
+                'emails': 'a@exemplo.com.br, b@exemplo.com.br\na@exemplo.com.br'
+            })
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.get_json()['summary'], {'valid': 2})
+        
+        response = self.client.post('/api/contact_info/verify_emails', data={})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_contact_info_cache_stats_api(self):
+        """Testa a API de estatísticas do cache WHOIS."""
+        response = self.client.get('/api/contact_info/cache_stats')
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('hit_ratio', response.get_json()['whois'])
+
 
 if __name__ == '__main__':
     unittest.main()
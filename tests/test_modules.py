@@ -8,9 +8,15 @@ Este script realiza testes básicos em todos os módulos da ferramenta OSINT.
 
 import os
 import sys
+import time
 import unittest
 import tempfile
 import shutil
+import socket
+import struct
+import threading
+import socketserver
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 from unittest.mock import patch, MagicMock
 
 # Adicionar diretório pai ao path para importar os módulos
@@ -22,10 +28,83 @@ try:
     from modules.contact_info import ContactInfoOSINT
     from modules.image_recognition import ImageRecognitionOSINT
     from modules.metadata_analysis import MetadataAnalysisOSINT
+    from modules.jobs import JobManager
+    from modules.crawler import AsyncCrawler, EmailScanner, LinkExtractor
+    from modules.http_client import HTTPClient
+    from modules.rate_limiter import RateLimiter, TokenBucket
+    from modules.cache import PersistentCache
+    from modules.dns_resolver import DNSResolver
+    from modules.frontier import URLFrontier, canonicalize_url, contact_priority
+    from modules.http_cache import HTTPResponseCache
+    from modules.email_verifier import EmailVerifier
+    from modules.tweet_store import TweetStore
+    from modules.client_pool import ClientPool
+    from modules.social_scheduler import CollectionScheduler, RateLimitExceeded, collection_costs
+    from modules.phone_codes import PrefixTrie, lookup_country, normalize_phone_number, classify_phone_numbers
 except ImportError as e:
     print(f"Erro ao importar módulos: {e}")
     sys.exit(1)
 
+
+class LocalHTTPServer:
+    """Servidor HTTP local que substitui websites reais nos testes."""
+    
+    def __init__(self, routes, delay=0.0):
+        """
+        Inicializa o servidor.
+        
+        Args:
+            routes: Dicionário caminho -> (status, cabeçalhos, corpo) ou função que recebe o handler
+            delay: Atraso, em segundos, aplicado a cada resposta
+        """
+        self.routes = routes
+        self.requests = []
+        self.client_ports = set()
+        server = self
+        
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            
+            def _respond(self, send_body):
+                import time
+                server.requests.append((self.command, self.path, dict(self.headers)))
+                server.client_ports.add(self.client_address[1])
+                time.sleep(delay)
+                route = server.routes.get(self.path, (404, {}, b"not found"))
+                status, headers, body = route(self) if callable(route) else route
+                if isinstance(body, str):
+                    body = body.encode('utf-8')
+                self.send_response(status)
+                headers = dict(headers)
+                headers.setdefault('Content-Type', 'text/html; charset=utf-8')
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                if send_body:
+                    self.wfile.write(body)
+            
+            def do_GET(self):
+                self._respond(True)
+            
+            def do_HEAD(self):
+                self._respond(False)
+            
+            def log_message(self, *args):
+                pass
+        
+        self.httpd = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
 class TestSocialMediaModule(unittest.TestCase):
     """Testes para o módulo de busca em redes sociais."""
     
@@ -162,6 +241,392 @@ class TestSocialMediaModule(unittest.TestCase):
         # Verificar resultado
         self.assertIsNotNone(result)
         self.assertTrue(os.path.exists(result))
+    
+    def test_search_all_concurrent(self):
+        """Testa a busca simultânea nas redes, com tempo limite por rede."""
+        import time
+        release = threading.Event()
+        
+        def fake_twitter(username, max_tweets=100, deadline=None):
+            time.sleep(0.2)
+            return {'profile': {'screen_name': username}}
+        
+        def fake_instagram(username, max_posts=20, deadline=None):
+            time.sleep(0.2)
+            return {'error': 'Falha'}
+        
+        def slow_facebook(username, max_posts=20, deadline=None):
+            release.wait(5)
+            return {'profile': {'username': username}}
+        
+        with patch.object(self.social_media, 'search_twitter', side_effect=fake_twitter), \
+             patch.object(self.social_media, 'search_instagram', side_effect=fake_instagram), \
+             patch.object(self.social_media, 'search_facebook', side_effect=slow_facebook):
+            start = time.monotonic()
+            result = self.social_media.search_all('@usuario_teste', timeouts={'facebook': 0.5})
+            elapsed = time.monotonic() - start
+            release.set()
+        
+        # As redes rodam em paralelo: o total é limitado pelo maior prazo, não pela soma
+        self.assertLess(elapsed, 1.5)
+        self.assertEqual(result['handles']['twitter'], 'usuario_teste')
+        self.assertEqual(result['results']['twitter']['profile']['screen_name'], 'usuario_teste')
+        self.assertEqual(result['results']['instagram'], {'error': 'Falha'})
+        self.assertEqual(result['timed_out'], ['facebook'])
+        self.assertIn('error', result['results']['facebook'])
+        self.assertLess(result['latency']['twitter'], 0.5)
+        self.assertGreaterEqual(result['latency']['facebook'], 0.5)
+        
+        self.assertIn('error', self.social_media.search_all({'myspace': 'usuario_teste'}))
+    
+    def test_search_all_timeout_releases_client(self):
+        """Testa que a coleta expirada se interrompe no prazo e devolve o cliente ao pool."""
+        import types
+        timeline = list(range(1, 101))
+        fake_tweepy = self.fake_tweepy(timeline, [])
+        
+        def slow_cursor(method, **params):
+            def items(limit):
+                for tweet in method(**params)[:limit]:
+                    time.sleep(0.05)
+                    yield tweet
+            return types.SimpleNamespace(items=items)
+        
+        fake_tweepy.Cursor = slow_cursor
+        credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's',
+                       'TWITTER_ACCESS_TOKEN': 't', 'TWITTER_ACCESS_SECRET': 'a'}
+        
+        with patch.dict(sys.modules, {'tweepy': fake_tweepy}), patch.dict(os.environ, credentials):
+            result = self.social_media.search_all({'twitter': 'usuario_teste'}, timeouts={'twitter': 0.3})
+            
+            # O coletor termina logo após o prazo, sem esperar os 100 tweets (5s)
+            limit = time.monotonic() + 2
+            while not self.social_media.client_pool.stats()['idle'].get('twitter/default') and time.monotonic() < limit:
+                time.sleep(0.05)
+        
+        self.assertEqual(result['timed_out'], ['twitter'])
+        self.assertEqual(self.social_media.client_pool.stats()['idle'], {'twitter/default': 1})
+        # A coleta interrompida não avança o checkpoint
+        self.assertIsNone(self.social_media.tweet_store.get_since_id('usuario_teste'))
+    
+    def fake_tweepy(self, timeline, calls):
+        """Cria um substituto do tweepy cuja linha do tempo é a lista timeline (ids numéricos)."""
+        import types
+        from datetime import datetime as dt
+        
+        def user_timeline(screen_name, tweet_mode, count, since_id=None, max_id=None):
+            calls.append(since_id if max_id is None else (since_id, max_id))
+            tweets = [types.SimpleNamespace(id=i, created_at=dt(2024, 1, 1), full_text=f"tweet {i}", retweet_count=0,
+                                            favorite_count=0, entities={}) for i in sorted(timeline, reverse=True)]
+            return [t for t in tweets if (since_id is None or t.id > since_id) and (max_id is None or t.id <= max_id)]
+        
+        api = MagicMock()
+        api.get_user.return_value = types.SimpleNamespace(
+            id=1, name='Usuário Teste', screen_name='usuario_teste', description='', location='', url=None,
+            followers_count=0, friends_count=0, listed_count=0, created_at=dt(2020, 1, 1), verified=False,
+            statuses_count=5, profile_image_url_https=None)
+        api.user_timeline = user_timeline
+        return types.SimpleNamespace(
+            OAuth1UserHandler=MagicMock(),
+            API=MagicMock(return_value=api),
+            Cursor=lambda method, **params: types.SimpleNamespace(items=lambda limit: iter(method(**params)[:limit]))
+        )
+    
+    def test_twitter_incremental_collection(self):
+        """Testa que coletas seguintes pedem apenas tweets novos (since_id) e combinam com os armazenados."""
+        timeline = []
+        calls = []
+        fake_tweepy = self.fake_tweepy(timeline, calls)
+        credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's',
+                       'TWITTER_ACCESS_TOKEN': 't', 'TWITTER_ACCESS_SECRET': 'a'}
+        
+        with patch.dict(sys.modules, {'tweepy': fake_tweepy}), patch.dict(os.environ, credentials):
+            timeline.extend([1, 2, 3])
+            first = self.social_media.search_twitter('usuario_teste')
+            
+            timeline.extend([4, 5])
+            second = self.social_media.search_twitter('usuario_teste')
+            
+            refreshed = self.social_media.search_twitter('usuario_teste', max_tweets=2, full_refresh=True)
+        
+        self.assertEqual(calls, [None, 3, None])
+        self.assertEqual(first['new_tweets'], 3)
+        self.assertEqual(second['new_tweets'], 2)
+        self.assertEqual(second['since_id'], 3)
+        self.assertEqual([t['id'] for t in second['tweets']], [5, 4, 3, 2, 1])
+        self.assertEqual(refreshed['stored_tweets'], 2)
+        self.assertEqual([t['id'] for t in refreshed['tweets']], [5, 4])
+    
+    def test_twitter_collection_fills_gap(self):
+        """Testa que os tweets deixados para trás por uma coleta limitada são pedidos nas coletas seguintes."""
+        timeline = []
+        calls = []
+        credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's',
+                       'TWITTER_ACCESS_TOKEN': 't', 'TWITTER_ACCESS_SECRET': 'a'}
+        store = self.social_media.tweet_store
+        
+        with patch.dict(sys.modules, {'tweepy': self.fake_tweepy(timeline, calls)}), patch.dict(os.environ, credentials):
+            timeline.extend([1, 2, 3])
+            self.social_media.search_twitter('usuario_teste')
+            
+            timeline.extend(range(4, 11))
+            limited = self.social_media.search_twitter('usuario_teste', max_tweets=2)
+            self.assertEqual(store.get_gaps('usuario_teste'), [(3, 8)])
+            
+            # Com cota para 4 tweets: 11 (novo) e 8, 7, 6 da lacuna, que encolhe
+            timeline.append(11)
+            partial = self.social_media.search_twitter('usuario_teste', max_tweets=4)
+            self.assertEqual(store.get_gaps('usuario_teste'), [(3, 5)])
+            
+            filled = self.social_media.search_twitter('usuario_teste')
+        
+        self.assertEqual(calls, [None, 3, 10, (3, 8), 11, (3, 5)])
+        self.assertEqual(limited['new_tweets'], 2)
+        self.assertEqual(partial['new_tweets'], 4)
+        self.assertEqual(filled['new_tweets'], 2)
+        self.assertEqual([t['id'] for t in filled['tweets']], list(range(11, 0, -1)))
+        self.assertEqual(store.get_gaps('usuario_teste'), [])
+        self.assertEqual(store.get_since_id('usuario_teste'), 11)
+    
+    def test_twitter_consecutive_gaps_stay_separate(self):
+        """Testa que duas coletas limitadas seguidas deixam lacunas separadas, sem pedir de novo os tweets entre elas."""
+        timeline = []
+        calls = []
+        credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's',
+                       'TWITTER_ACCESS_TOKEN': 't', 'TWITTER_ACCESS_SECRET': 'a'}
+        store = self.social_media.tweet_store
+        
+        with patch.dict(sys.modules, {'tweepy': self.fake_tweepy(timeline, calls)}), patch.dict(os.environ, credentials):
+            timeline.extend([1, 2, 3])
+            self.social_media.search_twitter('usuario_teste')
+            
+            timeline.extend(range(4, 11))
+            self.social_media.search_twitter('usuario_teste', max_tweets=2)
+            
+            # A segunda coleta limitada não alcança a lacuna anterior, que continua como estava
+            timeline.extend(range(11, 21))
+            self.social_media.search_twitter('usuario_teste', max_tweets=2)
+            self.assertEqual(store.get_gaps('usuario_teste'), [(10, 18), (3, 8)])
+            
+            filled = self.social_media.search_twitter('usuario_teste')
+        
+        # Os tweets 9 e 10, já armazenados entre as lacunas, não são pedidos de novo
+        self.assertEqual(calls, [None, 3, 10, 20, (10, 18), (3, 8)])
+        self.assertEqual(filled['new_tweets'], 13)
+        self.assertEqual([t['id'] for t in filled['tweets']], list(range(20, 0, -1)))
+        self.assertEqual(store.get_gaps('usuario_teste'), [])
+    
+    def test_interrupted_tweet_stream_keeps_checkpoint(self):
+        """Testa que iter_tweets produz os tweets à medida que chegam e só avança o checkpoint ao final."""
+        timeline = list(range(1, 51))
+        calls = []
+        credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's',
+                       'TWITTER_ACCESS_TOKEN': 't', 'TWITTER_ACCESS_SECRET': 'a'}
+        
+        with patch.dict(sys.modules, {'tweepy': self.fake_tweepy(timeline, calls)}), \
+                patch.dict(os.environ, credentials):
+            records = self.social_media.iter_tweets('usuario_teste', max_tweets=50)
+            profile = next(records)
+            first_posts = [next(records) for _ in range(25)]
+            records.close()
+            
+            self.assertIsNone(self.social_media.tweet_store.get_since_id('usuario_teste'))
+            
+            records = list(self.social_media.iter_tweets('usuario_teste', max_tweets=50))
+        
+        self.assertEqual(profile['type'], 'profile')
+        self.assertEqual(profile['data']['screen_name'], 'usuario_teste')
+        self.assertEqual([r['id'] for r in first_posts], list(range(50, 25, -1)))
+        self.assertEqual(first_posts[0]['url'], 'https://twitter.com/usuario_teste/status/50')
+        self.assertEqual(first_posts[0]['text'], 'tweet 50')
+        # O lote já armazenado na coleta interrompida não é contado de novo
+        summary = records[-1]
+        self.assertEqual(summary['type'], 'summary')
+        self.assertEqual((summary['count'], summary['new_tweets'], summary['stored_tweets']), (50, 30, 50))
+        self.assertEqual(calls, [None, None])
+        self.assertEqual(self.social_media.tweet_store.get_since_id('usuario_teste'), 50)
+    
+    def test_iter_posts_is_lazy(self):
+        """Testa que iter_posts consome a fonte de posts sob demanda e normaliza os registros."""
+        import types
+        consumed = []
+        
+        def get_posts(username, pages):
+            for i in range(100):
+                consumed.append(i)
+                yield {'post_id': str(i), 'text': f"post {i}", 'post_url': f"https://facebook.com/{username}/posts/{i}"}
+        
+        fake_scraper = types.SimpleNamespace(get_profile=lambda username: {'Name': 'Usuário Teste'},
+                                             get_posts=get_posts)
+        
+        with patch.dict(sys.modules, {'facebook_scraper': fake_scraper}):
+            records = self.social_media.iter_posts('facebook', 'usuario_teste', max_posts=50)
+            self.assertEqual(next(records)['data'], {'Name': 'Usuário Teste'})
+            post = next(records)
+            self.assertEqual(consumed, [0])
+            records.close()
+            
+            results = self.social_media.search_facebook('usuario_teste', max_posts=30)
+        
+        self.assertEqual((post['network'], post['type'], post['id'], post['text']), ('facebook', 'post', '0', 'post 0'))
+        self.assertEqual(post['url'], 'https://facebook.com/usuario_teste/posts/0')
+        self.assertEqual(len(results['posts']), 30)
+        self.assertEqual(results['posts'][29]['post_id'], '29')
+        
+        with self.assertRaises(ValueError):
+            self.social_media.iter_posts('orkut', 'usuario_teste')
+    
+    def test_scheduled_collection_is_retried_after_rate_limit(self):
+        """Testa que uma coleta agendada recusada por limite de taxa volta à fila até a renovação da cota."""
+        results = [{'error': 'Rate limit exceeded', 'rate_limited_until': time.time() + 0.3},
+                   {'profile': {'screen_name': 'usuario_teste'}, 'tweets': []}]
+        
+        with patch.object(self.social_media, 'search_twitter', side_effect=results) as search:
+            job = self.social_media.schedule_collection('twitter', 'usuario_teste', max_posts=450)
+            self.assertEqual(job.costs, {'users/show': 1, 'statuses/user_timeline': 3})
+            self.assertTrue(job.wait(timeout=5))
+        
+        self.assertEqual(job.status, 'finished')
+        self.assertEqual(job.attempts, 1)
+        self.assertEqual(search.call_count, 2)
+        self.assertGreaterEqual(job.started_at.timestamp(), results[0]['rate_limited_until'] - 0.05)
+        
+        with self.assertRaises(ValueError):
+            self.social_media.schedule_collection('facebook', 'usuario_teste')
+
+
+class LocalDNSServer:
+    """Servidor DNS (UDP) local que responde a partir de uma tabela de registros."""
+    
+    TYPES = {1: 'A', 2: 'NS', 15: 'MX', 16: 'TXT', 28: 'AAAA'}
+    
+    def __init__(self, records, malformed=False):
+        """
+        Inicializa o servidor.
+        
+        Args:
+            records: Dicionário (nome, tipo) -> lista de (ttl, valor); nomes ausentes recebem NXDOMAIN
+            malformed: Se True, responde com uma seção de respostas cortada no meio do registro
+        """
+        self.records = records
+        self.malformed = malformed
+        self.queries = []
+        server = self
+        
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                data, sock = self.request
+                sock.sendto(server._answer(data), self.client_address)
+        
+        self.udp = socketserver.ThreadingUDPServer(('127.0.0.1', 0), Handler)
+        self.address = self.udp.server_address
+        self.thread = threading.Thread(target=self.udp.serve_forever, daemon=True)
+    
+    def _answer(self, data):
+        """Monta a resposta para uma consulta."""
+        labels, offset = [], 12
+        while data[offset]:
+            labels.append(data[offset + 1:offset + 1 + data[offset]].decode())
+            offset += 1 + data[offset]
+        qtype = struct.unpack('!H', data[offset + 1:offset + 3])[0]
+        question = data[12:offset + 5]
+        name, rtype = '.'.join(labels).lower(), self.TYPES.get(qtype)
+        self.queries.append((name, rtype))
+        
+        if self.malformed:
+            # Cabeçalho anuncia uma resposta, mas o registro termina logo após o nome
+            return struct.pack('!HHHHHH', struct.unpack('!H', data[:2])[0], 0x8180, 1, 1, 0, 0) + question + b'\xc0\x0c\x00\x01'
+        
+        known = any(key[0] == name for key in self.records)
+        answers = b''
+        entries = self.records.get((name, rtype), [])
+        for ttl, value in entries:
+            if rtype == 'A':
+                rdata = socket.inet_pton(socket.AF_INET, value)
+            elif rtype == 'AAAA':
+                rdata = socket.inet_pton(socket.AF_INET6, value)
+            elif rtype == 'MX':
+                rdata = struct.pack('!H', value[0]) + self._encode(value[1])
+            elif rtype == 'TXT':
+                rdata = bytes([len(value)]) + value.encode()
+            else:
+                rdata = self._encode(value)
+            answers += struct.pack('!HHHIH', 0xC00C, qtype, 1, ttl, len(rdata)) + rdata
+        
+        flags = 0x8180 if known else 0x8183
+        return struct.pack('!HHHHHH', struct.unpack('!H', data[:2])[0], flags, 1, len(entries), 0, 0) + question + answers
+    
+    def _encode(self, name):
+        """Codifica um nome sem compressão."""
+        return b''.join(bytes([len(label)]) + label.encode() for label in name.split('.')) + b'\x00'
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.udp.shutdown()
+        self.udp.server_close()
+
+
+class LocalSMTPServer:
+    """Servidor SMTP local que responde ao RCPT TO a partir de uma lista de caixas existentes."""
+    
+    def __init__(self, mailboxes, catch_all_domains=(), greylist_domains=()):
+        """
+        Inicializa o servidor.
+        
+        Args:
+            mailboxes: E-mails aceitos no RCPT TO
+            catch_all_domains: Domínios em que qualquer destinatário é aceito
+            greylist_domains: Domínios em que destinatários desconhecidos recebem uma falha temporária
+        """
+        self.mailboxes = {m.lower() for m in mailboxes}
+        self.catch_all_domains = set(catch_all_domains)
+        self.greylist_domains = set(greylist_domains)
+        self.connections = 0
+        self.recipients = []
+        server = self
+        
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                server.connections += 1
+                self.wfile.write(b"220 stub ESMTP\r\n")
+                for raw in self.rfile:
+                    command = raw.decode().strip()
+                    verb = command.split(' ', 1)[0].upper()
+                    if verb == 'EHLO':
+                        reply = "250-stub\r\n250 OK"
+                    elif verb == 'RCPT':
+                        address = command.split(':', 1)[1].strip().strip('<>').lower()
+                        server.recipients.append(address)
+                        domain = address.split('@')[1]
+                        accepted = address in server.mailboxes or domain in server.catch_all_domains
+                        if accepted:
+                            reply = "250 OK"
+                        elif domain in server.greylist_domains:
+                            reply = "451 Greylisted, try again later"
+                        else:
+                            reply = "550 No such user"
+                    elif verb == 'QUIT':
+                        self.wfile.write(b"221 Bye\r\n")
+                        return
+                    else:
+                        reply = "250 OK"
+                    self.wfile.write(reply.encode() + b"\r\n")
+        
+        self.tcp = socketserver.ThreadingTCPServer(('127.0.0.1', 0), Handler)
+        self.tcp.daemon_threads = True
+        self.port = self.tcp.server_address[1]
+        self.thread = threading.Thread(target=self.tcp.serve_forever, daemon=True)
+    
+    def __enter__(self):
+        self.thread.start()
+        return self
+    
+    def __exit__(self, *args):
+        self.tcp.shutdown()
+        self.tcp.server_close()
 
 
 class TestContactInfoModule(unittest.TestCase):
@@ -211,6 +676,55 @@ class TestContactInfoModule(unittest.TestCase):
         self.assertIn("possible_emails", result)
         self.assertTrue(len(result["possible_emails"]) > 0)
     
+    def test_email_pattern_inference(self):
+        """Testa o aprendizado do padrão predominante e a ordenação dos e-mails candidatos."""
+        emails = ['joao.silva@acme.com.br', 'maria.souza@acme.com.br', 'pedro.lima@vendas.acme.com.br',
+                  'contato@acme.com.br', 'fulano@outro.com.br']
+        model = self.contact_info.pattern_inference.learn('acme.com.br', emails)
+        
+        self.assertEqual(model['dominant'], 'nome.sobrenome')
+        self.assertEqual(len(model['samples']), 3)
+        
+        # Repetir o aprendizado não conta os mesmos e-mails novamente
+        self.assertEqual(self.contact_info.pattern_inference.learn('acme.com.br', emails)['samples'], model['samples'])
+        
+        flast = self.contact_info.pattern_inference.learn('beta.com', ['jsouza@beta.com', 'mlima@beta.com', 'rcosta@beta.com'])
+        self.assertEqual(flast['dominant'], 'nsobrenome')
+        
+        result = self.contact_info.search_emails_for_person('Ana Paula Ferreira', ['acme.com.br', 'beta.com'], top_k=3)
+        
+        self.assertEqual(result['possible_emails'][:2], ['ana.ferreira@acme.com.br', 'aferreira@beta.com'])
+        self.assertEqual(len(result['possible_emails']), 3)
+        self.assertEqual(result['ranked_emails'][0]['pattern'], 'nome.sobrenome')
+        self.assertEqual(self.contact_info._generate_email_patterns('beta.com', flast)[0], 'nsobrenome@beta.com')
+    
+    def test_generate_email_candidates(self):
+        """Testa a geração em lote de e-mails candidatos a partir de um CSV."""
+        import pandas as pd
+        input_file = os.path.join(self.temp_dir, 'pessoas.csv')
+        with open(input_file, 'w', encoding='utf-8') as f:
+            f.write('nome,dominios\n')
+            f.write('João da Silva,exemplo.com.br; acme.com\n')
+            f.write('Ana,\n')
+            f.write(',exemplo.com.br\n')
+            f.write('José Pérez-Gómez,dominio_invalido\n')
+        output_file = os.path.join(self.temp_dir, 'candidatos.csv')
+        
+        result = self.contact_info.generate_email_candidates(input_file, output_file, domains=['gmail.com'], chunk_size=2)
+        candidates = pd.read_csv(output_file)
+        
+        self.assertEqual(result['people'], 4)
+        self.assertEqual(result['skipped'], 1)
+        self.assertEqual(result['candidates'], len(candidates))
+        self.assertEqual(len(candidates), 14 * 3 + 1)
+        self.assertIn('joao.d.silva@acme.com', set(candidates['email']))
+        self.assertIn('jose.gomez@gmail.com', set(candidates['email']))
+        self.assertIn('ana@gmail.com', set(candidates['email']))
+        
+        # A geração vetorizada deve coincidir com a busca individual
+        person = self.contact_info.search_emails_for_person('João da Silva', ['acme.com'])
+        self.assertEqual(set(person['possible_emails']), set(candidates[candidates['domain'] == 'acme.com']['email']))
+    
     @patch('modules.contact_info.phonenumbers.parse')
     @patch('modules.contact_info.phonenumbers.is_valid_number')
     @patch('modules.contact_info.phonenumbers.format_number')
@@ -272,6 +786,156 @@ class TestContactInfoModule(unittest.TestCase):
         self.assertTrue(result["site_available"])
         self.assertEqual(result["status_code"], 200)
         self.assertTrue(result["ssl_info"]["has_ssl"])
+    
+    @patch('modules.contact_info.whois.whois')
+    def test_whois_cache_by_registrable_domain(self, mock_whois):
+        """Testa que consultas WHOIS repetidas do mesmo domínio registrável usam o cache."""
+        mock_whois.return_value = MagicMock(registrar="Registrador Teste", creation_date=None,
+                                            expiration_date=None, updated_date=None)
+        
+        first = self.contact_info._get_domain_info("www.exemplo.com.br")
+        second = self.contact_info._get_domain_info("exemplo.com.br")
+        
+        mock_whois.assert_called_once_with("exemplo.com.br", timeout=10.0)
+        self.assertEqual(first["registrar"], "Registrador Teste")
+        self.assertEqual(first, second)
+        self.assertEqual(self.contact_info.get_cache_stats()["whois"]["hits"], 1)
+    
+    @patch('modules.contact_info.TLDEXTRACT_AVAILABLE', False)
+    def test_registrable_domain_unknown_suffix(self):
+        """Testa que, sem o tldextract, sufixos de dois rótulos desconhecidos não são tomados como domínio."""
+        registrable = self.contact_info._get_registrable_domain
+        
+        self.assertEqual(registrable("www.loja.exemplo.com.br"), "exemplo.com.br")
+        self.assertEqual(registrable("www.exemplo.com"), "exemplo.com")
+        self.assertEqual(registrable("shop.example.com.my"), "shop.example.com.my")
+        self.assertEqual(registrable("acme.co.id"), "acme.co.id")
+        self.assertEqual(registrable("sat.gob.mx"), "sat.gob.mx")
+        self.assertEqual(registrable("uni.ac.in"), "uni.ac.in")
+    
+    def test_analyze_domain_probes_run_in_parallel(self):
+        """Testa que as sondas rodam em paralelo e que sondas lentas geram resultado parcial."""
+        import time
+        
+        def slow(value, delay):
+            def probe(*args, **kwargs):
+                time.sleep(delay)
+                return value
+            return probe
+        
+        self.contact_info.probe_timeouts = {'whois': 1.0, 'dns': 1.0, 'http': 1.0, 'ssl': 0.2}
+        
+        with patch.object(self.contact_info, '_get_domain_info', slow({'registrar': 'Registrador Teste'}, 0.3)), \
+                patch.object(self.contact_info, '_get_dns_records', slow({'A': ['192.0.2.1'], 'MX': []}, 0.3)), \
+                patch.object(self.contact_info, '_check_website_availability', slow((True, 200), 0.3)), \
+                patch.object(self.contact_info, '_check_ssl', slow({'has_ssl': True}, 2.0)):
+            start = time.monotonic()
+            result = self.contact_info.analyze_domain("exemplo.com.br")
+            elapsed = time.monotonic() - start
+        
+        self.assertLess(elapsed, 0.9)
+        self.assertEqual(result["whois_info"]["registrar"], "Registrador Teste")
+        self.assertEqual(result["ip_addresses"], ['192.0.2.1'])
+        self.assertEqual(result["status_code"], 200)
+        self.assertFalse(result["ssl_info"]["has_ssl"])
+        self.assertEqual(result["timed_out_probes"], ['ssl'])
+        self.assertTrue(result["partial"])
+        self.assertEqual(set(result["probe_timings"]), {'whois', 'dns', 'http', 'ssl'})
+    
+    def test_analyze_domains_batch_resume(self):
+        """Testa a análise em lote com saída JSONL e retomada após interrupção."""
+        import json
+        output_file = os.path.join(self.temp_dir, 'lote.jsonl')
+        analyzed = []
+        
+        def fake_analyze(domain, save=True, probe_executor=None):
+            analyzed.append(domain)
+            return {'domain': domain, 'site_available': True}
+        
+        with patch.object(self.contact_info, 'analyze_domain', side_effect=fake_analyze):
+            # Interromper o lote após o primeiro resultado
+            batch = self.contact_info.analyze_domains(['a.com.br', 'b.com.br'], output_file, max_workers=1)
+            first = next(batch)
+            batch.close()
+            
+            results = list(self.contact_info.analyze_domains(
+                ['a.com.br', 'b.com.br', '', '# comentário', 'B.com.br', 'c.com.br'], output_file, max_workers=2))
+        
+        with open(output_file, encoding='utf-8') as f:
+            lines = [json.loads(line) for line in f if line.strip()]
+        
+        self.assertEqual(first['domain'], 'a.com.br')
+        self.assertEqual(sorted(r['domain'] for r in results), ['b.com.br', 'c.com.br'])
+        self.assertEqual(sorted(line['domain'] for line in lines), ['a.com.br', 'b.com.br', 'c.com.br'])
+        self.assertEqual(analyzed.count('a.com.br'), 1)
+    
+    def test_analyze_domains_resume_retries_errors(self):
+        """Testa que a retomada de um lote analisa novamente os domínios que terminaram com erro."""
+        import json
+        output_file = os.path.join(self.temp_dir, 'lote.jsonl')
+        with open(output_file, 'w', encoding='utf-8') as f:
+            f.write(json.dumps({'domain': 'a.com.br', 'site_available': True}) + '\n')
+            f.write(json.dumps({'domain': 'b.com.br', 'error': 'Tempo limite excedido'}) + '\n')
+        
+        with patch.object(self.contact_info, 'analyze_domain',
+                          side_effect=lambda domain, **kwargs: {'domain': domain, 'site_available': True}):
+            results = list(self.contact_info.analyze_domains(['a.com.br', 'b.com.br'], output_file))
+        
+        self.assertEqual([r['domain'] for r in results], ['b.com.br'])
+    
+    def test_analyze_domains_caps_workers(self):
+        """Testa que a concorrência pedida para o lote é limitada a max_batch_concurrency."""
+        from concurrent.futures import ThreadPoolExecutor
+        sizes = []
+        
+        def executor(max_workers, **kwargs):
+            sizes.append(max_workers)
+            return ThreadPoolExecutor(max_workers=max_workers, **kwargs)
+        
+        with patch.object(self.contact_info, 'analyze_domain',
+                          side_effect=lambda domain, **kwargs: {'domain': domain, 'site_available': True}), \
+                patch('modules.contact_info.ThreadPoolExecutor', side_effect=executor):
+            results = list(self.contact_info.analyze_domains(['a.com.br'], max_workers=5000))
+        
+        self.assertEqual(len(results), 1)
+        self.assertEqual(sizes, [32, 8 * 32])
+    
+    def test_export_results(self):
+        """Testa a exportação dos resultados gravados, com filtros de data e domínio."""
+        import json
+        self.contact_info._save_results('emails', 'exemplo.com.br', {
+            'domain': 'exemplo.com.br', 'emails_found': ['a@exemplo.com.br', 'b@exemplo.com.br'],
+            'collection_date': '2024-05-01T10:00:00'
+        })
+        self.contact_info._save_results('emails', 'loja.exemplo.com.br', {
+            'domain': 'loja.exemplo.com.br', 'emails_found': ['c@loja.exemplo.com.br'],
+            'collection_date': '2024-06-01T10:00:00'
+        })
+        self.contact_info._save_results('emails', 'outro.com.br', {
+            'domain': 'outro.com.br', 'emails_found': ['d@outro.com.br'], 'collection_date': '2024-06-02T10:00:00'
+        })
+        # Resultados da memória não são necessários: a exportação lê os arquivos
+        self.contact_info.results = {}
+        
+        output_file = os.path.join(self.temp_dir, 'emails.jsonl')
+        result = self.contact_info.export_results('emails', output_file, 'jsonl', domain='exemplo.com.br')
+        with open(output_file, encoding='utf-8') as f:
+            emails = [json.loads(line)['email'] for line in f]
+        self.assertEqual(result['rows'], 3)
+        self.assertEqual(sorted(emails), ['a@exemplo.com.br', 'b@exemplo.com.br', 'c@loja.exemplo.com.br'])
+        
+        result = self.contact_info.export_results('emails', output_file, 'jsonl', since='2024-06-01', until='2024-06-01')
+        self.assertEqual(result['rows'], 1)
+        
+        csv_file = self.contact_info.export_results_to_csv('emails', 'emails.csv')
+        with open(csv_file, encoding='utf-8') as f:
+            lines = f.read().splitlines()
+        self.assertEqual(lines[0], 'domain,email,collection_date')
+        self.assertEqual(len(lines), 5)
+        
+        self.assertEqual(self.contact_info.export_results_to_csv('phones'), "")
+        self.assertIn('error', self.contact_info.export_results('phones', domain='exemplo.com.br'))
+        self.assertIn('error', self.contact_info.export_results('emails', output_format='xlsx'))
 
 
 class TestImageRecognitionModule(unittest.TestCase):
@@ -607,5 +1271,1078 @@ class TestMetadataAnalysisModule(unittest.TestCase):
         self.assertTrue(csv_file.endswith('.csv'))
 
 
+class TestAsyncCrawler(unittest.TestCase):
+    """Testes para o crawler assíncrono de websites."""
+    
+    def _site(self, page_count):
+        """Gera um website em que cada página aponta para a seguinte e contém um e-mail."""
+        routes = {}
+        for i in range(page_count):
+            path = '/' if i == 0 else f'/pagina{i}'
+            body = f'<p>equipe{i}@exemplo.com.br</p><a href="/pagina{i + 1}">próxima</a>'
+            routes[path] = (200, {}, body)
+        return routes
+    
+    def test_crawl_local_site(self):
+        """Testa o rastreamento de um website local, respeitando o limite de páginas."""
+        progress = []
+        
+        with LocalHTTPServer(self._site(10)) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_concurrency=4)
+            result = crawler.crawl(server.url + '/', max_pages=5,
+                                   progress_callback=lambda event, data: progress.append(data))
+        
+        self.assertEqual(result['pages_scanned'], 5)
+        self.assertEqual(result['emails'], {f'equipe{i}@exemplo.com.br' for i in range(5)})
+        self.assertEqual(len(progress), 5)
+        pages = [r for r in server.requests if r[1] not in ('/robots.txt', '/sitemap.xml')]
+        self.assertEqual(len(pages), 5)
+    
+    def test_concurrent_fetches(self):
+        """Testa que páginas independentes são baixadas em paralelo."""
+        import time
+        routes = {'/': (200, {}, ''.join(f'<a href="/p{i}">p</a>' for i in range(8)))}
+        for i in range(8):
+            routes[f'/p{i}'] = (200, {}, f'contato{i}@exemplo.com.br')
+        
+        with LocalHTTPServer(routes, delay=0.2) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_concurrency=8)
+            start = time.monotonic()
+            result = crawler.crawl(server.url + '/', max_pages=9)
+            elapsed = time.monotonic() - start
+        
+        self.assertEqual(len(result['emails']), 8)
+        # Serialmente seriam 9 x 0,2s; em paralelo, a página inicial e um lote
+        self.assertLess(elapsed, 1.0)
+    
+    def test_contact_info_uses_crawler(self):
+        """Testa a extração de e-mails do módulo de contatos sobre o servidor local."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            contact_info = ContactInfoOSINT(output_dir=temp_dir)
+            contact_info.http.rate_limiter.default_rate = None
+            with LocalHTTPServer(self._site(3)) as server:
+                emails = contact_info._extract_emails_from_website(server.url, max_pages=3)
+        finally:
+            shutil.rmtree(temp_dir)
+        
+        self.assertEqual(emails, {f'equipe{i}@exemplo.com.br' for i in range(3)})
+    
+    def test_streaming_extraction_across_chunks(self):
+        """Testa que e-mails e links divididos entre blocos são encontrados."""
+        body = b'<p>Contato: joao.silva@exemplo.com.br</p><a href="/contato">c</a> suporte@exemplo.com.br'
+        
+        for size in (1, 3, 7, 16, len(body)):
+            scanner, extractor = EmailScanner(), LinkExtractor('utf-8')
+            for i in range(0, len(body), size):
+                scanner.feed(body[i:i + size])
+                extractor.feed(body[i:i + size])
+            
+            self.assertEqual(scanner.close(), {'joao.silva@exemplo.com.br', 'suporte@exemplo.com.br'})
+            self.assertEqual(extractor.close(), ['/contato'])
+    
+    def test_page_size_cap(self):
+        """Testa que páginas acima de max_page_bytes são descartadas, pelo tamanho declarado ou recebido."""
+        body = '<a href="/p1">p</a>inicio@exemplo.com.br' + ' ' * 100000 + 'fim@exemplo.com.br'
+        
+        with LocalHTTPServer({'/': (200, {}, body)}) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_page_bytes=50000, chunk_size=8192)
+            result = crawler.crawl(server.url + '/', max_pages=1)
+        
+        self.assertEqual(result['emails'], set())
+        self.assertEqual(result['pages_scanned'], 0)
+        self.assertEqual(result['skipped']['too_large'], 1)
+        
+        # Sem Content-Length, a leitura para no primeiro bloco que ultrapassa o limite
+        chunks_read = []
+        
+        def chunks():
+            for i in range(0, len(body), 8192):
+                chunks_read.append(i)
+                yield body[i:i + 8192].encode('utf-8')
+        
+        emails, links, too_large = crawler._scan_body('http://exemplo.com.br/', chunks(), 'utf-8')
+        
+        self.assertTrue(too_large)
+        self.assertEqual((emails, links), (set(), []))
+        self.assertEqual(len(chunks_read), 50000 // 8192 + 1)
+    
+    def test_fetch_policy_skips(self):
+        """Testa o descarte de arquivos, tipos de conteúdo não permitidos e páginas grandes demais."""
+        index = ''.join(f'<a href="{href}">x</a>' for href in ['/manual.pdf', '/foto', '/grande', '/longa', '/equipe'])
+        routes = {
+            '/': (200, {}, index),
+            '/manual.pdf': (200, {'Content-Type': 'application/pdf'}, 'pdf@exemplo.com.br'),
+            '/foto': (200, {'Content-Type': 'image/png'}, 'foto@exemplo.com.br'),
+            '/grande': (200, {}, 'grande@exemplo.com.br' + ' ' * 5000),
+            '/longa': (200, {'Content-Type': 'text/plain'}, 'longa@exemplo.com.br' + ' ' * 1500 + 'fim@exemplo.com.br'),
+            '/equipe': (200, {}, 'equipe@exemplo.com.br')
+        }
+        
+        with LocalHTTPServer(routes) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_page_bytes=4000)
+            result = crawler.crawl(server.url + '/', max_pages=10)
+        
+        self.assertEqual(result['emails'], {'longa@exemplo.com.br', 'fim@exemplo.com.br', 'equipe@exemplo.com.br'})
+        self.assertEqual(result['pages_scanned'], 3)
+        self.assertEqual(result['skipped']['extension'], 1)
+        self.assertEqual(result['skipped']['content_type'], 1)
+        self.assertEqual(result['skipped']['too_large'], 1)
+        self.assertNotIn('/manual.pdf', [r[1] for r in server.requests])
+    
+    def test_sitemap_seeded_crawl(self):
+        """Testa a semeadura pelo robots.txt e por um índice de sitemaps comprimido."""
+        import gzip
+        urlset = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            '<url><loc>{base}/blog/2020/post</loc></url>'
+            '<url><loc>{base}/fale-conosco/contato</loc></url>'
+            '<url><loc>{base}/privado/contato</loc></url>'
+            '</urlset>'
+        )
+        index = (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            '<sitemap><loc>{base}/sitemap-paginas.xml.gz</loc></sitemap>'
+            '</sitemapindex>'
+        )
+        routes = {
+            '/': (200, {}, '<a href="/blog/">blog</a>'),
+            '/blog/': (200, {}, 'blog@exemplo.com.br'),
+            '/blog/2020/post': (200, {}, 'post@exemplo.com.br'),
+            '/fale-conosco/contato': (200, {}, 'contato@exemplo.com.br'),
+            '/privado/contato': (200, {}, 'privado@exemplo.com.br')
+        }
+        
+        with LocalHTTPServer(routes) as server:
+            routes['/robots.txt'] = (200, {'Content-Type': 'text/plain'},
+                                     f'User-agent: *\nDisallow: /privado/\nSitemap: {server.url}/sitemap-index.xml\n')
+            routes['/sitemap-index.xml'] = (200, {'Content-Type': 'application/xml'}, index.format(base=server.url))
+            routes['/sitemap-paginas.xml.gz'] = (200, {'Content-Type': 'application/octet-stream'},
+                                                 gzip.compress(urlset.format(base=server.url).encode('utf-8')))
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_concurrency=1)
+            result = crawler.crawl(server.url + '/', max_pages=2)
+        
+        # A página de contato, que não é linkada pela inicial, é visitada antes do blog
+        self.assertEqual(result['seeded_urls'], 2)
+        self.assertEqual(result['emails'], {'contato@exemplo.com.br'})
+        self.assertNotIn('/privado/contato', [r[1] for r in server.requests])
+    
+    def test_robots_loaded_before_first_page(self):
+        """Testa que um robots.txt lento é baixado uma única vez e filtra os links da página inicial."""
+        def slow_robots(handler):
+            time.sleep(0.3)
+            return 200, {'Content-Type': 'text/plain'}, 'User-agent: *\nDisallow: /privado/\n'
+        
+        routes = {
+            '/': (200, {}, '<a href="/privado/contato">privado</a> <a href="/sobre">sobre</a>'),
+            '/privado/contato': (200, {}, 'privado@exemplo.com.br'),
+            '/sobre': (200, {}, 'sobre@exemplo.com.br'),
+            '/robots.txt': slow_robots
+        }
+        
+        with LocalHTTPServer(routes) as server:
+            client = HTTPClient(rate_limiter=RateLimiter(default_rate=None))
+            crawler = AsyncCrawler(http_client=client, max_concurrency=3)
+            result = crawler.crawl(server.url + '/', max_pages=3)
+        
+        paths = [r[1] for r in server.requests]
+        self.assertEqual(paths.count('/robots.txt'), 1)
+        self.assertLess(paths.index('/robots.txt'), paths.index('/'))
+        self.assertNotIn('/privado/contato', paths)
+        self.assertEqual(result['skipped']['robots'], 1)
+        self.assertEqual(result['emails'], {'sobre@exemplo.com.br'})
+    
+    def test_crawl_without_sitemap(self):
+        """Testa que a ausência de robots.txt e sitemap não interrompe o rastreamento."""
+        with LocalHTTPServer(self._site(3)) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient())
+            result = crawler.crawl(server.url + '/', max_pages=3)
+        
+        self.assertEqual(result['seeded_urls'], 0)
+        self.assertEqual(result['pages_scanned'], 3)
+
+
+class TestURLFrontier(unittest.TestCase):
+    """Testes para a normalização de URLs e a fronteira de rastreamento."""
+    
+    def test_canonicalize_url(self):
+        """Testa a resolução de links relativos e a forma canônica das URLs."""
+        base = 'https://Exemplo.com.br:443/equipe/index.html'
+        
+        self.assertEqual(canonicalize_url('contato.html', base), 'https://exemplo.com.br/equipe/contato.html')
+        self.assertEqual(canonicalize_url('../sobre/', base), 'https://exemplo.com.br/sobre/')
+        self.assertEqual(canonicalize_url('/busca?b=2&a=1&utm_source=x#topo', base), 'https://exemplo.com.br/busca?a=1&b=2')
+        self.assertEqual(canonicalize_url('//outro.com.br', base), 'https://outro.com.br/')
+        self.assertEqual(canonicalize_url('http://exemplo.com.br:8080/a/./b', base), 'http://exemplo.com.br:8080/a/b')
+        self.assertIsNone(canonicalize_url('mailto:contato@exemplo.com.br', base))
+        self.assertIsNone(canonicalize_url('javascript:void(0)', base))
+        self.assertIsNone(canonicalize_url('tel:+5511999999999', base))
+        self.assertIsNone(canonicalize_url('  ', base))
+    
+    def test_frontier_deduplicates_on_enqueue(self):
+        """Testa que variações da mesma página entram na fila uma única vez."""
+        frontier = URLFrontier(allowed_hosts={'exemplo.com.br'})
+        base = 'https://exemplo.com.br/'
+        
+        added = frontier.add_many(['/a', '/a#x', 'a', 'https://EXEMPLO.com.br/a', '/b?y=1&x=2', '/b?x=2&y=1',
+                                   'https://outro.com.br/', 'mailto:x@exemplo.com.br'], base)
+        
+        self.assertEqual(added, 2)
+        self.assertEqual([frontier.pop(), frontier.pop()], ['https://exemplo.com.br/a', 'https://exemplo.com.br/b?x=2&y=1'])
+        self.assertEqual(frontier.duplicates, 4)
+        self.assertEqual(frontier.rejected, 2)
+    
+    def test_contact_priority(self):
+        """Testa que páginas de contato saem da fronteira antes das demais."""
+        frontier = URLFrontier(allowed_hosts={'exemplo.com.br'}, priority=contact_priority)
+        frontier.add_many(['/blog/2020/01/post', '/arquivo.pdf', '/sobre-nos', '/contato', '/produtos'],
+                          'https://exemplo.com.br/')
+        
+        order = [frontier.pop() for _ in range(len(frontier))]
+        
+        self.assertEqual(order, [
+            'https://exemplo.com.br/contato', 'https://exemplo.com.br/sobre-nos', 'https://exemplo.com.br/produtos',
+            'https://exemplo.com.br/blog/2020/01/post', 'https://exemplo.com.br/arquivo.pdf'
+        ])
+    
+    def test_crawler_spends_budget_on_distinct_pages(self):
+        """Testa que duplicatas e links não navegáveis não consomem o limite de páginas."""
+        index = ''.join(f'<a href="{href}">x</a>' for href in [
+            '#topo', '/?', 'mailto:a@exemplo.com.br', 'javascript:void(0)', 'equipe/', 'equipe/#membros',
+            '/equipe/?b=1&a=2', '/equipe/?a=2&b=1'
+        ])
+        routes = {
+            '/': (200, {}, index),
+            '/equipe/': (200, {}, '<a href="joao.html">j</a><a href="../">inicio</a>'),
+            '/equipe/?a=2&b=1': (200, {}, 'lista@exemplo.com.br'),
+            '/equipe/joao.html': (200, {}, 'joao@exemplo.com.br')
+        }
+        
+        with LocalHTTPServer(routes) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), max_concurrency=1)
+            result = crawler.crawl(server.url, max_pages=4)
+        
+        self.assertEqual(result['pages_scanned'], 4)
+        self.assertEqual(result['emails'], {'a@exemplo.com.br', 'lista@exemplo.com.br', 'joao@exemplo.com.br'})
+        pages = sorted(r[1] for r in server.requests if r[1] not in ('/robots.txt', '/sitemap.xml'))
+        self.assertEqual(pages, ['/', '/equipe/', '/equipe/?a=2&b=1', '/equipe/joao.html'])
+
+
+class TestPhoneCodes(unittest.TestCase):
+    """Testes para a tabela de códigos de país e a classificação de telefones."""
+    
+    def test_prefix_trie_longest_match(self):
+        """Testa que a busca devolve o prefixo mais longo, e não o primeiro encontrado."""
+        trie = PrefixTrie([('3', 'a'), ('35', 'b'), ('351', 'c')])
+        
+        self.assertEqual(trie.longest_match('351912345678'), ('351', 'c'))
+        self.assertEqual(trie.longest_match('352'), ('35', 'b'))
+        self.assertEqual(trie.longest_match('39'), ('3', 'a'))
+        self.assertIsNone(trie.longest_match('4'))
+        self.assertEqual(len(trie), 3)
+    
+    def test_lookup_country(self):
+        """Testa a identificação de países, inclusive os que compartilham o código com outros."""
+        self.assertEqual(lookup_country('+351912345678')['country'], 'Portugal')
+        self.assertEqual(lookup_country('+5511999999999')['country_iso'], 'BR')
+        self.assertEqual(lookup_country('+18765551234')['country_iso'], 'JM')
+        self.assertEqual(lookup_country('+18765551234')['calling_code'], '1')
+        self.assertEqual(lookup_country('+14165551234')['country_iso'], 'CA')
+        self.assertEqual(lookup_country('+12125551234')['country_iso'], 'US')
+        self.assertEqual(lookup_country('+77011234567')['country_iso'], 'KZ')
+        self.assertEqual(lookup_country('+74951234567')['country_iso'], 'RU')
+        self.assertIsNone(lookup_country('+2591234567'))
+    
+    def test_normalize_and_classify(self):
+        """Testa a normalização para E.164 e a classificação em lote."""
+        self.assertEqual(normalize_phone_number('(11) 99999-9999'), '+5511999999999')
+        self.assertEqual(normalize_phone_number('011 99999-9999'), '+5511999999999')
+        self.assertEqual(normalize_phone_number('+351 912 345 678'), '+351912345678')
+        self.assertEqual(normalize_phone_number('00 44 20 7946 0958'), '+442079460958')
+        self.assertEqual(normalize_phone_number('123'), '')
+        
+        results = list(classify_phone_numbers(['# comentário', '', '+1 876 555 1234', 'abc']))
+        self.assertEqual(len(results), 2)
+        self.assertEqual(results[0]['country'], 'Jamaica')
+        self.assertTrue(results[0]['valid'])
+        self.assertFalse(results[1]['valid'])
+        self.assertEqual(results[1]['normalized_number'], '')
+    
+    def test_enrich_phone_numbers(self):
+        """Testa a classificação em blocos de um CSV, com deduplicação entre blocos."""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            input_file = os.path.join(temp_dir, 'vazamento.csv')
+            with open(input_file, 'w', encoding='utf-8') as f:
+                f.write('nome,telefone\nAna,(11) 99999-9999\nBia,+55 11 99999-9999\nCaio,+351 912 345 678\n'
+                        'Duda,123\nEva,123\nFabi,\n')
+            
+            contact_info = ContactInfoOSINT(output_dir=temp_dir)
+            output_file = os.path.join(temp_dir, 'telefones.csv')
+            result = contact_info.enrich_phone_numbers(input_file, output_file, chunk_size=2)
+            
+            self.assertEqual(result['rows'], 6)
+            self.assertEqual(result['unique'], 3)
+            self.assertEqual(result['duplicates'], 2)
+            self.assertEqual(result['blank'], 1)
+            self.assertEqual(result['invalid'], 1)
+            self.assertEqual(result['countries'], {'Brasil': 1, 'Portugal': 1})
+            
+            with open(output_file, 'r', encoding='utf-8') as f:
+                lines = f.read().splitlines()
+            self.assertEqual(lines[0], 'source_row,original_number,normalized_number,valid,calling_code,country_iso,country')
+            self.assertEqual([line.split(',')[2] for line in lines[1:]], ['+5511999999999', '+351912345678', ''])
+            
+            result = contact_info.enrich_phone_numbers(input_file, output_file, column='inexistente')
+            self.assertIn('error', result)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestTweetStore(unittest.TestCase):
+    """Testes para o armazenamento incremental de tweets."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = TweetStore(os.path.join(self.temp_dir, 'tweets.sqlite3'))
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_append_and_checkpoint(self):
+        """Testa a deduplicação por id e o avanço do checkpoint."""
+        self.assertIsNone(self.store.get_since_id('Usuario'))
+        
+        self.assertEqual(self.store.append('Usuario', [{'id': 10}, {'id': 12}]), 2)
+        self.assertEqual(self.store.append('@usuario', [{'id': 12}, {'id': 11}]), 1)
+        self.assertEqual(self.store.get_since_id('usuario'), 12)
+        
+        # Uma coleta sem tweets novos não faz o checkpoint recuar
+        self.store.append('usuario', [])
+        self.assertEqual(self.store.get_since_id('usuario'), 12)
+        
+        self.assertEqual([t['id'] for t in self.store.latest('usuario')], [12, 11, 10])
+        self.assertEqual([t['id'] for t in self.store.latest('usuario', 2)], [12, 11])
+        self.assertEqual(self.store.count('usuario'), 3)
+        
+        self.store.reset('usuario')
+        self.assertIsNone(self.store.get_since_id('usuario'))
+        self.assertEqual(self.store.count('usuario'), 0)
+
+
+class TestClientPool(unittest.TestCase):
+    """Testes para o pool de clientes autenticados das redes sociais."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        import types
+        self.temp_dir = tempfile.mkdtemp()
+        self.pool = ClientPool(os.path.join(self.temp_dir, 'sessions'), max_clients=1, acquire_timeout=0.2)
+        self.logins = []
+        
+        class BadCredentialsException(Exception):
+            pass
+        
+        class LoginRequiredException(Exception):
+            pass
+        
+        class FakeInstaloader:
+            def __init__(loader, **options):
+                loader.options = options
+                loader.session = None
+            
+            def login(loader, username, password):
+                if password != 'senha':
+                    raise BadCredentialsException("Senha incorreta")
+                self.logins.append(username)
+                loader.session = username
+            
+            def save_session_to_file(loader, filename):
+                with open(filename, 'w') as f:
+                    f.write(loader.session)
+            
+            def load_session_from_file(loader, username, filename):
+                with open(filename) as f:
+                    loader.session = f.read()
+        
+        self.fake_modules = {
+            'tweepy': types.SimpleNamespace(OAuth1UserHandler=lambda *credentials: credentials,
+                                            API=lambda auth, **options: types.SimpleNamespace(auth=auth, **options)),
+            'instaloader': types.SimpleNamespace(Instaloader=FakeInstaloader,
+                                                 LoginRequiredException=LoginRequiredException)
+        }
+        self.credentials = {'TWITTER_API_KEY': 'k', 'TWITTER_API_SECRET': 's', 'TWITTER_ACCESS_TOKEN': 't',
+                            'TWITTER_ACCESS_SECRET': 'a', 'INSTAGRAM_USERNAME': 'coletor',
+                            'INSTAGRAM_PASSWORD': 'senha'}
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_clients_are_reused_and_refreshed(self):
+        """Testa que o cliente é criado uma vez e recriado apenas quando as credenciais mudam."""
+        with patch.dict(sys.modules, self.fake_modules), patch.dict(os.environ, self.credentials):
+            with self.pool.acquire('twitter') as first:
+                # Com max_clients=1, um segundo empréstimo simultâneo aguarda e expira
+                with self.assertRaises(TimeoutError):
+                    with self.pool.acquire('twitter'):
+                        pass
+            
+            with self.pool.acquire('twitter') as second:
+                pass
+            
+            with patch.dict(os.environ, {'TWITTER_ACCESS_TOKEN': 'novo'}):
+                with self.pool.acquire('twitter') as third:
+                    pass
+        
+        self.assertIs(first, second)
+        self.assertIsNot(first, third)
+        self.assertEqual(third.auth[2], 'novo')
+        self.assertEqual(first.timeout, 30.0)
+        stats = self.pool.stats()
+        self.assertEqual((stats['created'], stats['reused'], stats['discarded']), (2, 1, 1))
+    
+    def test_instagram_session_is_persisted(self):
+        """Testa que a sessão do Instagram salva em disco evita um novo login."""
+        with patch.dict(sys.modules, self.fake_modules), patch.dict(os.environ, self.credentials):
+            with self.pool.acquire('instagram') as loader:
+                self.assertEqual(loader.session, 'coletor')
+            
+            other_pool = ClientPool(os.path.join(self.temp_dir, 'sessions'))
+            with other_pool.acquire('instagram') as loader:
+                self.assertEqual(loader.session, 'coletor')
+        
+        self.assertEqual(self.logins, ['coletor'])
+        self.assertEqual(other_pool.stats()['sessions_loaded'], 1)
+    
+    def test_failed_login_is_not_pooled(self):
+        """Testa que uma falha de login não deixa um cliente anônimo no pool sob as credenciais."""
+        with patch.dict(sys.modules, self.fake_modules), patch.dict(os.environ, self.credentials):
+            with patch.dict(os.environ, {'INSTAGRAM_PASSWORD': 'errada'}):
+                with self.assertRaises(Exception):
+                    with self.pool.acquire('instagram'):
+                        pass
+            
+            self.assertEqual(self.pool.stats()['clients'], {'instagram/default': 0})
+            
+            with self.pool.acquire('instagram') as loader:
+                self.assertEqual(loader.session, 'coletor')
+        
+        self.assertEqual(self.logins, ['coletor'])
+    
+    def test_expired_session_is_refreshed(self):
+        """Testa que um erro de login exigido descarta o cliente e a sessão salva, forçando um novo login."""
+        expired = self.fake_modules['instaloader'].LoginRequiredException
+        
+        with patch.dict(sys.modules, self.fake_modules), patch.dict(os.environ, self.credentials):
+            with self.assertRaises(expired):
+                with self.pool.acquire('instagram') as first:
+                    raise expired("Login required")
+            
+            self.assertFalse(os.listdir(os.path.join(self.temp_dir, 'sessions')))
+            
+            with self.pool.acquire('instagram') as second:
+                pass
+        
+        self.assertIsNot(first, second)
+        self.assertEqual(self.logins, ['coletor', 'coletor'])
+        stats = self.pool.stats()
+        self.assertEqual((stats['created'], stats['discarded'], stats['sessions_loaded']), (2, 1, 0))
+    
+    def test_additional_credential_sets(self):
+        """Testa que conjuntos de credenciais com sufixo têm clientes próprios."""
+        extra = {variable + '_2': value + '2' for variable, value in self.credentials.items()
+                 if variable.startswith('TWITTER')}
+        # Conjunto incompleto: ignorado
+        extra['TWITTER_API_KEY_3'] = 'k3'
+        
+        with patch.dict(sys.modules, self.fake_modules), patch.dict(os.environ, {**self.credentials, **extra}):
+            self.assertEqual(self.pool.credential_names('twitter'), ['default', '2'])
+            
+            with self.pool.acquire('twitter') as first, self.pool.acquire('twitter', '2') as second:
+                pass
+        
+        self.assertEqual(first.auth[0], 'k')
+        self.assertEqual(second.auth[0], 'k2')
+        self.assertEqual(self.pool.stats()['clients'], {'twitter/default': 1, 'twitter/2': 1})
+
+
+class FakeRateLimitedAPI:
+    """API de rede social local que recusa requisições acima do limite de cada credencial, como as APIs reais."""
+    
+    def __init__(self, limit, window):
+        """
+        Inicializa a API.
+        
+        Args:
+            limit: Requisições permitidas por janela, por credencial
+            window: Duração da janela, em segundos
+        """
+        self.limit = limit
+        self.window = window
+        self.calls = []
+        self.rejected = 0
+        self._windows = {}
+        self._lock = threading.Lock()
+    
+    def request(self, username, credential):
+        """Atende uma requisição ou lança RateLimitExceeded com o fim da janela atual."""
+        with self._lock:
+            now = time.time()
+            count, reset_at = self._windows.get(credential, (0, now + self.window))
+            if now >= reset_at:
+                count, reset_at = 0, now + self.window
+            
+            if count >= self.limit:
+                self.rejected += 1
+                raise RateLimitExceeded(reset_at)
+            
+            self._windows[credential] = (count + 1, reset_at)
+            self.calls.append((credential, now))
+        
+        return {'username': username, 'credential': credential}
+
+
+class TestSocialScheduler(unittest.TestCase):
+    """Testes para o agendador de coletas com limites de taxa."""
+    
+    def make_scheduler(self, limit, window, credentials=('default',)):
+        """Cria um agendador com uma rede de teste de um único endpoint."""
+        scheduler = CollectionScheduler({'fake': {'posts': (limit, window)}}, credentials=lambda network: list(credentials),
+                                        default_duration=0.01)
+        self.addCleanup(scheduler.shutdown)
+        return scheduler
+    
+    def test_jobs_are_spread_over_time(self):
+        """Testa que as coletas além da cota esperam a renovação da janela, com a previsão informada."""
+        # A cota do agendador é um pouco mais conservadora que a da API
+        api = FakeRateLimitedAPI(limit=2, window=0.4)
+        scheduler = self.make_scheduler(limit=2, window=0.5)
+        
+        start = time.time()
+        jobs = [scheduler.submit('fake', api.request, f"perfil{i}") for i in range(5)]
+        etas = [round(job.eta - start, 1) for job in jobs]
+        
+        for job in jobs:
+            self.assertTrue(job.wait(timeout=5))
+        
+        self.assertEqual(etas, [0.0, 0.0, 0.5, 0.5, 1.0])
+        self.assertEqual([job.status for job in jobs], ['finished'] * 5)
+        self.assertEqual(api.rejected, 0)
+        self.assertGreaterEqual(api.calls[4][1] - api.calls[0][1], 0.9)
+        self.assertEqual(jobs[4].result, {'username': 'perfil4', 'credential': 'default'})
+    
+    def test_jobs_are_spread_across_credentials(self):
+        """Testa que cada coleta usa a credencial com cota disponível mais cedo."""
+        api = FakeRateLimitedAPI(limit=1, window=60)
+        scheduler = self.make_scheduler(limit=1, window=60, credentials=('a', 'b'))
+        
+        first = scheduler.submit('fake', api.request, 'perfil1')
+        second = scheduler.submit('fake', api.request, 'perfil2')
+        self.assertTrue(first.wait(timeout=5) and second.wait(timeout=5))
+        
+        third = scheduler.submit('fake', api.request, 'perfil3')
+        status = scheduler.status()
+        
+        self.assertEqual({first.credential, second.credential}, {'a', 'b'})
+        self.assertEqual(api.rejected, 0)
+        self.assertEqual([job['job_id'] for job in status['queued']], [third.id])
+        self.assertGreater(status['queued'][0]['eta_seconds'], 55)
+        self.assertEqual(status['quotas']['fake']['a']['posts']['remaining'], 0)
+    
+    def test_rejected_jobs_wait_for_reset(self):
+        """Testa que uma coleta recusada pela API aguarda a renovação informada e é repetida."""
+        # Cota otimista: a própria API corrige o agendador
+        api = FakeRateLimitedAPI(limit=1, window=0.3)
+        scheduler = self.make_scheduler(limit=10, window=60)
+        
+        jobs = [scheduler.submit('fake', api.request, f"perfil{i}") for i in range(2)]
+        for job in jobs:
+            self.assertTrue(job.wait(timeout=5))
+        
+        self.assertEqual([job.status for job in jobs], ['finished', 'finished'])
+        self.assertEqual(api.rejected, 1)
+        self.assertEqual(sum(job.attempts for job in jobs), 1)
+        self.assertGreaterEqual(api.calls[1][1] - api.calls[0][1], 0.25)
+    
+    def test_collection_costs(self):
+        """Testa a estimativa de requisições de cada coleta."""
+        self.assertEqual(collection_costs('twitter', 100), {'users/show': 1, 'statuses/user_timeline': 1})
+        self.assertEqual(collection_costs('instagram', 30), {'profile': 1, 'posts': 3})
+        with self.assertRaises(ValueError):
+            collection_costs('facebook', 10)
+
+
+class TestHTTPResponseCache(unittest.TestCase):
+    """Testes para o cache de respostas HTTP com requisições condicionais."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = HTTPResponseCache(os.path.join(self.temp_dir, 'http.sqlite3'))
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def _page(self, handler):
+        """Página com ETag que responde 304 quando o validador enviado confere."""
+        if handler.headers.get('If-None-Match') == '"v1"':
+            return 304, {'ETag': '"v1"'}, b''
+        return 200, {'ETag': '"v1"'}, '<a href="/equipe">e</a> contato@exemplo.com.br'
+    
+    def test_recrawl_uses_conditional_requests(self):
+        """Testa que um novo rastreamento reutiliza o corpo em cache após uma resposta 304."""
+        routes = {'/': self._page, '/equipe': (200, {}, 'equipe@exemplo.com.br')}
+        
+        with LocalHTTPServer(routes) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), http_cache=self.cache)
+            first = crawler.crawl(server.url, max_pages=2)
+            second = crawler.crawl(server.url, max_pages=2)
+            forced = crawler.crawl(server.url, max_pages=2, force_refresh=True)
+        
+        conditional = [r for r in server.requests if r[1] == '/' and 'If-None-Match' in r[2]]
+        self.assertEqual(first['emails'], {'contato@exemplo.com.br', 'equipe@exemplo.com.br'})
+        self.assertEqual(second['emails'], first['emails'])
+        self.assertEqual(forced['emails'], first['emails'])
+        self.assertEqual(len(conditional), 1)
+        # Páginas sem ETag ou Last-Modified não são armazenadas
+        self.assertEqual(self.cache.stats()['entries'], 1)
+        self.assertEqual(self.cache.stats()['revalidated'], 1)
+    
+    def test_not_modified_without_cached_body_refetches(self):
+        """Testa que um 304 cujo corpo saiu do cache leva a um novo download, e não a uma página com falha."""
+        routes = {'/': self._page}
+        
+        with LocalHTTPServer(routes) as server:
+            crawler = AsyncCrawler(http_client=HTTPClient(), http_cache=self.cache)
+            crawler.crawl(server.url, max_pages=1)
+            
+            # Corpo descartado entre a leitura dos validadores e a resposta 304
+            with patch.object(self.cache, 'get_body', return_value=None):
+                result = crawler.crawl(server.url, max_pages=1)
+        
+        requests_to_root = [r for r in server.requests if r[1] == '/']
+        self.assertEqual(result['emails'], {'contato@exemplo.com.br'})
+        self.assertEqual(result['pages_scanned'], 1)
+        self.assertEqual(len(requests_to_root), 3)
+        self.assertIn('If-None-Match', requests_to_root[1][2])
+        self.assertNotIn('If-None-Match', requests_to_root[2][2])
+        self.assertEqual(self.cache.stats()['entries'], 1)
+    
+    def test_size_limit_evicts_least_recently_used(self):
+        """Testa que o limite de tamanho descarta as respostas menos acessadas."""
+        import time
+        body = os.urandom(4000)
+        cache = HTTPResponseCache(os.path.join(self.temp_dir, 'limite.sqlite3'), max_bytes=10000)
+        
+        cache.store('https://exemplo.com.br/a', 'https://exemplo.com.br/a', body, etag='"a"')
+        time.sleep(0.01)
+        cache.store('https://exemplo.com.br/b', 'https://exemplo.com.br/b', body, etag='"b"')
+        time.sleep(0.01)
+        cache.get_body('https://exemplo.com.br/a')
+        time.sleep(0.01)
+        cache.store('https://exemplo.com.br/c', 'https://exemplo.com.br/c', body, etag='"c"')
+        
+        self.assertEqual(cache.get_body('https://exemplo.com.br/a'), body)
+        self.assertIsNone(cache.get('https://exemplo.com.br/b'))
+        self.assertLessEqual(cache.stats()['total_bytes'], 10000)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        cache.close()
+
+
+class TestDNSResolver(unittest.TestCase):
+    """Testes para o resolvedor DNS assíncrono com cache."""
+    
+    RECORDS = {
+        ('exemplo.com.br', 'A'): [(300, '192.0.2.10'), (60, '192.0.2.11')],
+        ('exemplo.com.br', 'AAAA'): [(300, '2001:db8::10')],
+        ('exemplo.com.br', 'MX'): [(300, (10, 'mx.exemplo.com.br'))],
+        ('exemplo.com.br', 'NS'): [(300, 'ns1.exemplo.com.br')],
+        ('exemplo.com.br', 'TXT'): [(300, 'v=spf1 -all')],
+        ('curto.com.br', 'A'): [(1, '192.0.2.20')]
+    }
+    
+    def test_lookup_record_types(self):
+        """Testa a consulta simultânea dos tipos A, AAAA, MX, NS e TXT."""
+        with LocalDNSServer(self.RECORDS) as server:
+            resolver = DNSResolver(nameservers=[server.address], timeout=1)
+            records = resolver.lookup_sync('exemplo.com.br')
+        
+        self.assertEqual(records['A'], ['192.0.2.10', '192.0.2.11'])
+        self.assertEqual(records['AAAA'], ['2001:db8::10'])
+        self.assertEqual(records['MX'], [{'preference': 10, 'exchange': 'mx.exemplo.com.br'}])
+        self.assertEqual(records['NS'], ['ns1.exemplo.com.br'])
+        self.assertEqual(records['TXT'], ['v=spf1 -all'])
+    
+    def test_cache_respects_ttl(self):
+        """Testa que respostas ficam em cache apenas pelo menor TTL dos registros."""
+        import time
+        with LocalDNSServer(self.RECORDS) as server:
+            resolver = DNSResolver(nameservers=[server.address], timeout=1)
+            resolver.lookup_sync('exemplo.com.br', ['A'])
+            resolver.lookup_sync('curto.com.br', ['A'])
+            time.sleep(1.1)
+            resolver.lookup_sync('exemplo.com.br', ['A'])
+            resolver.lookup_sync('curto.com.br', ['A'])
+        
+        self.assertEqual(server.queries.count(('exemplo.com.br', 'A')), 1)
+        self.assertEqual(server.queries.count(('curto.com.br', 'A')), 2)
+        self.assertEqual(resolver.stats()['hits'], 1)
+    
+    def test_resolve_many_and_nxdomain(self):
+        """Testa consultas em lote, incluindo nomes inexistentes em cache negativo."""
+        with LocalDNSServer(self.RECORDS) as server:
+            resolver = DNSResolver(nameservers=[server.address], timeout=1, use_system_fallback=False)
+            results = resolver.resolve_many_sync(['exemplo.com.br', 'curto.com.br', 'inexistente.com.br'])
+            resolver.resolve_many_sync(['inexistente.com.br'])
+        
+        self.assertEqual(results['curto.com.br']['A'], ['192.0.2.20'])
+        self.assertEqual(results['inexistente.com.br']['A'], [])
+        self.assertEqual(server.queries.count(('inexistente.com.br', 'A')), 1)
+    
+    def test_lookup_sync_total_timeout(self):
+        """Testa que o prazo total interrompe consultas a um servidor que não responde."""
+        silent = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        silent.bind(('127.0.0.1', 0))
+        self.addCleanup(silent.close)
+        resolver = DNSResolver(nameservers=[silent.getsockname()], timeout=2, retries=2, use_system_fallback=False)
+        contact_info = ContactInfoOSINT(output_dir=tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, contact_info.output_dir)
+        contact_info.dns_resolver = resolver
+        
+        start = time.monotonic()
+        with self.assertRaises(Exception):
+            resolver.lookup_sync('exemplo.com.br', ['A'], timeout=0.3)
+        self.assertEqual(contact_info._get_dns_records('exemplo.com.br', timeout=0.3), {})
+        
+        self.assertLess(time.monotonic() - start, 1.5)
+    
+    def test_system_fallback_for_missing_names(self):
+        """Testa que nomes inexistentes nos servidores DNS (ex: do /etc/hosts) usam o resolvedor do sistema."""
+        from unittest.mock import AsyncMock
+        import asyncio
+        with LocalDNSServer(self.RECORDS) as server:
+            resolver = DNSResolver(nameservers=[server.address], timeout=1)
+            with patch.object(resolver, '_query_system', AsyncMock(return_value=['192.0.2.99'])) as system:
+                records = resolver.lookup_sync('intranet', ['A', 'MX'])
+                crawler = AsyncCrawler(http_client=MagicMock(), dns_resolver=resolver)
+                resolves = asyncio.run(crawler._host_resolves('intranet'))
+                resolver.lookup_sync('exemplo.com.br', ['A'])
+        
+        self.assertEqual(records, {'A': ['192.0.2.99'], 'MX': []})
+        self.assertTrue(resolves)
+        self.assertIn(('intranet', 'A'), server.queries)
+        # A resposta A já estava em cache; o crawler consultou apenas AAAA
+        self.assertEqual([c.args for c in system.call_args_list], [('intranet', 'A'), ('intranet', 'AAAA')])
+    
+    def test_malformed_reply_tries_next_server(self):
+        """Testa que uma resposta malformada passa ao próximo servidor e, sem outro, ao resolvedor do sistema."""
+        from unittest.mock import AsyncMock
+        from modules.dns_resolver import parse_response, build_query, DNSError
+        with LocalDNSServer(self.RECORDS, malformed=True) as bad, LocalDNSServer(self.RECORDS) as good:
+            resolver = DNSResolver(nameservers=[bad.address, good.address], timeout=1, use_system_fallback=False)
+            records = resolver.lookup_sync('exemplo.com.br', ['A'])
+            
+            only_bad = DNSResolver(nameservers=[bad.address], timeout=1, retries=1)
+            with patch.object(only_bad, '_query_system', AsyncMock(return_value=['192.0.2.99'])):
+                fallback = only_bad.lookup_sync('exemplo.com.br', ['A'])
+            
+            with self.assertRaises(DNSError):
+                parse_response(bad._answer(build_query('exemplo.com.br', 'A', 1)))
+        
+        self.assertEqual(records['A'], ['192.0.2.10', '192.0.2.11'])
+        self.assertIn(('exemplo.com.br', 'A'), bad.queries)
+        self.assertEqual(fallback['A'], ['192.0.2.99'])
+    
+    def test_crawler_skips_unresolvable_host(self):
+        """Testa que o crawler não faz requisições HTTP para hosts sem endereços."""
+        http_client = MagicMock()
+        with LocalDNSServer(self.RECORDS) as server:
+            resolver = DNSResolver(nameservers=[server.address], timeout=1, use_system_fallback=False)
+            crawler = AsyncCrawler(http_client=http_client, dns_resolver=resolver)
+            result = crawler.crawl('https://inexistente.com.br', max_pages=3)
+        
+        self.assertEqual(result['pages_scanned'], 0)
+        http_client.get.assert_not_called()
+        self.assertIn(('inexistente.com.br', 'A'), server.queries)
+
+
+class TestHTTPClient(unittest.TestCase):
+    """Testes para o cliente HTTP compartilhado."""
+    
+    def test_keep_alive_connection_reuse(self):
+        """Testa que requisições sucessivas reutilizam a mesma conexão."""
+        with LocalHTTPServer({'/': (200, {}, 'ok')}) as server:
+            client = HTTPClient()
+            for _ in range(5):
+                self.assertEqual(client.get(server.url + '/').status_code, 200)
+            client.close()
+        
+        self.assertEqual(len(server.requests), 5)
+        self.assertEqual(len(server.client_ports), 1)
+        self.assertIn('gzip', server.requests[0][2]['Accept-Encoding'])
+    
+    def test_retry_on_transient_errors(self):
+        """Testa novas tentativas após respostas de erro transitório."""
+        attempts = []
+        
+        def flaky(handler):
+            attempts.append(handler.path)
+            if len(attempts) < 3:
+                return 503, {}, 'indisponível'
+            return 200, {}, 'ok'
+        
+        with LocalHTTPServer({'/': flaky}) as server:
+            client = HTTPClient(max_retries=3, backoff_factor=0)
+            response = client.get(server.url + '/')
+        
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(attempts), 3)
+
+
+class TestRateLimiter(unittest.TestCase):
+    """Testes para o limitador de taxa por host."""
+    
+    def test_token_bucket_rate(self):
+        """Testa que o token bucket libera requisições na taxa configurada."""
+        bucket = TokenBucket(rate=10, capacity=1)
+        
+        self.assertEqual(bucket.reserve(), 0.0)
+        self.assertAlmostEqual(bucket.reserve(), 0.1, places=2)
+        self.assertAlmostEqual(bucket.reserve(), 0.2, places=2)
+    
+    def test_hosts_are_limited_independently(self):
+        """Testa que cada host possui seu próprio bucket e taxa."""
+        limiter = RateLimiter(default_rate=1, host_rates={'rapido.exemplo.com.br': None})
+        
+        self.assertEqual(limiter.wait('a.exemplo.com.br'), 0.0)
+        self.assertEqual(limiter.wait('b.exemplo.com.br'), 0.0)
+        self.assertEqual(limiter.wait('rapido.exemplo.com.br'), 0.0)
+        self.assertEqual(limiter.wait('rapido.exemplo.com.br'), 0.0)
+    
+    def test_crawl_delay_from_robots(self):
+        """Testa que o Crawl-delay do robots.txt reduz a taxa do host."""
+        import time
+        routes = {
+            '/robots.txt': (200, {'Content-Type': 'text/plain'}, 'User-agent: *\nCrawl-delay: 0.3\n'),
+            '/': (200, {}, 'ok')
+        }
+        
+        with LocalHTTPServer(routes) as server:
+            limiter = RateLimiter(default_rate=100)
+            client = HTTPClient(rate_limiter=limiter)
+            start = time.monotonic()
+            for _ in range(3):
+                client.get(server.url + '/')
+            elapsed = time.monotonic() - start
+        
+        host = server.url.split('://')[1]
+        self.assertAlmostEqual(limiter.get_rate(host), 1 / 0.3)
+        self.assertGreaterEqual(elapsed, 0.55)
+        self.assertEqual([r[1] for r in server.requests].count('/robots.txt'), 1)
+
+
+class TestPersistentCache(unittest.TestCase):
+    """Testes para o cache persistente com TTL."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_path = os.path.join(self.temp_dir, 'cache.sqlite3')
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        shutil.rmtree(self.temp_dir)
+    
+    def test_memory_and_disk_hits(self):
+        """Testa os acertos no LRU em memória e, após reabrir o cache, no disco."""
+        cache = PersistentCache(self.db_path)
+        cache.set('exemplo.com.br', {'registrar': 'Registrador Teste'})
+        self.assertEqual(cache.get('exemplo.com.br'), {'registrar': 'Registrador Teste'})
+        self.assertIsNone(cache.get('outro.com.br'))
+        cache.close()
+        
+        reopened = PersistentCache(self.db_path)
+        self.assertEqual(reopened.get('exemplo.com.br'), {'registrar': 'Registrador Teste'})
+        stats = reopened.stats()
+        reopened.close()
+        
+        self.assertEqual(stats['disk_hits'], 1)
+        self.assertEqual(stats['disk_entries'], 1)
+        self.assertEqual(stats['hit_ratio'], 1.0)
+    
+    def test_expired_entries(self):
+        """Testa que entradas expiradas não são devolvidas."""
+        import time
+        cache = PersistentCache(self.db_path)
+        cache.set('exemplo.com.br', {'registrar': 'Registrador Teste'}, ttl=0.05)
+        time.sleep(0.1)
+        
+        self.assertIsNone(cache.get('exemplo.com.br'))
+        self.assertEqual(cache.stats()['expired'], 1)
+        cache.close()
+    
+    def test_eviction_of_least_recently_used(self):
+        """Testa que o limite de entradas descarta as menos acessadas."""
+        import time
+        cache = PersistentCache(self.db_path, max_entries=2, memory_items=0)
+        cache.set('a', 1)
+        time.sleep(0.01)
+        cache.set('b', 2)
+        time.sleep(0.01)
+        cache.get('a')
+        time.sleep(0.01)
+        cache.set('c', 3)
+        
+        self.assertEqual(cache.get('a'), 1)
+        self.assertIsNone(cache.get('b'))
+        self.assertEqual(cache.get('c'), 3)
+        self.assertEqual(cache.stats()['evictions'], 1)
+        cache.close()
+
+
+class TestJobManager(unittest.TestCase):
+    """Testes para o gerenciador de tarefas em segundo plano."""
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.job_manager = JobManager(max_workers=2, max_finished_jobs=2)
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.job_manager.shutdown()
+    
+    def _wait(self, job):
+        """Aguarda a conclusão de uma tarefa."""
+        import time
+        for _ in range(100):
+            if job.done:
+                return
+            time.sleep(0.02)
+    
+    def test_submit_returns_immediately(self):
+        """Testa que a submissão não bloqueia e o resultado fica disponível."""
+        import threading
+        release = threading.Event()
+        
+        job = self.job_manager.submit('teste', lambda: release.wait(5) and {"ok": True})
+        self.assertFalse(job.done)
+        
+        release.set()
+        self._wait(job)
+        
+        self.assertEqual(job.status, 'finished')
+        self.assertEqual(job.to_dict(include_result=True)['result'], {"ok": True})
+    
+    def test_error_results_mark_job_as_failed(self):
+        """Testa que falhas (exceções ou chave 'error') marcam a tarefa como falha."""
+        def raise_error():
+            raise ValueError("falha")
+        
+        job_error = self.job_manager.submit('erro', lambda: {"error": "inválido"})
+        job_exception = self.job_manager.submit('excecao', raise_error)
+        self._wait(job_error)
+        self._wait(job_exception)
+        
+        self.assertEqual(job_error.status, 'failed')
+        self.assertEqual(job_error.error, "inválido")
+        self.assertEqual(job_exception.status, 'failed')
+        self.assertEqual(job_exception.error, "falha")
+    
+    def test_finished_jobs_are_bounded(self):
+        """Testa que apenas as tarefas concluídas mais recentes são mantidas."""
+        jobs = [self.job_manager.submit(f'tarefa_{i}', lambda: {}) for i in range(4)]
+        for job in jobs:
+            self._wait(job)
+        
+        self.assertEqual(len(self.job_manager.list_jobs()), 2)
+    
+    def test_progress_events(self):
+        """Testa a publicação e leitura dos eventos de progresso de uma tarefa."""
+        def collect(total, progress_callback=None):
+            for i in range(total):
+                progress_callback('page', {'page': i})
+            return {'pages': total}
+        
+        job = self.job_manager.submit('progresso', collect, 3, with_progress=True)
+        events = [event for event in job.iter_events(keepalive=1) if event]
+        
+        self.assertEqual([e['event'] for e in events], ['page', 'page', 'page', 'done'])
+        self.assertEqual(events[2]['data'], {'page': 2})
+        self.assertEqual(events[-1]['data']['status'], 'finished')
+        
+        # Retomar a partir de um evento já recebido
+        resumed = [event for event in job.iter_events(after=events[1]['id'], keepalive=1) if event]
+        self.assertEqual(len(resumed), 2)
+
+
+
+class TestEmailVerifier(unittest.TestCase):
+    """Testes para a verificação de e-mails por MX e SMTP."""
+    
+    RECORDS = {
+        ('exemplo.com.br', 'MX'): [(300, (10, 'mx.exemplo.com.br')), (20, (20, 'mx2.exemplo.com.br'))],
+        ('qualquer.com.br', 'MX'): [(300, (10, 'mx.exemplo.com.br'))],
+        ('mx.exemplo.com.br', 'A'): [(300, '127.0.0.1')]
+    }
+    
+    def setUp(self):
+        """Configuração inicial para os testes."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = PersistentCache(os.path.join(self.temp_dir, 'smtp.sqlite3'))
+    
+    def tearDown(self):
+        """Limpeza após os testes."""
+        self.cache.close()
+        shutil.rmtree(self.temp_dir)
+    
+    def test_verify_many_reuses_connection(self):
+        """Testa a verificação com uma conexão por MX, detecção de catch-all e domínios sem MX."""
+        emails = ['joao.silva@exemplo.com.br', 'jsilva@exemplo.com.br', 'joao@qualquer.com.br',
+                  'joao@semmx.com.br', 'invalido@']
+        
+        with LocalDNSServer(self.RECORDS) as dns, \
+                LocalSMTPServer(['joao.silva@exemplo.com.br'], catch_all_domains=['qualquer.com.br']) as smtp:
+            resolver = DNSResolver(nameservers=[dns.address], timeout=1, use_system_fallback=False)
+            verifier = EmailVerifier(dns_resolver=resolver, cache=self.cache, helo_host='teste.local',
+                                     smtp_port=smtp.port, timeout=2)
+            results = verifier.verify_many(emails)
+            verifier.verify_many(['maria@exemplo.com.br'])
+            verifier.close()
+        
+        self.assertEqual([r['status'] for r in results], ['valid', 'invalid', 'catch_all', 'no_mx', 'invalid_syntax'])
+        self.assertEqual(results[0]['mx_host'], 'mx.exemplo.com.br')
+        self.assertEqual(smtp.connections, 1)
+        # A sonda de catch-all é enviada uma única vez por domínio; depois, o resultado vem do cache
+        self.assertEqual(len(smtp.recipients), 3 + 2 + 1)
+        self.assertFalse(self.cache.get('catch_all:exemplo.com.br'))
+        self.assertTrue(self.cache.get('catch_all:qualquer.com.br'))
+    
+    def test_greylisted_probe_not_cached(self):
+        """Testa que uma resposta 4xx à sonda de catch-all não é guardada e deixa o resultado indefinido."""
+        with LocalDNSServer(self.RECORDS) as dns, \
+                LocalSMTPServer(['joao.silva@exemplo.com.br'], greylist_domains=['exemplo.com.br']) as smtp:
+            resolver = DNSResolver(nameservers=[dns.address], timeout=1, use_system_fallback=False)
+            verifier = EmailVerifier(dns_resolver=resolver, cache=self.cache, helo_host='teste.local',
+                                     smtp_port=smtp.port, timeout=2)
+            first = verifier.verify_many(['joao.silva@exemplo.com.br'])
+            second = verifier.verify_many(['joao.silva@exemplo.com.br'])
+            verifier.close()
+        
+        for results in (first, second):
+            self.assertEqual(results[0]['status'], 'unknown')
+            self.assertIsNone(results[0]['catch_all'])
+        self.assertIsNone(self.cache.get('catch_all:exemplo.com.br'))
+        # Sem resultado em cache, a sonda é repetida na verificação seguinte
+        self.assertEqual(len(smtp.recipients), 4)
+
+
 if __name__ == '__main__':
     unittest.main()